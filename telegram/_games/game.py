@@ -18,14 +18,15 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains an object that represents a Telegram Game."""
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, ClassVar, Optional
 
 from telegram._files.animation import Animation
 from telegram._files.photosize import PhotoSize
 from telegram._messageentity import MessageEntity
 from telegram._telegramobject import TelegramObject
 from telegram._utils.argumentparsing import de_json_optional, de_list_optional, parse_sequence_arg
-from telegram._utils.strings import TextEncoding
+from telegram._utils.defaultvalue import DEFAULT_NONE
+from telegram._utils.entities import get_utf_16_text, parse_message_entities, parse_message_entity
 from telegram._utils.types import JSONDict
 
 if TYPE_CHECKING:
@@ -90,6 +91,7 @@ class Game(TelegramObject):
     """
 
     __slots__ = (
+        "_utf_16_text",
         "animation",
         "description",
         "photo",
@@ -98,6 +100,9 @@ class Game(TelegramObject):
         "title",
     )
 
+    # The UTF-16 encodings cached by `telegram._utils.entities.get_utf_16_text`
+    _CACHE_ATTRIBUTES: ClassVar[frozenset[str]] = frozenset(("_utf_16_text",))
+
     def __init__(
         self,
         title: str,
@@ -119,6 +124,9 @@ class Game(TelegramObject):
         self.text_entities: tuple[MessageEntity, ...] = parse_sequence_arg(text_entities)
         self.animation: Optional[Animation] = animation
 
+        # Cache for `telegram._utils.entities.get_utf_16_text`
+        self._utf_16_text: object = DEFAULT_NONE
+
         self._id_attrs = (self.title, self.description, self.photo)
 
         self._freeze()
@@ -156,10 +164,7 @@ class Game(TelegramObject):
         if not self.text:
             raise RuntimeError("This Game has no 'text'.")
 
-        entity_text = self.text.encode(TextEncoding.UTF_16_LE)
-        entity_text = entity_text[entity.offset * 2 : (entity.offset + entity.length) * 2]
-
-        return entity_text.decode(TextEncoding.UTF_16_LE)
+        return parse_message_entity(self.text, entity, get_utf_16_text(self, "text"))
 
     def parse_text_entities(self, types: Optional[list[str]] = None) -> dict[MessageEntity, str]:
         """
@@ -184,11 +189,14 @@ class Game(TelegramObject):
             the text that belongs to them, calculated based on UTF-16 codepoints.
 
         """
-        if types is None:
-            types = MessageEntity.ALL_TYPES
-
-        return {
-            entity: self.parse_text_entity(entity)
-            for entity in self.text_entities
-            if entity.type in types
-        }
+        if not self.text:
+            # Raises an exception if there are any matching entities
+            return {
+                entity: self.parse_text_entity(entity)
+                for entity in self.text_entities
+                if types is None or entity.type in types
+            }
+
+        return parse_message_entities(
+            self.text, self.text_entities, types, utf_16_text=get_utf_16_text(self, "text")
+        )
@@ -20,10 +20,11 @@
 """This module contains an object that represents a Telegram Message."""
 
 import datetime as dtm
+import functools
 import re
 from collections.abc import Sequence
 from html import escape
-from typing import TYPE_CHECKING, Optional, TypedDict, Union
+from typing import TYPE_CHECKING, ClassVar, Optional, TypedDict, Union, cast
 
 from telegram._chat import Chat
 from telegram._chatbackground import ChatBackground
@@ -68,7 +69,12 @@ from telegram._user import User
 from telegram._utils.argumentparsing import de_json_optional, de_list_optional, parse_sequence_arg
 from telegram._utils.datetime import extract_tzinfo_from_defaults, from_timestamp
 from telegram._utils.defaultvalue import DEFAULT_NONE, DefaultValue
-from telegram._utils.entities import parse_message_entities, parse_message_entity
+from telegram._utils.entities import (
+    get_utf_16_text,
+    parse_message_entities,
+    parse_message_entity,
+    render_message_entities,
+)
 from telegram._utils.strings import TextEncoding
 from telegram._utils.types import (
     CorrectOptionID,
@@ -935,6 +941,8 @@ class Message(MaybeInaccessibleMessage):
     # fmt: on
     __slots__ = (
         "_effective_attachment",
+        "_utf_16_caption",
+        "_utf_16_text",
         "animation",
         "audio",
         "author_signature",
@@ -1019,6 +1027,9 @@ class Message(MaybeInaccessibleMessage):
         "write_access_allowed",
     )
 
+    # The UTF-16 encodings cached by `telegram._utils.entities.get_utf_16_text`
+    _CACHE_ATTRIBUTES: ClassVar[frozenset[str]] = frozenset(("_utf_16_caption", "_utf_16_text"))
+
     def __init__(
         self,
         message_id: int,
@@ -1211,6 +1222,9 @@ class Message(MaybeInaccessibleMessage):
             self.refunded_payment: Optional[RefundedPayment] = refunded_payment
 
             self._effective_attachment = DEFAULT_NONE
+            # Caches for `telegram._utils.entities.get_utf_16_text`
+            self._utf_16_text: object = DEFAULT_NONE
+            self._utf_16_caption: object = DEFAULT_NONE
 
             self._id_attrs = (self.message_id, self.chat)
 
@@ -1542,11 +1556,11 @@ class Message(MaybeInaccessibleMessage):
             RuntimeError: If the message has neither :attr:`text` nor :attr:`caption`.
             ValueError: If the requested index of quote doesn't exist in the message.
         """
-        if not (text := (self.text or self.caption)):
+        if not (self.text or self.caption):
             raise RuntimeError("This message has neither text nor caption.")
 
         # Telegram wants the position in UTF-16 code units, so we have to calculate in that space
-        utf16_text = text.encode(TextEncoding.UTF_16_LE)
+        utf16_text = cast(bytes, get_utf_16_text(self, "text" if self.text else "caption"))
         utf16_quote = quote.encode(TextEncoding.UTF_16_LE)
         effective_index = index or 0
 
@@ -4551,7 +4565,7 @@ class Message(MaybeInaccessibleMessage):
         if not self.text:
             raise RuntimeError("This Message has no 'text'.")
 
-        return parse_message_entity(self.text, entity)
+        return parse_message_entity(self.text, entity, get_utf_16_text(self, "text"))
 
     def parse_caption_entity(self, entity: MessageEntity) -> str:
         """Returns the text from a given :class:`telegram.MessageEntity`.
@@ -4575,7 +4589,7 @@ class Message(MaybeInaccessibleMessage):
         if not self.caption:
             raise RuntimeError("This Message has no 'caption'.")
 
-        return parse_message_entity(self.caption, entity)
+        return parse_message_entity(self.caption, entity, get_utf_16_text(self, "caption"))
 
     def parse_entities(self, types: Optional[list[str]] = None) -> dict[MessageEntity, str]:
         """
@@ -4600,7 +4614,9 @@ class Message(MaybeInaccessibleMessage):
             the text that belongs to them, calculated based on UTF-16 codepoints.
 
         """
-        return parse_message_entities(self.text, self.entities, types=types)
+        return parse_message_entities(
+            self.text, self.entities, types=types, utf_16_text=get_utf_16_text(self, "text")
+        )
 
     def parse_caption_entities(
         self, types: Optional[list[str]] = None
@@ -4627,7 +4643,12 @@ class Message(MaybeInaccessibleMessage):
             the text that belongs to them, calculated based on UTF-16 codepoints.
 
         """
-        return parse_message_entities(self.caption, self.caption_entities, types=types)
+        return parse_message_entities(
+            self.caption,
+            self.caption_entities,
+            types=types,
+            utf_16_text=get_utf_16_text(self, "caption"),
+        )
 
     @classmethod
     def _parse_html(
@@ -4635,88 +4656,49 @@ class Message(MaybeInaccessibleMessage):
         message_text: Optional[str],
         entities: dict[MessageEntity, str],
         urled: bool = False,
-        offset: int = 0,
+        utf_16_text: Optional[bytes] = None,
     ) -> Optional[str]:
         if message_text is None:
             return None
 
-        utf_16_text = message_text.encode(TextEncoding.UTF_16_LE)
-        html_text = ""
-        last_offset = 0
-
-        sorted_entities = sorted(entities.items(), key=lambda item: item[0].offset)
-        parsed_entities = []
-
-        for entity, text in sorted_entities:
-            if entity in parsed_entities:
-                continue
-
-            nested_entities = {
-                e: t
-                for (e, t) in sorted_entities
-                if e.offset >= entity.offset
-                and e.offset + e.length <= entity.offset + entity.length
-                and e != entity
-            }
-            parsed_entities.extend(list(nested_entities.keys()))
-
-            if nested_entities:
-                escaped_text = cls._parse_html(
-                    text, nested_entities, urled=urled, offset=entity.offset
-                )
-            else:
-                escaped_text = escape(text)
-
+        def render_entity(
+            entity: MessageEntity, escaped_text: str, _text: str, _nested: bool
+        ) -> str:
             if entity.type == MessageEntity.TEXT_LINK:
-                insert = f'<a href="{entity.url}">{escaped_text}</a>'
-            elif entity.type == MessageEntity.TEXT_MENTION and entity.user:
-                insert = f'<a href="tg://user?id={entity.user.id}">{escaped_text}</a>'
-            elif entity.type == MessageEntity.URL and urled:
-                insert = f'<a href="{escaped_text}">{escaped_text}</a>'
-            elif entity.type == MessageEntity.BLOCKQUOTE:
-                insert = f"<blockquote>{escaped_text}</blockquote>"
-            elif entity.type == MessageEntity.EXPANDABLE_BLOCKQUOTE:
-                insert = f"<blockquote expandable>{escaped_text}</blockquote>"
-            elif entity.type == MessageEntity.BOLD:
-                insert = f"<b>{escaped_text}</b>"
-            elif entity.type == MessageEntity.ITALIC:
-                insert = f"<i>{escaped_text}</i>"
-            elif entity.type == MessageEntity.CODE:
-                insert = f"<code>{escaped_text}</code>"
-            elif entity.type == MessageEntity.PRE:
+                return f'<a href="{entity.url}">{escaped_text}</a>'
+            if entity.type == MessageEntity.TEXT_MENTION and entity.user:
+                return f'<a href="tg://user?id={entity.user.id}">{escaped_text}</a>'
+            if entity.type == MessageEntity.URL and urled:
+                return f'<a href="{escaped_text}">{escaped_text}</a>'
+            if entity.type == MessageEntity.BLOCKQUOTE:
+                return f"<blockquote>{escaped_text}</blockquote>"
+            if entity.type == MessageEntity.EXPANDABLE_BLOCKQUOTE:
+                return f"<blockquote expandable>{escaped_text}</blockquote>"
+            if entity.type == MessageEntity.BOLD:
+                return f"<b>{escaped_text}</b>"
+            if entity.type == MessageEntity.ITALIC:
+                return f"<i>{escaped_text}</i>"
+            if entity.type == MessageEntity.CODE:
+                return f"<code>{escaped_text}</code>"
+            if entity.type == MessageEntity.PRE:
                 if entity.language:
-                    insert = f'<pre><code class="{entity.language}">{escaped_text}</code></pre>'
-                else:
-                    insert = f"<pre>{escaped_text}</pre>"
-            elif entity.type == MessageEntity.UNDERLINE:
-                insert = f"<u>{escaped_text}</u>"
-            elif entity.type == MessageEntity.STRIKETHROUGH:
-                insert = f"<s>{escaped_text}</s>"
-            elif entity.type == MessageEntity.SPOILER:
-                insert = f'<span class="tg-spoiler">{escaped_text}</span>'
-            elif entity.type == MessageEntity.CUSTOM_EMOJI:
-                insert = f'<tg-emoji emoji-id="{entity.custom_emoji_id}">{escaped_text}</tg-emoji>'
-            else:
-                insert = escaped_text
-
-            # Make sure to escape the text that is not part of the entity
-            # if we're in a nested entity, this is still required, since in that case this
-            # text is part of the parent entity
-            html_text += (
-                escape(
-                    utf_16_text[last_offset * 2 : (entity.offset - offset) * 2].decode(
-                        TextEncoding.UTF_16_LE
-                    )
-                )
-                + insert
-            )
-
-            last_offset = entity.offset - offset + entity.length
-
-        # see comment above
-        html_text += escape(utf_16_text[last_offset * 2 :].decode(TextEncoding.UTF_16_LE))
-
-        return html_text
+                    return f'<pre><code class="{entity.language}">{escaped_text}</code></pre>'
+                return f"<pre>{escaped_text}</pre>"
+            if entity.type == MessageEntity.UNDERLINE:
+                return f"<u>{escaped_text}</u>"
+            if entity.type == MessageEntity.STRIKETHROUGH:
+                return f"<s>{escaped_text}</s>"
+            if entity.type == MessageEntity.SPOILER:
+                return f'<span class="tg-spoiler">{escaped_text}</span>'
+            if entity.type == MessageEntity.CUSTOM_EMOJI:
+                return f'<tg-emoji emoji-id="{entity.custom_emoji_id}">{escaped_text}</tg-emoji>'
+            return escaped_text
+
+        # The text that is not part of an entity is escaped as well. For nested entities, this
+        # is still required, since in that case this text is part of the parent entity.
+        return render_message_entities(
+            message_text, entities, escape, render_entity, utf_16_text=utf_16_text
+        )
 
     @property
     def text_html(self) -> str:
@@ -4741,7 +4723,12 @@ class Message(MaybeInaccessibleMessage):
             :obj:`str`: Message text with entities formatted as HTML.
 
         """
-        return self._parse_html(self.text, self.parse_entities(), urled=False)
+        return self._parse_html(
+            self.text,
+            self.parse_entities(),
+            urled=False,
+            utf_16_text=get_utf_16_text(self, "text"),
+        )
 
     @property
     def text_html_urled(self) -> str:
@@ -4766,7 +4753,12 @@ class Message(MaybeInaccessibleMessage):
             :obj:`str`: Message text with entities formatted as HTML.
 
         """
-        return self._parse_html(self.text, self.parse_entities(), urled=True)
+        return self._parse_html(
+            self.text,
+            self.parse_entities(),
+            urled=True,
+            utf_16_text=get_utf_16_text(self, "text"),
+        )
 
     @property
     def caption_html(self) -> str:
@@ -4791,7 +4783,12 @@ class Message(MaybeInaccessibleMessage):
         Returns:
             :obj:`str`: Message caption with caption entities formatted as HTML.
         """
-        return self._parse_html(self.caption, self.parse_caption_entities(), urled=False)
+        return self._parse_html(
+            self.caption,
+            self.parse_caption_entities(),
+            urled=False,
+            utf_16_text=get_utf_16_text(self, "caption"),
+        )
 
     @property
     def caption_html_urled(self) -> str:
@@ -4816,7 +4813,12 @@ class Message(MaybeInaccessibleMessage):
         Returns:
             :obj:`str`: Message caption with caption entities formatted as HTML.
         """
-        return self._parse_html(self.caption, self.parse_caption_entities(), urled=True)
+        return self._parse_html(
+            self.caption,
+            self.parse_caption_entities(),
+            urled=True,
+            utf_16_text=get_utf_16_text(self, "caption"),
+        )
 
     @classmethod
     def _parse_markdown(
@@ -4825,7 +4827,7 @@ class Message(MaybeInaccessibleMessage):
         entities: dict[MessageEntity, str],
         urled: bool = False,
         version: MarkdownVersion = 1,
-        offset: int = 0,
+        utf_16_text: Optional[bytes] = None,
     ) -> Optional[str]:
         if version == 1:
             for entity_type in (
@@ -4843,39 +4845,11 @@ class Message(MaybeInaccessibleMessage):
         if message_text is None:
             return None
 
-        utf_16_text = message_text.encode(TextEncoding.UTF_16_LE)
-        markdown_text = ""
-        last_offset = 0
-
-        sorted_entities = sorted(entities.items(), key=lambda item: item[0].offset)
-        parsed_entities = []
-
-        for entity, text in sorted_entities:
-            if entity in parsed_entities:
-                continue
-
-            nested_entities = {
-                e: t
-                for (e, t) in sorted_entities
-                if e.offset >= entity.offset
-                and e.offset + e.length <= entity.offset + entity.length
-                and e != entity
-            }
-            parsed_entities.extend(list(nested_entities.keys()))
-
-            if nested_entities:
-                if version < 2:
-                    raise ValueError("Nested entities are not supported for Markdown version 1")
-
-                escaped_text = cls._parse_markdown(
-                    text,
-                    nested_entities,
-                    urled=urled,
-                    offset=entity.offset,
-                    version=version,
-                )
-            else:
-                escaped_text = escape_markdown(text, version=version)
+        def render_entity(
+            entity: MessageEntity, escaped_text: str, text: str, nested: bool
+        ) -> str:
+            if nested and version < 2:
+                raise ValueError("Nested entities are not supported for Markdown version 1")
 
             if entity.type == MessageEntity.TEXT_LINK:
                 if version == 1:
@@ -4885,20 +4859,20 @@ class Message(MaybeInaccessibleMessage):
                     url = escape_markdown(
                         entity.url, version=version, entity_type=MessageEntity.TEXT_LINK
                     )
-                insert = f"[{escaped_text}]({url})"
-            elif entity.type == MessageEntity.TEXT_MENTION and entity.user:
-                insert = f"[{escaped_text}](tg://user?id={entity.user.id})"
-            elif entity.type == MessageEntity.URL and urled:
+                return f"[{escaped_text}]({url})"
+            if entity.type == MessageEntity.TEXT_MENTION and entity.user:
+                return f"[{escaped_text}](tg://user?id={entity.user.id})"
+            if entity.type == MessageEntity.URL and urled:
                 link = text if version == 1 else escaped_text
-                insert = f"[{link}]({text})"
-            elif entity.type == MessageEntity.BOLD:
-                insert = f"*{escaped_text}*"
-            elif entity.type == MessageEntity.ITALIC:
-                insert = f"_{escaped_text}_"
-            elif entity.type == MessageEntity.CODE:
+                return f"[{link}]({text})"
+            if entity.type == MessageEntity.BOLD:
+                return f"*{escaped_text}*"
+            if entity.type == MessageEntity.ITALIC:
+                return f"_{escaped_text}_"
+            if entity.type == MessageEntity.CODE:
                 # Monospace needs special escaping. Also can't have entities nested within
-                insert = f"`{escape_markdown(text, version, MessageEntity.CODE)}`"
-            elif entity.type == MessageEntity.PRE:
+                return f"`{escape_markdown(text, version, MessageEntity.CODE)}`"
+            if entity.type == MessageEntity.PRE:
                 # Monospace needs special escaping. Also can't have entities nested within
                 code = escape_markdown(text, version=version, entity_type=MessageEntity.PRE)
                 if entity.language:
@@ -4907,18 +4881,19 @@ class Message(MaybeInaccessibleMessage):
                     prefix = "```"
                 else:
                     prefix = "```\n"
-                insert = f"{prefix}{code}```"
-            elif entity.type == MessageEntity.UNDERLINE:
-                insert = f"__{escaped_text}__"
-            elif entity.type == MessageEntity.STRIKETHROUGH:
-                insert = f"~{escaped_text}~"
-            elif entity.type == MessageEntity.SPOILER:
-                insert = f"||{escaped_text}||"
-            elif entity.type in (MessageEntity.BLOCKQUOTE, MessageEntity.EXPANDABLE_BLOCKQUOTE):
+                return f"{prefix}{code}```"
+            if entity.type == MessageEntity.UNDERLINE:
+                return f"__{escaped_text}__"
+            if entity.type == MessageEntity.STRIKETHROUGH:
+                return f"~{escaped_text}~"
+            if entity.type == MessageEntity.SPOILER:
+                return f"||{escaped_text}||"
+            if entity.type in (MessageEntity.BLOCKQUOTE, MessageEntity.EXPANDABLE_BLOCKQUOTE):
                 insert = ">" + "\n>".join(escaped_text.splitlines())
                 if entity.type == MessageEntity.EXPANDABLE_BLOCKQUOTE:
                     insert = f"{insert}||"
-            elif entity.type == MessageEntity.CUSTOM_EMOJI:
+                return insert
+            if entity.type == MessageEntity.CUSTOM_EMOJI:
                 # This should never be needed because ids are numeric but the documentation
                 # specifically mentions it so here we are
                 custom_emoji_id = escape_markdown(
@@ -4926,33 +4901,19 @@ class Message(MaybeInaccessibleMessage):
                     version=version,
                     entity_type=MessageEntity.CUSTOM_EMOJI,
                 )
-                insert = f"![{escaped_text}](tg://emoji?id={custom_emoji_id})"
-            else:
-                insert = escaped_text
-
-            # Make sure to escape the text that is not part of the entity
-            # if we're in a nested entity, this is still required, since in that case this
-            # text is part of the parent entity
-            markdown_text += (
-                escape_markdown(
-                    utf_16_text[last_offset * 2 : (entity.offset - offset) * 2].decode(
-                        TextEncoding.UTF_16_LE
-                    ),
-                    version=version,
-                )
-                + insert
-            )
-
-            last_offset = entity.offset - offset + entity.length
-
-        # see comment above
-        markdown_text += escape_markdown(
-            utf_16_text[last_offset * 2 :].decode(TextEncoding.UTF_16_LE),
-            version=version,
+                return f"![{escaped_text}](tg://emoji?id={custom_emoji_id})"
+            return escaped_text
+
+        # The text that is not part of an entity is escaped as well. For nested entities, this
+        # is still required, since in that case this text is part of the parent entity.
+        return render_message_entities(
+            message_text,
+            entities,
+            functools.partial(escape_markdown, version=version),
+            render_entity,
+            utf_16_text=utf_16_text,
         )
 
-        return markdown_text
-
     @property
     def text_markdown(self) -> str:
         """Creates an Markdown-formatted string from the markup entities found in the message
@@ -4982,7 +4943,12 @@ class Message(MaybeInaccessibleMessage):
                 blockquote or nested entities.
 
         """
-        return self._parse_markdown(self.text, self.parse_entities(), urled=False)
+        return self._parse_markdown(
+            self.text,
+            self.parse_entities(),
+            urled=False,
+            utf_16_text=get_utf_16_text(self, "text"),
+        )
 
     @property
     def text_markdown_v2(self) -> str:
@@ -5007,7 +4973,13 @@ class Message(MaybeInaccessibleMessage):
         Returns:
             :obj:`str`: Message text with entities formatted as Markdown.
         """
-        return self._parse_markdown(self.text, self.parse_entities(), urled=False, version=2)
+        return self._parse_markdown(
+            self.text,
+            self.parse_entities(),
+            urled=False,
+            version=2,
+            utf_16_text=get_utf_16_text(self, "text"),
+        )
 
     @property
     def text_markdown_urled(self) -> str:
@@ -5039,7 +5011,12 @@ class Message(MaybeInaccessibleMessage):
                 blockquote or nested entities.
 
         """
-        return self._parse_markdown(self.text, self.parse_entities(), urled=True)
+        return self._parse_markdown(
+            self.text,
+            self.parse_entities(),
+            urled=True,
+            utf_16_text=get_utf_16_text(self, "text"),
+        )
 
     @property
     def text_markdown_v2_urled(self) -> str:
@@ -5064,7 +5041,13 @@ class Message(MaybeInaccessibleMessage):
         Returns:
             :obj:`str`: Message text with entities formatted as Markdown.
         """
-        return self._parse_markdown(self.text, self.parse_entities(), urled=True, version=2)
+        return self._parse_markdown(
+            self.text,
+            self.parse_entities(),
+            urled=True,
+            version=2,
+            utf_16_text=get_utf_16_text(self, "text"),
+        )
 
     @property
     def caption_markdown(self) -> str:
@@ -5094,7 +5077,12 @@ class Message(MaybeInaccessibleMessage):
                 blockquote or nested entities.
 
         """
-        return self._parse_markdown(self.caption, self.parse_caption_entities(), urled=False)
+        return self._parse_markdown(
+            self.caption,
+            self.parse_caption_entities(),
+            urled=False,
+            utf_16_text=get_utf_16_text(self, "caption"),
+        )
 
     @property
     def caption_markdown_v2(self) -> str:
@@ -5120,7 +5108,11 @@ class Message(MaybeInaccessibleMessage):
             :obj:`str`: Message caption with caption entities formatted as Markdown.
         """
         return self._parse_markdown(
-            self.caption, self.parse_caption_entities(), urled=False, version=2
+            self.caption,
+            self.parse_caption_entities(),
+            urled=False,
+            version=2,
+            utf_16_text=get_utf_16_text(self, "caption"),
         )
 
     @property
@@ -5153,7 +5145,12 @@ class Message(MaybeInaccessibleMessage):
                 blockquote or nested entities.
 
         """
-        return self._parse_markdown(self.caption, self.parse_caption_entities(), urled=True)
+        return self._parse_markdown(
+            self.caption,
+            self.parse_caption_entities(),
+            urled=True,
+            utf_16_text=get_utf_16_text(self, "caption"),
+        )
 
     @property
     def caption_markdown_v2_urled(self) -> str:
@@ -5179,5 +5176,9 @@ class Message(MaybeInaccessibleMessage):
             :obj:`str`: Message caption with caption entities formatted as Markdown.
         """
         return self._parse_markdown(
-            self.caption, self.parse_caption_entities(), urled=True, version=2
+            self.caption,
+            self.parse_caption_entities(),
+            urled=True,
+            version=2,
+            utf_16_text=get_utf_16_text(self, "caption"),
         )
@@ -19,7 +19,7 @@
 """This module contains an object that represents a Telegram Poll."""
 import datetime as dtm
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, Final, Optional
+from typing import TYPE_CHECKING, ClassVar, Final, Optional
 
 from telegram import constants
 from telegram._chat import Chat
@@ -30,7 +30,11 @@ from telegram._utils import enum
 from telegram._utils.argumentparsing import de_json_optional, de_list_optional, parse_sequence_arg
 from telegram._utils.datetime import extract_tzinfo_from_defaults, from_timestamp
 from telegram._utils.defaultvalue import DEFAULT_NONE
-from telegram._utils.entities import parse_message_entities, parse_message_entity
+from telegram._utils.entities import (
+    get_utf_16_text,
+    parse_message_entities,
+    parse_message_entity,
+)
 from telegram._utils.types import JSONDict, ODVInput
 
 if TYPE_CHECKING:
@@ -401,6 +405,8 @@ class Poll(TelegramObject):
     """
 
     __slots__ = (
+        "_utf_16_explanation",
+        "_utf_16_question",
         "allows_multiple_answers",
         "close_date",
         "correct_option_id",
@@ -417,6 +423,11 @@ class Poll(TelegramObject):
         "type",
     )
 
+    # The UTF-16 encodings cached by `telegram._utils.entities.get_utf_16_text`
+    _CACHE_ATTRIBUTES: ClassVar[frozenset[str]] = frozenset(
+        ("_utf_16_explanation", "_utf_16_question")
+    )
+
     def __init__(
         self,
         id: str,  # pylint: disable=redefined-builtin
@@ -454,6 +465,10 @@ class Poll(TelegramObject):
         self.close_date: Optional[dtm.datetime] = close_date
         self.question_entities: tuple[MessageEntity, ...] = parse_sequence_arg(question_entities)
 
+        # Caches for `telegram._utils.entities.get_utf_16_text`
+        self._utf_16_question: object = DEFAULT_NONE
+        self._utf_16_explanation: object = DEFAULT_NONE
+
         self._id_attrs = (self.id,)
 
         self._freeze()
@@ -500,7 +515,7 @@ class Poll(TelegramObject):
         if not self.explanation:
             raise RuntimeError("This Poll has no 'explanation'.")
 
-        return parse_message_entity(self.explanation, entity)
+        return parse_message_entity(self.explanation, entity, get_utf_16_text(self, "explanation"))
 
     def parse_explanation_entities(
         self, types: Optional[list[str]] = None
@@ -531,7 +546,12 @@ class Poll(TelegramObject):
         if not self.explanation:
             raise RuntimeError("This Poll has no 'explanation'.")
 
-        return parse_message_entities(self.explanation, self.explanation_entities, types)
+        return parse_message_entities(
+            self.explanation,
+            self.explanation_entities,
+            types,
+            utf_16_text=get_utf_16_text(self, "explanation"),
+        )
 
     def parse_question_entity(self, entity: MessageEntity) -> str:
         """Returns the text in :attr:`question` from a given :class:`telegram.MessageEntity` of
@@ -551,7 +571,7 @@ class Poll(TelegramObject):
         Returns:
             :obj:`str`: The text of the given entity.
         """
-        return parse_message_entity(self.question, entity)
+        return parse_message_entity(self.question, entity, get_utf_16_text(self, "question"))
 
     def parse_question_entities(
         self, types: Optional[list[str]] = None
@@ -578,7 +598,12 @@ class Poll(TelegramObject):
             the text that belongs to them, calculated based on UTF-16 codepoints.
 
         """
-        return parse_message_entities(self.question, self.question_entities, types)
+        return parse_message_entities(
+            self.question,
+            self.question_entities,
+            types,
+            utf_16_text=get_utf_16_text(self, "question"),
+        )
 
     REGULAR: Final[str] = constants.PollType.REGULAR
     """:const:`telegram.constants.PollType.REGULAR`"""
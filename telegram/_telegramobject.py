@@ -78,6 +78,10 @@ class TelegramObject:
 
     __slots__ = ("_bot", "_frozen", "_id_attrs", "api_kwargs")
 
+    # Names of private attributes that only cache values computed from other attributes. They are
+    # neither pickled nor deep-copied, so they must be read with a default value.
+    _CACHE_ATTRIBUTES: ClassVar[frozenset[str]] = frozenset()
+
     # Used to cache the names of the parameters of the __init__ method of the class
     # Must be a private attribute to avoid name clashes between subclasses
     __INIT_PARAMS: ClassVar[set[str]] = set()
@@ -264,6 +268,8 @@ class TelegramObject:
         # MappingProxyType is not pickable, so we convert it to a dict and revert in
         # __setstate__
         out["api_kwargs"] = dict(self.api_kwargs)
+        for key in self._CACHE_ATTRIBUTES:
+            out.pop(key, None)
         return out
 
     def __setstate__(self, state: dict[str, object]) -> None:
@@ -351,8 +357,9 @@ class TelegramObject:
 
         # now we set the attributes in the deepcopied object
         for k in self._get_attrs_names(include_private=True):
-            if k == "_frozen":
-                # Setting the frozen status to True would prevent the attributes from being set
+            if k == "_frozen" or k in self._CACHE_ATTRIBUTES:
+                # Setting the frozen status to True would prevent the attributes from being set.
+                # Caches are not copied, since they can be computed again.
                 continue
             if k == "api_kwargs":
                 # Need to copy api_kwargs manually, since it's a MappingProxyType is not
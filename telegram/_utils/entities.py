@@ -24,30 +24,65 @@ Warning:
     the changelog.
 """
 from collections.abc import Sequence
-from typing import Optional
+from typing import Callable, Optional
 
 from telegram._messageentity import MessageEntity
 from telegram._utils.strings import TextEncoding
 
 
-def parse_message_entity(text: str, entity: MessageEntity) -> str:
+def get_utf_16_text(obj: object, name: str) -> Optional[bytes]:
+    """Returns the UTF-16-LE encoding of a text attribute of an object, e.g.
+    :attr:`telegram.Message.text`. The encoding is cached in the attribute ``_utf_16_<name>`` of
+    the object, so that the text is encoded only once, no matter how many entities are extracted.
+    The attribute may be missing, e.g. if the object was unpickled.
+
+    Args:
+        obj (:obj:`object`): The object. Should list ``_utf_16_<name>`` in its
+            ``_CACHE_ATTRIBUTES`` such that the cache is not pickled.
+        name (:obj:`str`): The name of the attribute that holds the text.
+
+    Returns:
+        :obj:`bytes` | :obj:`None`: The encoded text or :obj:`None`, if the attribute is not set.
+    """
+    if (text := getattr(obj, name)) is None:
+        return None
+
+    cache_name = f"_utf_16_{name}"
+    cached = getattr(obj, cache_name, None)
+    # The identity check makes sure that the cache is invalidated if the text was replaced
+    if isinstance(cached, tuple) and cached[0] is text:
+        return cached[1]
+    utf_16_text = text.encode(TextEncoding.UTF_16_LE)
+    setattr(obj, cache_name, (text, utf_16_text))
+    return utf_16_text
+
+
+def parse_message_entity(
+    text: str, entity: MessageEntity, utf_16_text: Optional[bytes] = None
+) -> str:
     """Returns the text from a given :class:`telegram.MessageEntity`.
 
     Args:
         text (:obj:`str`): The text to extract the entity from.
         entity (:class:`telegram.MessageEntity`): The entity to extract the text from.
+        utf_16_text (:obj:`bytes`, optional): The UTF-16-LE encoding of :paramref:`text`, if
+            already available.
 
     Returns:
         :obj:`str`: The text of the given entity.
     """
-    entity_text = text.encode(TextEncoding.UTF_16_LE)
-    entity_text = entity_text[entity.offset * 2 : (entity.offset + entity.length) * 2]
+    if utf_16_text is None:
+        utf_16_text = text.encode(TextEncoding.UTF_16_LE)
+    entity_text = utf_16_text[entity.offset * 2 : (entity.offset + entity.length) * 2]
 
     return entity_text.decode(TextEncoding.UTF_16_LE)
 
 
 def parse_message_entities(
-    text: str, entities: Sequence[MessageEntity], types: Optional[Sequence[str]] = None
+    text: str,
+    entities: Sequence[MessageEntity],
+    types: Optional[Sequence[str]] = None,
+    utf_16_text: Optional[bytes] = None,
 ) -> dict[MessageEntity, str]:
     """
     Returns a :obj:`dict` that maps :class:`telegram.MessageEntity` to :obj:`str`.
@@ -60,6 +95,8 @@ def parse_message_entities(
         types (list[:obj:`str`], optional): List of ``MessageEntity`` types as strings. If the
             ``type`` attribute of an entity is contained in this list, it will be returned.
             Defaults to :attr:`telegram.MessageEntity.ALL_TYPES`.
+        utf_16_text (:obj:`bytes`, optional): The UTF-16-LE encoding of :paramref:`text`, if
+            already available.
 
     Returns:
         dict[:class:`telegram.MessageEntity`, :obj:`str`]: A dictionary of entities mapped to
@@ -67,7 +104,86 @@ def parse_message_entities(
     """
     if types is None:
         types = MessageEntity.ALL_TYPES
+    if not entities:
+        return {}
 
+    # The text is encoded only once for all entities
+    if utf_16_text is None:
+        utf_16_text = text.encode(TextEncoding.UTF_16_LE)
     return {
-        entity: parse_message_entity(text, entity) for entity in entities if entity.type in types
+        entity: utf_16_text[entity.offset * 2 : (entity.offset + entity.length) * 2].decode(
+            TextEncoding.UTF_16_LE
+        )
+        for entity in entities
+        if entity.type in types
     }
+
+
+def render_message_entities(
+    text: str,
+    entities: dict[MessageEntity, str],
+    escape: Callable[[str], str],
+    render_entity: Callable[[MessageEntity, str, str, bool], str],
+    utf_16_text: Optional[bytes] = None,
+) -> str:
+    """Formats a text with the given entities, e.g. as HTML.
+
+    The entities are processed in a single pass in the order of their offsets, keeping the
+    entities that contain the current position on a stack. Entities that are contained in another
+    entity are rendered within that entity. Of entities with the same offset, the longer one
+    encloses the shorter ones. Of entities with identical spans, the one that comes first in
+    :paramref:`entities` encloses the others. The text is encoded to UTF-16 only once.
+
+    Args:
+        text (:obj:`str`): The text to format.
+        entities (dict[:class:`telegram.MessageEntity`, :obj:`str`]): The entities mapped to the
+            text that belongs to them, as returned by :func:`parse_message_entities`.
+        escape (Callable[[:obj:`str`], :obj:`str`]): Escapes the parts of the text that are not
+            formatted by an entity.
+        render_entity (Callable[[:class:`telegram.MessageEntity`, :obj:`str`, :obj:`str`, \
+            :obj:`bool`], :obj:`str`]): Formats an entity. Receives the entity, its escaped and
+            already formatted content, the text that belongs to it and whether it contains
+            other entities.
+        utf_16_text (:obj:`bytes`, optional): The UTF-16-LE encoding of :paramref:`text`, if
+            already available.
+
+    Returns:
+        :obj:`str`: The formatted text.
+    """
+    if utf_16_text is None:
+        utf_16_text = text.encode(TextEncoding.UTF_16_LE)
+    parts: list[str] = []
+    # Each entry holds an entity, the parts of the enclosing entity and whether the entity
+    # contains other entities
+    stack: list[tuple[MessageEntity, list[str], list[bool]]] = []
+    position = 0
+
+    def close_entity() -> None:
+        nonlocal parts, position
+        entity, outer_parts, nested = stack.pop()
+        end = entity.offset + entity.length
+        parts.append(escape(utf_16_text[position * 2 : end * 2].decode(TextEncoding.UTF_16_LE)))
+        position = end
+        outer_parts.append(render_entity(entity, "".join(parts), entities[entity], nested[0]))
+        parts = outer_parts
+
+    # For entities with the same offset, the enclosing one comes first
+    for entity in sorted(entities, key=lambda item: (item.offset, -item.length)):
+        end = entity.offset + entity.length
+        while stack and end > stack[-1][0].offset + stack[-1][0].length:
+            close_entity()
+        if stack:
+            stack[-1][2][0] = True
+
+        parts.append(
+            escape(utf_16_text[position * 2 : entity.offset * 2].decode(TextEncoding.UTF_16_LE))
+        )
+        position = entity.offset
+        stack.append((entity, parts, [False]))
+        parts = []
+
+    while stack:
+        close_entity()
+    parts.append(escape(utf_16_text[position * 2 :].decode(TextEncoding.UTF_16_LE)))
+
+    return "".join(parts)
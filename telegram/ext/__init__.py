@@ -23,12 +23,16 @@ __all__ = (
     "Application",
     "ApplicationBuilder",
     "ApplicationHandlerStop",
+    "ApplicationMetrics",
     "BaseHandler",
     "BasePersistence",
     "BaseRateLimiter",
     "BaseUpdateProcessor",
+    "BatchHandler",
+    "BoundedUpdateQueue",
     "BusinessConnectionHandler",
     "BusinessMessagesDeletedHandler",
+    "CPUBoundCallback",
     "CallbackContext",
     "CallbackDataCache",
     "CallbackQueryHandler",
@@ -41,11 +45,15 @@ __all__ = (
     "ConversationHandler",
     "Defaults",
     "DictPersistence",
+    "DurationStatistics",
     "ExtBot",
+    "HandlerStatistics",
     "InlineQueryHandler",
     "InvalidCallbackData",
     "Job",
     "JobQueue",
+    "KeyedUpdateProcessor",
+    "LoadSheddingPolicy",
     "MessageHandler",
     "MessageReactionHandler",
     "PaidMediaPurchasedHandler",
@@ -55,11 +63,16 @@ __all__ = (
     "PollHandler",
     "PreCheckoutQueryHandler",
     "PrefixHandler",
+    "PriorityUpdateProcessor",
+    "RateLimiterSimulator",
+    "RateLimiterStatistics",
+    "ShardedApplication",
     "ShippingQueryHandler",
     "SimpleUpdateProcessor",
     "StringCommandHandler",
     "StringRegexHandler",
     "TypeHandler",
+    "UpdateDeduplicator",
     "Updater",
     "filters",
 )
@@ -68,16 +81,20 @@ from . import filters
 from ._aioratelimiter import AIORateLimiter
 from ._application import Application, ApplicationHandlerStop
 from ._applicationbuilder import ApplicationBuilder
+from ._applicationmetrics import ApplicationMetrics, DurationStatistics, HandlerStatistics
 from ._basepersistence import BasePersistence, PersistenceInput
-from ._baseratelimiter import BaseRateLimiter
+from ._baseratelimiter import BaseRateLimiter, RateLimiterStatistics
 from ._baseupdateprocessor import BaseUpdateProcessor, SimpleUpdateProcessor
+from ._boundedupdatequeue import BoundedUpdateQueue
 from ._callbackcontext import CallbackContext
 from ._callbackdatacache import CallbackDataCache, InvalidCallbackData
 from ._contexttypes import ContextTypes
+from ._cpuboundcallback import CPUBoundCallback
 from ._defaults import Defaults
 from ._dictpersistence import DictPersistence
 from ._extbot import ExtBot
 from ._handlers.basehandler import BaseHandler
+from ._handlers.batchhandler import BatchHandler
 from ._handlers.businessconnectionhandler import BusinessConnectionHandler
 from ._handlers.businessmessagesdeletedhandler import BusinessMessagesDeletedHandler
 from ._handlers.callbackqueryhandler import CallbackQueryHandler
@@ -100,5 +117,11 @@ from ._handlers.stringcommandhandler import StringCommandHandler
 from ._handlers.stringregexhandler import StringRegexHandler
 from ._handlers.typehandler import TypeHandler
 from ._jobqueue import Job, JobQueue
+from ._keyedupdateprocessor import KeyedUpdateProcessor
+from ._loadsheddingpolicy import LoadSheddingPolicy
 from ._picklepersistence import PicklePersistence
+from ._priorityupdateprocessor import PriorityUpdateProcessor
+from ._ratelimitersimulator import RateLimiterSimulator
+from ._shardedapplication import ShardedApplication
+from ._updatededuplicator import UpdateDeduplicator
 from ._updater import Updater
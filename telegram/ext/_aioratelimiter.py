@@ -36,7 +36,7 @@ from telegram import constants
 from telegram._utils.logging import get_logger
 from telegram._utils.types import JSONDict
 from telegram.error import RetryAfter
-from telegram.ext._baseratelimiter import BaseRateLimiter
+from telegram.ext._baseratelimiter import BaseRateLimiter, RateLimiterStatistics
 
 # Useful for something like:
 #    async with group_limiter if group else null_context():
@@ -109,6 +109,12 @@ class AIORateLimiter(BaseRateLimiter[int]):
         welcome you to implement your own subclass of :class:`~telegram.ext.BaseRateLimiter`.
         Feel free to check out the source code of this class for inspiration.
 
+    Tip:
+        Use :attr:`statistics` to monitor how long requests wait and how often a
+        :exc:`~telegram.error.RetryAfter` was raised. To tune the parameters of this class before
+        deploying, :class:`~telegram.ext.RateLimiterSimulator` can be used to run synthetic
+        traffic through it.
+
     .. seealso:: :wiki:`Avoiding Flood Limits <Avoiding-flood-limits>`
 
     .. versionadded:: 20.0
@@ -141,6 +147,7 @@ class AIORateLimiter(BaseRateLimiter[int]):
         "_group_time_period",
         "_max_retries",
         "_retry_after_event",
+        "_statistics",
     )
 
     def __init__(
@@ -177,6 +184,18 @@ class AIORateLimiter(BaseRateLimiter[int]):
         self._max_retries: int = max_retries
         self._retry_after_event = asyncio.Event()
         self._retry_after_event.set()
+        self._statistics = RateLimiterStatistics()
+
+    @property
+    def statistics(self) -> RateLimiterStatistics:
+        """:class:`telegram.ext.RateLimiterStatistics`: Runtime statistics of this rate limiter.
+        Requests to the Bot API that are sent without a ``chat_id`` or to a private chat are
+        listed in :attr:`~telegram.ext.RateLimiterStatistics.queue_depths` under the key
+        :obj:`None`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._statistics
 
     async def initialize(self) -> None:
         """Does nothing."""
@@ -271,29 +290,49 @@ class AIORateLimiter(BaseRateLimiter[int]):
             # We can't really tell channels from groups though ...
             group = chat_id
 
-        for i in range(max_retries + 1):
-            try:
-                return await self._run_request(
-                    chat=chat,
-                    group=group,
-                    allow_paid_broadcast=allow_paid_broadcast,
-                    callback=callback,
-                    args=args,
-                    kwargs=kwargs,
-                )
-            except RetryAfter as exc:
-                if i == max_retries:
-                    _LOGGER.exception(
-                        "Rate limit hit after maximum of %d retries", max_retries, exc_info=exc
+        statistics_group = group if group is not False else None
+        received_at = self._statistics.request_received(statistics_group)
+        started = False
+
+        async def tracked_callback(
+            *cb_args: Any, **cb_kwargs: Any
+        ) -> Union[bool, JSONDict, list[JSONDict]]:
+            nonlocal started
+            if not started:
+                started = True
+                self._statistics.request_started(received_at, statistics_group)
+            return await callback(*cb_args, **cb_kwargs)
+
+        try:
+            for i in range(max_retries + 1):
+                try:
+                    return await self._run_request(
+                        chat=chat,
+                        group=group,
+                        allow_paid_broadcast=allow_paid_broadcast,
+                        callback=tracked_callback,
+                        args=args,
+                        kwargs=kwargs,
                     )
-                    raise
-
-                sleep = exc.retry_after + 0.1
-                _LOGGER.info("Rate limit hit. Retrying after %f seconds", sleep)
-                # Make sure we don't allow other requests to be processed
-                self._retry_after_event.clear()
-                await asyncio.sleep(sleep)
-            finally:
-                # Allow other requests to be processed
-                self._retry_after_event.set()
+                except RetryAfter as exc:
+                    self._statistics.retry_after_received()
+                    if i == max_retries:
+                        _LOGGER.exception(
+                            "Rate limit hit after maximum of %d retries",
+                            max_retries,
+                            exc_info=exc,
+                        )
+                        raise
+
+                    sleep = exc.retry_after + 0.1
+                    _LOGGER.info("Rate limit hit. Retrying after %f seconds", sleep)
+                    # Make sure we don't allow other requests to be processed
+                    self._retry_after_event.clear()
+                    await asyncio.sleep(sleep)
+                    self._statistics.request_retried()
+                finally:
+                    # Allow other requests to be processed
+                    self._retry_after_event.set()
+        finally:
+            self._statistics.request_finished(started, statistics_group)
         return None  # type: ignore[return-value]
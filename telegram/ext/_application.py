@@ -20,13 +20,19 @@
 
 import asyncio
 import contextlib
+import contextvars
+import functools
 import inspect
 import itertools
+import multiprocessing
 import platform
 import signal
 import sys
-from collections import defaultdict
+import time
+from collections import Counter, defaultdict
 from collections.abc import Awaitable, Coroutine, Generator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from copy import deepcopy
 from pathlib import Path
 from types import MappingProxyType, TracebackType
@@ -45,12 +51,20 @@ from telegram._utils.repr import build_repr_with_selected_attrs
 from telegram._utils.types import SCT, DVType, ODVInput
 from telegram._utils.warnings import warn
 from telegram.error import TelegramError
-from telegram.ext._basepersistence import BasePersistence
+from telegram.ext._applicationmetrics import ApplicationMetrics
+from telegram.ext._basepersistence import BasePersistence, PersistenceInput
+from telegram.ext._callbackcontext import CallbackContext
 from telegram.ext._contexttypes import ContextTypes
 from telegram.ext._extbot import ExtBot
 from telegram.ext._handlers.basehandler import BaseHandler
+from telegram.ext._loadsheddingpolicy import LoadSheddingPolicy
 from telegram.ext._updater import Updater
+from telegram.ext._utils.asyncio import TrackedBoundedSemaphore
+from telegram.ext._utils.filtercompiler import cache_filter_results
+from telegram.ext._utils.handlerindex import HandlerIndex, get_update_kind
+from telegram.ext._utils.objectcache import cache_object_data
 from telegram.ext._utils.stack import was_called_by
+from telegram.ext._utils.threadpool import TrackedThreadPoolExecutor
 from telegram.ext._utils.trackingdict import TrackingDict
 from telegram.ext._utils.types import BD, BT, CCT, CD, JQ, RT, UD, ConversationKey, HandlerCallback
 from telegram.warnings import PTBDeprecationWarning
@@ -59,7 +73,7 @@ if TYPE_CHECKING:
     from socket import socket
 
     from telegram import Message
-    from telegram.ext import ConversationHandler, JobQueue
+    from telegram.ext import ConversationHandler, JobQueue, UpdateDeduplicator
     from telegram.ext._applicationbuilder import InitApplicationBuilder
     from telegram.ext._baseupdateprocessor import BaseUpdateProcessor
     from telegram.ext._jobqueue import Job
@@ -69,6 +83,9 @@ DEFAULT_GROUP: int = 0
 _AppType = TypeVar("_AppType", bound="Application")  # pylint: disable=invalid-name
 _STOP_SIGNAL = object()
 _DEFAULT_0 = DefaultValue(0)
+_NO_DATA_TO_REFRESH = PersistenceInput(
+    bot_data=False, chat_data=False, user_data=False, callback_data=False
+)
 
 # Since python 3.12, the coroutine passed to create_task should not be an (async) generator. Remove
 # this check when we drop support for python 3.11.
@@ -237,6 +254,7 @@ class Application(
     __slots__ = (
         (
             "__create_task_tasks",
+            "__queued_tasks",
             "__update_fetcher_task",
             "__update_persistence_event",
             "__update_persistence_lock",
@@ -246,10 +264,25 @@ class Application(
             "_chat_ids_to_be_deleted_in_persistence",
             "_chat_ids_to_be_updated_in_persistence",
             "_conversation_handler_conversations",
+            "_data_to_refresh",
+            "_handler_index",
             "_initialized",
             "_job_queue",
+            "_load_shedding_policies",
+            "_max_concurrent_tasks",
+            "_max_pending_cpu_tasks",
+            "_max_queued_tasks",
+            "_metrics",
+            "_pending_task_names",
+            "_process_pool",
+            "_process_pool_semaphore",
+            "_process_pool_size",
             "_running",
+            "_task_semaphore",
+            "_thread_pool",
+            "_thread_pool_size",
             "_update_processor",
+            "_updates_in_progress",
             "_user_data",
             "_user_ids_to_be_deleted_in_persistence",
             "_user_ids_to_be_updated_in_persistence",
@@ -292,6 +325,13 @@ class Application(
         post_stop: Optional[
             Callable[["Application[BT, CCT, UD, CD, BD, JQ]"], Coroutine[Any, Any, None]]
         ],
+        thread_pool_size: Optional[int] = None,
+        process_pool_size: Optional[int] = None,
+        max_pending_cpu_tasks: Optional[int] = None,
+        metrics: Optional[ApplicationMetrics] = None,
+        load_shedding_policies: Optional[Sequence[LoadSheddingPolicy]] = None,
+        max_concurrent_tasks: Optional[int] = None,
+        max_queued_tasks: Optional[int] = None,
     ):
         if not was_called_by(
             inspect.currentframe(), Path(__file__).parent.resolve() / "_applicationbuilder.py"
@@ -306,6 +346,8 @@ class Application(
         self.context_types: ContextTypes[CCT, UD, CD, BD] = context_types
         self.updater: Optional[Updater] = updater
         self.handlers: dict[int, list[BaseHandler[Any, CCT, Any]]] = {}
+        # Allows to skip handlers that can't handle the kind of the update at hand
+        self._handler_index = HandlerIndex()
         self.error_handlers: dict[
             HandlerCallback[object, CCT, None], Union[bool, DefaultValue[bool]]
         ] = {}
@@ -319,6 +361,34 @@ class Application(
             Callable[[Application[BT, CCT, UD, CD, BD, JQ]], Coroutine[Any, Any, None]]
         ] = post_stop
         self._update_processor = update_processor
+        if thread_pool_size is not None and thread_pool_size < 1:
+            raise ValueError("`thread_pool_size` must be a positive integer!")
+        self._thread_pool_size: Optional[int] = thread_pool_size
+        self._thread_pool: Optional[TrackedThreadPoolExecutor] = None
+        if process_pool_size is not None and process_pool_size < 1:
+            raise ValueError("`process_pool_size` must be a positive integer!")
+        if max_pending_cpu_tasks is not None and max_pending_cpu_tasks < 1:
+            raise ValueError("`max_pending_cpu_tasks` must be a positive integer!")
+        self._process_pool_size: Optional[int] = process_pool_size
+        self._max_pending_cpu_tasks: Optional[int] = max_pending_cpu_tasks or (
+            2 * process_pool_size if process_pool_size else None
+        )
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_pool_semaphore: Optional[TrackedBoundedSemaphore] = None
+        self._metrics: Optional[ApplicationMetrics] = metrics
+        self._load_shedding_policies: tuple[LoadSheddingPolicy, ...] = tuple(
+            load_shedding_policies or ()
+        )
+        if max_concurrent_tasks is not None and max_concurrent_tasks < 1:
+            raise ValueError("`max_concurrent_tasks` must be a positive integer!")
+        if max_queued_tasks is not None:
+            if max_queued_tasks < 0:
+                raise ValueError("`max_queued_tasks` must be a non-negative integer!")
+            if max_concurrent_tasks is None:
+                raise ValueError("`max_queued_tasks` requires `max_concurrent_tasks` to be set!")
+        self._max_concurrent_tasks: Optional[int] = max_concurrent_tasks
+        self._max_queued_tasks: Optional[int] = max_queued_tasks
+        self._task_semaphore: Optional[TrackedBoundedSemaphore] = None
         self.bot_data: BD = self.context_types.bot_data()
         self._user_data: defaultdict[int, UD] = defaultdict(self.context_types.user_data)
         self._chat_data: defaultdict[int, CD] = defaultdict(self.context_types.chat_data)
@@ -343,6 +413,9 @@ class Application(
             str, TrackingDict[ConversationKey, object]
         ] = {}
 
+        # Caches which of the refresh_* methods of the persistence actually do something
+        self._data_to_refresh: Optional[tuple[BasePersistence, PersistenceInput]] = None
+
         # A number of low-level helpers for the internal logic
         self._initialized = False
         self._running = False
@@ -352,7 +425,12 @@ class Application(
         self.__update_persistence_event = asyncio.Event()
         self.__update_persistence_lock = asyncio.Lock()
         self.__create_task_tasks: set[asyncio.Task] = set()  # Used for awaiting tasks upon exit
+        # Tasks created via `create_task` that wait for a free slot of `_task_semaphore`
+        self.__queued_tasks: set[asyncio.Task] = set()
+        self._pending_task_names: Counter[str] = Counter()
         self.__stop_running_marker = asyncio.Event()
+        # Updates that were taken from the update queue and are not yet processed
+        self._updates_in_progress = 0
 
     async def __aenter__(self: _AppType) -> _AppType:  # noqa: PYI019
         """|async_context_manager| :meth:`initializes <initialize>` the App.
@@ -442,6 +520,145 @@ class Application(
         """
         return self._update_processor
 
+    @property
+    def thread_pool_size(self) -> Optional[int]:
+        """:obj:`int`: Optional. The maximum number of threads that synchronous handler and job
+        callbacks are run in. :obj:`None` indicates that synchronous callbacks are called
+        directly in the event loop.
+
+        .. seealso:: :meth:`telegram.ext.ApplicationBuilder.thread_pool_size`,
+            :meth:`run_in_thread`
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._thread_pool_size
+
+    @property
+    def running_thread_pool_tasks(self) -> int:
+        """:obj:`int`: The number of functions that are currently being executed in the thread
+        pool. If this equals :attr:`thread_pool_size`, the thread pool is saturated.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._thread_pool.running_tasks if self._thread_pool else 0
+
+    @property
+    def pending_thread_pool_tasks(self) -> int:
+        """:obj:`int`: The number of functions that were submitted to the thread pool and are
+        waiting for a free thread.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._thread_pool.pending_tasks if self._thread_pool else 0
+
+    @property
+    def process_pool_size(self) -> Optional[int]:
+        """:obj:`int`: Optional. The number of worker processes that :meth:`run_cpu` uses.
+        :obj:`None` indicates that :meth:`run_cpu` is not available.
+
+        .. seealso:: :meth:`telegram.ext.ApplicationBuilder.process_pool_size`
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._process_pool_size
+
+    @property
+    def max_pending_cpu_tasks(self) -> Optional[int]:
+        """:obj:`int`: Optional. The maximum number of functions that may be submitted to the
+        process pool via :meth:`run_cpu` at the same time. Further calls of :meth:`run_cpu` wait
+        until one of those functions is finished.
+
+        .. seealso:: :meth:`telegram.ext.ApplicationBuilder.max_pending_cpu_tasks`
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._max_pending_cpu_tasks
+
+    @property
+    def pending_cpu_tasks(self) -> int:
+        """:obj:`int`: The number of functions that were submitted to the process pool via
+        :meth:`run_cpu` and are not yet finished.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        if self._process_pool_semaphore is None or self._max_pending_cpu_tasks is None:
+            return 0
+        return self._max_pending_cpu_tasks - self._process_pool_semaphore.current_value
+
+    @property
+    def metrics(self) -> Optional[ApplicationMetrics]:
+        """:class:`telegram.ext.ApplicationMetrics`: Optional. The metrics that this application
+        reports to. :obj:`None` indicates that no metrics are collected.
+
+        .. seealso:: :meth:`telegram.ext.ApplicationBuilder.metrics`
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._metrics
+
+    @property
+    def load_shedding_policies(self) -> tuple[LoadSheddingPolicy, ...]:
+        """tuple[:class:`telegram.ext.LoadSheddingPolicy`]: The policies that decide which
+        updates are shed when the application can't keep up with the incoming updates.
+
+        .. seealso:: :meth:`telegram.ext.ApplicationBuilder.load_shedding_policies`
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._load_shedding_policies
+
+    @property
+    def max_concurrent_tasks(self) -> Optional[int]:
+        """:obj:`int`: Optional. The maximum number of tasks created via :meth:`create_task` that
+        run at the same time while the application is running. This includes the tasks for
+        handlers and error handlers with ``block=False``. Further tasks wait for a free slot.
+        :obj:`None` indicates that the number of tasks is not limited.
+
+        Note:
+            If updates are processed concurrently (see :attr:`concurrent_updates`), this also
+            caps the number of updates that are processed at the same time. Instead of being
+            rejected due to :attr:`max_queued_tasks`, further updates stay in
+            :attr:`update_queue` until a slot is free.
+
+        .. seealso:: :meth:`telegram.ext.ApplicationBuilder.max_concurrent_tasks`
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._max_concurrent_tasks
+
+    @property
+    def max_queued_tasks(self) -> Optional[int]:
+        """:obj:`int`: Optional. The maximum number of tasks that may wait for a free slot if
+        :attr:`max_concurrent_tasks` tasks are already running. If this number is reached,
+        :meth:`create_task` rejects further tasks. :obj:`None` indicates that the number of
+        waiting tasks is not limited.
+
+        .. seealso:: :meth:`telegram.ext.ApplicationBuilder.max_queued_tasks`
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._max_queued_tasks
+
+    @property
+    def queued_tasks(self) -> int:
+        """:obj:`int`: The number of tasks created via :meth:`create_task` that wait for a free
+        slot because :attr:`max_concurrent_tasks` tasks are already running.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return len(self.__queued_tasks)
+
+    @property
+    def pending_tasks(self) -> dict[str, int]:
+        """dict[:obj:`str`, :obj:`int`]: The number of tasks created via :meth:`create_task` that
+        are not yet done, grouped by the name of the task. This includes tasks that wait for a
+        free slot. Tasks created without a name are counted together under the key
+        ``"<unnamed>"``.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return dict(self._pending_task_names)
+
     @staticmethod
     def _raise_system_exit() -> NoReturn:
         raise SystemExit
@@ -471,6 +688,10 @@ class Application(
         * The :attr:`persistence`, by loading persistent conversations and data.
         * The :attr:`update_processor` by calling
           :meth:`telegram.ext.BaseUpdateProcessor.initialize`.
+        * The thread pool for synchronous callbacks, if :attr:`thread_pool_size` is set.
+
+        .. versionchanged:: NEXT.VERSION
+            Creates the thread pool for synchronous callbacks.
 
         Does *not* call :attr:`post_init` - that is only done by :meth:`run_polling` and
         :meth:`run_webhook`.
@@ -484,6 +705,11 @@ class Application(
 
         await self.bot.initialize()
         await self._update_processor.initialize()
+        if self._thread_pool_size is not None:
+            self._thread_pool = TrackedThreadPoolExecutor(
+                max_workers=self._thread_pool_size,
+                thread_name_prefix=f"Application:{self.bot.id}",
+            )
 
         if self.updater:
             await self.updater.initialize()
@@ -519,6 +745,11 @@ class Application(
         * :attr:`persistence` by calling :meth:`update_persistence` and
           :meth:`BasePersistence.flush`
         * :attr:`update_processor` by calling :meth:`telegram.ext.BaseUpdateProcessor.shutdown`
+        * The thread pool for synchronous callbacks, if :attr:`thread_pool_size` is set. This
+          waits for all functions that were already submitted to the thread pool.
+
+        .. versionchanged:: NEXT.VERSION
+            Shuts down the thread pool for synchronous callbacks.
 
         Does *not* call :attr:`post_shutdown` - that is only done by :meth:`run_polling` and
         :meth:`run_webhook`.
@@ -536,6 +767,9 @@ class Application(
             _LOGGER.debug("This Application is already shut down. Returning.")
             return
 
+        if self._thread_pool:
+            thread_pool, self._thread_pool = self._thread_pool, None
+            await asyncio.to_thread(thread_pool.shutdown, wait=True)
         await self.bot.shutdown()
         await self._update_processor.shutdown()
 
@@ -587,6 +821,10 @@ class Application(
         * :attr:`job_queue`, if set.
         * a background task that calls :meth:`update_persistence` in regular intervals, if
           :attr:`persistence` is set.
+        * the process pool used by :meth:`run_cpu`, if :attr:`process_pool_size` is set.
+
+        .. versionchanged:: NEXT.VERSION
+            Starts the process pool used by :meth:`run_cpu`.
 
         Note:
             This does *not* start fetching updates from Telegram. To fetch updates, you need to
@@ -619,6 +857,15 @@ class Application(
                 )
                 _LOGGER.debug("Loop for updating persistence started")
 
+            if self._process_pool_size is not None:
+                self._process_pool_semaphore = TrackedBoundedSemaphore(
+                    self._max_pending_cpu_tasks  # type: ignore[arg-type]
+                )
+                self._start_process_pool()
+
+            if self._max_concurrent_tasks is not None:
+                self._task_semaphore = TrackedBoundedSemaphore(self._max_concurrent_tasks)
+
             if self._job_queue:
                 await self._job_queue.start()  # type: ignore[union-attr]
                 _LOGGER.debug("JobQueue started")
@@ -634,10 +881,14 @@ class Application(
 
     async def stop(self) -> None:
         """Stops the process after processing any pending updates or tasks created by
-        :meth:`create_task`. Also stops :attr:`job_queue`, if set.
+        :meth:`create_task`. Also stops :attr:`job_queue`, if set, and shuts down the process
+        pool used by :meth:`run_cpu`, if :attr:`process_pool_size` is set.
         Finally, calls :meth:`update_persistence` and :meth:`BasePersistence.flush` on
         :attr:`persistence`, if set.
 
+        .. versionchanged:: NEXT.VERSION
+            Shuts down the process pool used by :meth:`run_cpu`.
+
         Warning:
             Once this method is called, no more updates will be fetched from :attr:`update_queue`,
             even if it's not empty.
@@ -688,6 +939,13 @@ class Application(
 
         _LOGGER.debug("Waiting for `create_task` calls to be processed")
         await asyncio.gather(*self.__create_task_tasks, return_exceptions=True)
+        self._task_semaphore = None
+
+        if self._process_pool:
+            _LOGGER.debug("Shutting down the process pool")
+            process_pool, self._process_pool = self._process_pool, None
+            await asyncio.to_thread(process_pool.shutdown, wait=True)
+            _LOGGER.debug("Process pool shut down")
 
         # Make sure that this is the *last* step of stopping the application!
         if self.persistence and self.__update_persistence_task:
@@ -897,6 +1155,7 @@ class Application(
         stop_signals: ODVInput[Sequence[int]] = DEFAULT_NONE,
         secret_token: Optional[str] = None,
         unix: Optional[Union[str, Path, "socket"]] = None,
+        update_deduplicator: Optional["UpdateDeduplicator"] = None,
     ) -> None:
         """Convenience method that takes care of initializing and starting the app,
         listening for updates from Telegram using :meth:`telegram.ext.Updater.start_webhook` and
@@ -1011,6 +1270,13 @@ class Application(
                 .. versionadded:: 20.8
                 .. versionchanged:: 21.1
                     Added support to pass a socket instance itself.
+            update_deduplicator (:class:`telegram.ext.UpdateDeduplicator`, optional): If
+                passed, incoming updates whose :attr:`~telegram.Update.update_id` was already
+                received are dropped before they are parsed and put into the
+                :attr:`update_queue`. Useful if the handlers are slow to answer, which makes
+                Telegram deliver updates again.
+
+                .. versionadded:: NEXT.VERSION
         """
         if not self.updater:
             raise RuntimeError(
@@ -1032,6 +1298,7 @@ class Application(
                 max_connections=max_connections,
                 secret_token=secret_token,
                 unix=unix,
+                update_deduplicator=update_deduplicator,
             ),
             close_loop=close_loop,
             stop_signals=stop_signals,
@@ -1096,12 +1363,152 @@ class Application(
                 if close_loop:
                     loop.close()
 
+    async def run_in_thread(self, func: Callable[..., RT], /, *args: Any, **kwargs: Any) -> RT:
+        """Runs a synchronous function in a separate thread and returns its result. Use this for
+        blocking operations such as synchronous database queries or file I/O, which would
+        otherwise block the event loop.
+
+        If :attr:`thread_pool_size` is set, the function is run in the thread pool of this
+        application. Otherwise, the default executor of the event loop is used, just like
+        :func:`asyncio.to_thread` does. In both cases, the current :mod:`contextvars` context is
+        propagated to the thread.
+
+        Example:
+            .. code:: python
+
+                async def callback(update, context):
+                    rows = await context.application.run_in_thread(db.query, "SELECT ...")
+
+        .. seealso:: :meth:`telegram.ext.ApplicationBuilder.thread_pool_size`
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            func (:obj:`callable`): The function to run.
+            *args: Positional arguments for :paramref:`func`.
+            **kwargs: Keyword arguments for :paramref:`func`.
+
+        Returns:
+            The return value of :paramref:`func`.
+
+        Raises:
+            :exc:`RuntimeError`: If :attr:`thread_pool_size` is set and the application is not
+                initialized.
+        """
+        if self._thread_pool_size is not None:
+            self._check_initialized()
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            self._thread_pool, functools.partial(context.run, func, *args, **kwargs)
+        )
+
+    def _start_process_pool(self) -> None:
+        # The "fork" start method is unsafe in multithreaded programs, so we always use "spawn"
+        self._process_pool = ProcessPoolExecutor(
+            max_workers=self._process_pool_size, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    async def run_cpu(self, func: Callable[..., RT], /, *args: Any, **kwargs: Any) -> RT:
+        """Runs a CPU-bound function in a separate process and returns its result. Use this for
+        work like image processing or report generation that would otherwise block the event
+        loop and - due to the GIL - can't be sped up by running it in a thread.
+
+        At most :attr:`max_pending_cpu_tasks` functions are submitted to the process pool at the
+        same time. If that limit is reached, this method waits until one of those functions is
+        finished, which slows down the handlers producing the work. Exceptions raised by
+        :paramref:`func` are re-raised by this method, such that they are passed on to
+        :meth:`process_error` when this method is called within a handler or job callback.
+
+        Example:
+            .. code:: python
+
+                def make_thumbnail(data: bytes) -> bytes:
+                    # runs in a worker process
+                    ...
+
+                async def callback(update, context):
+                    file = await update.message.photo[-1].get_file()
+                    data = await file.download_as_bytearray()
+                    thumbnail = await context.application.run_cpu(make_thumbnail, bytes(data))
+                    await update.message.reply_photo(thumbnail)
+
+        Important:
+            The worker processes are started with the ``"spawn"`` start method. Therefore,
+            :paramref:`func` must be defined at the top level of an importable module, and all
+            arguments and the return value must be picklable.
+
+        .. seealso:: :meth:`telegram.ext.ApplicationBuilder.process_pool_size`,
+            :class:`telegram.ext.CPUBoundCallback`, :meth:`run_in_thread`
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            func (:obj:`callable`): The function to run.
+            *args: Positional arguments for :paramref:`func`.
+            **kwargs: Keyword arguments for :paramref:`func`.
+
+        Returns:
+            The return value of :paramref:`func`.
+
+        Raises:
+            :exc:`RuntimeError`: If :attr:`process_pool_size` is not set or if the application
+                is not running.
+        """
+        if self._process_pool is None or self._process_pool_semaphore is None:
+            raise RuntimeError(
+                "No process pool available. Make sure that `process_pool_size` is set and that "
+                "the Application is running."
+            )
+
+        semaphore = self._process_pool_semaphore
+        await semaphore.acquire()
+        loop = asyncio.get_running_loop()
+
+        def release(_: object) -> None:
+            # The slot is freed only once the function is finished in the worker process, even if
+            # the caller was cancelled in the meantime
+            with contextlib.suppress(RuntimeError):  # The event loop may already be closed
+                loop.call_soon_threadsafe(semaphore.release)
+
+        process_pool = self._process_pool
+        try:
+            future = process_pool.submit(func, *args, **kwargs)
+        except BaseException:
+            semaphore.release()
+            raise
+        future.add_done_callback(release)
+
+        try:
+            return await asyncio.wrap_future(future)
+        except BrokenProcessPool:
+            # A worker process died unexpectedly. Replace the pool such that the application can
+            # continue to offload work.
+            if self._process_pool is process_pool:
+                _LOGGER.warning("A worker process died unexpectedly. Starting a new process pool.")
+                process_pool.shutdown(wait=False)
+                self._start_process_pool()
+            raise
+
+    async def _run_sync_callback(self, callback: Callable[..., Any], *args: Any) -> Any:
+        """Runs a handler or job callback that is not a coroutine function. It's run in the thread
+        pool if one is configured and called directly otherwise. Awaitable return values are
+        awaited for backwards compatibility.
+        """
+        if self._thread_pool is not None:
+            result = await self.run_in_thread(callback, *args)
+        else:
+            result = callback(*args)
+        if inspect.isawaitable(result):
+            return await result
+        return result
+
     def create_task(
         self,
         coroutine: _CoroType[RT],
         update: Optional[object] = None,
         *,
         name: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> "asyncio.Task[RT]":
         """Thin wrapper around :func:`asyncio.create_task` that handles exceptions raised by
         the :paramref:`coroutine` with :meth:`process_error`.
@@ -1111,6 +1518,12 @@ class Application(
               this method even though it's handled by :meth:`process_error`.
             * If the application is currently running, tasks created by this method will be
               awaited with :meth:`stop`.
+            * If :attr:`max_concurrent_tasks` is set and the application is running, the
+              :paramref:`coroutine` is awaited only once one of the running tasks is done.
+              The number of tasks waiting for that is limited by :attr:`max_queued_tasks`.
+
+        .. versionchanged:: NEXT.VERSION
+            Respects :attr:`max_concurrent_tasks` and :attr:`max_queued_tasks`.
 
         .. seealso:: :wiki:`Concurrency`
 
@@ -1130,11 +1543,23 @@ class Application(
             name (:obj:`str`, optional): The name of the task.
 
                 .. versionadded:: 20.4
+            timeout (:obj:`float`, optional): The number of seconds after which
+                :paramref:`coroutine` is cancelled if it's not yet done. The time spent waiting for
+                a free slot doesn't count. In that case, :exc:`asyncio.TimeoutError` is handled
+                with :meth:`process_error` and set on the task.
+
+                .. versionadded:: NEXT.VERSION
 
         Returns:
             :class:`asyncio.Task`: The created task.
+
+        Raises:
+            :exc:`RuntimeError`: If :attr:`max_queued_tasks` tasks are already waiting for a free
+                slot. :paramref:`coroutine` is closed in this case.
+
+                .. versionadded:: NEXT.VERSION
         """
-        return self.__create_task(coroutine=coroutine, update=update, name=name)
+        return self.__create_task(coroutine=coroutine, update=update, name=name, timeout=timeout)
 
     def __create_task(
         self,
@@ -1142,17 +1567,48 @@ class Application(
         update: Optional[object] = None,
         is_error_handler: bool = False,
         name: Optional[str] = None,
+        timeout: Optional[float] = None,
+        slot_acquired: bool = False,
     ) -> "asyncio.Task[RT]":
+        # If `slot_acquired` is True, the caller already acquired a slot of `_task_semaphore`
+        # and the task only has to release it
+        semaphore = self._task_semaphore
+        if semaphore is not None and self._max_queued_tasks is not None and not slot_acquired:
+            # Slots that are taken plus tasks that wait for a slot
+            occupied = (
+                self._max_concurrent_tasks
+                - semaphore.current_value  # type: ignore[operator]
+                + len(self.__queued_tasks)
+            )
+            if occupied >= self._max_concurrent_tasks + self._max_queued_tasks:  # type: ignore
+                if inspect.iscoroutine(coroutine):
+                    coroutine.close()
+                raise RuntimeError(
+                    f"Can't create task {name!r}, since {self._max_queued_tasks} tasks are "
+                    "already waiting for a free slot."
+                )
+
         # Unfortunately, we can't know if `coroutine` runs one of the error handler functions
         # but by passing `is_error_handler=True` from `process_error`, we can make sure that we
         # get at most one recursion of the user calls `create_task` manually with an error handler
         # function
         task: asyncio.Task[RT] = asyncio.create_task(
             self.__create_task_callback(
-                coroutine=coroutine, update=update, is_error_handler=is_error_handler
+                coroutine=coroutine,
+                update=update,
+                is_error_handler=is_error_handler,
+                semaphore=semaphore,
+                timeout=timeout,
+                slot_acquired=slot_acquired,
             ),
             name=name,
         )
+        if semaphore is not None and not slot_acquired:
+            self.__queued_tasks.add(task)
+        # asyncio assigns a unique default name to each unnamed task
+        task_name = "<unnamed>" if name is None else name
+        self._pending_task_names[task_name] += 1
+        task.add_done_callback(functools.partial(self.__release_task_name, task_name))
 
         if self.running:
             self.__create_task_tasks.add(task)
@@ -1166,6 +1622,13 @@ class Application(
 
         return task
 
+    def __release_task_name(self, task_name: str, task: asyncio.Task) -> None:
+        # The task may be cancelled before it could take a slot
+        self.__queued_tasks.discard(task)
+        self._pending_task_names[task_name] -= 1
+        if not self._pending_task_names[task_name]:
+            del self._pending_task_names[task_name]
+
     def __create_task_done_callback(self, task: asyncio.Task) -> None:
         self.__create_task_tasks.discard(task)  # Discard from our set since we are done with it
         # We just retrieve the eventual exception so that asyncio doesn't complain in case
@@ -1178,7 +1641,20 @@ class Application(
         coroutine: _CoroType[RT],
         update: Optional[object] = None,
         is_error_handler: bool = False,
+        semaphore: Optional[TrackedBoundedSemaphore] = None,
+        timeout: Optional[float] = None,
+        slot_acquired: bool = False,
     ) -> RT:
+        if semaphore is not None and not slot_acquired:
+            try:
+                await semaphore.acquire()
+            except asyncio.CancelledError:
+                if inspect.iscoroutine(coroutine):
+                    coroutine.close()
+                raise
+            finally:
+                self.__queued_tasks.discard(asyncio.current_task())  # type: ignore[arg-type]
+
         try:
             # Generator-based coroutines are not supported in Python 3.12+
             if sys.version_info < (3, 12) and isinstance(coroutine, Generator):
@@ -1190,6 +1666,8 @@ class Application(
                     ),
                 )
                 return await asyncio.create_task(coroutine)
+            if timeout is not None:
+                return await asyncio.wait_for(coroutine, timeout)
             # If user uses generator in python 3.12+, Exception will happen and we cannot do
             # anything about it. (hence the type ignore if mypy is run on python 3.12-)
             return await coroutine  # type: ignore[misc]
@@ -1217,6 +1695,8 @@ class Application(
             # Raise exception so that it can be set on the task and retrieved by task.exception()
             raise
         finally:
+            if semaphore is not None:
+                semaphore.release()
             self._mark_for_persistence_update(update=update)
 
     async def __update_fetcher(self) -> None:
@@ -1229,17 +1709,55 @@ class Application(
                 self.update_queue.task_done()
                 return
 
-            _LOGGER.debug("Processing update %s", update)
+            degraded_handler = None
+            if self._load_shedding_policies:
+                policy = self.__get_load_shedding_policy(update)
+                if policy is not None:
+                    if policy.degraded_handler is None:
+                        _LOGGER.debug("Dropping update %s due to load shedding", update)
+                        self.update_queue.task_done()
+                        continue
+                    degraded_handler = policy.degraded_handler
 
-            if self._update_processor.max_concurrent_updates > 1:
+            _LOGGER.debug("Processing update %s", update)
+            self._updates_in_progress += 1
+            fetched_at = None
+            if self._metrics is not None:
+                self._metrics.record_update_fetched(self.update_queue.qsize())
+                fetched_at = time.perf_counter()
+
+            if self._update_processor.concurrent_dispatch:
+                # Instead of queuing an unbounded number of tasks or having them rejected
+                # because of `max_queued_tasks`, we wait for a free slot before creating the
+                # task. This way, pending updates stay in the update queue.
+                semaphore = self._task_semaphore
+                if semaphore is not None:
+                    try:
+                        await semaphore.acquire()
+                    except BaseException:
+                        self._updates_in_progress -= 1
+                        self.update_queue.task_done()
+                        raise
                 # We don't await the below because it has to be run concurrently
-                self.create_task(
-                    self.__process_update_wrapper(update),
+                self.__create_task(
+                    self.__process_update_wrapper(update, fetched_at, degraded_handler),
                     update=update,
                     name=f"Application:{self.bot.id}:process_concurrent_update",
+                    slot_acquired=semaphore is not None,
                 )
             else:
-                await self.__process_update_wrapper(update)
+                await self.__process_update_wrapper(update, fetched_at, degraded_handler)
+
+    def __get_load_shedding_policy(self, update: object) -> Optional[LoadSheddingPolicy]:
+        update_kind = get_update_kind(update)
+        pending_updates = self.update_queue.qsize() + self._updates_in_progress
+        for policy in self._load_shedding_policies:
+            # The policies are tightly coupled to the application, so we access the private method
+            if policy._should_shed(  # pylint: disable=protected-access
+                update, update_kind, pending_updates
+            ):
+                return policy
+        return None
 
     async def _update_fetcher(self) -> None:
         try:
@@ -1252,12 +1770,116 @@ class Application(
                     # on an empty queue
                     self.update_queue.task_done()
 
-    async def __process_update_wrapper(self, update: object) -> None:
+    async def __process_update_wrapper(
+        self,
+        update: object,
+        fetched_at: Optional[float] = None,
+        degraded_handler: Optional[BaseHandler[Any, CCT, Any]] = None,
+    ) -> None:
+        if degraded_handler is not None:
+            coroutine = self.__process_degraded_update(update, degraded_handler)
+        elif fetched_at is None:
+            coroutine = self.process_update(update)
+        else:
+            coroutine = self.__process_fetched_update(update, fetched_at)
         try:
-            await self._update_processor.process_update(update, self.process_update(update))
+            await self._update_processor.process_update(update, coroutine)
         finally:
+            self._updates_in_progress -= 1
             self.update_queue.task_done()
 
+    async def __process_degraded_update(
+        self, update: object, handler: BaseHandler[Any, CCT, Any]
+    ) -> None:
+        # Simplified version of process_update for updates that were shed to a degraded handler
+        check = handler.check_update(update)
+        if check is None or check is False:
+            return
+        try:
+            context = self.context_types.context.from_update(update, self)
+            if self._context_needs_refresh(context, handler):
+                await context.refresh_data()
+            await handler.handle_update(update, self, check, context)
+        except ApplicationHandlerStop:
+            pass
+        except Exception as exc:
+            await self.process_error(update=update, error=exc)
+        finally:
+            self._mark_for_persistence_update(update=update)
+
+    async def __process_fetched_update(self, update: object, fetched_at: float) -> None:
+        # Only used if metrics are enabled. Measures how long the update waited for the
+        # update processor
+        self._metrics.record_queue_wait(time.perf_counter() - fetched_at)  # type: ignore[union-attr]
+        await self.process_update(update)
+
+    @staticmethod
+    async def __measure_callback(
+        coroutine: Coroutine[Any, Any, RT],
+        handler: BaseHandler[Any, CCT, Any],
+        group: int,
+        metrics: ApplicationMetrics,
+    ) -> RT:
+        start = time.perf_counter()
+        failed = False
+        try:
+            return await coroutine
+        except ApplicationHandlerStop:
+            raise
+        except Exception:
+            failed = True
+            raise
+        finally:
+            metrics.record_callback(handler, group, time.perf_counter() - start, failed)
+
+    def _get_data_to_refresh(self) -> PersistenceInput:
+        """Returns which kinds of data :meth:`CallbackContext.refresh_data` has to refresh. Kinds
+        that are not stored by the persistence or whose ``refresh_*`` method is one of the no-op
+        implementations of :class:`DictPersistence` and :class:`PicklePersistence` are set to
+        :obj:`False`. The result is computed once per persistence.
+        """
+        # pylint: disable=import-outside-toplevel
+        # Avoid circular imports
+        from telegram.ext._dictpersistence import DictPersistence
+        from telegram.ext._picklepersistence import PicklePersistence
+
+        persistence = self.persistence
+        if persistence is None:
+            return _NO_DATA_TO_REFRESH
+
+        def needs_refresh(name: str) -> bool:
+            # Comparing by identity ensures that methods overridden by subclasses are still called
+            method = getattr(persistence, name)
+            method = getattr(method, "__func__", method)
+            return method is not getattr(DictPersistence, name) and method is not getattr(
+                PicklePersistence, name
+            )
+
+        if self._data_to_refresh is None or self._data_to_refresh[0] is not persistence:
+            store_data = persistence.store_data
+            self._data_to_refresh = (
+                persistence,
+                PersistenceInput(
+                    bot_data=store_data.bot_data and needs_refresh("refresh_bot_data"),
+                    chat_data=store_data.chat_data and needs_refresh("refresh_chat_data"),
+                    user_data=store_data.user_data and needs_refresh("refresh_user_data"),
+                    callback_data=False,
+                ),
+            )
+        return self._data_to_refresh[1]
+
+    def _context_needs_refresh(self, context: CCT, handler: BaseHandler[Any, CCT, Any]) -> bool:
+        # Custom implementations of refresh_data may do anything, so we always call them
+        if type(context).refresh_data is not CallbackContext.refresh_data:
+            return True
+        data = self._get_data_to_refresh()
+        needed = handler.context_data
+        return (
+            (data.bot_data and needed.bot_data)
+            or (data.chat_data and needed.chat_data)
+            or (data.user_data and needed.user_data)
+        )
+
     async def process_update(self, update: object) -> None:
         """Processes a single update and marks the update to be updated by the persistence later.
         Exceptions raised by handler callbacks will be processed by :meth:`process_error`.
@@ -1268,6 +1890,18 @@ class Application(
             Persistence is now updated in an interval set by
             :attr:`telegram.ext.BasePersistence.update_interval`.
 
+        .. versionchanged:: NEXT.VERSION
+            Handlers that can't handle the kind of :paramref:`update` according to
+            :attr:`telegram.ext.BaseHandler.update_types` are skipped without calling
+            :meth:`~telegram.ext.BaseHandler.check_update`.
+
+        .. versionchanged:: NEXT.VERSION
+            Reports to :attr:`metrics`, if set.
+
+        .. versionchanged:: NEXT.VERSION
+            The results of the built-in filters are computed only once per update, even if
+            multiple handlers use the same filter.
+
         Args:
             update (:class:`telegram.Update` | :obj:`object` | \
                 :class:`telegram.error.TelegramError`): The update to process.
@@ -1278,13 +1912,35 @@ class Application(
         # Processing updates before initialize() is a problem e.g. if persistence is used
         self._check_initialized()
 
+        # Handlers that use the same built-in filters share their results for this update, and
+        # values derived from the objects of the update, e.g. entity texts, are computed once
+        with cache_filter_results(update), cache_object_data():
+            await self.__process_update(update)
+
+    async def __process_update(self, update: object) -> None:
         context = None
+        refresh_pending = False  # Whether the data of the context still needs to be refreshed
         any_blocking = False  # Flag which is set to True if any handler specifies block=True
+        update_kind = get_update_kind(update)
+        metrics = self._metrics
+        start = time.perf_counter() if metrics is not None else 0.0
 
-        for handlers in self.handlers.values():
+        for group, handlers in self.handlers.items():
             try:
-                for handler in handlers:
-                    check = handler.check_update(update)  # Should the handler handle this update?
+                for handler in self._handler_index.get_candidates(
+                    group, handlers, update_kind, update
+                ):
+                    if metrics is None:
+                        check = handler.check_update(update)  # Should the handler handle this?
+                    else:
+                        check_start = time.perf_counter()
+                        check = handler.check_update(update)
+                        metrics.record_check(
+                            handler,
+                            group,
+                            time.perf_counter() - check_start,
+                            check is not None and check is not False,
+                        )
                     if check is None or check is False:
                         continue
 
@@ -1300,9 +1956,22 @@ class Application(
                                 update,
                                 exc_info=exc,
                             )
+                            if metrics is not None:
+                                metrics.record_update_processed(time.perf_counter() - start)
                             return
-                        await context.refresh_data()
+                        refresh_pending = True
+                    # Refresh the data only once per update and only if the handler needs it
+                    if refresh_pending and self._context_needs_refresh(context, handler):
+                        refresh_pending = False
+                        if metrics is None:
+                            await context.refresh_data()
+                        else:
+                            refresh_start = time.perf_counter()
+                            await context.refresh_data()
+                            metrics.record_refresh_data(time.perf_counter() - refresh_start)
                     coroutine: Coroutine = handler.handle_update(update, self, check, context)
+                    if metrics is not None:
+                        coroutine = self.__measure_callback(coroutine, handler, group, metrics)
 
                     if not handler.block or (  # if handler is running with block=False,
                         handler.block is DEFAULT_TRUE
@@ -1310,6 +1979,8 @@ class Application(
                         and self.bot.defaults
                         and not self.bot.defaults.block
                     ):
+                        if metrics is not None:
+                            metrics.record_non_blocking_task(handler, group)
                         self.create_task(
                             coroutine,
                             update=update,
@@ -1340,6 +2011,9 @@ class Application(
             # (in __create_task_callback)
             self._mark_for_persistence_update(update=update)
 
+        if metrics is not None:
+            metrics.record_update_processed(time.perf_counter() - start)
+
     def add_handler(self, handler: BaseHandler[Any, CCT, Any], group: int = DEFAULT_GROUP) -> None:
         """Register a handler.
 
@@ -1404,6 +2078,7 @@ class Application(
             self.handlers = dict(sorted(self.handlers.items()))  # lower -> higher groups
 
         self.handlers[group].append(handler)
+        self._handler_index.invalidate(group)
 
     def add_handlers(
         self,
@@ -1477,6 +2152,7 @@ class Application(
         """
         if handler in self.handlers[group]:
             self.handlers[group].remove(handler)
+            self._handler_index.invalidate(group)
             if not self.handlers[group]:
                 del self.handlers[group]
 
@@ -1671,6 +2347,11 @@ class Application(
 
         .. seealso:: :attr:`telegram.ext.BasePersistence.update_interval`,
             :meth:`mark_data_for_update_persistence`
+
+        .. versionchanged:: NEXT.VERSION
+            The changed conversation states are passed to
+            :meth:`telegram.ext.BasePersistence.update_conversations` in one batch per
+            :class:`~telegram.ext.ConversationHandler`.
         """
         async with self.__update_persistence_lock:
             await self.__update_persistence()
@@ -1735,6 +2416,8 @@ class Application(
         # pylint: disable=import-outside-toplevel
         from telegram.ext._handlers.conversationhandler import PendingState
 
+        # The changes are passed to the persistence in one batch per conversation handler
+        conversation_changes: dict[str, dict[ConversationKey, Optional[object]]] = {}
         for name, (key, new_state) in itertools.chain.from_iterable(
             zip(itertools.repeat(name), states_dict.pop_accessed_write_items())
             for name, states_dict in self._conversation_handler_conversations.items()
@@ -1766,11 +2449,10 @@ class Application(
                 result = new_state
 
             effective_new_state = None if result is TrackingDict.DELETED else result
-            coroutines.add(
-                self.persistence.update_conversation(
-                    name=name, key=key, new_state=effective_new_state
-                )
-            )
+            conversation_changes.setdefault(name, {})[key] = effective_new_state
+
+        for name, changes in conversation_changes.items():
+            coroutines.add(self.persistence.update_conversations(name=name, changes=changes))
 
         results = await asyncio.gather(*coroutines, return_exceptions=True)
         _LOGGER.debug("Finished updating persistence.")
@@ -1834,6 +2516,7 @@ class Application(
         error: Exception,
         job: Optional["Job[CCT]"] = None,
         coroutine: Optional[_ErrorCoroType[RT]] = None,
+        batch: Optional[list[Update]] = None,
     ) -> bool:
         """Processes an error by passing it to all error handlers registered with
         :meth:`add_error_handler`. If one of the error handlers raises
@@ -1857,11 +2540,18 @@ class Application(
 
                 .. versionadded:: 20.0
             coroutine (:term:`coroutine function`, optional): The coroutine that caused the error.
+            batch (list[:class:`telegram.Update`], optional): The batch of updates whose
+                processing by a :class:`telegram.ext.BatchHandler` caused the error. Available to
+                the error handlers as :attr:`telegram.ext.CallbackContext.batch`.
+
+                .. versionadded:: NEXT.VERSION
 
         Returns:
             :obj:`bool`: :obj:`True`, if one of the error handlers raised
             :class:`telegram.ext.ApplicationHandlerStop`. :obj:`False`, otherwise.
         """
+        if self._metrics is not None:
+            self._metrics.record_error()
         if self.error_handlers:
             for (
                 callback,
@@ -1875,6 +2565,8 @@ class Application(
                         job=job,
                         coroutine=coroutine,
                     )
+                    if batch is not None:
+                        context.batch = batch
                 except Exception as exc:
                     _LOGGER.critical(
                         (
@@ -1892,12 +2584,15 @@ class Application(
                     and self.bot.defaults
                     and not self.bot.defaults.block
                 ):
-                    self.__create_task(
-                        callback(update, context),
-                        update=update,
-                        is_error_handler=True,
-                        name=f"Application:{self.bot.id}:process_error:non_blocking",
-                    )
+                    try:
+                        self.__create_task(
+                            callback(update, context),
+                            update=update,
+                            is_error_handler=True,
+                            name=f"Application:{self.bot.id}:process_error:non_blocking",
+                        )
+                    except RuntimeError as exc:
+                        _LOGGER.warning("Skipping error handler %s: %s", callback, exc)
                 else:
                     try:
                         await callback(update, context)
@@ -18,7 +18,7 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains the Builder classes for the telegram.ext module."""
 from asyncio import Queue
-from collections.abc import Collection, Coroutine
+from collections.abc import Collection, Coroutine, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Generic, Optional, TypeVar, Union
 
@@ -49,7 +49,14 @@ from telegram.warnings import PTBDeprecationWarning
 
 if TYPE_CHECKING:
     from telegram import Update
-    from telegram.ext import BasePersistence, BaseRateLimiter, CallbackContext, Defaults
+    from telegram.ext import (
+        ApplicationMetrics,
+        BasePersistence,
+        BaseRateLimiter,
+        CallbackContext,
+        Defaults,
+        LoadSheddingPolicy,
+    )
     from telegram.ext._utils.types import RLARGS
 
 # Type hinting is a bit complicated here because we try to get to a sane level of
@@ -149,8 +156,13 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         "_get_updates_write_timeout",
         "_http_version",
         "_job_queue",
+        "_load_shedding_policies",
         "_local_mode",
+        "_max_concurrent_tasks",
+        "_max_pending_cpu_tasks",
+        "_max_queued_tasks",
         "_media_write_timeout",
+        "_metrics",
         "_persistence",
         "_pool_timeout",
         "_post_init",
@@ -158,11 +170,13 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         "_post_stop",
         "_private_key",
         "_private_key_password",
+        "_process_pool_size",
         "_proxy",
         "_rate_limiter",
         "_read_timeout",
         "_request",
         "_socket_options",
+        "_thread_pool_size",
         "_token",
         "_update_processor",
         "_update_queue",
@@ -220,6 +234,13 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._post_stop: Optional[Callable[[Application], Coroutine[Any, Any, None]]] = None
         self._rate_limiter: ODVInput[BaseRateLimiter] = DEFAULT_NONE
         self._http_version: DVInput[str] = DefaultValue("1.1")
+        self._thread_pool_size: Optional[int] = None
+        self._process_pool_size: Optional[int] = None
+        self._max_pending_cpu_tasks: Optional[int] = None
+        self._metrics: Optional[ApplicationMetrics] = None
+        self._load_shedding_policies: Optional[Sequence[LoadSheddingPolicy]] = None
+        self._max_concurrent_tasks: Optional[int] = None
+        self._max_queued_tasks: Optional[int] = None
 
     def _build_request(self, get_updates: bool) -> BaseRequest:
         prefix = "_get_updates_" if get_updates else "_"
@@ -332,6 +353,13 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
             post_init=self._post_init,
             post_shutdown=self._post_shutdown,
             post_stop=self._post_stop,
+            thread_pool_size=self._thread_pool_size,
+            process_pool_size=self._process_pool_size,
+            max_pending_cpu_tasks=self._max_pending_cpu_tasks,
+            metrics=self._metrics,
+            load_shedding_policies=self._load_shedding_policies,
+            max_concurrent_tasks=self._max_concurrent_tasks,
+            max_queued_tasks=self._max_queued_tasks,
             **self._application_kwargs,  # For custom Application subclasses
         )
 
@@ -1072,6 +1100,10 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         fetch updates from. Will also be used for the :attr:`telegram.ext.Application.updater`.
         If not called, a queue will be instantiated.
 
+        Tip:
+            Pass a :class:`telegram.ext.BoundedUpdateQueue` to limit the number of pending
+            updates.
+
         .. seealso:: :attr:`telegram.ext.Updater.update_queue`
 
         Args:
@@ -1397,6 +1429,209 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._rate_limiter = rate_limiter
         return self  # type: ignore[return-value]
 
+    def thread_pool_size(self: BuilderType, thread_pool_size: int) -> BuilderType:
+        """Sets the number of threads for :attr:`telegram.ext.Application.thread_pool_size`.
+        If called, handler and job callbacks that are synchronous functions are run in a
+        :class:`~concurrent.futures.ThreadPoolExecutor` of that size instead of being called
+        directly in the event loop. The thread pool is created in
+        :meth:`telegram.ext.Application.initialize` and shut down in
+        :meth:`telegram.ext.Application.shutdown`.
+
+        Use this if some of your callbacks perform blocking operations such as synchronous
+        database queries. If more synchronous callbacks are run at the same time than there are
+        threads, the remaining ones wait for a free thread.
+
+        Example:
+            .. code:: python
+
+                def callback(update: Update, context: CallbackContext) -> None:
+                    # Runs in a worker thread and hence doesn't block the event loop
+                    context.bot_data["count"] = database.increment_counter()
+
+                application = Application.builder().token("TOKEN").thread_pool_size(8).build()
+                application.add_handler(CommandHandler("count", callback))
+
+        Warning:
+            Synchronous callbacks can not await coroutines such as
+            :meth:`telegram.Bot.send_message`. Use an asynchronous callback that calls
+            :meth:`telegram.ext.Application.run_in_thread` for the blocking part instead if you
+            need both.
+
+        .. seealso:: :attr:`telegram.ext.Application.running_thread_pool_tasks`,
+            :attr:`telegram.ext.Application.pending_thread_pool_tasks`
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            thread_pool_size (:obj:`int`): The maximum number of threads.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._thread_pool_size = thread_pool_size
+        return self
+
+    def process_pool_size(self: BuilderType, process_pool_size: int) -> BuilderType:
+        """Sets the number of worker processes for
+        :attr:`telegram.ext.Application.process_pool_size`. If called, the application manages a
+        :class:`~concurrent.futures.ProcessPoolExecutor` of that size, which can be used to
+        offload CPU-bound work via :meth:`telegram.ext.Application.run_cpu` and
+        :class:`telegram.ext.CPUBoundCallback`. The process pool is started in
+        :meth:`telegram.ext.Application.start` and shut down in
+        :meth:`telegram.ext.Application.stop`.
+
+        Example:
+            .. code:: python
+
+                application = Application.builder().token("TOKEN").process_pool_size(4).build()
+
+        .. seealso:: :meth:`max_pending_cpu_tasks`
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            process_pool_size (:obj:`int`): The number of worker processes.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._process_pool_size = process_pool_size
+        return self
+
+    def max_pending_cpu_tasks(self: BuilderType, max_pending_cpu_tasks: int) -> BuilderType:
+        """Sets the value for :attr:`telegram.ext.Application.max_pending_cpu_tasks`, i.e. the
+        maximum number of functions that may be submitted to the process pool at the same time
+        via :meth:`telegram.ext.Application.run_cpu`. Further calls wait until one of those
+        functions is finished. This prevents handlers from piling up more work than the worker
+        processes can handle. If not called, twice the value of :meth:`process_pool_size` is
+        used, which keeps the worker processes busy without queuing up too much work.
+
+        .. seealso:: :meth:`process_pool_size`
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            max_pending_cpu_tasks (:obj:`int`): The maximum number of pending functions.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._max_pending_cpu_tasks = max_pending_cpu_tasks
+        return self
+
+    def metrics(self: BuilderType, metrics: "ApplicationMetrics") -> BuilderType:
+        """Sets a :class:`telegram.ext.ApplicationMetrics` instance to be used for
+        :attr:`telegram.ext.Application.metrics`. The application will report handler timings,
+        match counts and errors to this instance. If not called, no metrics are collected.
+
+        Example:
+            .. code:: python
+
+                metrics = ApplicationMetrics()
+                application = Application.builder().token("TOKEN").metrics(metrics).build()
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            metrics (:class:`telegram.ext.ApplicationMetrics`): The metrics instance.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._metrics = metrics
+        return self
+
+    def load_shedding_policies(
+        self: BuilderType, load_shedding_policies: Sequence["LoadSheddingPolicy"]
+    ) -> BuilderType:
+        """Sets the policies to be used for
+        :attr:`telegram.ext.Application.load_shedding_policies`. When the application takes an
+        update from the update queue, the first matching policy decides whether the update is
+        dropped or passed to a degraded handler instead of being processed normally. If not
+        called, no updates are shed.
+
+        Example:
+            .. code:: python
+
+                policy = LoadSheddingPolicy(
+                    update_types=[UpdateType.EDITED_MESSAGE], max_pending_updates=1000
+                )
+                application = (
+                    Application.builder().token("TOKEN").load_shedding_policies([policy]).build()
+                )
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            load_shedding_policies (Sequence[:class:`telegram.ext.LoadSheddingPolicy`]): The
+                policies, in the order in which they are checked.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._load_shedding_policies = load_shedding_policies
+        return self
+
+    def max_concurrent_tasks(self: BuilderType, max_concurrent_tasks: int) -> BuilderType:
+        """Sets the value for :attr:`telegram.ext.Application.max_concurrent_tasks`, i.e. the
+        maximum number of tasks created via :meth:`telegram.ext.Application.create_task` that run
+        at the same time. This includes the tasks for handlers and error handlers with
+        ``block=False``. Further tasks wait until one of the running tasks is done, which prevents
+        bursts of updates from starting an unbounded number of callbacks at once. If not called,
+        the number of tasks is not limited.
+
+        Note:
+            If updates are processed concurrently (see :meth:`concurrent_updates`), this also caps
+            the number of updates that are processed at the same time. Such updates are never
+            rejected due to :meth:`max_queued_tasks`. Instead, they stay in the update queue until
+            a slot is free.
+
+        .. seealso:: :meth:`max_queued_tasks`
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            max_concurrent_tasks (:obj:`int`): The maximum number of running tasks.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._max_concurrent_tasks = max_concurrent_tasks
+        return self
+
+    def max_queued_tasks(self: BuilderType, max_queued_tasks: int) -> BuilderType:
+        """Sets the value for :attr:`telegram.ext.Application.max_queued_tasks`, i.e. the
+        maximum number of tasks that may wait for a free slot if
+        :meth:`max_concurrent_tasks` tasks are already running. Further calls of
+        :meth:`telegram.ext.Application.create_task` raise an exception. For handlers with
+        ``block=False``, that exception is passed to the error handlers. Pass ``0`` to reject
+        tasks as soon as all slots are taken. If not called, the number of waiting tasks is not
+        limited.
+
+        Example:
+            .. code:: python
+
+                application = (
+                    Application.builder()
+                    .token("TOKEN")
+                    .max_concurrent_tasks(256)
+                    .max_queued_tasks(1024)
+                    .build()
+                )
+
+        .. seealso:: :meth:`max_concurrent_tasks`
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            max_queued_tasks (:obj:`int`): The maximum number of waiting tasks.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._max_queued_tasks = max_queued_tasks
+        return self
+
 
 InitApplicationBuilder = (  # This is defined all the way down here so that its type is inferred
     ApplicationBuilder[  # by Pylance correctly.
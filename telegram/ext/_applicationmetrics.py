@@ -0,0 +1,471 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains classes that collect runtime metrics of an Application."""
+from collections.abc import Iterator
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from telegram._utils.repr import build_repr_with_selected_attrs
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from telegram.ext import BaseHandler
+
+
+class DurationStatistics:
+    """Aggregates observed durations, e.g. of handler callbacks.
+
+    .. versionadded:: NEXT.VERSION
+    """
+
+    __slots__ = ("_count", "_maximum", "_total")
+
+    def __init__(self) -> None:
+        self._count: int = 0
+        self._total: float = 0.0
+        self._maximum: float = 0.0
+
+    def __repr__(self) -> str:
+        """Give a string representation of the statistics in the form
+        ``DurationStatistics[count=..., total=..., maximum=...]``.
+
+        Returns:
+            :obj:`str`
+        """
+        return build_repr_with_selected_attrs(
+            self, count=self._count, total=self._total, maximum=self._maximum
+        )
+
+    @property
+    def count(self) -> int:
+        """:obj:`int`: The number of observed durations."""
+        return self._count
+
+    @property
+    def total(self) -> float:
+        """:obj:`float`: The sum of all observed durations in seconds."""
+        return self._total
+
+    @property
+    def maximum(self) -> float:
+        """:obj:`float`: The longest observed duration in seconds."""
+        return self._maximum
+
+    @property
+    def mean(self) -> float:
+        """:obj:`float`: The mean of the observed durations in seconds. ``0`` if nothing was
+        observed yet.
+        """
+        return self._total / self._count if self._count else 0.0
+
+    def observe(self, duration: float) -> None:
+        """Records a duration.
+
+        Args:
+            duration (:obj:`float`): The duration in seconds.
+        """
+        self._count += 1
+        self._total += duration
+        self._maximum = max(self._maximum, duration)
+
+
+class HandlerStatistics:
+    """Runtime statistics of a single handler as collected by :class:`ApplicationMetrics`.
+
+    .. versionadded:: NEXT.VERSION
+
+    Attributes:
+        handler (:class:`telegram.ext.BaseHandler`): The handler.
+        group (:obj:`int`): The group that the handler was registered in.
+        check_duration (:class:`telegram.ext.DurationStatistics`): Durations of the calls of
+            :meth:`~telegram.ext.BaseHandler.check_update`.
+        callback_duration (:class:`telegram.ext.DurationStatistics`): Durations of the calls of
+            :meth:`~telegram.ext.BaseHandler.handle_update`, including those that raised an
+            exception.
+    """
+
+    __slots__ = (
+        "_errors",
+        "_matches",
+        "_non_blocking_tasks",
+        "callback_duration",
+        "check_duration",
+        "group",
+        "handler",
+    )
+
+    def __init__(self, handler: "BaseHandler[Any, Any, Any]", group: int) -> None:
+        self.handler: BaseHandler[Any, Any, Any] = handler
+        self.group: int = group
+        self.check_duration: DurationStatistics = DurationStatistics()
+        self.callback_duration: DurationStatistics = DurationStatistics()
+        self._matches: int = 0
+        self._errors: int = 0
+        self._non_blocking_tasks: int = 0
+
+    def __repr__(self) -> str:
+        """Give a string representation of the statistics in the form
+        ``HandlerStatistics[handler=..., group=...]``.
+
+        Returns:
+            :obj:`str`
+        """
+        return build_repr_with_selected_attrs(self, handler=self.handler, group=self.group)
+
+    @property
+    def matches(self) -> int:
+        """:obj:`int`: How often :meth:`~telegram.ext.BaseHandler.check_update` accepted an
+        update.
+        """
+        return self._matches
+
+    @property
+    def errors(self) -> int:
+        """:obj:`int`: How often the callback raised an exception."""
+        return self._errors
+
+    @property
+    def non_blocking_tasks(self) -> int:
+        """:obj:`int`: How often the callback was run as non-blocking task."""
+        return self._non_blocking_tasks
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+class ApplicationMetrics:
+    """Collects runtime metrics of a :class:`telegram.ext.Application`, e.g. how long the
+    handler callbacks take and how often they fail. Pass an instance of this class to
+    :meth:`telegram.ext.ApplicationBuilder.metrics` to enable the instrumentation. The
+    application then reports to this instance via the ``record_*`` methods. Subclasses may
+    override these methods to forward the data to other monitoring systems.
+
+    The metrics can be read directly from this instance or exported in the Prometheus text
+    format via :meth:`to_prometheus`. For :class:`~telegram.ext.ConversationHandler` instances,
+    the export also includes :attr:`~telegram.ext.ConversationHandler.active_conversations` and
+    :attr:`~telegram.ext.ConversationHandler.evicted_conversations`.
+
+    Example:
+        .. code:: python
+
+            metrics = ApplicationMetrics()
+            application = Application.builder().token("TOKEN").metrics(metrics).build()
+            ...
+            for stats in metrics.handler_statistics:
+                print(stats.handler, stats.matches, stats.callback_duration.mean)
+
+    Note:
+        All durations are measured in seconds with :func:`time.perf_counter`. For handlers that
+        are run in a non-blocking way, the callback durations are measured within the task that
+        runs the callback.
+
+    Caution:
+        The values exposed by this class are snapshots and may change immediately after being
+        read.
+
+    .. versionadded:: NEXT.VERSION
+
+    Attributes:
+        queue_wait (:class:`telegram.ext.DurationStatistics`): The time between taking an update
+            from :attr:`telegram.ext.Application.update_queue` and the start of its processing,
+            i.e. the time that the update waited for the
+            :attr:`~telegram.ext.Application.update_processor`. Not recorded for updates passed
+            to :meth:`~telegram.ext.Application.process_update` manually.
+        refresh_data_duration (:class:`telegram.ext.DurationStatistics`): Durations of the calls
+            of :meth:`telegram.ext.CallbackContext.refresh_data`.
+        processing_duration (:class:`telegram.ext.DurationStatistics`): Durations of the calls of
+            :meth:`telegram.ext.Application.process_update`. Does not include non-blocking tasks.
+    """
+
+    __slots__ = (
+        "_errors",
+        "_handlers",
+        "_max_update_queue_size",
+        "_processed_updates",
+        "_update_queue_size",
+        "processing_duration",
+        "queue_wait",
+        "refresh_data_duration",
+    )
+
+    def __init__(self) -> None:
+        self.queue_wait: DurationStatistics = DurationStatistics()
+        self.refresh_data_duration: DurationStatistics = DurationStatistics()
+        self.processing_duration: DurationStatistics = DurationStatistics()
+        self._handlers: dict[tuple[int, BaseHandler[Any, Any, Any]], HandlerStatistics] = {}
+        self._processed_updates: int = 0
+        self._errors: int = 0
+        self._update_queue_size: int = 0
+        self._max_update_queue_size: int = 0
+
+    def __repr__(self) -> str:
+        """Give a string representation of the metrics in the form
+        ``ApplicationMetrics[processed_updates=..., errors=...]``.
+
+        Returns:
+            :obj:`str`
+        """
+        return build_repr_with_selected_attrs(
+            self, processed_updates=self._processed_updates, errors=self._errors
+        )
+
+    @property
+    def processed_updates(self) -> int:
+        """:obj:`int`: The number of updates processed by
+        :meth:`telegram.ext.Application.process_update`.
+        """
+        return self._processed_updates
+
+    @property
+    def errors(self) -> int:
+        """:obj:`int`: The number of errors passed to
+        :meth:`telegram.ext.Application.process_error`.
+        """
+        return self._errors
+
+    @property
+    def update_queue_size(self) -> int:
+        """:obj:`int`: The number of updates that were left in
+        :attr:`telegram.ext.Application.update_queue` when the last update was taken from it.
+        """
+        return self._update_queue_size
+
+    @property
+    def max_update_queue_size(self) -> int:
+        """:obj:`int`: The maximum of :attr:`update_queue_size` observed so far."""
+        return self._max_update_queue_size
+
+    @property
+    def handler_statistics(self) -> tuple[HandlerStatistics, ...]:
+        """tuple[:class:`telegram.ext.HandlerStatistics`]: The statistics of all handlers that
+        were checked at least once, in the order in which they were first checked.
+        """
+        return tuple(self._handlers.values())
+
+    @property
+    def handlers(self) -> "Mapping[tuple[int, BaseHandler[Any, Any, Any]], HandlerStatistics]":
+        """Mapping[tuple[:obj:`int`, :class:`telegram.ext.BaseHandler`], \
+        :class:`telegram.ext.HandlerStatistics`]: Read-only mapping of ``(group, handler)`` to
+        the statistics of that handler.
+        """
+        return MappingProxyType(self._handlers)
+
+    def get_handler_statistics(
+        self, handler: "BaseHandler[Any, Any, Any]", group: int = 0
+    ) -> HandlerStatistics:
+        """Returns the statistics of a handler. If the handler was not checked yet, the returned
+        statistics are empty.
+
+        Args:
+            handler (:class:`telegram.ext.BaseHandler`): The handler.
+            group (:obj:`int`, optional): The group that the handler was registered in. Defaults
+                to ``0``.
+
+        Returns:
+            :class:`telegram.ext.HandlerStatistics`
+        """
+        key = (group, handler)
+        if (stats := self._handlers.get(key)) is None:
+            stats = self._handlers[key] = HandlerStatistics(handler, group)
+        return stats
+
+    def reset(self) -> None:
+        """Discards all collected metrics."""
+        self.queue_wait = DurationStatistics()
+        self.refresh_data_duration = DurationStatistics()
+        self.processing_duration = DurationStatistics()
+        self._handlers.clear()
+        self._processed_updates = 0
+        self._errors = 0
+        self._update_queue_size = 0
+        self._max_update_queue_size = 0
+
+    def record_update_fetched(self, queue_size: int) -> None:
+        """Called when an update was taken from :attr:`telegram.ext.Application.update_queue`.
+
+        Args:
+            queue_size (:obj:`int`): The number of updates left in the queue.
+        """
+        self._update_queue_size = queue_size
+        self._max_update_queue_size = max(self._max_update_queue_size, queue_size)
+
+    def record_queue_wait(self, duration: float) -> None:
+        """Called when the processing of an update that was taken from
+        :attr:`telegram.ext.Application.update_queue` starts.
+
+        Args:
+            duration (:obj:`float`): The time that the update waited.
+        """
+        self.queue_wait.observe(duration)
+
+    def record_refresh_data(self, duration: float) -> None:
+        """Called after :meth:`telegram.ext.CallbackContext.refresh_data` was awaited.
+
+        Args:
+            duration (:obj:`float`): The duration of the call.
+        """
+        self.refresh_data_duration.observe(duration)
+
+    def record_check(
+        self, handler: "BaseHandler[Any, Any, Any]", group: int, duration: float, matched: bool
+    ) -> None:
+        """Called after :meth:`telegram.ext.BaseHandler.check_update` was called.
+
+        Args:
+            handler (:class:`telegram.ext.BaseHandler`): The handler.
+            group (:obj:`int`): The group of the handler.
+            duration (:obj:`float`): The duration of the call.
+            matched (:obj:`bool`): Whether the handler accepted the update.
+        """
+        stats = self.get_handler_statistics(handler, group)
+        stats.check_duration.observe(duration)
+        if matched:
+            stats._matches += 1  # pylint: disable=protected-access
+
+    def record_callback(
+        self, handler: "BaseHandler[Any, Any, Any]", group: int, duration: float, failed: bool
+    ) -> None:
+        """Called after the callback of a handler has finished.
+
+        Args:
+            handler (:class:`telegram.ext.BaseHandler`): The handler.
+            group (:obj:`int`): The group of the handler.
+            duration (:obj:`float`): The duration of the callback.
+            failed (:obj:`bool`): Whether the callback raised an exception other than
+                :class:`telegram.ext.ApplicationHandlerStop`.
+        """
+        stats = self.get_handler_statistics(handler, group)
+        stats.callback_duration.observe(duration)
+        if failed:
+            stats._errors += 1  # pylint: disable=protected-access
+
+    def record_non_blocking_task(self, handler: "BaseHandler[Any, Any, Any]", group: int) -> None:
+        """Called when the callback of a handler is scheduled as non-blocking task.
+
+        Args:
+            handler (:class:`telegram.ext.BaseHandler`): The handler.
+            group (:obj:`int`): The group of the handler.
+        """
+        stats = self.get_handler_statistics(handler, group)
+        stats._non_blocking_tasks += 1  # pylint: disable=protected-access
+
+    def record_update_processed(self, duration: float) -> None:
+        """Called after :meth:`telegram.ext.Application.process_update` has finished.
+
+        Args:
+            duration (:obj:`float`): The duration of the call.
+        """
+        self._processed_updates += 1
+        self.processing_duration.observe(duration)
+
+    def record_error(self) -> None:
+        """Called when :meth:`telegram.ext.Application.process_error` is called."""
+        self._errors += 1
+
+    def _handler_labels(self) -> Iterator[tuple[str, HandlerStatistics]]:
+        seen: dict[tuple[int, str], int] = {}
+        for stats in self._handlers.values():
+            name = repr(stats.handler)
+            count = seen[(stats.group, name)] = seen.get((stats.group, name), 0) + 1
+            if count > 1:
+                # Distinguish different handlers with the same representation
+                name = f"{name}#{count}"
+            yield f'group="{stats.group}",handler="{_escape_label(name)}"', stats
+
+    def to_prometheus(self, namespace: str = "ptb") -> str:
+        """Exports the metrics in the
+        `Prometheus text format <https://prometheus.io/docs/instrumenting/exposition_formats/>`_.
+        Durations are exported as summaries without quantiles, i.e. as ``_count`` and ``_sum``.
+        Handler metrics are labeled by the group and the string representation of the handler.
+
+        Args:
+            namespace (:obj:`str`, optional): Prefix for the metric names. Defaults to ``"ptb"``.
+
+        Returns:
+            :obj:`str`: The metrics.
+        """
+        lines: list[str] = []
+
+        def header(name: str, kind: str, description: str) -> str:
+            full_name = f"{namespace}_{name}"
+            lines.append(f"# HELP {full_name} {description}")
+            lines.append(f"# TYPE {full_name} {kind}")
+            return full_name
+
+        def summary(name: str, stats: DurationStatistics, labels: str = "") -> None:
+            labels = f"{{{labels}}}" if labels else ""
+            lines.append(f"{name}_count{labels} {stats.count}")
+            lines.append(f"{name}_sum{labels} {stats.total!r}")
+
+        name = header("updates_processed_total", "counter", "Number of processed updates.")
+        lines.append(f"{name} {self._processed_updates}")
+        name = header("errors_total", "counter", "Number of errors passed to process_error.")
+        lines.append(f"{name} {self._errors}")
+        name = header("update_queue_size", "gauge", "Number of updates waiting in update_queue.")
+        lines.append(f"{name} {self._update_queue_size}")
+        for attr, description in (
+            ("queue_wait", "Time that updates waited for the update processor."),
+            ("refresh_data_duration", "Duration of CallbackContext.refresh_data."),
+            ("processing_duration", "Duration of Application.process_update."),
+        ):
+            name = header(f"{attr}_seconds", "summary", description)
+            summary(name, getattr(self, attr))
+
+        handler_labels = list(self._handler_labels())
+        name = header("handler_check_seconds", "summary", "Duration of check_update.")
+        for labels, stats in handler_labels:
+            summary(name, stats.check_duration, labels)
+        name = header("handler_callback_seconds", "summary", "Duration of handler callbacks.")
+        for labels, stats in handler_labels:
+            summary(name, stats.callback_duration, labels)
+        for attr, description in (
+            ("matches", "Number of updates accepted by check_update."),
+            ("errors", "Number of exceptions raised by handler callbacks."),
+            ("non_blocking_tasks", "Number of callbacks run as non-blocking tasks."),
+        ):
+            name = header(f"handler_{attr}_total", "counter", description)
+            for labels, stats in handler_labels:
+                lines.append(f"{name}{{{labels}}} {getattr(stats, attr)}")
+
+        # Import here to avoid circular imports
+        from telegram.ext import ConversationHandler  # pylint: disable=import-outside-toplevel
+
+        conversation_labels = [
+            (labels, stats.handler)
+            for labels, stats in handler_labels
+            if isinstance(stats.handler, ConversationHandler)
+        ]
+        if conversation_labels:
+            for attr, kind, description in (
+                ("active_conversations", "gauge", "Number of active conversations."),
+                (
+                    "evicted_conversations",
+                    "counter",
+                    "Number of conversations dropped due to max_conversations or "
+                    "conversation_ttl.",
+                ),
+            ):
+                suffix = "_total" if kind == "counter" else ""
+                name = header(f"handler_{attr}{suffix}", kind, description)
+                for labels, handler in conversation_labels:
+                    lines.append(f"{name}{{{labels}}} {getattr(handler, attr)}")
+
+        return "\n".join(lines) + "\n"
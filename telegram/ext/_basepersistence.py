@@ -17,6 +17,7 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains the BasePersistence class."""
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Generic, NamedTuple, NoReturn, Optional
 
@@ -85,6 +86,9 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
     For example, if you don't store ``bot_data``, you don't need :meth:`get_bot_data`,
     :meth:`update_bot_data` or :meth:`refresh_bot_data`.
 
+    Optionally, :meth:`update_conversations` can be overridden to store all changed states of a
+    :class:`~telegram.ext.ConversationHandler` at once, e.g. in a single database transaction.
+
     Note:
        You should avoid saving :class:`telegram.Bot` instances. This is because if you change e.g.
        the bots token, this won't propagate to the serialized instances and may lead to exceptions.
@@ -281,6 +285,29 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
             new_state (:class:`object`): The new state for the given key.
         """
 
+    async def update_conversations(
+        self, name: str, changes: dict[ConversationKey, Optional[object]]
+    ) -> None:
+        """Will be called by :meth:`telegram.ext.Application.update_persistence` with all states
+        of a :class:`telegram.ext.ConversationHandler` that changed since the last call.
+
+        By default, this calls :meth:`update_conversation` for each of the changes concurrently.
+        Override this method if the backend can store many states more efficiently at once.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            name (:obj:`str`): The handler's name.
+            changes (dict[:obj:`tuple`, :class:`object`]): The new states by the keys they are
+                changed for. A state of :obj:`None` means that the conversation has ended.
+        """
+        await asyncio.gather(
+            *(
+                self.update_conversation(name=name, key=key, new_state=new_state)
+                for key, new_state in changes.items()
+            )
+        )
+
     @abstractmethod
     async def update_user_data(self, user_id: int, data: UD) -> None:
         """Will be called by the :class:`telegram.ext.Application` after a handler has
@@ -17,14 +17,244 @@
 #  You should have received a copy of the GNU Lesser Public License
 #  along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains a class that allows to rate limit requests to the Bot API."""
+import asyncio
+import math
 from abc import ABC, abstractmethod
-from collections.abc import Coroutine
+from collections import deque
+from collections.abc import Coroutine, Mapping
+from types import MappingProxyType
 from typing import Any, Callable, Generic, Optional, Union
 
 from telegram._utils.types import JSONDict
 from telegram.ext._utils.types import RLARGS
 
 
+class RateLimiterStatistics:
+    """Collects runtime statistics of a :class:`~telegram.ext.BaseRateLimiter`, e.g. how long
+    requests wait before they are sent to Telegram and how often
+    :exc:`~telegram.error.RetryAfter` was raised.
+
+    Rate limiter implementations report to an instance of this class via
+    :meth:`request_received`, :meth:`request_started`, :meth:`request_finished`,
+    :meth:`retry_after_received` and :meth:`request_retried`. All timestamps are taken from the
+    clock of the running event loop, i.e. :meth:`asyncio.loop.time`. This allows to use this
+    class both for live instrumentation and for the simulations of
+    :class:`~telegram.ext.RateLimiterSimulator`.
+
+    Caution:
+        The values exposed by this class are snapshots and may change immediately after being
+        read.
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        max_samples (:obj:`int`, optional): The maximum number of wait times to keep for computing
+            :attr:`wait_times` and :meth:`wait_time_percentile`. Older samples are discarded.
+            Defaults to ``1000``.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`max_samples` is not a positive integer.
+    """
+
+    __slots__ = (
+        "_completed_requests",
+        "_first_received",
+        "_last_finished",
+        "_max_wait_time",
+        "_queue_depths",
+        "_received_requests",
+        "_retry_after_count",
+        "_retry_count",
+        "_started_requests",
+        "_total_wait_time",
+        "_wait_times",
+    )
+
+    def __init__(self, max_samples: int = 1000) -> None:
+        if max_samples < 1:
+            raise ValueError("`max_samples` must be a positive integer!")
+
+        self._received_requests: int = 0
+        self._started_requests: int = 0
+        self._completed_requests: int = 0
+        self._retry_after_count: int = 0
+        self._retry_count: int = 0
+        self._total_wait_time: float = 0.0
+        self._max_wait_time: float = 0.0
+        self._wait_times: deque[float] = deque(maxlen=max_samples)
+        self._queue_depths: dict[Optional[Union[str, int]], int] = {}
+        self._first_received: Optional[float] = None
+        self._last_finished: Optional[float] = None
+
+    @staticmethod
+    def _now() -> float:
+        return asyncio.get_running_loop().time()
+
+    def request_received(self, group: Optional[Union[str, int]] = None) -> float:
+        """Reports that a request was passed to the rate limiter and now waits to be sent.
+
+        Args:
+            group (:obj:`str` | :obj:`int`, optional): The group the request belongs to, e.g. the
+                ``chat_id`` of a group chat. Pass :obj:`None` for requests that don't belong to a
+                group.
+
+        Returns:
+            :obj:`float`: The current time. Must be passed to :meth:`request_started` and
+            :meth:`request_finished`.
+        """
+        now = self._now()
+        if self._first_received is None:
+            self._first_received = now
+        self._received_requests += 1
+        self._queue_depths[group] = self._queue_depths.get(group, 0) + 1
+        return now
+
+    def request_started(self, received_at: float, group: Optional[Union[str, int]] = None) -> None:
+        """Reports that the request is sent to Telegram for the first time. Retries of the same
+        request must not be reported.
+
+        Args:
+            received_at (:obj:`float`): The return value of :meth:`request_received`.
+            group (:obj:`str` | :obj:`int`, optional): The group that was passed to
+                :meth:`request_received`.
+        """
+        wait_time = self._now() - received_at
+        self._started_requests += 1
+        self._total_wait_time += wait_time
+        self._max_wait_time = max(self._max_wait_time, wait_time)
+        self._wait_times.append(wait_time)
+        self._decrease_queue_depth(group)
+
+    def request_finished(self, started: bool, group: Optional[Union[str, int]] = None) -> None:
+        """Reports that the rate limiter is done with the request, regardless of whether it
+        succeeded or not.
+
+        Args:
+            started (:obj:`bool`): Whether :meth:`request_started` was called for this request. If
+                not, the request is removed from :attr:`queue_depths`.
+            group (:obj:`str` | :obj:`int`, optional): The group that was passed to
+                :meth:`request_received`.
+        """
+        if started:
+            self._completed_requests += 1
+        else:
+            self._decrease_queue_depth(group)
+        self._last_finished = self._now()
+
+    def retry_after_received(self) -> None:
+        """Reports that Telegram responded with :exc:`~telegram.error.RetryAfter`."""
+        self._retry_after_count += 1
+
+    def request_retried(self) -> None:
+        """Reports that a request is sent to Telegram again after
+        :exc:`~telegram.error.RetryAfter` was raised.
+        """
+        self._retry_count += 1
+
+    def _decrease_queue_depth(self, group: Optional[Union[str, int]]) -> None:
+        depth = self._queue_depths.get(group, 0) - 1
+        # Remove idle groups such that this mapping doesn't grow indefinitely
+        if depth > 0:
+            self._queue_depths[group] = depth
+        else:
+            self._queue_depths.pop(group, None)
+
+    @property
+    def received_requests(self) -> int:
+        """:obj:`int`: The number of requests passed to the rate limiter."""
+        return self._received_requests
+
+    @property
+    def started_requests(self) -> int:
+        """:obj:`int`: The number of requests that were sent to Telegram at least once."""
+        return self._started_requests
+
+    @property
+    def completed_requests(self) -> int:
+        """:obj:`int`: The number of sent requests that the rate limiter is done with, including
+        requests that failed.
+        """
+        return self._completed_requests
+
+    @property
+    def pending_requests(self) -> int:
+        """:obj:`int`: The number of requests currently waiting to be sent to Telegram."""
+        return sum(self._queue_depths.values())
+
+    @property
+    def queue_depths(self) -> Mapping[Optional[Union[str, int]], int]:
+        """Mapping[:obj:`str` | :obj:`int` | :obj:`None`, :obj:`int`]: A read-only mapping of
+        the groups to the number of requests that currently wait to be sent. Requests that don't
+        belong to a group are listed under the key :obj:`None`. Groups without waiting requests
+        are not included.
+        """
+        return MappingProxyType(self._queue_depths)
+
+    @property
+    def retry_after_count(self) -> int:
+        """:obj:`int`: How often :exc:`~telegram.error.RetryAfter` was raised."""
+        return self._retry_after_count
+
+    @property
+    def retry_count(self) -> int:
+        """:obj:`int`: How often a request was retried after :exc:`~telegram.error.RetryAfter`
+        was raised.
+        """
+        return self._retry_count
+
+    @property
+    def mean_wait_time(self) -> float:
+        """:obj:`float`: The average time in seconds that requests waited before being sent."""
+        if not self._started_requests:
+            return 0.0
+        return self._total_wait_time / self._started_requests
+
+    @property
+    def max_wait_time(self) -> float:
+        """:obj:`float`: The longest time in seconds that a request waited before being sent."""
+        return self._max_wait_time
+
+    @property
+    def wait_times(self) -> tuple[float, ...]:
+        """tuple[:obj:`float`]: The most recent wait times in seconds, oldest first. At most
+        :paramref:`max_samples` values are kept.
+        """
+        return tuple(self._wait_times)
+
+    @property
+    def throughput(self) -> float:
+        """:obj:`float`: The number of completed requests per second, measured from the first
+        received request until the last finished request.
+        """
+        if self._first_received is None or self._last_finished is None:
+            return 0.0
+        duration = self._last_finished - self._first_received
+        if duration <= 0:
+            return 0.0
+        return self._completed_requests / duration
+
+    def wait_time_percentile(self, percentile: float) -> float:
+        """Computes a percentile of :attr:`wait_times` using the nearest-rank method.
+
+        Args:
+            percentile (:obj:`float`): The percentile to compute. Must be between ``0`` and
+                ``100``.
+
+        Returns:
+            :obj:`float`: The percentile in seconds. ``0`` if no requests were sent yet.
+
+        Raises:
+            :exc:`ValueError`: If :paramref:`percentile` is out of range.
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError("`percentile` must be between 0 and 100!")
+        if not self._wait_times:
+            return 0.0
+        samples = sorted(self._wait_times)
+        rank = max(math.ceil(percentile / 100 * len(samples)), 1)
+        return samples[rank - 1]
+
+
 class BaseRateLimiter(ABC, Generic[RLARGS]):
     """
     Abstract interface class that allows to rate limit the requests that python-telegram-bot
@@ -46,6 +276,16 @@ class BaseRateLimiter(ABC, Generic[RLARGS]):
 
     __slots__ = ()
 
+    @property
+    def statistics(self) -> Optional[RateLimiterStatistics]:
+        """:class:`telegram.ext.RateLimiterStatistics`: Runtime statistics of this rate limiter
+        or :obj:`None`, if the implementation does not collect any. This default implementation
+        returns :obj:`None`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return None
+
     @abstractmethod
     async def initialize(self) -> None:
         """Initialize resources used by this class. Must be implemented by a subclass."""
@@ -117,6 +117,17 @@ class BaseUpdateProcessor(AbstractAsyncContextManager["BaseUpdateProcessor"], AB
         """
         return self.max_concurrent_updates - self._semaphore.current_value
 
+    @property
+    def concurrent_dispatch(self) -> bool:
+        """:obj:`bool`: Whether :class:`telegram.ext.Application` passes updates to
+        :meth:`process_update` without waiting for the previous update to be processed. This is
+        the case if :attr:`max_concurrent_updates` is greater than ``1``. Processors that reorder
+        waiting updates should return :obj:`True` also for a single slot.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self.max_concurrent_updates > 1
+
     @abstractmethod
     async def do_process_update(
         self,
@@ -166,8 +177,41 @@ class BaseUpdateProcessor(AbstractAsyncContextManager["BaseUpdateProcessor"], AB
             coroutine (:term:`Awaitable`): The coroutine that will be awaited to process the
                 update.
         """
-        async with self._semaphore:
+        await self.acquire_slot(update)
+        try:
             await self.do_process_update(update, coroutine)
+        finally:
+            self.release_slot()
+
+    async def acquire_slot(self, update: object) -> None:  # noqa: ARG002
+        """Waits until the update may be processed. By default, waiting updates are processed in
+        the order in which they arrived. Subclasses may override this together with
+        :meth:`release_slot` to change that order.
+
+        Warning:
+            This method will be called by :meth:`process_update`. It should *not* be called
+            manually. Overriding implementations must make sure that the number of updates
+            between calls of this method and :meth:`release_slot` never exceeds
+            :attr:`max_concurrent_updates`, e.g. by calling the implementation of this class.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            update (:obj:`object`): The update to be processed.
+        """
+        await self._semaphore.acquire()
+
+    def release_slot(self) -> None:
+        """Marks the processing of an update as finished such that the next update may be
+        processed.
+
+        Warning:
+            This method will be called by :meth:`process_update`. It should *not* be called
+            manually.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        self._semaphore.release()
 
 
 class SimpleUpdateProcessor(BaseUpdateProcessor):
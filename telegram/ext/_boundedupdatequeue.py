@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains an update queue that signals backpressure to the producers of updates."""
+import asyncio
+from typing import Optional
+
+
+class BoundedUpdateQueue(asyncio.Queue[object]):
+    """Subclass of :class:`asyncio.Queue` that tracks the number of *pending* updates, i.e.
+    updates that were put into the queue and not yet marked as done via :meth:`task_done`.
+    :class:`telegram.ext.Application` calls :meth:`task_done` only once an update was processed,
+    so this includes the updates that are currently being processed.
+
+    Once the number of pending updates reaches :paramref:`high_watermark`, the queue is
+    :attr:`overloaded` until the number drops to :paramref:`low_watermark`. While the queue is
+    overloaded, :class:`telegram.ext.Updater` applies backpressure:
+
+    * When polling, :meth:`telegram.Bot.get_updates` is not called until the queue is no longer
+      overloaded. Moreover, :paramref:`telegram.Bot.get_updates.limit` is reduced such that no
+      more than :attr:`free_capacity` updates are fetched at once. Updates that are not fetched
+      stay on the Telegram servers.
+    * The webhook server answers incoming requests with ``503 Service Unavailable``, which makes
+      Telegram deliver the update again later.
+
+    Use this class via :meth:`telegram.ext.ApplicationBuilder.update_queue`.
+
+    Example:
+        .. code:: python
+
+            application = (
+                ApplicationBuilder()
+                .token("TOKEN")
+                .update_queue(BoundedUpdateQueue(high_watermark=1000, low_watermark=500))
+                .build()
+            )
+
+    Note:
+        The watermarks are not enforced for updates that are put into the queue manually. In
+        particular, :meth:`put` never blocks. Moreover, the webhook server may accept a few
+        updates more than :paramref:`high_watermark` if several requests arrive at the same time.
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        high_watermark (:obj:`int`): The number of pending updates at which the queue becomes
+            :attr:`overloaded`.
+        low_watermark (:obj:`int`, optional): The number of pending updates at which the queue is
+            no longer :attr:`overloaded`. Must be smaller than :paramref:`high_watermark`.
+            Defaults to half of :paramref:`high_watermark`.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`high_watermark` is a non-positive integer or if
+            :paramref:`low_watermark` is not in the range ``[0, high_watermark)``.
+    """
+
+    __slots__ = (
+        "_high_watermark",
+        "_low_watermark",
+        "_not_overloaded",
+        "_pending_updates",
+    )
+
+    def __init__(self, high_watermark: int, low_watermark: Optional[int] = None):
+        super().__init__()
+        if high_watermark < 1:
+            raise ValueError("`high_watermark` must be a positive integer!")
+        if low_watermark is None:
+            low_watermark = high_watermark // 2
+        if not 0 <= low_watermark < high_watermark:
+            raise ValueError("`low_watermark` must be in the range [0, high_watermark)!")
+
+        self._high_watermark: int = high_watermark
+        self._low_watermark: int = low_watermark
+        self._pending_updates = 0
+        self._not_overloaded = asyncio.Event()
+        self._not_overloaded.set()
+
+    @property
+    def high_watermark(self) -> int:
+        """:obj:`int`: The number of pending updates at which the queue becomes
+        :attr:`overloaded`.
+        """
+        return self._high_watermark
+
+    @property
+    def low_watermark(self) -> int:
+        """:obj:`int`: The number of pending updates at which the queue is no longer
+        :attr:`overloaded`.
+        """
+        return self._low_watermark
+
+    @property
+    def pending_updates(self) -> int:
+        """:obj:`int`: The number of updates that were put into the queue and not yet marked as
+        done.
+        """
+        return self._pending_updates
+
+    @property
+    def overloaded(self) -> bool:
+        """:obj:`bool`: Whether no more updates should be put into the queue for now."""
+        return not self._not_overloaded.is_set()
+
+    @property
+    def free_capacity(self) -> int:
+        """:obj:`int`: The number of updates that can be put into the queue before it becomes
+        :attr:`overloaded`.
+        """
+        if self.overloaded:
+            return 0
+        return max(self._high_watermark - self._pending_updates, 0)
+
+    async def wait_for_capacity(self) -> None:
+        """Waits until the queue is no longer :attr:`overloaded`."""
+        await self._not_overloaded.wait()
+
+    def put_nowait(self, item: object) -> None:
+        """Puts an item into the queue without blocking and updates :attr:`pending_updates`.
+
+        Args:
+            item (:obj:`object`): The item.
+        """
+        super().put_nowait(item)
+        self._pending_updates += 1
+        if self._pending_updates >= self._high_watermark:
+            self._not_overloaded.clear()
+
+    def task_done(self) -> None:
+        """Marks a formerly enqueued item as done and updates :attr:`pending_updates`.
+
+        Raises:
+            :exc:`ValueError`: If called more times than there were items placed in the queue.
+        """
+        super().task_done()
+        self._pending_updates -= 1
+        if self._pending_updates <= self._low_watermark:
+            self._not_overloaded.set()
@@ -110,6 +110,11 @@ class CallbackContext(Generic[BT, UD, CD, BD]):
 
             .. versionchanged:: 20.0
                 :attr:`job` is now also present in error handlers if the error is caused by a job.
+        batch (list[:class:`telegram.Update`]): Optional. The updates passed to the callback of a
+            :class:`telegram.ext.BatchHandler`. Only present in that callback or in error handlers
+            if the error is caused by that callback.
+
+            .. versionadded:: NEXT.VERSION
 
     """
 
@@ -119,6 +124,7 @@ class CallbackContext(Generic[BT, UD, CD, BD]):
         "_chat_id",
         "_user_id",
         "args",
+        "batch",
         "coroutine",
         "error",
         "job",
@@ -138,6 +144,7 @@ class CallbackContext(Generic[BT, UD, CD, BD]):
         self.matches: Optional[list[Match[str]]] = None
         self.error: Optional[Exception] = None
         self.job: Optional[Job[Any]] = None
+        self.batch: Optional[list[Update]] = None
         self.coroutine: Optional[
             Union[Generator[Optional[Future[object]], None, Any], Awaitable[Any]]
         ] = None
@@ -223,16 +230,23 @@ class CallbackContext(Generic[BT, UD, CD, BD]):
         :meth:`telegram.ext.Job.run`.
 
         .. versionadded:: 13.6
+
+        .. versionchanged:: NEXT.VERSION
+            Methods of the persistence that do nothing, e.g.
+            :meth:`telegram.ext.PicklePersistence.refresh_chat_data`, are no longer called. In
+            particular, :attr:`chat_data` and :attr:`user_data` are not created in that case.
         """
         if self.application.persistence:
-            if self.application.persistence.store_data.bot_data:
+            # Which refresh methods actually do something is internal logic of the application
+            data = self.application._get_data_to_refresh()  # pylint: disable=protected-access
+            if data.bot_data:
                 await self.application.persistence.refresh_bot_data(self.bot_data)
-            if self.application.persistence.store_data.chat_data and self._chat_id is not None:
+            if data.chat_data and self._chat_id is not None:
                 await self.application.persistence.refresh_chat_data(
                     chat_id=self._chat_id,
                     chat_data=self.chat_data,  # type: ignore[arg-type]
                 )
-            if self.application.persistence.store_data.user_data and self._user_id is not None:
+            if data.user_data and self._user_id is not None:
                 await self.application.persistence.refresh_user_data(
                     user_id=self._user_id,
                     user_data=self.user_data,  # type: ignore[arg-type]
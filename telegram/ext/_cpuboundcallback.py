@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains a handler callback that offloads its work to a process pool."""
+from collections.abc import Coroutine
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+from telegram._utils.repr import build_repr_with_selected_attrs
+from telegram.ext._utils.types import CCT, RT
+
+_UT = TypeVar("_UT")
+_R = TypeVar("_R")
+
+
+class CPUBoundCallback(Generic[_UT, CCT, _R, RT]):
+    """A handler callback that runs a CPU-bound function in the process pool of the application
+    via :meth:`telegram.ext.Application.run_cpu`. The function receives only the update, as the
+    ``context`` argument can't be transferred to another process. Its result is passed back to
+    :paramref:`result_callback`, which runs in the event loop and can e.g. send the result to the
+    user.
+
+    Exceptions raised by :paramref:`func` are passed to the error handlers just like exceptions
+    raised in any other handler callback. Use this class as callback of any handler:
+
+    Example:
+        .. code:: python
+
+            def make_report(update: Update) -> str:
+                # runs in a worker process
+                ...
+
+            async def send_report(update: Update, context: CallbackContext, report: str) -> None:
+                await update.message.reply_text(report)
+
+            application = Application.builder().token("TOKEN").process_pool_size(4).build()
+            application.add_handler(
+                CommandHandler("report", CPUBoundCallback(make_report, send_report))
+            )
+
+    Important:
+        :paramref:`func` must be defined at the top level of an importable module and the
+        update as well as the return value of :paramref:`func` must be picklable. Note that the
+        update is pickled without the bot instance, i.e. shortcut methods like
+        :meth:`telegram.Message.reply_text` are not available in :paramref:`func`.
+
+    .. seealso:: :meth:`telegram.ext.ApplicationBuilder.process_pool_size`
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        func (:obj:`callable`): The CPU-bound function. Will be called with the update as only
+            argument.
+        result_callback (:term:`coroutine function`, optional): Will be called with the update,
+            the context and the return value of :paramref:`func`::
+
+                async def result_callback(update: Update, context: CallbackContext, result)
+
+            The return value of :paramref:`result_callback` is returned by this callback, which
+            makes it usable within a :class:`telegram.ext.ConversationHandler`.
+
+    Attributes:
+        func (:obj:`callable`): The CPU-bound function.
+        result_callback (:term:`coroutine function`): Optional. Will be called with the result of
+            :attr:`func`.
+    """
+
+    __slots__ = ("func", "result_callback")
+
+    def __init__(
+        self,
+        func: Callable[[_UT], _R],
+        result_callback: Optional[Callable[[_UT, CCT, _R], Coroutine[Any, Any, RT]]] = None,
+    ):
+        self.func: Callable[[_UT], _R] = func
+        self.result_callback: Optional[Callable[[_UT, CCT, _R], Coroutine[Any, Any, RT]]] = (
+            result_callback
+        )
+
+    def __repr__(self) -> str:
+        """Give a string representation of the callback in the form ``CPUBoundCallback[func=...]``.
+
+        As this class doesn't implement :meth:`object.__str__`, the default implementation
+        will be used, which is equivalent to :meth:`__repr__`.
+
+        Returns:
+            :obj:`str`
+        """
+        return build_repr_with_selected_attrs(
+            self, func=getattr(self.func, "__qualname__", self.func)
+        )
+
+    async def __call__(self, update: _UT, context: CCT) -> Optional[RT]:
+        """Runs :attr:`func` in the process pool and passes the result to
+        :attr:`result_callback`.
+
+        Args:
+            update (:obj:`object` | :class:`telegram.Update`): The update.
+            context (:class:`telegram.ext.CallbackContext`): The context.
+
+        Returns:
+            The return value of :attr:`result_callback` or :obj:`None`, if that is not set.
+        """
+        result = await context.application.run_cpu(self.func, update)
+        if self.result_callback is None:
+            return None
+        return await self.result_callback(update, context, result)
@@ -304,12 +304,27 @@ class DictPersistence(BasePersistence[dict[Any, Any], dict[Any, Any], dict[Any,
             key (:obj:`tuple`): The key the state is changed for.
             new_state (:obj:`tuple` | :class:`object`): The new state for the given key.
         """
+        await self.update_conversations(name, {key: new_state})
+
+    async def update_conversations(
+        self, name: str, changes: dict[ConversationKey, Optional[object]]
+    ) -> None:
+        """Will update the conversations for the given handler.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            name (:obj:`str`): The handler's name.
+            changes (dict[:obj:`tuple`, :class:`object`]): The new states by the keys they are
+                changed for.
+        """
         if not self._conversations:
             self._conversations = {}
-        if self._conversations.setdefault(name, {}).get(key) == new_state:
-            return
-        self._conversations[name][key] = new_state
-        self._conversations_json = None
+        conversations = self._conversations.setdefault(name, {})
+        for key, new_state in changes.items():
+            if conversations.get(key) != new_state:
+                conversations[key] = new_state
+                self._conversations_json = None
 
     async def update_user_data(self, user_id: int, data: dict[Any, Any]) -> None:
         """Will update the user_data (if changed).
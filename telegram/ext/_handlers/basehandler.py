@@ -23,14 +23,23 @@ from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar, Union
 from telegram._utils.defaultvalue import DEFAULT_TRUE
 from telegram._utils.repr import build_repr_with_selected_attrs
 from telegram._utils.types import DVType
+from telegram.ext._basepersistence import PersistenceInput
+from telegram.ext._utils.handlerindex import HandlerIndex
+from telegram.ext._utils.threadpool import is_coroutine_callable
 from telegram.ext._utils.types import CCT, HandlerCallback
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from telegram.ext import Application
 
 RT = TypeVar("RT")
 UT = TypeVar("UT")
 
+_ALL_CONTEXT_DATA = PersistenceInput()
+# Attributes of the built-in handlers that decide which updates the handler index routes to them
+_ROUTING_ATTRIBUTES = frozenset(("commands", "data_prefix", "filters", "game_pattern", "pattern"))
+
 
 class BaseHandler(Generic[UT, CCT, RT], ABC):
     """The base class for all update handlers. Create custom handlers by inheriting from it.
@@ -56,6 +65,16 @@ class BaseHandler(Generic[UT, CCT, RT], ABC):
            this handler fits the definition of the :class:`~Application`.
     3. The return type of the :paramref:`callback` function accepted by this handler.
 
+    Note:
+        :class:`telegram.ext.Application` and :class:`telegram.ext.ConversationHandler` keep track
+        of which handlers can possibly handle which updates. The attributes of the built-in
+        handlers that this depends on, e.g. :attr:`telegram.ext.CommandHandler.commands`,
+        :attr:`telegram.ext.MessageHandler.filters` or
+        :attr:`telegram.ext.CallbackQueryHandler.pattern`, may still be reassigned after the
+        handler was added. Only the groups that contain the handler are updated in that case.
+
+        .. versionadded:: NEXT.VERSION
+
     .. seealso:: :wiki:`Types of Handlers <Types-of-Handlers>`
 
     .. versionchanged:: 20.0
@@ -72,6 +91,11 @@ class BaseHandler(Generic[UT, CCT, RT], ABC):
 
             The return value of the callback is usually ignored except for the special case of
             :class:`telegram.ext.ConversationHandler`.
+
+            .. versionchanged:: NEXT.VERSION
+                Synchronous functions are accepted as well. They are run in a thread if
+                :attr:`telegram.ext.Application.thread_pool_size` is set and called directly in
+                the event loop otherwise.
         block (:obj:`bool`, optional): Determines whether the return value of the callback should
             be awaited before processing the next handler in
             :meth:`telegram.ext.Application.process_update`. Defaults to :obj:`True`.
@@ -81,12 +105,37 @@ class BaseHandler(Generic[UT, CCT, RT], ABC):
     Attributes:
         callback (:term:`coroutine function`): The callback function for this handler.
         block (:obj:`bool`): Determines whether the callback will run in a blocking way.
+        context_data (:class:`telegram.ext.PersistenceInput`): The kinds of data that
+            :attr:`callback` accesses via its ``context`` argument. Before calling the callback,
+            :meth:`telegram.ext.Application.process_update` refreshes only those kinds of data
+            via :meth:`telegram.ext.CallbackContext.refresh_data` that are set to :obj:`True`
+            here. If none of them are needed, refreshing is skipped entirely. Note that
+            :attr:`~telegram.ext.PersistenceInput.callback_data` is ignored. Defaults to
+            :class:`~telegram.ext.PersistenceInput` with all kinds of data set to :obj:`True`.
+            Can be changed after initialization, e.g.
+
+            .. code:: python
+
+                handler = MessageHandler(filters.TEXT, echo)
+                handler.context_data = PersistenceInput(
+                    bot_data=False, chat_data=False, user_data=True
+                )
+
+            Caution:
+                This is merely a hint for the :class:`~telegram.ext.Application`. If the
+                data was already refreshed for another handler of the same update, the callback
+                can still access it. If a custom context class overrides
+                :meth:`~telegram.ext.CallbackContext.refresh_data`, the data is always refreshed.
+
+            .. versionadded:: NEXT.VERSION
 
     """
 
     __slots__ = (
+        "_indexed_groups",
         "block",
         "callback",
+        "context_data",
     )
 
     def __init__(
@@ -96,6 +145,16 @@ class BaseHandler(Generic[UT, CCT, RT], ABC):
     ):
         self.callback: HandlerCallback[UT, CCT, RT] = callback
         self.block: DVType[bool] = block
+        self.context_data: PersistenceInput = _ALL_CONTEXT_DATA
+        # The groups of the handler indices that this handler is part of
+        self._indexed_groups: set[tuple[HandlerIndex, Hashable]] = set()
+
+    def __setattr__(self, key: str, value: object) -> None:
+        # Application and ConversationHandler cache which handlers can handle which updates.
+        # Reassigning e.g. the commands of a handler after it was added makes that outdated.
+        if key in _ROUTING_ATTRIBUTES:
+            HandlerIndex.invalidate_handler(self)
+        super().__setattr__(key, value)
 
     def __repr__(self) -> str:
         """Give a string representation of the handler in the form ``ClassName[callback=...]``.
@@ -112,6 +171,27 @@ class BaseHandler(Generic[UT, CCT, RT], ABC):
             callback_name = repr(self.callback)
         return build_repr_with_selected_attrs(self, callback=callback_name)
 
+    @property
+    def update_types(self) -> Optional[frozenset[str]]:
+        """frozenset[:obj:`str`]: The kinds of :class:`telegram.Update` that this handler can
+        possibly handle, e.g. ``{"callback_query"}``, given as the names of the corresponding
+        attributes of :class:`telegram.Update`. :obj:`None`, if this handler may handle
+        any kind of update or objects that are not instances of :class:`telegram.Update`.
+        :meth:`telegram.ext.Application.process_update` uses this information to skip handlers
+        that can't handle an update without calling their :meth:`check_update`.
+
+        This default implementation returns :obj:`None`. Subclasses that only handle specific
+        kinds of updates can override this property. In that case, :meth:`check_update` must
+        return :obj:`None` or :obj:`False` for all other updates.
+
+        Note:
+            If a subclass of a handler overrides :meth:`check_update` but not this property, the
+            value of this property is ignored by :class:`~telegram.ext.Application`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return None
+
     @abstractmethod
     def check_update(self, update: object) -> Optional[Union[bool, object]]:
         """
@@ -155,7 +235,12 @@ class BaseHandler(Generic[UT, CCT, RT], ABC):
 
         """
         self.collect_additional_context(context, update, application, check_result)
-        return await self.callback(update, context)
+        if is_coroutine_callable(self.callback):
+            return await self.callback(update, context)
+        # Running sync callbacks is internal logic of application - let's keep it private for now
+        return await application._run_sync_callback(  # pylint: disable=protected-access
+            self.callback, update, context
+        )
 
     def collect_additional_context(
         self,
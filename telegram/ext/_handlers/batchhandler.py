@@ -0,0 +1,249 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the BatchHandler class."""
+import asyncio
+from collections.abc import Coroutine
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+from telegram import Update
+from telegram._utils.defaultvalue import DEFAULT_TRUE
+from telegram._utils.logging import get_logger
+from telegram._utils.types import DVType
+from telegram._utils.warnings import warn
+from telegram.ext import filters as filters_module
+from telegram.ext._application import ApplicationHandlerStop
+from telegram.ext._handlers.basehandler import BaseHandler
+from telegram.ext._utils.filtercompiler import CompiledFilter
+from telegram.ext._utils.handlerindex import get_filter_update_types
+from telegram.ext._utils.threadpool import is_coroutine_callable
+from telegram.ext._utils.types import CCT
+
+if TYPE_CHECKING:
+    from telegram.ext import Application
+
+_LOGGER = get_logger(__name__, class_name="BatchHandler")
+
+
+class BatchHandler(BaseHandler[Update, CCT, None]):
+    """Handler class that collects updates and passes them to its callback in batches, e.g. to
+    store them in a database with a single bulk write instead of one write per update.
+
+    Updates that pass :paramref:`filters` are appended to the current batch. The callback is
+    called with the batch once it contains :paramref:`max_batch_size` updates or once
+    :paramref:`max_delay` seconds have passed since the first update was added to the batch,
+    whichever happens first. When the application is stopped, the last batch is passed to the
+    callback after at most :paramref:`max_delay` seconds as well.
+
+    Example:
+        .. code:: python
+
+            async def store_messages(updates: list[Update], context: CallbackContext) -> None:
+                await database.insert_many(update.message.to_dict() for update in updates)
+
+            application.add_handler(
+                BatchHandler(filters.TEXT, store_messages, max_batch_size=500, max_delay=2)
+            )
+
+    Note:
+        * Since a batch contains updates from different chats and users, the ``context``
+          argument of the callback is not associated with a specific chat or user. That is,
+          :attr:`telegram.ext.CallbackContext.chat_data` and
+          :attr:`telegram.ext.CallbackContext.user_data` are not available. Instead, the chat and
+          user data of all updates in the batch are marked for the next run of
+          :meth:`telegram.ext.Application.update_persistence`.
+        * The updates of the batch are also available as
+          :attr:`telegram.ext.CallbackContext.batch`. If the callback raises an exception, the
+          error handlers are called with :obj:`None` as ``update`` argument and can access the
+          batch in the same way.
+        * Raising :class:`telegram.ext.ApplicationHandlerStop` in the callback has no effect,
+          since the updates of the batch have already been passed on to the other handler
+          groups. A warning is issued in that case.
+        * If the batch is passed to the callback because it's full, this happens within the
+          processing of the update that completed the batch. Hence, if :paramref:`block` is
+          :obj:`True`, processing of that update waits for the callback to finish. Batches that
+          are passed to the callback because :paramref:`max_delay` has passed are always
+          processed in a non-blocking way via :meth:`telegram.ext.Application.create_task`.
+
+    Warning:
+        Since :meth:`handle_update` returns before the callback has processed the update, this
+        handler can't be used within a :class:`telegram.ext.ConversationHandler`.
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        filters (:class:`telegram.ext.filters.BaseFilter`): A filter inheriting from
+            :class:`telegram.ext.filters.BaseFilter`. Standard filters can be found in
+            :mod:`telegram.ext.filters`. Filters can be combined using bitwise
+            operators (& for and, | for or, ~ for not). Passing :obj:`None` is a shortcut
+            to passing :class:`telegram.ext.filters.ALL`.
+        callback (:term:`coroutine function`): The callback function for this handler. Will be
+            called with the list of collected updates. Callback signature::
+
+                async def callback(updates: list[Update], context: CallbackContext)
+
+            Just like for other handlers, synchronous functions are accepted as well.
+        max_batch_size (:obj:`int`, optional): The maximum number of updates in a batch. Defaults
+            to ``100``.
+        max_delay (:obj:`float`, optional): The maximum number of seconds that an update waits in
+            the batch before the batch is passed to the callback. Defaults to ``1.0``.
+        block (:obj:`bool`, optional): Determines whether the return value of the callback should
+            be awaited before processing the next handler in
+            :meth:`telegram.ext.Application.process_update`. Defaults to :obj:`True`.
+
+            .. seealso:: :wiki:`Concurrency`
+
+    Attributes:
+        filters (:class:`telegram.ext.filters.BaseFilter`): Only allow updates with these Filters.
+        callback (:term:`coroutine function`): The callback function for this handler.
+        max_batch_size (:obj:`int`): The maximum number of updates in a batch.
+        max_delay (:obj:`float`): The maximum number of seconds that an update waits in the batch.
+        block (:obj:`bool`): Determines whether the return value of the callback should be
+            awaited before processing the next handler in
+            :meth:`telegram.ext.Application.process_update`.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`max_batch_size` or :paramref:`max_delay` is not
+            positive.
+    """
+
+    __slots__ = ("_batch", "_compiled_filters", "filters", "max_batch_size", "max_delay")
+
+    def __init__(
+        self: "BatchHandler[CCT]",
+        filters: Optional[filters_module.BaseFilter],
+        callback: Callable[[list[Update], CCT], Union[Coroutine[Any, Any, None], None]],
+        max_batch_size: int = 100,
+        max_delay: float = 1.0,
+        block: DVType[bool] = DEFAULT_TRUE,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("`max_batch_size` must be a positive integer!")
+        if max_delay <= 0:
+            raise ValueError("`max_delay` must be a positive number!")
+
+        super().__init__(callback, block=block)  # type: ignore[arg-type]
+        self.filters: filters_module.BaseFilter = (
+            filters if filters is not None else filters_module.ALL
+        )
+        self._compiled_filters: CompiledFilter = CompiledFilter(self.filters)
+        self.max_batch_size: int = max_batch_size
+        self.max_delay: float = max_delay
+        self._batch: list[Update] = []
+
+    @property
+    def update_types(self) -> Optional[frozenset[str]]:
+        """frozenset[:obj:`str`]: The kinds of updates that :attr:`filters` can accept. See
+        :attr:`telegram.ext.BaseHandler.update_types` for details.
+        """
+        return get_filter_update_types(self.filters)
+
+    @property
+    def pending_updates(self) -> int:
+        """:obj:`int`: The number of updates in the current batch."""
+        return len(self._batch)
+
+    def check_update(self, update: object) -> Optional[bool]:
+        """Determines whether an update should be added to the batch.
+
+        Args:
+            update (:class:`telegram.Update` | :obj:`object`): Incoming update.
+
+        Returns:
+            :obj:`bool`
+
+        """
+        if isinstance(update, Update):
+            return bool(self._compiled_filters.check_update(update, self.filters))
+        return None
+
+    async def handle_update(
+        self,
+        update: Update,
+        application: "Application[Any, CCT, Any, Any, Any, Any]",
+        check_result: object,  # noqa: ARG002
+        context: CCT,  # noqa: ARG002
+    ) -> None:
+        """Adds the update to the current batch and passes the batch to :attr:`callback` if it's
+        full. Otherwise, makes sure that the batch is passed to the callback after at most
+        :attr:`max_delay` seconds.
+
+        Args:
+            update (:class:`telegram.Update`): The update to be handled.
+            application (:class:`telegram.ext.Application`): The calling application.
+            check_result (:class:`object`): The result from :meth:`check_update`.
+            context (:class:`telegram.ext.CallbackContext`): The context as provided by
+                the application. Not used, since the callback receives a context that is not
+                associated with a specific update.
+        """
+        batch = self._batch
+        batch.append(update)
+        if len(batch) >= self.max_batch_size:
+            self._batch = []
+            await self._process_batch(batch, application)
+        elif len(batch) == 1:
+            try:
+                application.create_task(
+                    self._process_batch_later(batch, application),
+                    name=f"BatchHandler:{update.update_id}:process_batch_later",
+                )
+            except RuntimeError:
+                # The application doesn't accept more tasks. Rather than risking that the
+                # batch is never processed, we pass it to the callback right away.
+                self._batch = []
+                await self._process_batch(batch, application)
+
+    async def _process_batch_later(
+        self, batch: list[Update], application: "Application[Any, CCT, Any, Any, Any, Any]"
+    ) -> None:
+        await asyncio.sleep(self.max_delay)
+        # If the batch was already processed because it was full, there is nothing to do
+        if self._batch is batch:
+            self._batch = []
+            await self._process_batch(batch, application)
+
+    async def _process_batch(
+        self, batch: list[Update], application: "Application[Any, CCT, Any, Any, Any, Any]"
+    ) -> None:
+        _LOGGER.debug("Processing batch of %d updates", len(batch))
+        try:
+            context = application.context_types.context(application=application)
+            context.batch = batch
+            await context.refresh_data()
+            if is_coroutine_callable(self.callback):
+                await self.callback(batch, context)  # type: ignore[arg-type]
+            else:
+                # Running sync callbacks is internal logic of application
+                await application._run_sync_callback(  # pylint: disable=protected-access
+                    self.callback, batch, context
+                )
+        except ApplicationHandlerStop:
+            warn(
+                "ApplicationHandlerStop in the callback of a BatchHandler has no effect. "
+                "Ignoring.",
+                stacklevel=1,
+            )
+        except Exception as exc:
+            # The exception concerns the whole batch rather than a single update
+            await application.process_error(update=None, error=exc, batch=batch)
+        finally:
+            for update in batch:
+                # This is internal logic of application - let's keep it private for now
+                application._mark_for_persistence_update(  # pylint: disable=protected-access
+                    update=update
+                )
@@ -61,6 +61,15 @@ class CallbackQueryHandler(BaseHandler[Update, CCT, RT]):
 
           .. versionadded:: 21.5
 
+        * The :class:`~telegram.ext.Application` uses literal prefixes of :paramref:`pattern`
+          and :paramref:`game_pattern` (e.g. ``"menu_"`` for ``r"menu_(\\d+)"``) as well as
+          :paramref:`data_prefix` to skip handlers that can't match a callback query without
+          evaluating their patterns. This makes routing cheap even for many handlers. Use
+          :paramref:`data_prefix` if :paramref:`pattern` is a callable or doesn't start with a
+          literal prefix.
+
+          .. versionadded:: NEXT.VERSION
+
     Warning:
         When setting :paramref:`block` to :obj:`False`, you cannot rely on adding custom
         attributes to :class:`telegram.ext.CallbackContext`. See its docs for more info.
@@ -102,6 +111,11 @@ class CallbackQueryHandler(BaseHandler[Update, CCT, RT]):
             handled by this handler.
 
             .. versionadded:: 21.5
+        data_prefix (:obj:`str`, optional): Prefix that :attr:`telegram.CallbackQuery.data` must
+            start with. Is checked before :paramref:`pattern`. If only this is set, all callback
+            queries whose data starts with the prefix are handled.
+
+            .. versionadded:: NEXT.VERSION
         block (:obj:`bool`, optional): Determines whether the return value of the callback should
             be awaited before processing the next handler in
             :meth:`telegram.ext.Application.process_update`. Defaults to :obj:`True`.
@@ -117,13 +131,17 @@ class CallbackQueryHandler(BaseHandler[Update, CCT, RT]):
                Added support for arbitrary callback data.
         game_pattern (:func:`re.Pattern <re.compile>`): Optional.
             Regex pattern to test :attr:`telegram.CallbackQuery.game_short_name`
+        data_prefix (:obj:`str`): Optional. Prefix that :attr:`telegram.CallbackQuery.data`
+            must start with.
+
+            .. versionadded:: NEXT.VERSION
         block (:obj:`bool`): Determines whether the return value of the callback should be
             awaited before processing the next handler in
             :meth:`telegram.ext.Application.process_update`.
 
     """
 
-    __slots__ = ("game_pattern", "pattern")
+    __slots__ = ("data_prefix", "game_pattern", "pattern")
 
     def __init__(
         self: "CallbackQueryHandler[CCT, RT]",
@@ -133,6 +151,7 @@ class CallbackQueryHandler(BaseHandler[Update, CCT, RT]):
         ] = None,
         game_pattern: Optional[Union[str, Pattern[str]]] = None,
         block: DVType[bool] = DEFAULT_TRUE,
+        data_prefix: Optional[str] = None,
     ):
         super().__init__(callback, block=block)
 
@@ -149,6 +168,17 @@ class CallbackQueryHandler(BaseHandler[Update, CCT, RT]):
             Union[str, Pattern[str], type, Callable[[object], Optional[bool]]]
         ] = pattern
         self.game_pattern: Optional[Union[str, Pattern[str]]] = game_pattern
+        self.data_prefix: Optional[str] = data_prefix
+
+    @property
+    def update_types(self) -> frozenset[str]:
+        """frozenset[:obj:`str`]: This handler only handles updates with
+        :attr:`telegram.Update.callback_query`. See :attr:`telegram.ext.BaseHandler.update_types`
+        for details.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return frozenset((Update.CALLBACK_QUERY,))
 
     def check_update(self, update: object) -> Optional[Union[bool, object]]:
         """Determines whether an update should be passed to this handler's :attr:`callback`.
@@ -167,12 +197,19 @@ class CallbackQueryHandler(BaseHandler[Update, CCT, RT]):
         callback_data = update.callback_query.data
         game_short_name = update.callback_query.game_short_name
 
-        if not any([self.pattern, self.game_pattern]):
+        if not any([self.pattern, self.game_pattern, self.data_prefix]):
             return True
 
         # we check for .data or .game_short_name from update to filter based on whats coming
         # this gives xor-like behavior
         if callback_data:
+            if self.data_prefix:
+                if not (
+                    isinstance(callback_data, str) and callback_data.startswith(self.data_prefix)
+                ):
+                    return False
+                if not self.pattern:
+                    return True
             if not self.pattern:
                 return False
             if isinstance(self.pattern, type):
@@ -96,6 +96,16 @@ class ChatBoostHandler(BaseHandler[Update, CCT, RT]):
         self._chat_ids = parse_chat_id(chat_id)
         self._chat_usernames = parse_username(chat_username)
 
+    @property
+    def update_types(self) -> frozenset[str]:
+        """frozenset[:obj:`str`]: This handler only handles updates with
+        :attr:`telegram.Update.chat_boost` and :attr:`telegram.Update.removed_chat_boost`. See
+        :attr:`telegram.ext.BaseHandler.update_types` for details.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return frozenset((Update.CHAT_BOOST, Update.REMOVED_CHAT_BOOST))
+
     def check_update(self, update: object) -> bool:
         """Determines whether an update should be passed to this handler's :attr:`callback`.
 
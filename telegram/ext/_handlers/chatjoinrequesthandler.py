@@ -92,6 +92,16 @@ class ChatJoinRequestHandler(BaseHandler[Update, CCT, RT]):
         self._chat_ids = parse_chat_id(chat_id)
         self._usernames = parse_username(username)
 
+    @property
+    def update_types(self) -> frozenset[str]:
+        """frozenset[:obj:`str`]: This handler only handles updates with
+        :attr:`telegram.Update.chat_join_request`. See
+        :attr:`telegram.ext.BaseHandler.update_types` for details.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return frozenset((Update.CHAT_JOIN_REQUEST,))
+
     def check_update(self, update: object) -> bool:
         """Determines whether an update should be passed to this handler's :attr:`callback`.
 
@@ -98,6 +98,16 @@ class ChatMemberHandler(BaseHandler[Update, CCT, RT]):
         self.chat_member_types: Optional[int] = chat_member_types
         self._chat_ids = parse_chat_id(chat_id)
 
+    @property
+    def update_types(self) -> frozenset[str]:
+        """frozenset[:obj:`str`]: This handler only handles updates with
+        :attr:`telegram.Update.my_chat_member` and :attr:`telegram.Update.chat_member`. See
+        :attr:`telegram.ext.BaseHandler.update_types` for details.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return frozenset((Update.MY_CHAT_MEMBER, Update.CHAT_MEMBER))
+
     def check_update(self, update: object) -> bool:
         """Determines whether an update should be passed to this handler's :attr:`callback`.
 
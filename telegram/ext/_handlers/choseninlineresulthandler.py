@@ -89,6 +89,16 @@ class ChosenInlineResultHandler(BaseHandler[Update, CCT, RT]):
 
         self.pattern: Optional[Union[str, Pattern[str]]] = pattern
 
+    @property
+    def update_types(self) -> frozenset[str]:
+        """frozenset[:obj:`str`]: This handler only handles updates with
+        :attr:`telegram.Update.chosen_inline_result`. See
+        :attr:`telegram.ext.BaseHandler.update_types` for details.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return frozenset((Update.CHOSEN_INLINE_RESULT,))
+
     def check_update(self, update: object) -> Optional[Union[bool, object]]:
         """Determines whether an update should be passed to this handler's :attr:`callback`.
 
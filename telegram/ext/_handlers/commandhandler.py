@@ -20,11 +20,14 @@
 import re
 from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union
 
-from telegram import MessageEntity, Update
+from telegram import Update
 from telegram._utils.defaultvalue import DEFAULT_TRUE
 from telegram._utils.types import SCT, DVType
 from telegram.ext import filters as filters_module
 from telegram.ext._handlers.basehandler import BaseHandler
+from telegram.ext._utils.commandparsing import parse_command
+from telegram.ext._utils.filtercompiler import CompiledFilter
+from telegram.ext._utils.handlerindex import get_filter_update_types
 from telegram.ext._utils.types import CCT, FilterDataDict, HandlerCallback
 
 if TYPE_CHECKING:
@@ -121,7 +124,7 @@ class CommandHandler(BaseHandler[Update, CCT, RT]):
             .. versionadded:: 20.5
     """
 
-    __slots__ = ("commands", "filters", "has_args")
+    __slots__ = ("_compiled_filters", "commands", "filters", "has_args")
 
     def __init__(
         self: "CommandHandler[CCT, RT]",
@@ -145,6 +148,7 @@ class CommandHandler(BaseHandler[Update, CCT, RT]):
         self.filters: filters_module.BaseFilter = (
             filters if filters is not None else filters_module.UpdateType.MESSAGES
         )
+        self._compiled_filters: CompiledFilter = CompiledFilter(self.filters)
 
         self.has_args: Optional[Union[bool, int]] = has_args
 
@@ -165,6 +169,17 @@ class CommandHandler(BaseHandler[Update, CCT, RT]):
             or (isinstance(self.has_args, int) and len(args) == self.has_args)
         )
 
+    @property
+    def update_types(self) -> Optional[frozenset[str]]:
+        """frozenset[:obj:`str`]: The kinds of updates that :attr:`filters` can accept.
+        :obj:`None`, if the filter implements a custom
+        :meth:`~telegram.ext.filters.BaseFilter.check_update`. See
+        :attr:`telegram.ext.BaseHandler.update_types` for details.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return get_filter_update_types(self.filters)
+
     def check_update(
         self, update: object
     ) -> Optional[Union[bool, tuple[list[str], Optional[Union[bool, FilterDataDict]]]]]:
@@ -179,29 +194,23 @@ class CommandHandler(BaseHandler[Update, CCT, RT]):
         """
         if isinstance(update, Update) and update.effective_message:
             message = update.effective_message
+            parsed_command = parse_command(message)
 
-            if (
-                message.entities
-                and message.entities[0].type == MessageEntity.BOT_COMMAND
-                and message.entities[0].offset == 0
-                and message.text
-                and message.get_bot()
-            ):
-                command = message.text[1 : message.entities[0].length]
-                args = message.text.split()[1:]
-                command_parts = command.split("@")
-                command_parts.append(message.get_bot().username)
-
+            if parsed_command and parsed_command.command is not None and message.get_bot():
                 if not (
-                    command_parts[0].lower() in self.commands
-                    and command_parts[1].lower() == message.get_bot().username.lower()
+                    parsed_command.command in self.commands
+                    and (
+                        parsed_command.bot_username is None
+                        or parsed_command.bot_username == message.get_bot().username.lower()
+                    )
                 ):
                     return None
 
+                args = list(parsed_command.words[1:])
                 if not self._check_correct_args(args):
                     return None
 
-                filter_result = self.filters.check_update(update)
+                filter_result = self._compiled_filters.check_update(update, self.filters)
                 if filter_result:
                     return args, filter_result
                 return False
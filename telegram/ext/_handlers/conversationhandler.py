@@ -19,7 +19,11 @@
 """This module contains the ConversationHandler."""
 import asyncio
 import datetime as dtm
+import itertools
+import time
+from collections.abc import Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Final, Generic, NoReturn, Optional, Union, cast
 
 from telegram import Update
@@ -29,6 +33,7 @@ from telegram._utils.repr import build_repr_with_selected_attrs
 from telegram._utils.types import DVType
 from telegram._utils.warnings import warn
 from telegram.ext._application import ApplicationHandlerStop
+from telegram.ext._basepersistence import PersistenceInput
 from telegram.ext._extbot import ExtBot
 from telegram.ext._handlers.basehandler import BaseHandler
 from telegram.ext._handlers.callbackqueryhandler import CallbackQueryHandler
@@ -37,8 +42,14 @@ from telegram.ext._handlers.inlinequeryhandler import InlineQueryHandler
 from telegram.ext._handlers.stringcommandhandler import StringCommandHandler
 from telegram.ext._handlers.stringregexhandler import StringRegexHandler
 from telegram.ext._handlers.typehandler import TypeHandler
+from telegram.ext._utils.handlerindex import (
+    HandlerIndex,
+    get_handler_update_types,
+    get_update_kind,
+)
 from telegram.ext._utils.trackingdict import TrackingDict
 from telegram.ext._utils.types import CCT, ConversationDict, ConversationKey
+from telegram.warnings import PTBDeprecationWarning
 
 if TYPE_CHECKING:
     from telegram.ext import Application, Job, JobQueue
@@ -46,19 +57,23 @@ _CheckUpdateType = tuple[object, ConversationKey, BaseHandler[Update, CCT, objec
 
 _LOGGER = get_logger(__name__, class_name="ConversationHandler")
 
+# Keys of the entry points and fallbacks in the handler index. States use their own value as key.
+_ENTRY_POINTS: Final = object()
+_FALLBACKS: Final = object()
+
 
 @dataclass
 class _ConversationTimeoutContext(Generic[CCT]):
-    """Used as a datastore for conversation timeouts. Passed in the
-    :paramref:`JobQueue.run_once.data` parameter. See :meth:`_trigger_timeout`.
-    """
+    """Used as a datastore for conversation timeouts. See :meth:`_trigger_timeout`."""
 
-    __slots__ = ("application", "callback_context", "conversation_key", "update")
+    __slots__ = ("application", "callback_context", "conversation_key", "deadline", "update")
 
     conversation_key: ConversationKey
     update: Update
     application: "Application[Any, CCT, Any, Any, Any, JobQueue]"
     callback_context: CCT
+    deadline: float
+    """The point in time of :func:`time.monotonic` at which the conversation times out."""
 
 
 @dataclass
@@ -209,6 +224,16 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
             handled by *ALL* the handler's whose :meth:`check_update` method returns :obj:`True`
             that are in the state :attr:`ConversationHandler.TIMEOUT`.
 
+            Note:
+                The timeouts of all conversations are tracked in a queue ordered by their
+                deadline, which is checked by a single job of the
+                :attr:`~telegram.ext.Application.job_queue` at the earliest deadline. Thus,
+                extending the timeout of a conversation on a new update doesn't involve
+                rescheduling a job, even for many active conversations.
+
+                .. versionchanged:: NEXT.VERSION
+                   Previously, one job was scheduled for each conversation.
+
             Caution:
                 * This feature relies on the :attr:`telegram.ext.Application.job_queue` being set
                   and hence requires that the dependencies that :class:`telegram.ext.JobQueue`
@@ -241,10 +266,32 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
 
             .. versionchanged:: 20.0
                 No longer overrides the handlers settings. Resolution order was changed.
+        max_conversations (:obj:`int`, optional): The maximum number of conversations that are
+            kept. If a new conversation would exceed this number, the conversation that was
+            inactive for the longest time is dropped. Useful to bound the memory usage and the
+            size of the persisted data if users often abandon conversations.
+
+            .. versionadded:: NEXT.VERSION
+        conversation_ttl (:obj:`float` | :obj:`datetime.timedelta`, optional): Conversations that
+            were inactive for longer than this (in seconds) are dropped. Unlike
+            :paramref:`conversation_timeout`, this doesn't require a
+            :class:`~telegram.ext.JobQueue` and doesn't trigger the handlers of the
+            :attr:`TIMEOUT` state. Instead, the conversations are dropped lazily, when this
+            handler checks the next update.
+
+            .. versionadded:: NEXT.VERSION
+
+    Note:
+        Conversations that are dropped due to :paramref:`max_conversations` or
+        :paramref:`conversation_ttl` are treated as if they had ended. In particular, they are
+        removed from the persisted data as well. Conversations that wait for a non-blocking
+        callback are never dropped. Finding the conversations to drop takes constant time per
+        update on average.
 
     Raises:
         :exc:`ValueError`: If :paramref:`persistent` is used but :paramref:`name` was not set, or
-            when :attr:`per_message`, :attr:`per_chat`, :attr:`per_user` are all :obj:`False`.
+            when :attr:`per_message`, :attr:`per_chat`, :attr:`per_user` are all :obj:`False`,
+            or if :paramref:`max_conversations` or :paramref:`conversation_ttl` is not positive.
 
     Attributes:
         block (:obj:`bool`): Determines whether the callback will run in a blocking way. Always
@@ -256,19 +303,25 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
         "_allow_reentry",
         "_block",
         "_child_conversations",
+        "_conversation_activity",
         "_conversation_timeout",
+        "_conversation_ttl",
         "_conversations",
         "_entry_points",
+        "_evicted_conversations",
+        "_expired_timeouts",
         "_fallbacks",
+        "_handler_index",
         "_map_to_parent",
+        "_max_conversations",
         "_name",
         "_per_chat",
         "_per_message",
         "_per_user",
         "_persistent",
         "_states",
-        "_timeout_jobs_lock",
-        "timeout_jobs",
+        "_timeout_job",
+        "_timeouts",
     )
 
     END: Final[int] = -1
@@ -296,6 +349,8 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
         persistent: bool = False,
         map_to_parent: Optional[dict[object, object]] = None,
         block: DVType[bool] = DEFAULT_TRUE,
+        max_conversations: Optional[int] = None,
+        conversation_ttl: Optional[Union[float, dtm.timedelta]] = None,
     ):
         # these imports need to be here because of circular import error otherwise
         from telegram.ext import (  # pylint: disable=import-outside-toplevel
@@ -310,10 +365,15 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
         self.block: DVType[bool] = True
         # Store the actual setting in a protected variable instead
         self._block: DVType[bool] = block
+        # The context is shared by the callbacks of all handlers of the conversation
+        self.context_data: PersistenceInput = PersistenceInput()
 
         self._entry_points: list[BaseHandler[Update, CCT, object]] = entry_points
         self._states: dict[object, list[BaseHandler[Update, CCT, object]]] = states
         self._fallbacks: list[BaseHandler[Update, CCT, object]] = fallbacks
+        # Maps the kinds of updates to the handlers that can possibly handle them, separately for
+        # the entry points, the fallbacks and each state
+        self._handler_index: HandlerIndex = HandlerIndex()
 
         self._allow_reentry: bool = allow_reentry
         self._per_user: bool = per_user
@@ -323,13 +383,31 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
         self._name: Optional[str] = name
         self._map_to_parent: Optional[dict[object, object]] = map_to_parent
 
-        # if conversation_timeout is used, this dict is used to schedule a job which runs when the
-        # conv has timed out.
-        self.timeout_jobs: dict[ConversationKey, Job[Any]] = {}
-        self._timeout_jobs_lock = asyncio.Lock()
+        # If conversation_timeout is used, this dict holds the timeouts of the conversations.
+        # Since all conversations have the same timeout, the insertion order is the order of the
+        # deadlines, as long as extending a timeout removes and reinserts its entry. A single job
+        # checks the timeouts at the earliest deadline.
+        self._timeouts: dict[ConversationKey, _ConversationTimeoutContext[CCT]] = {}
+        # Holds the timeouts that have expired, but whose TIMEOUT handlers have not finished yet.
+        # Handling a new update for the conversation removes its entry, which cancels the timeout.
+        self._expired_timeouts: dict[ConversationKey, _ConversationTimeoutContext[CCT]] = {}
+        self._timeout_job: Optional[Job[Any]] = None
         self._conversations: ConversationDict = {}
         self._child_conversations: set[ConversationHandler] = set()
 
+        if max_conversations is not None and max_conversations <= 0:
+            raise ValueError("`max_conversations` must be a positive integer!")
+        if isinstance(conversation_ttl, dtm.timedelta):
+            conversation_ttl = conversation_ttl.total_seconds()
+        if conversation_ttl is not None and conversation_ttl <= 0:
+            raise ValueError("`conversation_ttl` must be positive!")
+        self._max_conversations: Optional[int] = max_conversations
+        self._conversation_ttl: Optional[float] = conversation_ttl
+        # Maps the conversations to the time of their last activity. Updating an entry removes
+        # and reinserts it, so the least recently active conversations come first.
+        self._conversation_activity: dict[ConversationKey, float] = {}
+        self._evicted_conversations: int = 0
+
         if persistent and not self.name:
             raise ValueError("Conversations can't be persistent when handler is unnamed.")
         self._persistent: bool = persistent
@@ -541,6 +619,74 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
             "You can not assign a new value to conversation_timeout after initialization."
         )
 
+    @property
+    def timeout_jobs(self) -> Mapping[ConversationKey, "Job[Any]"]:
+        """Mapping[:obj:`tuple`, :class:`telegram.ext.Job`]: Read-only view that maps the
+        conversations with a pending timeout to the job that checks the timeouts. All
+        conversations share this job.
+
+        .. deprecated:: NEXT.VERSION
+           Conversations no longer have a job of their own. This view is only kept for backwards
+           compatibility.
+        """
+        warn(
+            PTBDeprecationWarning(
+                "NEXT.VERSION",
+                "`ConversationHandler.timeout_jobs` is deprecated. All conversations share a "
+                "single job that checks their timeouts.",
+            ),
+            stacklevel=2,
+        )
+        job = self._timeout_job
+        return MappingProxyType({} if job is None else dict.fromkeys(self._timeouts, job))
+
+    @property
+    def max_conversations(self) -> Optional[int]:
+        """:obj:`int`: Optional. The maximum number of conversations that are kept.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._max_conversations
+
+    @max_conversations.setter
+    def max_conversations(self, _: object) -> NoReturn:
+        raise AttributeError(
+            "You can not assign a new value to max_conversations after initialization."
+        )
+
+    @property
+    def conversation_ttl(self) -> Optional[float]:
+        """:obj:`float`: Optional. The time in seconds after which inactive conversations are
+        dropped.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._conversation_ttl
+
+    @conversation_ttl.setter
+    def conversation_ttl(self, _: object) -> NoReturn:
+        raise AttributeError(
+            "You can not assign a new value to conversation_ttl after initialization."
+        )
+
+    @property
+    def active_conversations(self) -> int:
+        """:obj:`int`: The number of conversations that are currently active, i.e. that have
+        not ended.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return len(self._conversations)
+
+    @property
+    def evicted_conversations(self) -> int:
+        """:obj:`int`: The number of conversations that were dropped due to
+        :attr:`max_conversations` or :attr:`conversation_ttl`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._evicted_conversations
+
     @property
     def name(self) -> Optional[str]:
         """:obj:`str`: Optional. The name for this :class:`ConversationHandler`."""
@@ -576,6 +722,27 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
             "You can not assign a new value to map_to_parent after initialization."
         )
 
+    @property
+    def update_types(self) -> Optional[frozenset[str]]:
+        """frozenset[:obj:`str`]: The kinds of updates that the handlers in :attr:`entry_points`,
+        :attr:`states` and :attr:`fallbacks` can accept, except for
+        :attr:`telegram.Update.channel_post` and :attr:`telegram.Update.edited_channel_post`.
+        :obj:`None`, if any of these handlers may accept any kind of update. See
+        :attr:`telegram.ext.BaseHandler.update_types` for details.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        update_types: set[str] = set()
+        for handler in itertools.chain(
+            self.entry_points, self.fallbacks, itertools.chain.from_iterable(self.states.values())
+        ):
+            handler_types = get_handler_update_types(handler)
+            if handler_types is None:
+                return None
+            update_types.update(handler_types)
+        update_types.difference_update((Update.CHANNEL_POST, Update.EDITED_CHANNEL_POST))
+        return frozenset(update_types)
+
     async def _initialize_persistence(
         self, application: "Application"
     ) -> dict[str, TrackingDict[ConversationKey, object]]:
@@ -616,6 +783,10 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
         for key, state in stored_data.items():
             if state == self.END:
                 self._update_state(new_state=self.END, key=key)
+        # The activity of the stored conversations is unknown, so it's counted from now on
+        for key in self._conversations:
+            self._record_activity(key)
+        self._evict_conversations()
 
         out = {self.name: self._conversations}
 
@@ -688,19 +859,53 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
         context: CCT,
         conversation_key: ConversationKey,
     ) -> None:
-        """Schedules a job which executes :meth:`_trigger_timeout` upon conversation timeout."""
+        """Adds the conversation to the timeout queue and makes sure that a job executes
+        :meth:`_trigger_timeouts` upon the earliest conversation timeout.
+        """
         if new_state == self.END:
             return
 
+        timeout = self.conversation_timeout
+        if isinstance(timeout, dtm.timedelta):
+            timeout = timeout.total_seconds()
+        # Removing the entry first moves it to the end of the queue
+        self._timeouts.pop(conversation_key, None)
+        self._timeouts[conversation_key] = _ConversationTimeoutContext(
+            conversation_key,
+            update,
+            application,
+            context,
+            time.monotonic() + timeout,  # type: ignore[operator]
+        )
+        if (
+            self._timeout_job is None
+            # e.g. if the JobQueue was restarted in between
+            or application.job_queue.scheduler.get_job(  # type: ignore[union-attr]
+                self._timeout_job.id
+            )
+            is None
+        ):
+            self._schedule_timeout_job()
+
+    def _schedule_timeout_job(self) -> None:
+        """Schedules a job which executes :meth:`_trigger_timeouts` upon the earliest deadline
+        in the timeout queue.
+        """
+        if not self._timeouts:
+            return
+
+        ctxt = next(iter(self._timeouts.values()))
         try:
             # both job_queue & conversation_timeout are checked before calling _schedule_job
-            j_queue = application.job_queue
-            self.timeout_jobs[conversation_key] = j_queue.run_once(  # type: ignore[union-attr]
-                self._trigger_timeout,
-                self.conversation_timeout,  # type: ignore[arg-type]
-                data=_ConversationTimeoutContext(conversation_key, update, application, context),
+            j_queue = ctxt.application.job_queue
+            self._timeout_job = j_queue.run_once(  # type: ignore[union-attr]
+                self._trigger_timeouts,
+                max(ctxt.deadline - time.monotonic(), 0),
+                name=f"ConversationHandler:{self.name}:timeouts",
             )
         except Exception as exc:
+            # Without the job, the timeout can't be triggered
+            del self._timeouts[ctxt.conversation_key]
             _LOGGER.exception("Failed to schedule timeout.", exc_info=exc)
 
     # pylint: disable=too-many-return-statements
@@ -730,9 +935,10 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
         if update.callback_query and self.per_chat and not update.callback_query.message:
             return None
 
+        self._evict_conversations()
         key = self._get_key(update)
         state = self._conversations.get(key)
-        check: Optional[object] = None
+        kind = get_update_kind(update)
 
         # Resolve futures
         if isinstance(state, PendingState):
@@ -751,50 +957,54 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
 
             # if not then handle WAITING state instead
             else:
-                handlers = self.states.get(self.WAITING, [])
-                for handler_ in handlers:
-                    check = handler_.check_update(update)
-                    if check is not None and check is not False:
-                        return self.WAITING, key, handler_, check
-                return None
+                match = self._find_handler(
+                    self.WAITING, self.states.get(self.WAITING), update, kind
+                )
+                if match is None:
+                    return None
+                return (self.WAITING, key, *match)  # type: ignore[return-value]
 
         _LOGGER.debug("Selecting conversation %s with state %s", str(key), str(state))
 
-        handler: Optional[BaseHandler] = None
+        match = None
 
         # Search entry points for a match
         if state is None or self.allow_reentry:
-            for entry_point in self.entry_points:
-                check = entry_point.check_update(update)
-                if check is not None and check is not False:
-                    handler = entry_point
-                    break
-
-            else:
-                if state is None:
-                    return None
+            match = self._find_handler(_ENTRY_POINTS, self.entry_points, update, kind)
+            if match is None and state is None:
+                return None
 
         # Get the handler list for current state, if we didn't find one yet and we're still here
-        if state is not None and handler is None:
-            for candidate in self.states.get(state, []):
-                check = candidate.check_update(update)
-                if check is not None and check is not False:
-                    handler = candidate
-                    break
+        if state is not None and match is None:
+            match = self._find_handler(state, self.states.get(state), update, kind)
 
             # Find a fallback handler if all other handlers fail
-            else:
-                for fallback in self.fallbacks:
-                    check = fallback.check_update(update)
-                    if check is not None and check is not False:
-                        handler = fallback
-                        break
-
-                else:
+            if match is None:
+                match = self._find_handler(_FALLBACKS, self.fallbacks, update, kind)
+                if match is None:
                     return None
 
+        handler, check = match  # type: ignore[misc]
         return state, key, handler, check  # type: ignore[return-value]
 
+    def _find_handler(
+        self,
+        index_key: object,
+        handlers: Optional[list[BaseHandler[Update, CCT, object]]],
+        update: Update,
+        kind: Optional[object],
+    ) -> Optional[tuple[BaseHandler[Update, CCT, object], object]]:
+        """Returns the first of the handlers that accepts the update along with its check
+        result. Only the handlers that can possibly handle the kind of the update are checked.
+        """
+        if not handlers:
+            return None
+        for handler in self._handler_index.get_candidates(index_key, handlers, kind, update):
+            check = handler.check_update(update)
+            if check is not None and check is not False:
+                return handler, check
+        return None
+
     async def handle_update(  # type: ignore[override]
         self,
         update: Update,
@@ -817,12 +1027,9 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
         current_state, conversation_key, handler, handler_check_result = check_result
         raise_dp_handler_stop = False
 
-        async with self._timeout_jobs_lock:
-            # Remove the old timeout job (if present)
-            timeout_job = self.timeout_jobs.pop(conversation_key, None)
-
-            if timeout_job is not None:
-                timeout_job.schedule_removal()
+        # Remove the old timeout (if present) and cancel it, if it has expired already
+        self._timeouts.pop(conversation_key, None)
+        self._expired_timeouts.pop(conversation_key, None)
 
         # Resolution order of "block":
         # 1. Setting of the selected handler
@@ -853,31 +1060,30 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
         except ApplicationHandlerStop as exception:
             new_state = exception.state
             raise_dp_handler_stop = True
-        async with self._timeout_jobs_lock:
-            if self.conversation_timeout:
-                if application.job_queue is None:
-                    warn(
-                        "Ignoring `conversation_timeout` because the Application has no JobQueue.",
-                        stacklevel=1,
-                    )
-                elif not application.job_queue.scheduler.running:
-                    warn(
-                        "Ignoring `conversation_timeout` because the Applications JobQueue is "
-                        "not running.",
-                        stacklevel=1,
-                    )
-                elif isinstance(new_state, asyncio.Task):
-                    # Add the new timeout job
-                    # checking if the new state is self.END is done in _schedule_job
-                    application.create_task(
-                        self._schedule_job_delayed(
-                            new_state, application, update, context, conversation_key
-                        ),
-                        update=update,
-                        name=f"ConversationHandler:{update.update_id}:handle_update:timeout_job",
-                    )
-                else:
-                    self._schedule_job(new_state, application, update, context, conversation_key)
+        if self.conversation_timeout:
+            if application.job_queue is None:
+                warn(
+                    "Ignoring `conversation_timeout` because the Application has no JobQueue.",
+                    stacklevel=1,
+                )
+            elif not application.job_queue.scheduler.running:
+                warn(
+                    "Ignoring `conversation_timeout` because the Applications JobQueue is "
+                    "not running.",
+                    stacklevel=1,
+                )
+            elif isinstance(new_state, asyncio.Task):
+                # Add the new timeout
+                # checking if the new state is self.END is done in _schedule_job
+                application.create_task(
+                    self._schedule_job_delayed(
+                        new_state, application, update, context, conversation_key
+                    ),
+                    update=update,
+                    name=f"ConversationHandler:{update.update_id}:handle_update:timeout_job",
+                )
+            else:
+                self._schedule_job(new_state, application, update, context, conversation_key)
 
         if isinstance(self.map_to_parent, dict) and new_state in self.map_to_parent:
             self._update_state(self.END, conversation_key, handler)
@@ -902,6 +1108,7 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
             if key in self._conversations:
                 # If there is no key in conversations, nothing is done.
                 del self._conversations[key]
+            self._conversation_activity.pop(key, None)
 
         elif isinstance(new_state, asyncio.Task):
             self._conversations[key] = PendingState(
@@ -918,13 +1125,108 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
                 )
             self._conversations[key] = new_state
 
+        if key in self._conversations:
+            self._record_activity(key)
+            self._evict_conversations()
+
+    def _record_activity(self, key: ConversationKey) -> None:
+        """Marks the conversation as the most recently active one."""
+        if self._max_conversations is None and self._conversation_ttl is None:
+            return
+        # Removing the entry first moves it to the end
+        self._conversation_activity.pop(key, None)
+        self._conversation_activity[key] = time.monotonic()
+
+    def _evict_conversations(self) -> None:
+        """Drops the least recently active conversations while there are more than
+        :attr:`max_conversations` or while they were inactive for longer than
+        :attr:`conversation_ttl`.
+        """
+        if self._max_conversations is None and self._conversation_ttl is None:
+            return
+
+        activity = self._conversation_activity
+        inactive_since = (
+            time.monotonic() - self._conversation_ttl
+            if self._conversation_ttl is not None
+            else None
+        )
+        # Conversations that wait for a callback are moved to the end, so each of them is skipped
+        # at most once
+        pending = 0
+        while activity and pending < len(activity):
+            key, last_activity = next(iter(activity.items()))
+            if key not in self._conversations:
+                # The conversation was removed in a different way
+                del activity[key]
+                continue
+            if not (
+                (
+                    self._max_conversations is not None
+                    and len(self._conversations) > self._max_conversations
+                )
+                or (inactive_since is not None and last_activity <= inactive_since)
+            ):
+                break
+            state = self._conversations[key]
+            if isinstance(state, PendingState) and not state.done():
+                pending += 1
+                self._record_activity(key)
+                continue
+
+            _LOGGER.debug("Dropping inactive conversation %s", key)
+            del activity[key]
+            del self._conversations[key]
+            self._timeouts.pop(key, None)
+            self._expired_timeouts.pop(key, None)
+            self._evicted_conversations += 1
+
+    async def _trigger_timeouts(self, _: CCT) -> None:
+        """This is run by the timeout job. Moves the conversations that have timed out from the
+        timeout queue to the expired timeouts and schedules a job executing
+        :meth:`_trigger_timeout` for each of them. Then schedules the timeout job for the next
+        deadline.
+        """
+        self._timeout_job = None
+        now = time.monotonic()
+        expired = []
+        for ctxt in self._timeouts.values():
+            if ctxt.deadline > now:
+                break
+            expired.append(ctxt)
+        for ctxt in expired:
+            del self._timeouts[ctxt.conversation_key]
+            self._expired_timeouts[ctxt.conversation_key] = ctxt
+        self._schedule_timeout_job()
+
+        # Like before the timeouts were queued, each timeout runs in a job of its own, so that
+        # the timeouts of different conversations run concurrently
+        for ctxt in expired:
+            try:
+                ctxt.application.job_queue.run_once(  # type: ignore[union-attr]
+                    self._trigger_timeout, 0, data=ctxt
+                )
+            except Exception as exc:
+                del self._expired_timeouts[ctxt.conversation_key]
+                _LOGGER.exception("Failed to schedule timeout.", exc_info=exc)
+
+    def _timeout_is_cancelled(self, ctxt: _ConversationTimeoutContext[CCT]) -> bool:
+        """Checks whether an update was handled for the conversation of :paramref:`ctxt` after
+        the timeout expired.
+        """
+        return self._expired_timeouts.get(ctxt.conversation_key) is not ctxt
+
     async def _trigger_timeout(self, context: CCT) -> None:
         """This is run whenever a conversation has timed out. Also makes sure that all handlers
         which are in the :attr:`TIMEOUT` state and whose :meth:`BaseHandler.check_update` returns
         :obj:`True` is handled.
         """
         job = cast("Job", context.job)
-        ctxt = cast(_ConversationTimeoutContext, job.data)
+        ctxt = cast("_ConversationTimeoutContext[CCT]", job.data)
+
+        if self._timeout_is_cancelled(ctxt):
+            # A new update was handled after the timeout expired, but before this job ran
+            return
 
         _LOGGER.debug(
             "Conversation timeout was triggered for conversation %s!", ctxt.conversation_key
@@ -932,27 +1234,28 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
 
         callback_context = ctxt.callback_context
 
-        async with self._timeout_jobs_lock:
-            found_job = self.timeout_jobs.get(ctxt.conversation_key)
-            if found_job is not job:
-                # The timeout has been cancelled in handle_update
+        try:
+            # Now run all handlers which are in TIMEOUT state
+            handlers = self.states.get(self.TIMEOUT, [])
+            for handler in handlers:
+                check = handler.check_update(ctxt.update)
+                if check is not None and check is not False:
+                    try:
+                        await handler.handle_update(
+                            ctxt.update, ctxt.application, check, callback_context
+                        )
+                    except ApplicationHandlerStop:
+                        warn(
+                            "ApplicationHandlerStop in TIMEOUT state of "
+                            "ConversationHandler has no effect. Ignoring.",
+                            stacklevel=2,
+                        )
+
+            if self._timeout_is_cancelled(ctxt):
+                # The conversation continued while the TIMEOUT handlers ran. Ending it would
+                # overwrite its new state.
                 return
-            del self.timeout_jobs[ctxt.conversation_key]
-
-        # Now run all handlers which are in TIMEOUT state
-        handlers = self.states.get(self.TIMEOUT, [])
-        for handler in handlers:
-            check = handler.check_update(ctxt.update)
-            if check is not None and check is not False:
-                try:
-                    await handler.handle_update(
-                        ctxt.update, ctxt.application, check, callback_context
-                    )
-                except ApplicationHandlerStop:
-                    warn(
-                        "ApplicationHandlerStop in TIMEOUT state of "
-                        "ConversationHandler has no effect. Ignoring.",
-                        stacklevel=2,
-                    )
-
+        finally:
+            if not self._timeout_is_cancelled(ctxt):
+                del self._expired_timeouts[ctxt.conversation_key]
         self._update_state(self.END, ctxt.conversation_key)
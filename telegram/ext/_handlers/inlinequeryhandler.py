@@ -102,6 +102,16 @@ class InlineQueryHandler(BaseHandler[Update, CCT, RT]):
         self.pattern: Optional[Union[str, Pattern[str]]] = pattern
         self.chat_types: Optional[list[str]] = chat_types
 
+    @property
+    def update_types(self) -> frozenset[str]:
+        """frozenset[:obj:`str`]: This handler only handles updates with
+        :attr:`telegram.Update.inline_query`. See :attr:`telegram.ext.BaseHandler.update_types` for
+        details.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return frozenset((Update.INLINE_QUERY,))
+
     def check_update(self, update: object) -> Optional[Union[bool, Match[str]]]:
         """
         Determines whether an update should be passed to this handler's :attr:`callback`.
@@ -24,6 +24,8 @@ from telegram._utils.defaultvalue import DEFAULT_TRUE
 from telegram._utils.types import DVType
 from telegram.ext import filters as filters_module
 from telegram.ext._handlers.basehandler import BaseHandler
+from telegram.ext._utils.filtercompiler import CompiledFilter
+from telegram.ext._utils.handlerindex import get_filter_update_types
 from telegram.ext._utils.types import CCT, HandlerCallback
 
 if TYPE_CHECKING:
@@ -72,7 +74,7 @@ class MessageHandler(BaseHandler[Update, CCT, RT]):
 
     """
 
-    __slots__ = ("filters",)
+    __slots__ = ("_compiled_filters", "filters")
 
     def __init__(
         self: "MessageHandler[CCT, RT]",
@@ -84,6 +86,18 @@ class MessageHandler(BaseHandler[Update, CCT, RT]):
         self.filters: filters_module.BaseFilter = (
             filters if filters is not None else filters_module.ALL
         )
+        self._compiled_filters: CompiledFilter = CompiledFilter(self.filters)
+
+    @property
+    def update_types(self) -> Optional[frozenset[str]]:
+        """frozenset[:obj:`str`]: The kinds of updates that :attr:`filters` can accept.
+        :obj:`None`, if the filter implements a custom
+        :meth:`~telegram.ext.filters.BaseFilter.check_update`. See
+        :attr:`telegram.ext.BaseHandler.update_types` for details.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return get_filter_update_types(self.filters)
 
     def check_update(self, update: object) -> Optional[Union[bool, dict[str, list[Any]]]]:
         """Determines whether an update should be passed to this handler's :attr:`callback`.
@@ -96,7 +110,7 @@ class MessageHandler(BaseHandler[Update, CCT, RT]):
 
         """
         if isinstance(update, Update):
-            return self.filters.check_update(update) or False
+            return self._compiled_filters.check_update(update, self.filters) or False
         return None
 
     def collect_additional_context(
@@ -135,6 +135,17 @@ class MessageReactionHandler(BaseHandler[Update, CCT, RT]):
         self._user_ids = parse_chat_id(user_id)
         self._user_usernames = parse_username(user_username)
 
+    @property
+    def update_types(self) -> frozenset[str]:
+        """frozenset[:obj:`str`]: This handler only handles updates with
+        :attr:`telegram.Update.message_reaction` and
+        :attr:`telegram.Update.message_reaction_count`. See
+        :attr:`telegram.ext.BaseHandler.update_types` for details.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return frozenset((Update.MESSAGE_REACTION, Update.MESSAGE_REACTION_COUNT))
+
     def check_update(self, update: object) -> bool:
         """Determines whether an update should be passed to this handler's :attr:`callback`.
 
@@ -75,6 +75,16 @@ class PaidMediaPurchasedHandler(BaseHandler[Update, CCT, RT]):
         self._user_ids = parse_chat_id(user_id)
         self._usernames = parse_username(username)
 
+    @property
+    def update_types(self) -> frozenset[str]:
+        """frozenset[:obj:`str`]: This handler only handles updates with
+        :attr:`telegram.Update.purchased_paid_media`. See
+        :attr:`telegram.ext.BaseHandler.update_types` for details.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return frozenset((Update.PURCHASED_PAID_MEDIA,))
+
     def check_update(self, update: object) -> bool:
         """Determines whether an update should be passed to this handler's :attr:`callback`.
 
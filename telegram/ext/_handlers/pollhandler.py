@@ -58,6 +58,16 @@ class PollHandler(BaseHandler[Update, CCT, RT]):
 
     __slots__ = ()
 
+    @property
+    def update_types(self) -> frozenset[str]:
+        """frozenset[:obj:`str`]: This handler only handles updates with
+        :attr:`telegram.Update.poll`. See :attr:`telegram.ext.BaseHandler.update_types` for
+        details.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return frozenset((Update.POLL,))
+
     def check_update(self, update: object) -> bool:
         """Determines whether an update should be passed to this handler's :attr:`callback`.
 
@@ -83,6 +83,16 @@ class PreCheckoutQueryHandler(BaseHandler[Update, CCT, RT]):
 
         self.pattern: Optional[Pattern[str]] = re.compile(pattern) if pattern is not None else None
 
+    @property
+    def update_types(self) -> frozenset[str]:
+        """frozenset[:obj:`str`]: This handler only handles updates with
+        :attr:`telegram.Update.pre_checkout_query`. See
+        :attr:`telegram.ext.BaseHandler.update_types` for details.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return frozenset((Update.PRE_CHECKOUT_QUERY,))
+
     def check_update(self, update: object) -> bool:
         """Determines whether an update should be passed to this handler's :attr:`callback`.
 
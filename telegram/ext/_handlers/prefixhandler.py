@@ -25,6 +25,9 @@ from telegram._utils.defaultvalue import DEFAULT_TRUE
 from telegram._utils.types import SCT, DVType
 from telegram.ext import filters as filters_module
 from telegram.ext._handlers.basehandler import BaseHandler
+from telegram.ext._utils.commandparsing import parse_command
+from telegram.ext._utils.filtercompiler import CompiledFilter
+from telegram.ext._utils.handlerindex import get_filter_update_types
 from telegram.ext._utils.types import CCT, HandlerCallback
 
 if TYPE_CHECKING:
@@ -120,7 +123,7 @@ class PrefixHandler(BaseHandler[Update, CCT, RT]):
     """
 
     # 'prefix' is a class property, & 'command' is included in the superclass, so they're left out.
-    __slots__ = ("commands", "filters")
+    __slots__ = ("_compiled_filters", "commands", "filters")
 
     def __init__(
         self: "PrefixHandler[CCT, RT]",
@@ -142,6 +145,18 @@ class PrefixHandler(BaseHandler[Update, CCT, RT]):
         self.filters: filters_module.BaseFilter = (
             filters if filters is not None else filters_module.UpdateType.MESSAGES
         )
+        self._compiled_filters: CompiledFilter = CompiledFilter(self.filters)
+
+    @property
+    def update_types(self) -> Optional[frozenset[str]]:
+        """frozenset[:obj:`str`]: The kinds of updates that :attr:`filters` can accept.
+        :obj:`None`, if the filter implements a custom
+        :meth:`~telegram.ext.filters.BaseFilter.check_update`. See
+        :attr:`telegram.ext.BaseHandler.update_types` for details.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return get_filter_update_types(self.filters)
 
     def check_update(
         self, update: object
@@ -158,13 +173,12 @@ class PrefixHandler(BaseHandler[Update, CCT, RT]):
         if isinstance(update, Update) and update.effective_message:
             message = update.effective_message
 
-            if message.text:
-                text_list = message.text.split()
-                if text_list[0].lower() not in self.commands:
+            if parsed_command := parse_command(message):
+                if parsed_command.first_word not in self.commands:
                     return None
-                filter_result = self.filters.check_update(update)
+                filter_result = self._compiled_filters.check_update(update, self.filters)
                 if filter_result:
-                    return text_list[1:], filter_result
+                    return list(parsed_command.words[1:]), filter_result
                 return False
         return None
 
@@ -57,6 +57,16 @@ class ShippingQueryHandler(BaseHandler[Update, CCT, RT]):
 
     __slots__ = ()
 
+    @property
+    def update_types(self) -> frozenset[str]:
+        """frozenset[:obj:`str`]: This handler only handles updates with
+        :attr:`telegram.Update.shipping_query`. See :attr:`telegram.ext.BaseHandler.update_types`
+        for details.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return frozenset((Update.SHIPPING_QUERY,))
+
     def check_update(self, update: object) -> bool:
         """Determines whether an update should be passed to this handler's :attr:`callback`.
 
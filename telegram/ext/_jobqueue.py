@@ -36,6 +36,7 @@ from telegram._utils.logging import get_logger
 from telegram._utils.repr import build_repr_with_selected_attrs
 from telegram._utils.types import JSONDict
 from telegram.ext._extbot import ExtBot
+from telegram.ext._utils.threadpool import is_coroutine_callable
 from telegram.ext._utils.types import CCT, JobCallback
 
 if TYPE_CHECKING:
@@ -780,6 +781,10 @@ class Job(Generic[CCT]):
 
                 async def callback(context: CallbackContext)
 
+            .. versionchanged:: NEXT.VERSION
+                Synchronous functions are accepted as well. They are run in a thread if
+                :attr:`telegram.ext.Application.thread_pool_size` is set and called directly in
+                the event loop otherwise.
         data (:obj:`object`, optional): Additional data needed for the :paramref:`callback`
             function. Can be accessed through :attr:`Job.data` in the callback. Defaults to
             :obj:`None`.
@@ -994,7 +999,12 @@ class Job(Generic[CCT]):
                 return
 
             await context.refresh_data()
-            await self.callback(context)
+            if is_coroutine_callable(self.callback):
+                await self.callback(context)
+            else:
+                await application._run_sync_callback(  # pylint: disable=protected-access
+                    self.callback, context
+                )
         except Exception as exc:
             await application.create_task(
                 application.process_error(None, exc, job=self),
@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains an update processor that processes updates of the same chat and/or user
+sequentially.
+"""
+import asyncio
+from collections.abc import Awaitable, Hashable
+from typing import Any, Callable, Optional
+
+from telegram import Update
+from telegram.ext._baseupdateprocessor import BaseUpdateProcessor
+
+
+class _KeyState:
+    """The lock of a key along with the number of updates that currently hold or wait for it."""
+
+    __slots__ = ("lock", "pending")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.pending = 0
+
+
+class KeyedUpdateProcessor(BaseUpdateProcessor):
+    """Instance of :class:`telegram.ext.BaseUpdateProcessor` that processes updates with the same
+    key one after another in the order in which they were received, while updates with different
+    keys are processed concurrently. By default, the key is the id of the
+    :attr:`~telegram.Update.effective_chat`. This avoids race conditions e.g. on
+    :attr:`telegram.ext.CallbackContext.chat_data` or on the state of a
+    :class:`~telegram.ext.ConversationHandler`, while still making use of concurrency across
+    chats.
+
+    Updates for which no key can be determined, e.g. updates without a chat or objects that are
+    not instances of :class:`telegram.Update`, are processed without any ordering guarantees.
+
+    While an update waits for the previous update with the same key, it does not count towards
+    :attr:`max_concurrent_updates`. Hence, a single busy chat can't block updates of other chats.
+    The state for a key is discarded as soon as no update with that key is pending, such that
+    memory usage does not grow with the number of keys that were ever seen.
+
+    Example:
+        .. code:: python
+
+            application = (
+                ApplicationBuilder()
+                .token("TOKEN")
+                .concurrent_updates(KeyedUpdateProcessor(256, per_user=True))
+                .build()
+            )
+
+    .. seealso:: :wiki:`Concurrency`
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        max_concurrent_updates (:obj:`int`): The maximum number of updates to be processed
+            concurrently across all keys.
+        per_chat (:obj:`bool`, optional): Whether the key should contain the id of the
+            :attr:`~telegram.Update.effective_chat`. Defaults to :obj:`True`.
+        per_user (:obj:`bool`, optional): Whether the key should contain the id of the
+            :attr:`~telegram.Update.effective_user`. Defaults to :obj:`False`.
+        key (Callable[[:obj:`object`], :class:`~collections.abc.Hashable` | :obj:`None`], \
+            optional): A custom function that computes the key of an update. Must return
+            :obj:`None` for updates that don't need to be ordered. If passed,
+            :paramref:`per_chat` and :paramref:`per_user` are ignored.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`max_concurrent_updates` is a non-positive integer or if
+            neither of :paramref:`per_chat`, :paramref:`per_user` and :paramref:`key` is set.
+    """
+
+    __slots__ = ("_key", "_key_states", "_per_chat", "_per_user")
+
+    def __init__(
+        self,
+        max_concurrent_updates: int,
+        per_chat: bool = True,
+        per_user: bool = False,
+        key: Optional[Callable[[object], Optional[Hashable]]] = None,
+    ):
+        super().__init__(max_concurrent_updates)
+        if not (per_chat or per_user or key):
+            raise ValueError("At least one of `per_chat`, `per_user` and `key` must be set!")
+
+        self._per_chat: bool = per_chat
+        self._per_user: bool = per_user
+        self._key: Optional[Callable[[object], Optional[Hashable]]] = key
+        self._key_states: dict[Hashable, _KeyState] = {}
+
+    @property
+    def pending_keys(self) -> int:
+        """:obj:`int`: The number of keys for which updates are currently being processed or
+        waiting to be processed.
+
+        Caution:
+            This value is a snapshot and may change immediately after being read.
+        """
+        return len(self._key_states)
+
+    def get_key(self, update: object) -> Optional[Hashable]:
+        """Computes the key of an update. Updates with the same key are processed sequentially.
+
+        Args:
+            update (:obj:`object`): The update.
+
+        Returns:
+            :class:`~collections.abc.Hashable` | :obj:`None`: The key or :obj:`None`, if the
+            update can be processed without ordering guarantees.
+        """
+        if self._key is not None:
+            return self._key(update)
+        if not isinstance(update, Update):
+            return None
+
+        key: list[int] = []
+        if self._per_chat:
+            if not update.effective_chat:
+                return None
+            key.append(update.effective_chat.id)
+        if self._per_user:
+            if not update.effective_user:
+                return None
+            key.append(update.effective_user.id)
+        return tuple(key)
+
+    async def do_process_update(
+        self,
+        update: object,
+        coroutine: "Awaitable[Any]",
+    ) -> None:
+        """Awaits the coroutine once all previously received updates with the same key are
+        processed.
+
+        Args:
+            update (:obj:`object`): The update to be processed.
+            coroutine (:term:`Awaitable`): The coroutine that will be awaited to process the
+                update.
+        """
+        key = self.get_key(update)
+        if key is None:
+            await coroutine
+            return
+
+        if (state := self._key_states.get(key)) is None:
+            state = self._key_states[key] = _KeyState()
+        state.pending += 1
+        acquired = False
+        try:
+            if state.pending > 1:
+                # Don't occupy a slot of `max_concurrent_updates` while waiting. `process_update`
+                # releases the slot once we're done, so we have to get it back in any case.
+                self._semaphore.release()
+                try:
+                    await state.lock.acquire()
+                    acquired = True
+                finally:
+                    await self._reacquire_semaphore()
+            else:
+                # No other update with this key is pending, so this doesn't actually wait
+                await state.lock.acquire()
+                acquired = True
+
+            await coroutine
+        finally:
+            if acquired:
+                state.lock.release()
+            state.pending -= 1
+            if not state.pending:
+                del self._key_states[key]
+
+    async def _reacquire_semaphore(self) -> None:
+        acquire_task = asyncio.ensure_future(self._semaphore.acquire())
+        cancelled = False
+        while not acquire_task.done():
+            try:
+                await asyncio.shield(acquire_task)
+            except asyncio.CancelledError:
+                cancelled = True
+        if cancelled:
+            raise asyncio.CancelledError
+
+    async def initialize(self) -> None:
+        """Does nothing."""
+
+    async def shutdown(self) -> None:
+        """Does nothing."""
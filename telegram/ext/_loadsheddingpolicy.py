@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the LoadSheddingPolicy class."""
+import datetime as dtm
+import random
+import time
+from collections.abc import Collection
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from telegram import Update
+from telegram._utils.repr import build_repr_with_selected_attrs
+
+if TYPE_CHECKING:
+    from telegram.ext import BaseHandler
+
+
+def _get_update_date(update: object) -> Optional[dtm.datetime]:
+    """Returns the point in time at which Telegram created the update, if available."""
+    if not isinstance(update, Update):
+        return None
+    if message := update.effective_message:
+        return message.edit_date or message.date
+    for attribute in (
+        update.message_reaction,
+        update.message_reaction_count,
+        update.chat_member,
+        update.my_chat_member,
+        update.chat_join_request,
+    ):
+        if attribute is not None:
+            return attribute.date
+    return None
+
+
+class LoadSheddingPolicy:
+    """Describes which updates :class:`telegram.ext.Application` may shed, i.e. drop or pass to
+    a cheaper handler, when it can't keep up with the incoming updates. This allows to focus on
+    the important updates during spikes instead of falling behind on all of them.
+
+    The application checks the policies when it takes an update from
+    :attr:`~telegram.ext.Application.update_queue`, i.e. before the update is passed to the
+    handlers. An update is shed according to the first policy that
+
+    * lists the kind of the update in :paramref:`update_types`,
+    * has a threshold that is exceeded, i.e. the number of pending updates is at least
+      :paramref:`max_pending_updates` or the update is at least :paramref:`max_update_age`
+      old,
+    * and doesn't keep the update as part of the :paramref:`sample_rate`.
+
+    Shed updates are dropped or, if :paramref:`degraded_handler` is set, handled only by that
+    handler instead of the handlers registered via :meth:`~telegram.ext.Application.add_handler`.
+
+    Example:
+        .. code:: python
+
+            policy = LoadSheddingPolicy(
+                update_types=[UpdateType.EDITED_MESSAGE, UpdateType.MESSAGE_REACTION],
+                max_pending_updates=1000,
+                sample_rate=0.1,
+            )
+            application = (
+                Application.builder().token("TOKEN").load_shedding_policies([policy]).build()
+            )
+
+    Note:
+        The pending updates are the updates that wait in
+        :attr:`~telegram.ext.Application.update_queue` plus the updates that were taken from it
+        and are not yet fully processed, excluding the update at hand. The age of an update is
+        determined from the date that Telegram provides, e.g. :attr:`telegram.Message.date`
+        or :attr:`telegram.Message.edit_date`. Updates that don't provide a date never exceed
+        :paramref:`max_update_age`.
+
+    .. seealso:: :meth:`telegram.ext.ApplicationBuilder.load_shedding_policies`
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        update_types (Collection[:obj:`str`]): The kinds of updates that may be shed, given as
+            the names of the corresponding attributes of :class:`telegram.Update`, e.g.
+            :attr:`telegram.constants.UpdateType.EDITED_MESSAGE`.
+        max_pending_updates (:obj:`int`, optional): The number of pending updates from which on
+            updates are shed.
+        max_update_age (:obj:`float` | :obj:`datetime.timedelta`, optional): The age in seconds
+            from which on updates are shed.
+        sample_rate (:obj:`float`, optional): The fraction of the matching updates that is
+            processed normally even if a threshold is exceeded. Defaults to ``0``, i.e. all
+            matching updates are shed.
+        degraded_handler (:class:`telegram.ext.BaseHandler`, optional): Handler for the shed
+            updates. If not passed, shed updates are dropped.
+
+    Attributes:
+        update_types (frozenset[:obj:`str`]): The kinds of updates that may be shed.
+        max_pending_updates (:obj:`int`): Optional. The number of pending updates from which on
+            updates are shed.
+        max_update_age (:obj:`float`): Optional. The age in seconds from which on updates are
+            shed.
+        sample_rate (:obj:`float`): The fraction of the matching updates that is processed
+            normally.
+        degraded_handler (:class:`telegram.ext.BaseHandler`): Optional. Handler for the shed
+            updates.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`update_types` is empty, if neither
+            :paramref:`max_pending_updates` nor :paramref:`max_update_age` is passed or if
+            :paramref:`sample_rate` is not in the range ``[0, 1)``.
+    """
+
+    __slots__ = (
+        "_degraded_updates",
+        "_dropped_updates",
+        "degraded_handler",
+        "max_pending_updates",
+        "max_update_age",
+        "sample_rate",
+        "update_types",
+    )
+
+    def __init__(
+        self,
+        update_types: Collection[str],
+        max_pending_updates: Optional[int] = None,
+        max_update_age: Optional[Union[float, dtm.timedelta]] = None,
+        sample_rate: float = 0.0,
+        degraded_handler: Optional["BaseHandler[Update, Any, Any]"] = None,
+    ):
+        if not update_types:
+            raise ValueError("`update_types` must not be empty!")
+        if max_pending_updates is None and max_update_age is None:
+            raise ValueError("Either `max_pending_updates` or `max_update_age` must be passed!")
+        if not 0 <= sample_rate < 1:
+            raise ValueError("`sample_rate` must be in the range [0, 1)!")
+
+        # Converting enum members to plain strings for a readable representation
+        self.update_types: frozenset[str] = frozenset(str(kind) for kind in update_types)
+        self.max_pending_updates: Optional[int] = max_pending_updates
+        self.max_update_age: Optional[float] = (
+            max_update_age.total_seconds()
+            if isinstance(max_update_age, dtm.timedelta)
+            else max_update_age
+        )
+        self.sample_rate: float = sample_rate
+        self.degraded_handler: Optional[BaseHandler[Update, Any, Any]] = degraded_handler
+        self._dropped_updates: int = 0
+        self._degraded_updates: int = 0
+
+    def __repr__(self) -> str:
+        """Give a string representation of the policy in the form
+        ``LoadSheddingPolicy[update_types=..., shed_updates=...]``.
+
+        Returns:
+            :obj:`str`
+        """
+        return build_repr_with_selected_attrs(
+            self, update_types=sorted(self.update_types), shed_updates=self.shed_updates
+        )
+
+    @property
+    def dropped_updates(self) -> int:
+        """:obj:`int`: The number of updates that were dropped due to this policy."""
+        return self._dropped_updates
+
+    @property
+    def degraded_updates(self) -> int:
+        """:obj:`int`: The number of updates that were passed to :attr:`degraded_handler` due to
+        this policy.
+        """
+        return self._degraded_updates
+
+    @property
+    def shed_updates(self) -> int:
+        """:obj:`int`: The total number of updates that were shed due to this policy."""
+        return self._dropped_updates + self._degraded_updates
+
+    def _should_shed(self, update: object, update_kind: object, pending_updates: int) -> bool:
+        """Decides whether the update is shed and counts it, if so. The checks are ordered by
+        their cost.
+        """
+        if update_kind not in self.update_types:
+            return False
+        if not (
+            self.max_pending_updates is not None and pending_updates >= self.max_pending_updates
+        ):
+            if self.max_update_age is None:
+                return False
+            date = _get_update_date(update)
+            if date is None or time.time() - date.timestamp() < self.max_update_age:
+                return False
+        if self.sample_rate and random.random() < self.sample_rate:  # noqa: S311
+            return False
+
+        if self.degraded_handler is None:
+            self._dropped_updates += 1
+        else:
+            self._degraded_updates += 1
+        return True
@@ -396,12 +396,30 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             key (:obj:`tuple`): The key the state is changed for.
             new_state (:class:`object`): The new state for the given key.
         """
+        await self.update_conversations(name, {key: new_state})
+
+    async def update_conversations(
+        self, name: str, changes: dict[ConversationKey, Optional[object]]
+    ) -> None:
+        """Will update the conversations for the given handler and depending on :attr:`on_flush`
+        save the pickle file. The file is written at most once for all changes.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            name (:obj:`str`): The handler's name.
+            changes (dict[:obj:`tuple`, :class:`object`]): The new states by the keys they are
+                changed for.
+        """
         if not self.conversations:
             self.conversations = {}
-        if self.conversations.setdefault(name, {}).get(key) == new_state:
-            return
-        self.conversations[name][key] = new_state
-        if not self.on_flush:
+        conversations = self.conversations.setdefault(name, {})
+        changed = False
+        for key, new_state in changes.items():
+            if conversations.get(key) != new_state:
+                conversations[key] = new_state
+                changed = True
+        if changed and not self.on_flush:
             if not self.single_file:
                 self._dump_file(Path(f"{self.filepath}_conversations"), self.conversations)
             else:
@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains an update processor that processes updates in weighted priority
+lanes.
+"""
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Mapping, Sequence
+from types import MappingProxyType
+from typing import Any, Callable, Final, Optional
+
+from telegram.constants import UpdateType
+from telegram.ext._baseupdateprocessor import BaseUpdateProcessor
+from telegram.ext._utils.handlerindex import get_update_kind
+
+
+class PriorityUpdateProcessor(BaseUpdateProcessor):
+    """Instance of :class:`telegram.ext.BaseUpdateProcessor` that sorts updates into priority
+    lanes. Whenever one of the :attr:`max_concurrent_updates` slots becomes free, the next update
+    is taken from the lanes in a weighted round-robin fashion: In each round, lane ``i`` may
+    provide up to ``weights[i]`` updates, lanes with a smaller index go first and lanes without
+    waiting updates are skipped. Hence, e.g. callback queries are answered quickly even if
+    thousands of :attr:`~telegram.Update.message_reaction` updates are waiting, while low-priority
+    lanes still make progress. Within a lane, updates are processed in the order in which they
+    were received.
+
+    By default, the lane of an update is determined by its type according to
+    :paramref:`lanes`. Alternatively, a custom :paramref:`classifier` can be passed.
+
+    Example:
+        .. code:: python
+
+            application = (
+                ApplicationBuilder()
+                .token("TOKEN")
+                .concurrent_updates(
+                    PriorityUpdateProcessor(
+                        256,
+                        weights=(4, 1),
+                        lanes={"callback_query": 0, "inline_query": 0},
+                    )
+                )
+                .build()
+            )
+
+    Note:
+        Updates are reordered even if :attr:`max_concurrent_updates` is ``1``. In this case,
+        :class:`telegram.ext.Application` still fetches updates from the
+        :attr:`~telegram.ext.Application.update_queue` concurrently such that they can be sorted
+        into the lanes, see :attr:`concurrent_dispatch`.
+
+    .. seealso:: :wiki:`Concurrency`
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        max_concurrent_updates (:obj:`int`): The maximum number of updates to be processed
+            concurrently.
+        weights (Sequence[:obj:`int`], optional): The weights of the lanes. The number of lanes is
+            the length of this sequence. Defaults to ``(4, 2, 1)``.
+        lanes (Mapping[:obj:`str`, :obj:`int`], optional): Maps the types of updates as listed in
+            :attr:`telegram.Update.ALL_TYPES` to the index of their lane. Updates of other types
+            and objects that are not instances of :class:`telegram.Update` go to the last lane.
+            Defaults to :attr:`DEFAULT_LANES`.
+        classifier (Callable[[:obj:`object`], :obj:`int`], optional): A custom function that
+            returns the index of the lane of an update. If passed, :paramref:`lanes` is ignored.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`max_concurrent_updates` is a non-positive integer, if
+            :paramref:`weights` is empty or contains non-positive integers or if
+            :paramref:`lanes` refers to a lane that does not exist.
+    """
+
+    __slots__ = ("_classifier", "_credits", "_lanes", "_queues", "_waiting", "_weights")
+
+    DEFAULT_LANES: Final[Mapping[str, int]] = MappingProxyType(
+        {
+            UpdateType.CALLBACK_QUERY: 0,
+            UpdateType.INLINE_QUERY: 0,
+            UpdateType.CHOSEN_INLINE_RESULT: 0,
+            UpdateType.PRE_CHECKOUT_QUERY: 0,
+            UpdateType.SHIPPING_QUERY: 0,
+            UpdateType.MESSAGE: 1,
+            UpdateType.EDITED_MESSAGE: 1,
+            UpdateType.BUSINESS_MESSAGE: 1,
+            UpdateType.EDITED_BUSINESS_MESSAGE: 1,
+            UpdateType.CHANNEL_POST: 1,
+            UpdateType.EDITED_CHANNEL_POST: 1,
+        }
+    )
+    """Mapping[:obj:`str`, :obj:`int`]: The default lanes of updates. Queries that users wait for
+    actively go to lane ``0``, messages go to lane ``1``. All other updates go to the last lane.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_updates: int,
+        weights: Sequence[int] = (4, 2, 1),
+        lanes: Optional[Mapping[str, int]] = None,
+        classifier: Optional[Callable[[object], int]] = None,
+    ):
+        super().__init__(max_concurrent_updates)
+        if not weights or any(weight < 1 for weight in weights):
+            raise ValueError("`weights` must be a non-empty sequence of positive integers!")
+        lanes = self.DEFAULT_LANES if lanes is None else lanes
+        if classifier is None and any(lane < 0 or lane >= len(weights) for lane in lanes.values()):
+            raise ValueError("`lanes` must only refer to lanes defined by `weights`!")
+
+        self._weights: tuple[int, ...] = tuple(weights)
+        self._lanes: Mapping[str, int] = lanes
+        self._classifier: Optional[Callable[[object], int]] = classifier
+        self._queues: tuple[deque[asyncio.Future[None]], ...] = tuple(deque() for _ in weights)
+        self._credits: list[int] = list(self._weights)
+        self._waiting = 0
+
+    @property
+    def weights(self) -> tuple[int, ...]:
+        """tuple[:obj:`int`]: The weights of the lanes."""
+        return self._weights
+
+    @property
+    def waiting_updates(self) -> tuple[int, ...]:
+        """tuple[:obj:`int`]: The number of updates that wait for being processed, per lane.
+
+        Caution:
+            This value is a snapshot and may change immediately after being read.
+        """
+        return tuple(sum(1 for future in queue if not future.done()) for queue in self._queues)
+
+    def get_lane(self, update: object) -> int:
+        """Determines the lane of an update.
+
+        Args:
+            update (:obj:`object`): The update.
+
+        Returns:
+            :obj:`int`: The index of the lane. Indices that are out of range are clamped to the
+            range of existing lanes.
+        """
+        if self._classifier is not None:
+            lane = self._classifier(update)
+        else:
+            lane = self._lanes.get(
+                get_update_kind(update), len(self._weights) - 1  # type: ignore[arg-type]
+            )
+        return min(max(lane, 0), len(self._weights) - 1)
+
+    @property
+    def concurrent_dispatch(self) -> bool:
+        """:obj:`bool`: Always :obj:`True`, since updates can only be sorted into the lanes if
+        they are passed to :meth:`process_update` concurrently.
+        """
+        return True
+
+    async def acquire_slot(self, update: object) -> None:
+        """Waits until the update may be processed. If all slots are taken, the update waits in
+        its lane until :meth:`release_slot` hands a slot to it.
+
+        Args:
+            update (:obj:`object`): The update to be processed.
+        """
+        if not self._waiting and self.current_concurrent_updates < self.max_concurrent_updates:
+            # Nobody is waiting, so there is nothing to prioritize. This doesn't block.
+            await super().acquire_slot(update)
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._queues[self.get_lane(update)].append(future)
+        self._waiting += 1
+        try:
+            await future
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                # We were cancelled after the slot was handed to us, so we pass it on
+                self.release_slot()
+            raise
+
+    def release_slot(self) -> None:
+        """Hands the slot to the next waiting update according to the weights of the lanes. If
+        no update is waiting, the slot is freed.
+        """
+        while self._waiting:
+            future = self._next_waiter()
+            if not future.done():
+                future.set_result(None)
+                return
+        super().release_slot()
+
+    def _next_waiter(self) -> "asyncio.Future[None]":
+        while True:
+            for index, queue in enumerate(self._queues):
+                if queue and self._credits[index] > 0:
+                    self._credits[index] -= 1
+                    self._waiting -= 1
+                    return queue.popleft()
+            # All lanes with waiting updates have used up their credits, start the next round
+            self._credits[:] = self._weights
+
+    async def do_process_update(
+        self,
+        update: object,  # noqa: ARG002
+        coroutine: "Awaitable[Any]",
+    ) -> None:
+        """Immediately awaits the coroutine. The prioritization happens before this method is
+        called.
+
+        Args:
+            update (:obj:`object`): The update to be processed.
+            coroutine (:term:`Awaitable`): The coroutine that will be awaited to process the
+                update.
+        """
+        await coroutine
+
+    async def initialize(self) -> None:
+        """Does nothing."""
+
+    async def shutdown(self) -> None:
+        """Does nothing."""
@@ -0,0 +1,369 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains a class that allows to simulate the behavior of rate limiters on a
+virtual clock.
+"""
+import asyncio
+import contextlib
+import math
+import selectors
+from collections import deque
+from collections.abc import Iterable
+from typing import Any, Callable, Optional, Union
+
+from telegram import constants
+from telegram.error import RetryAfter
+from telegram.ext._baseratelimiter import BaseRateLimiter, RateLimiterStatistics
+
+
+class _VirtualClockSelector(selectors.SelectSelector):
+    """Selector that never waits for I/O. Instead of blocking, it advances a virtual clock by
+    the requested timeout, which makes the event loop jump directly to the next scheduled callback.
+
+    Every iteration of the event loop advances the clock by at least :attr:`RESOLUTION`. Otherwise
+    callbacks that are rescheduled for "now" due to rounding errors (e.g. in ``aiolimiter``) would
+    keep the loop spinning forever.
+    """
+
+    RESOLUTION: float = 1e-6
+
+    __slots__ = ("time",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.time: float = 0.0
+
+    def select(self, timeout: Optional[float] = None) -> list[tuple[selectors.SelectorKey, int]]:
+        if timeout is None:
+            raise RuntimeError(
+                "The simulation stalled: No callbacks are scheduled, but not all requests are "
+                "processed yet."
+            )
+        self.time += max(timeout, self.RESOLUTION)
+        return []
+
+
+class _VirtualClockEventLoop(asyncio.SelectorEventLoop):
+    """Event loop whose :meth:`time` is driven by :class:`_VirtualClockSelector`. Simulations
+    running on this loop are deterministic and don't take any real time for sleeping.
+    """
+
+    __slots__ = ("_virtual_selector",)
+
+    def __init__(self) -> None:
+        self._virtual_selector = _VirtualClockSelector()
+        super().__init__(selector=self._virtual_selector)
+
+    def time(self) -> float:
+        return self._virtual_selector.time
+
+
+class _FloodControl:
+    """Minimal model of the flood limits enforced by the Bot API. Uses sliding windows that store
+    the timestamps of the accepted requests.
+    """
+
+    __slots__ = (
+        "_group_max_rate",
+        "_group_time_period",
+        "_group_windows",
+        "_overall_max_rate",
+        "_overall_time_period",
+        "_overall_window",
+        "_paid_window",
+    )
+
+    def __init__(
+        self,
+        overall_max_rate: float,
+        overall_time_period: float,
+        group_max_rate: float,
+        group_time_period: float,
+    ):
+        self._overall_max_rate = overall_max_rate
+        self._overall_time_period = overall_time_period
+        self._group_max_rate = group_max_rate
+        self._group_time_period = group_time_period
+        self._overall_window: deque[float] = deque()
+        self._paid_window: deque[float] = deque()
+        self._group_windows: dict[Union[str, int], deque[float]] = {}
+
+    @staticmethod
+    def _waiting_time(
+        window: deque[float], max_rate: float, time_period: float, now: float
+    ) -> float:
+        while window and window[0] <= now - time_period:
+            window.popleft()
+        if len(window) >= max_rate:
+            return window[0] + time_period - now
+        return 0.0
+
+    def check(self, group: Optional[Union[str, int]], paid: bool, now: float) -> None:
+        windows: list[tuple[deque[float], float, float]] = []
+        if paid:
+            windows.append((self._paid_window, constants.FloodLimit.PAID_MESSAGES_PER_SECOND, 1))
+        else:
+            if self._overall_max_rate and self._overall_time_period:
+                windows.append(
+                    (self._overall_window, self._overall_max_rate, self._overall_time_period)
+                )
+            if group is not None and self._group_max_rate and self._group_time_period:
+                windows.append(
+                    (
+                        self._group_windows.setdefault(group, deque()),
+                        self._group_max_rate,
+                        self._group_time_period,
+                    )
+                )
+
+        waiting_time = max(
+            (self._waiting_time(*window, now=now) for window in windows), default=0.0
+        )
+        if waiting_time > 0:
+            raise RetryAfter(retry_after=max(math.ceil(waiting_time), 1))
+
+        for window, _, _ in windows:
+            window.append(now)
+
+
+class RateLimiterSimulator:
+    """Runs synthetic traffic through a :class:`~telegram.ext.BaseRateLimiter` on a virtual
+    clock, i.e. without making any requests to Telegram and without waiting in real time. The
+    simulated Bot API raises :exc:`~telegram.error.RetryAfter` whenever the configured flood
+    limits are exceeded. The resulting :class:`~telegram.ext.RateLimiterStatistics` allow to
+    tune the parameters of a rate limiter, e.g.
+    :paramref:`~telegram.ext.AIORateLimiter.overall_max_rate` and
+    :paramref:`~telegram.ext.AIORateLimiter.group_max_rate`, before deploying.
+
+    Example:
+        .. code:: python
+
+            simulator = RateLimiterSimulator(lambda: AIORateLimiter(max_retries=3))
+            # 100 messages to a group and 100 messages to private chats within 10 seconds
+            traffic = [(i / 10, {"chat_id": -100123}) for i in range(100)] + [
+                (i / 10, {"chat_id": i}) for i in range(100)
+            ]
+            statistics = simulator.run(traffic)
+            print(statistics.wait_time_percentile(95), statistics.throughput)
+
+    Note:
+        * The flood limits of Telegram are not documented in detail. This class uses sliding
+          windows, which is an approximation of the behavior of the Bot API.
+        * The simulation is deterministic as long as the rate limiter only uses the clock of
+          the running event loop, i.e. :func:`asyncio.sleep` and :meth:`asyncio.loop.time`,
+          which is the case for :class:`~telegram.ext.AIORateLimiter`.
+
+    Caution:
+        :meth:`run` starts its own event loop and hence can't be called while an event loop is
+        running in the current thread.
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        rate_limiter (Callable[[], :class:`telegram.ext.BaseRateLimiter`]): Callable that returns
+            a new rate limiter. It is called once per run of :meth:`run` such that every
+            simulation starts with a fresh state.
+        api_overall_max_rate (:obj:`float`, optional): The number of requests the simulated Bot
+            API accepts per :paramref:`api_overall_time_period` for all requests that have a
+            ``chat_id``. Defaults to
+            :tg-const:`telegram.constants.FloodLimit.MESSAGES_PER_SECOND`.
+        api_overall_time_period (:obj:`float`, optional): The time period in seconds for
+            :paramref:`api_overall_max_rate`. Defaults to ``1``.
+        api_group_max_rate (:obj:`float`, optional): The number of requests the simulated Bot API
+            accepts per :paramref:`api_group_time_period` for each group chat. Defaults to
+            :tg-const:`telegram.constants.FloodLimit.MESSAGES_PER_MINUTE_PER_GROUP`.
+        api_group_time_period (:obj:`float`, optional): The time period in seconds for
+            :paramref:`api_group_max_rate`. Defaults to ``60``.
+        request_duration (:obj:`float`, optional): The simulated time in seconds that a single
+            request to the Bot API takes. Defaults to ``0``.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`request_duration` is negative.
+    """
+
+    __slots__ = (
+        "_api_group_max_rate",
+        "_api_group_time_period",
+        "_api_overall_max_rate",
+        "_api_overall_time_period",
+        "_rate_limiter",
+        "_request_duration",
+    )
+
+    def __init__(
+        self,
+        rate_limiter: Callable[[], BaseRateLimiter[Any]],
+        api_overall_max_rate: float = constants.FloodLimit.MESSAGES_PER_SECOND,
+        api_overall_time_period: float = 1,
+        api_group_max_rate: float = constants.FloodLimit.MESSAGES_PER_MINUTE_PER_GROUP,
+        api_group_time_period: float = 60,
+        request_duration: float = 0,
+    ):
+        if request_duration < 0:
+            raise ValueError("`request_duration` must not be negative!")
+
+        self._rate_limiter: Callable[[], BaseRateLimiter[Any]] = rate_limiter
+        self._api_overall_max_rate: float = api_overall_max_rate
+        self._api_overall_time_period: float = api_overall_time_period
+        self._api_group_max_rate: float = api_group_max_rate
+        self._api_group_time_period: float = api_group_time_period
+        self._request_duration: float = request_duration
+
+    def run(
+        self,
+        requests: Iterable[tuple[float, dict[str, Any]]],
+        endpoint: str = "sendMessage",
+        rate_limit_args: Optional[object] = None,
+    ) -> RateLimiterStatistics:
+        """Runs the simulation.
+
+        Args:
+            requests (Iterable[tuple[:obj:`float`, dict[:obj:`str`, :obj:`object`]]]): The
+                synthetic traffic. Each item consists of the time in seconds after the start of
+                the simulation at which the request is made and the parameters of the request,
+                which are passed as :paramref:`~telegram.ext.BaseRateLimiter.process_request.data`
+                to the rate limiter. For example, ``(1.5, {"chat_id": -100123})`` makes a request
+                to a group chat after 1.5 seconds.
+            endpoint (:obj:`str`, optional): The endpoint passed to the rate limiter for all
+                requests. Defaults to ``"sendMessage"``.
+            rate_limit_args (:obj:`object`, optional): Passed to the rate limiter for all
+                requests.
+
+        Returns:
+            :class:`telegram.ext.RateLimiterStatistics`: The statistics of the simulation. All
+            times are measured in simulated seconds.
+
+        Raises:
+            :exc:`RuntimeError`: If called while an event loop is running or if the simulation
+                stalls.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError("`run` can't be called while an event loop is running.")
+
+        sorted_requests = sorted(requests, key=lambda request: request[0])
+        loop = _VirtualClockEventLoop()
+        try:
+            return loop.run_until_complete(
+                self._run(sorted_requests, endpoint=endpoint, rate_limit_args=rate_limit_args)
+            )
+        finally:
+            loop.close()
+
+    async def _run(
+        self,
+        requests: list[tuple[float, dict[str, Any]]],
+        endpoint: str,
+        rate_limit_args: Optional[object],
+    ) -> RateLimiterStatistics:
+        loop = asyncio.get_running_loop()
+        rate_limiter = self._rate_limiter()
+        statistics = RateLimiterStatistics(max_samples=max(len(requests), 1))
+        flood_control = _FloodControl(
+            overall_max_rate=self._api_overall_max_rate,
+            overall_time_period=self._api_overall_time_period,
+            group_max_rate=self._api_group_max_rate,
+            group_time_period=self._api_group_time_period,
+        )
+
+        await rate_limiter.initialize()
+        try:
+            start = loop.time()
+            tasks = []
+            for send_time, data in requests:
+                delay = start + send_time - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                tasks.append(
+                    asyncio.create_task(
+                        self._send_request(
+                            rate_limiter=rate_limiter,
+                            statistics=statistics,
+                            flood_control=flood_control,
+                            data=data,
+                            endpoint=endpoint,
+                            rate_limit_args=rate_limit_args,
+                        )
+                    )
+                )
+            await asyncio.gather(*tasks)
+        finally:
+            await rate_limiter.shutdown()
+
+        return statistics
+
+    async def _send_request(
+        self,
+        rate_limiter: BaseRateLimiter[Any],
+        statistics: RateLimiterStatistics,
+        flood_control: _FloodControl,
+        data: dict[str, Any],
+        endpoint: str,
+        rate_limit_args: Optional[object],
+    ) -> None:
+        chat_id = data.get("chat_id")
+        with contextlib.suppress(ValueError, TypeError):
+            chat_id = int(chat_id)  # type: ignore[arg-type]
+        # Same logic as in AIORateLimiter: string chat_ids only work for channels and supergroups
+        group = (
+            chat_id
+            if (isinstance(chat_id, int) and chat_id < 0) or isinstance(chat_id, str)
+            else None
+        )
+        paid = bool(data.get("allow_paid_broadcast", False))
+
+        received_at = statistics.request_received(group)
+        attempts = 0
+
+        async def callback() -> bool:
+            nonlocal attempts
+            loop = asyncio.get_running_loop()
+            if attempts == 0:
+                statistics.request_started(received_at, group)
+            else:
+                statistics.request_retried()
+            attempts += 1
+
+            if chat_id is not None or paid:
+                try:
+                    flood_control.check(group=group, paid=paid, now=loop.time())
+                except RetryAfter:
+                    statistics.retry_after_received()
+                    raise
+            if self._request_duration:
+                await asyncio.sleep(self._request_duration)
+            return True
+
+        try:
+            await rate_limiter.process_request(
+                callback=callback,
+                args=(),
+                kwargs={},
+                endpoint=endpoint,
+                data=data,
+                rate_limit_args=rate_limit_args,
+            )
+        except RetryAfter:
+            # The request failed, which is already reflected in the statistics
+            pass
+        finally:
+            statistics.request_finished(attempts > 0, group)
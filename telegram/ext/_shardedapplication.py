@@ -0,0 +1,550 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the ShardedApplication class, which distributes updates over several
+worker processes.
+"""
+import asyncio
+import contextlib
+import itertools
+import multiprocessing
+import os
+import queue
+import time
+from collections import deque
+from collections.abc import Hashable
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
+
+from telegram._update import Update
+from telegram._utils.logging import get_logger
+from telegram._utils.repr import build_repr_with_selected_attrs
+from telegram.ext._utils.hashring import HashRing
+
+if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+    from multiprocessing.process import BaseProcess
+    from multiprocessing.queues import Queue as MPQueue
+
+    from telegram.ext import Application, Updater
+
+_ShardedApplicationType = TypeVar(  # pylint: disable=invalid-name
+    "_ShardedApplicationType", bound="ShardedApplication"
+)
+_LOGGER = get_logger(__name__, class_name="ShardedApplication")
+_STOP_SIGNAL = object()
+
+
+def _run_worker(
+    index: int,
+    application_factory: Callable[[], "Application[Any, Any, Any, Any, Any, Any]"],
+    updates: "MPQueue[Optional[tuple[bool, object]]]",
+    heartbeats: "MPQueue[tuple[int, int, int]]",
+    heartbeat_interval: float,
+) -> None:
+    """The entry point of the worker processes."""
+    asyncio.run(_worker_main(index, application_factory, updates, heartbeats, heartbeat_interval))
+
+
+async def _worker_main(
+    index: int,
+    application_factory: Callable[[], "Application[Any, Any, Any, Any, Any, Any]"],
+    updates: "MPQueue[Optional[tuple[bool, object]]]",
+    heartbeats: "MPQueue[tuple[int, int, int]]",
+    heartbeat_interval: float,
+) -> None:
+    application = application_factory()
+    loop = asyncio.get_running_loop()
+    pid = os.getpid()
+    received = 0
+
+    async def report_health() -> None:
+        while True:
+            heartbeats.put((index, pid, received))
+            await asyncio.sleep(heartbeat_interval)
+
+    async with application:
+        await application.start()
+        heartbeat_task = asyncio.create_task(report_health())
+        try:
+            while (item := await loop.run_in_executor(None, updates.get)) is not None:
+                is_update, payload = item
+                update = (
+                    Update.de_json(payload, application.bot)  # type: ignore[arg-type]
+                    if is_update
+                    else payload
+                )
+                received += 1
+                await application.update_queue.put(update)
+        finally:
+            heartbeat_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat_task
+            await application.stop()
+
+
+class _Worker:
+    """The state of a worker process as seen by the ingest process."""
+
+    __slots__ = (
+        "acknowledged",
+        "index",
+        "last_heartbeat",
+        "process",
+        "restarts",
+        "unacknowledged",
+        "updates",
+    )
+
+    def __init__(self, index: int, updates: "MPQueue[Optional[tuple[bool, object]]]") -> None:
+        self.index = index
+        self.updates = updates
+        self.process: Optional[BaseProcess] = None
+        self.restarts = 0
+        self.last_heartbeat = 0.0
+        # Number of items that the current process confirmed to have received
+        self.acknowledged = 0
+        # Items that were sent but not confirmed yet. They are sent again on restart.
+        self.unacknowledged: deque[tuple[bool, object]] = deque()
+
+
+class ShardedApplication(contextlib.AbstractAsyncContextManager["ShardedApplication"]):
+    """This class distributes the processing of updates over several worker processes, such that
+    more than one CPU core can be used.
+
+    The ingest process, i.e. the process in which this class is used, only runs the
+    :paramref:`updater`. Each worker process runs its own :class:`telegram.ext.Application`,
+    which is built by :paramref:`application_factory` and hence has the same handlers in all
+    workers. Updates are passed from the :attr:`updater`'s
+    :attr:`~telegram.ext.Updater.update_queue` to the workers via inter-process queues. The worker
+    of an update is determined by a consistent hash of its key, which by default is the id of the
+    :attr:`~telegram.Update.effective_chat`. Hence, all updates of a chat are processed by the
+    same worker, such that :attr:`telegram.ext.CallbackContext.chat_data` and conversation states
+    stay local to one worker. The updates are passed to the worker in the order in which they
+    were received. To process updates concurrently within a worker while keeping this order per
+    chat, use :class:`telegram.ext.KeyedUpdateProcessor` in the workers.
+
+    The workers regularly report their health. Workers that exit or stop reporting are restarted.
+    Updates that the worker had not confirmed to have received are sent again to the restarted
+    worker, which means that an update may be processed twice. Updates that the worker had
+    already confirmed, but not finished processing when it crashed, are lost.
+
+    Instances of this class can be used as asyncio context managers, where
+
+    .. code:: python
+
+        async with sharded_application:
+            # code
+
+    is roughly equivalent to
+
+    .. code:: python
+
+        try:
+            await sharded_application.initialize()
+            # code
+        finally:
+            await sharded_application.shutdown()
+
+    Example:
+        .. code:: python
+
+            def build_application():
+                application = Application.builder().token("TOKEN").updater(None).build()
+                application.add_handler(CommandHandler("start", start))
+                return application
+
+            async def main():
+                updater = Updater(Bot("TOKEN"), update_queue=asyncio.Queue())
+                async with ShardedApplication(build_application, updater, workers=4) as sharded:
+                    await sharded.start()
+                    await updater.start_polling()
+                    # run until the bot should be stopped
+                    await updater.stop()
+                    await sharded.stop()
+
+    Caution:
+        * :paramref:`application_factory` is called in the worker processes. With the default
+          start method ``"spawn"``, it must therefore be picklable, e.g. a function defined on
+          module level. Moreover, the module defining it must be importable without side
+          effects, i.e. the code starting the bot must be guarded by
+          ``if __name__ == "__main__":``.
+        * Arbitrary callback data is not supported, since the cache of
+          :class:`telegram.ext.CallbackDataCache` can't be shared between processes.
+        * State that is not bound to a chat, e.g. :attr:`telegram.ext.CallbackContext.bot_data`,
+          is *not* shared between the workers.
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        application_factory (Callable[[], :class:`telegram.ext.Application`]): Builds the
+            application of a worker process. The :attr:`telegram.ext.Application.updater` of that
+            application is not used.
+        updater (:class:`telegram.ext.Updater`): The updater that fetches the updates.
+        workers (:obj:`int`): The number of worker processes.
+        key (Callable[[:obj:`object`], :class:`~collections.abc.Hashable` | :obj:`None`], \
+            optional): A custom function that computes the key of an update. Updates with the
+            same key are processed by the same worker. Updates with the key :obj:`None` are
+            distributed round-robin. Defaults to the id of the
+            :attr:`~telegram.Update.effective_chat` or, if that is not available, of the
+            :attr:`~telegram.Update.effective_user`.
+        heartbeat_interval (:obj:`float`, optional): The interval in seconds in which workers
+            report their health. Defaults to ``1``.
+        heartbeat_timeout (:obj:`float`, optional): The number of seconds after which a worker
+            that did not report its health is restarted. This includes the startup time of the
+            worker. Defaults to ``30``.
+        start_method (:obj:`str`, optional): The :mod:`multiprocessing` start method. Defaults
+            to ``"spawn"``.
+
+    Attributes:
+        updater (:class:`telegram.ext.Updater`): The updater that fetches the updates.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`workers` is a non-positive integer.
+    """
+
+    __slots__ = (
+        "_application_factory",
+        "_context",
+        "_dispatch_task",
+        "_heartbeat_interval",
+        "_heartbeat_timeout",
+        "_heartbeats",
+        "_initialized",
+        "_key",
+        "_monitor_task",
+        "_ring",
+        "_round_robin",
+        "_running",
+        "_workers",
+        "updater",
+    )
+
+    def __init__(
+        self,
+        application_factory: Callable[[], "Application[Any, Any, Any, Any, Any, Any]"],
+        updater: "Updater",
+        workers: int,
+        key: Optional[Callable[[object], Optional[Hashable]]] = None,
+        heartbeat_interval: float = 1.0,
+        heartbeat_timeout: float = 30.0,
+        start_method: str = "spawn",
+    ):
+        if workers < 1:
+            raise ValueError("`workers` must be a positive integer!")
+
+        self.updater: Updater = updater
+        self._application_factory = application_factory
+        self._key: Optional[Callable[[object], Optional[Hashable]]] = key
+        self._heartbeat_interval: float = heartbeat_interval
+        self._heartbeat_timeout: float = heartbeat_timeout
+        self._context: BaseContext = multiprocessing.get_context(start_method)
+        self._ring = HashRing(workers)
+        self._round_robin = itertools.cycle(range(workers))
+        self._heartbeats: MPQueue[tuple[int, int, int]] = self._context.Queue()
+        self._workers: tuple[_Worker, ...] = tuple(
+            _Worker(index, self._context.Queue()) for index in range(workers)
+        )
+        self._initialized = False
+        self._running = False
+        self._dispatch_task: Optional[asyncio.Task[None]] = None
+        self._monitor_task: Optional[asyncio.Task[None]] = None
+
+    async def __aenter__(
+        self: _ShardedApplicationType,
+    ) -> _ShardedApplicationType:  # noqa: PYI019
+        """|async_context_manager| :meth:`initializes <initialize>` the instance.
+
+        Returns:
+            The initialized instance.
+
+        Raises:
+            :exc:`Exception`: If an exception is raised during initialization, :meth:`shutdown`
+                is called in this case.
+        """
+        try:
+            await self.initialize()
+        except Exception:
+            await self.shutdown()
+            raise
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """|async_context_manager| :meth:`shuts down <shutdown>` the instance."""
+        if self.running:
+            await self.stop()
+        await self.shutdown()
+
+    def __repr__(self) -> str:
+        """Give a string representation of the instance in the form
+        ``ShardedApplication[workers=...]``.
+
+        As this class doesn't implement :meth:`object.__str__`, the default implementation
+        will be used, which is equivalent to :meth:`__repr__`.
+
+        Returns:
+            :obj:`str`
+        """
+        return build_repr_with_selected_attrs(self, workers=self.workers)
+
+    @property
+    def running(self) -> bool:
+        """:obj:`bool`: Indicates if the worker processes are running."""
+        return self._running
+
+    @property
+    def workers(self) -> int:
+        """:obj:`int`: The number of worker processes."""
+        return len(self._workers)
+
+    @property
+    def worker_pids(self) -> tuple[Optional[int], ...]:
+        """tuple[:obj:`int` | :obj:`None`]: The process ids of the workers."""
+        return tuple(worker.process.pid if worker.process else None for worker in self._workers)
+
+    @property
+    def worker_restarts(self) -> tuple[int, ...]:
+        """tuple[:obj:`int`]: How often each worker was restarted."""
+        return tuple(worker.restarts for worker in self._workers)
+
+    def get_shard(self, update: object) -> int:
+        """Determines the worker that processes an update.
+
+        Args:
+            update (:obj:`object`): The update.
+
+        Returns:
+            :obj:`int`: The index of the worker.
+        """
+        if self._key is not None:
+            key = self._key(update)
+        elif isinstance(update, Update) and update.effective_chat:
+            key = update.effective_chat.id
+        elif isinstance(update, Update) and update.effective_user:
+            key = update.effective_user.id
+        else:
+            key = None
+
+        if key is None:
+            return next(self._round_robin)
+        return self._ring.get_node(key)
+
+    async def initialize(self) -> None:
+        """Initializes the :attr:`updater`.
+
+        .. seealso::
+            :meth:`shutdown`
+        """
+        if self._initialized:
+            _LOGGER.debug("This ShardedApplication is already initialized.")
+            return
+
+        await self.updater.initialize()
+        self._initialized = True
+
+    async def shutdown(self) -> None:
+        """Shuts down the :attr:`updater`.
+
+        .. seealso::
+            :meth:`initialize`
+
+        Raises:
+            :exc:`RuntimeError`: If the workers are still running.
+        """
+        if self.running:
+            raise RuntimeError("This ShardedApplication is still running!")
+
+        if not self._initialized:
+            _LOGGER.debug("This ShardedApplication is already shut down. Returning.")
+            return
+
+        await self.updater.shutdown()
+        self._initialized = False
+
+    async def start(self) -> None:
+        """Starts the worker processes and the distribution of updates from the
+        :attr:`~telegram.ext.Updater.update_queue` of the :attr:`updater`. Does *not* start the
+        :attr:`updater`.
+
+        .. seealso::
+            :meth:`stop`
+
+        Raises:
+            :exc:`RuntimeError`: If the instance is already running or was not initialized.
+        """
+        if self.running:
+            raise RuntimeError("This ShardedApplication is already running!")
+        if not self._initialized:
+            raise RuntimeError("This ShardedApplication was not initialized!")
+
+        self._running = True
+        for worker in self._workers:
+            self._start_worker(worker)
+        self._dispatch_task = asyncio.create_task(
+            self._dispatch_updates(), name="ShardedApplication:dispatch_updates"
+        )
+        self._monitor_task = asyncio.create_task(
+            self._monitor_workers(), name="ShardedApplication:monitor_workers"
+        )
+        _LOGGER.info("ShardedApplication started with %d workers", self.workers)
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """Stops the distribution of updates and the worker processes. Updates that are still
+        in the :attr:`~telegram.ext.Updater.update_queue` are distributed first and the workers
+        finish processing all updates they received.
+
+        .. seealso::
+            :meth:`start`
+
+        Args:
+            timeout (:obj:`float`, optional): The number of seconds to wait for each worker to
+                exit before it is killed. By default, waits indefinitely.
+
+        Raises:
+            :exc:`RuntimeError`: If the instance is not running.
+        """
+        if not self.running:
+            raise RuntimeError("This ShardedApplication is not running!")
+
+        _LOGGER.info("ShardedApplication is stopping. This might take a moment.")
+        if self._dispatch_task:
+            await self.updater.update_queue.put(_STOP_SIGNAL)
+            await self._dispatch_task
+            self._dispatch_task = None
+        # No more restarts from here on
+        if self._monitor_task:
+            self._monitor_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._monitor_task
+            self._monitor_task = None
+
+        loop = asyncio.get_running_loop()
+        for worker in self._workers:
+            worker.updates.put(None)
+        for worker in self._workers:
+            if worker.process is None:
+                continue
+            await loop.run_in_executor(None, worker.process.join, timeout)
+            if worker.process.is_alive():
+                _LOGGER.warning("Worker %d did not exit in time. Killing it.", worker.index)
+                worker.process.kill()
+                await loop.run_in_executor(None, worker.process.join)
+            worker.process.close()
+            worker.process = None
+
+        self._running = False
+        _LOGGER.info("ShardedApplication stopped")
+
+    def _start_worker(self, worker: _Worker) -> None:
+        worker.process = self._context.Process(
+            target=_run_worker,
+            args=(
+                worker.index,
+                self._application_factory,
+                worker.updates,
+                self._heartbeats,
+                self._heartbeat_interval,
+            ),
+            name=f"ShardedApplication:worker:{worker.index}",
+            daemon=True,
+        )
+        worker.process.start()
+        worker.acknowledged = 0
+        # The startup time counts towards the heartbeat timeout
+        worker.last_heartbeat = time.monotonic()
+
+    async def _restart_worker(self, worker: _Worker) -> None:
+        process = worker.process
+        if process is not None:
+            if process.is_alive():
+                process.kill()
+            await asyncio.get_running_loop().run_in_executor(None, process.join)
+            process.close()
+
+        # The queue may be unusable if the process was killed while reading from it. Hence, we
+        # use a new one and send the updates that were not confirmed again.
+        worker.updates.close()
+        worker.updates = self._context.Queue()
+        for item in worker.unacknowledged:
+            worker.updates.put(item)
+
+        worker.restarts += 1
+        self._start_worker(worker)
+
+    async def _dispatch_updates(self) -> None:
+        update_queue = self.updater.update_queue
+        while True:
+            update = await update_queue.get()
+            try:
+                if update is _STOP_SIGNAL:
+                    return
+
+                worker = self._workers[self.get_shard(update)]
+                item = (True, update.to_dict()) if isinstance(update, Update) else (False, update)
+                worker.unacknowledged.append(item)
+                worker.updates.put(item)
+            finally:
+                update_queue.task_done()
+
+    def _collect_heartbeats(self) -> None:
+        now = time.monotonic()
+        while True:
+            try:
+                index, pid, received = self._heartbeats.get_nowait()
+            except queue.Empty:
+                return
+
+            worker = self._workers[index]
+            if worker.process is None or worker.process.pid != pid:
+                # Late heartbeat of a process that was restarted in the meantime
+                continue
+            worker.last_heartbeat = now
+            for _ in range(received - worker.acknowledged):
+                worker.unacknowledged.popleft()
+            worker.acknowledged = received
+
+    async def _monitor_workers(self) -> None:
+        while True:
+            await asyncio.sleep(self._heartbeat_interval)
+            self._collect_heartbeats()
+            now = time.monotonic()
+            for worker in self._workers:
+                if worker.process is None:
+                    continue
+                if not worker.process.is_alive():
+                    _LOGGER.error(
+                        "Worker %d (pid %s) exited with code %s. Restarting it.",
+                        worker.index,
+                        worker.process.pid,
+                        worker.process.exitcode,
+                    )
+                elif now - worker.last_heartbeat > self._heartbeat_timeout:
+                    _LOGGER.error(
+                        "Worker %d (pid %s) did not report for %.1f seconds. Restarting it.",
+                        worker.index,
+                        worker.process.pid,
+                        now - worker.last_heartbeat,
+                    )
+                else:
+                    continue
+                await self._restart_worker(worker)
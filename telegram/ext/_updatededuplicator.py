@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains a class that detects updates that were delivered more than once."""
+from typing import Optional
+
+from telegram._utils.repr import build_repr_with_selected_attrs
+
+
+class UpdateDeduplicator:
+    """Detects updates that Telegram delivered more than once based on their
+    :attr:`~telegram.Update.update_id`. Telegram delivers an update again if the webhook did not
+    answer in time, which would otherwise lead to the update being processed twice.
+
+    The update ids that were seen recently are stored in a bitset relative to the highest seen
+    update id, i.e. the memory usage is bounded by :paramref:`window_size` bits. Update ids that
+    are more than :paramref:`window_size` lower than the highest seen id can't be checked. They
+    are treated as new, but are not recorded, so a single stale update can't make the
+    deduplicator forget the recent ids. Since Telegram may choose a new, random starting point for
+    the update ids after a week without updates, an update id that is more than
+    :paramref:`window_size` higher than the highest seen id starts a new window. If the new
+    starting point is lower, call :meth:`reset`.
+
+    Pass an instance of this class to :meth:`telegram.ext.Updater.start_webhook` or
+    :meth:`telegram.ext.Application.run_webhook`. The webhook server then drops duplicate updates
+    before they are parsed and put into the update queue.
+
+    Example:
+        .. code:: python
+
+            deduplicator = UpdateDeduplicator()
+            application.run_webhook(..., update_deduplicator=deduplicator)
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        window_size (:obj:`int`, optional): The number of update ids below the highest seen
+            update id that are tracked. Defaults to ``4096``.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`window_size` is not a positive integer.
+    """
+
+    __slots__ = ("_duplicates", "_highest_update_id", "_seen", "_unique_updates", "_window_size")
+
+    def __init__(self, window_size: int = 4096):
+        if window_size < 1:
+            raise ValueError("`window_size` must be a positive integer!")
+        self._window_size: int = window_size
+        self._highest_update_id: Optional[int] = None
+        # Bit i is set if the update id `_highest_update_id - i` was seen
+        self._seen: int = 0
+        self._duplicates: int = 0
+        self._unique_updates: int = 0
+
+    def __repr__(self) -> str:
+        """Give a string representation of the deduplicator in the form
+        ``UpdateDeduplicator[window_size=..., duplicates=...]``.
+
+        Returns:
+            :obj:`str`
+        """
+        return build_repr_with_selected_attrs(
+            self, window_size=self._window_size, duplicates=self._duplicates
+        )
+
+    @property
+    def window_size(self) -> int:
+        """:obj:`int`: The number of update ids below the highest seen update id that are
+        tracked.
+        """
+        return self._window_size
+
+    @property
+    def highest_update_id(self) -> Optional[int]:
+        """:obj:`int`: Optional. The highest update id seen in the current window."""
+        return self._highest_update_id
+
+    @property
+    def duplicates(self) -> int:
+        """:obj:`int`: The number of updates that were detected as duplicates."""
+        return self._duplicates
+
+    @property
+    def unique_updates(self) -> int:
+        """:obj:`int`: The number of updates that were not detected as duplicates."""
+        return self._unique_updates
+
+    def _start_window(self, update_id: int) -> None:
+        self._highest_update_id = update_id
+        self._seen = 1
+
+    def record(self, update_id: int) -> bool:
+        """Records that an update with the given id was received.
+
+        Args:
+            update_id (:obj:`int`): The :attr:`~telegram.Update.update_id` of the update.
+
+        Returns:
+            :obj:`bool`: :obj:`True`, if the update id was not seen before and :obj:`False` if
+            the update is a duplicate.
+        """
+        highest = self._highest_update_id
+        if highest is None or update_id > highest:
+            shift = update_id - highest if highest is not None else self._window_size
+            if shift >= self._window_size:
+                self._start_window(update_id)
+            else:
+                self._highest_update_id = update_id
+                self._seen = ((self._seen << shift) | 1) & ((1 << self._window_size) - 1)
+            self._unique_updates += 1
+            return True
+
+        offset = highest - update_id
+        if offset < self._window_size:
+            bit = 1 << offset
+            if self._seen & bit:
+                self._duplicates += 1
+                return False
+            self._seen |= bit
+        # Otherwise, the update id is too old to be checked and we keep the current window
+        self._unique_updates += 1
+        return True
+
+    def reset(self) -> None:
+        """Forgets all seen update ids and resets the counters."""
+        self._highest_update_id = None
+        self._seen = 0
+        self._duplicates = 0
+        self._unique_updates = 0
@@ -31,6 +31,7 @@ from telegram._utils.logging import get_logger
 from telegram._utils.repr import build_repr_with_selected_attrs
 from telegram._utils.types import DVType, ODVInput
 from telegram.error import InvalidToken, RetryAfter, TelegramError, TimedOut
+from telegram.ext._boundedupdatequeue import BoundedUpdateQueue
 
 try:
     from telegram.ext._utils.webhookhandler import WebhookAppClass, WebhookServer
@@ -43,6 +44,7 @@ if TYPE_CHECKING:
     from socket import socket
 
     from telegram import Bot
+    from telegram.ext import UpdateDeduplicator
 
 
 _UpdaterType = TypeVar("_UpdaterType", bound="Updater")  # pylint: disable=invalid-name
@@ -367,9 +369,18 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
         _LOGGER.debug("Bootstrap done")
 
         async def polling_action_cb() -> bool:
+            limit = None
+            if isinstance(self.update_queue, BoundedUpdateQueue):
+                # Apply backpressure by leaving the updates on the Telegram servers
+                if self.update_queue.overloaded:
+                    _LOGGER.debug("Update queue is overloaded. Waiting before fetching updates.")
+                    await self.update_queue.wait_for_capacity()
+                limit = min(max(self.update_queue.free_capacity, 1), 100)
+
             try:
                 updates = await self.bot.get_updates(
                     offset=self._last_update_id,
+                    limit=limit,
                     timeout=timeout,
                     read_timeout=read_timeout,
                     connect_timeout=connect_timeout,
@@ -467,6 +478,7 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
         max_connections: int = 40,
         secret_token: Optional[str] = None,
         unix: Optional[Union[str, Path, "socket"]] = None,
+        update_deduplicator: Optional["UpdateDeduplicator"] = None,
     ) -> "asyncio.Queue[object]":
         """
         Starts a small http server to listen for updates via webhook. If :paramref:`cert`
@@ -559,6 +571,12 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
                 .. versionadded:: 20.8
                 .. versionchanged:: 21.1
                     Added support to pass a socket instance itself.
+            update_deduplicator (:class:`telegram.ext.UpdateDeduplicator`, optional): If
+                passed, incoming updates whose :attr:`~telegram.Update.update_id` was already
+                received are answered with ``200 OK`` and dropped before they are parsed and put
+                into the :attr:`update_queue`.
+
+                .. versionadded:: NEXT.VERSION
         Returns:
             :class:`queue.Queue`: The update queue that can be filled from the main thread.
 
@@ -613,6 +631,7 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
                     max_connections=max_connections,
                     secret_token=secret_token,
                     unix=unix,
+                    update_deduplicator=update_deduplicator,
                 )
 
                 _LOGGER.debug("Waiting for webhook server to start")
@@ -641,6 +660,7 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
         max_connections: int = 40,
         secret_token: Optional[str] = None,
         unix: Optional[Union[str, Path, "socket"]] = None,
+        update_deduplicator: Optional["UpdateDeduplicator"] = None,
     ) -> None:
         _LOGGER.debug("Updater thread started (webhook)")
 
@@ -648,7 +668,9 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
             url_path = f"/{url_path}"
 
         # Create Tornado app instance
-        app = WebhookAppClass(url_path, self.bot, self.update_queue, secret_token)
+        app = WebhookAppClass(
+            url_path, self.bot, self.update_queue, secret_token, update_deduplicator
+        )
 
         # Form SSL Context
         # An SSLError is raised if the private key does not match with the certificate
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains a helper function that parses the command of a message once, such that
+the result can be shared by all command-like handlers.
+
+.. versionadded:: NEXT.VERSION
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+from typing import NamedTuple, Optional
+
+from telegram import Message, MessageEntity
+from telegram.ext._utils.objectcache import get_object_cache
+
+
+class ParsedCommand(NamedTuple):
+    """The result of :func:`parse_command`."""
+
+    words: tuple[str, ...]
+    """The text of the message split on whitespace."""
+    first_word: Optional[str]
+    """The lowercased first item of :attr:`words`. Used by
+    :class:`~telegram.ext.PrefixHandler`."""
+    command: Optional[str]
+    """The lowercased command without leading ``/`` and without the bot username, if the message
+    starts with a :attr:`telegram.MessageEntity.BOT_COMMAND`. Used by
+    :class:`~telegram.ext.CommandHandler`."""
+    bot_username: Optional[str]
+    """The lowercased bot username in commands of the form ``/command@username``."""
+
+
+def parse_command(message: Message) -> Optional[ParsedCommand]:
+    """Parses the text of a message such that it can be matched against the commands of
+    :class:`~telegram.ext.CommandHandler` and :class:`~telegram.ext.PrefixHandler`.
+
+    Within :func:`~telegram.ext._utils.objectcache.cache_object_data`, the result is cached for
+    the message, so that the text is parsed only once, no matter how many handlers check the
+    message.
+
+    Args:
+        message (:class:`telegram.Message`): The message.
+
+    Returns:
+        :class:`ParsedCommand` | :obj:`None`: The parsed text or :obj:`None`, if the message has
+        no text.
+    """
+    text = message.text
+    entity = message.entities[0] if message.entities else None
+    # The key makes sure that the cache is invalidated if the message was modified
+    key = (text, entity.type, entity.offset, entity.length) if entity else (text,)
+
+    cache = get_object_cache(message)
+    cached = cache.get("parsed_command") if cache is not None else None
+    if cached is not None and cached[0] == key:  # type: ignore[index]
+        return cached[1]  # type: ignore[index]
+
+    parsed: Optional[ParsedCommand] = None
+    if text:
+        words = tuple(text.split())
+        command = bot_username = None
+        if entity and entity.type == MessageEntity.BOT_COMMAND and entity.offset == 0:
+            command_parts = text[1 : entity.length].split("@")
+            command = command_parts[0].lower()
+            if len(command_parts) > 1:
+                bot_username = command_parts[1].lower()
+        parsed = ParsedCommand(
+            words=words,
+            first_word=words[0].lower() if words else None,
+            command=command,
+            bot_username=bot_username,
+        )
+
+    if cache is not None:
+        cache["parsed_command"] = (key, parsed)
+    return parsed
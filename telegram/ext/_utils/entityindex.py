@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains a helper that extracts the texts of the entities of a message once, such
+that the result can be shared by all filters and handlers that check the entities.
+
+.. versionadded:: NEXT.VERSION
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+import functools
+from collections.abc import Sequence
+from typing import Callable, Optional
+
+from telegram import Message, MessageEntity
+from telegram._utils.entities import get_utf_16_text, parse_message_entities
+from telegram.ext._utils.objectcache import get_object_cache
+
+
+class EntityIndex:
+    """The entities of a text, grouped by their type. The texts of the entities are extracted
+    lazily, encoding the text to UTF-16 only once for all entities.
+
+    Args:
+        text (:obj:`str` | :obj:`None`): The text that the entities belong to.
+        entities (Sequence[:class:`telegram.MessageEntity`]): The entities.
+        encode (Callable[[], :obj:`bytes`], optional): Returns the UTF-16-LE encoding of
+            :paramref:`text`. Used to reuse an encoding that is cached elsewhere.
+
+    Attributes:
+        entities (Sequence[:class:`telegram.MessageEntity`]): The entities.
+        types (frozenset[:obj:`str`]): The types of the entities.
+        user_ids (frozenset[:obj:`int`]): The ids of :attr:`telegram.MessageEntity.user`.
+    """
+
+    __slots__ = (
+        "_encode",
+        "_mentions",
+        "_text",
+        "_texts",
+        "_texts_by_type",
+        "entities",
+        "types",
+        "user_ids",
+    )
+
+    def __init__(
+        self,
+        text: Optional[str],
+        entities: Sequence[MessageEntity],
+        encode: Optional[Callable[[], Optional[bytes]]] = None,
+    ):
+        self._text: Optional[str] = text
+        self._encode: Optional[Callable[[], Optional[bytes]]] = encode
+        self.entities: Sequence[MessageEntity] = entities
+        self.types: frozenset[str] = frozenset(entity.type for entity in entities)
+        self.user_ids: frozenset[int] = frozenset(
+            entity.user.id for entity in entities if entity.user
+        )
+        self._texts: Optional[dict[MessageEntity, str]] = None
+        self._texts_by_type: dict[str, frozenset[str]] = {}
+        self._mentions: Optional[frozenset[str]] = None
+
+    @property
+    def texts(self) -> dict[MessageEntity, str]:
+        """dict[:class:`telegram.MessageEntity`, :obj:`str`]: The text of each entity, like
+        :meth:`telegram.Message.parse_entities`. Empty, if there is no text.
+        """
+        if self._texts is None:
+            if not self._text:
+                self._texts = {}
+            else:
+                self._texts = parse_message_entities(
+                    self._text,
+                    self.entities,
+                    types=self.types,
+                    utf_16_text=self._encode() if self._encode else None,
+                )
+        return self._texts
+
+    @property
+    def mentions(self) -> frozenset[str]:
+        """frozenset[:obj:`str`]: The texts of the :attr:`~telegram.MessageEntity.MENTION` and
+        :attr:`~telegram.MessageEntity.TEXT_MENTION` entities without leading ``'@'`` s.
+        """
+        if self._mentions is None:
+            self._mentions = frozenset(
+                text.lstrip("@")
+                for text in self.get_texts(MessageEntity.MENTION, MessageEntity.TEXT_MENTION)
+            )
+        return self._mentions
+
+    def get_texts(self, *entity_types: str) -> frozenset[str]:
+        """Returns the texts of the entities of the given types.
+
+        Args:
+            *entity_types (:obj:`str`): The types of the entities.
+
+        Returns:
+            frozenset[:obj:`str`]: The texts.
+        """
+        key = "\n".join(entity_types)
+        if (texts := self._texts_by_type.get(key)) is None:
+            if self.types.isdisjoint(entity_types):
+                texts = frozenset()
+            else:
+                texts = frozenset(
+                    text for entity, text in self.texts.items() if entity.type in entity_types
+                )
+            self._texts_by_type[key] = texts
+        return texts
+
+
+def get_entity_index(message: Message, caption: bool = False) -> EntityIndex:
+    """Returns the :class:`EntityIndex` of the text or caption of a message.
+
+    Within :func:`~telegram.ext._utils.objectcache.cache_object_data`, the result is cached for
+    the message, so that the entities are processed only once, no matter how many filters and
+    handlers check the message.
+
+    Args:
+        message (:class:`telegram.Message`): The message.
+        caption (:obj:`bool`, optional): Whether to index :attr:`telegram.Message.caption` and
+            :attr:`telegram.Message.caption_entities` instead of :attr:`telegram.Message.text`
+            and :attr:`telegram.Message.entities`. Defaults to :obj:`False`.
+
+    Returns:
+        :class:`EntityIndex`: The index.
+    """
+    if caption:
+        text, entities, cache_key = message.caption, message.caption_entities, "caption_index"
+    else:
+        text, entities, cache_key = message.text, message.entities, "entity_index"
+
+    cache = get_object_cache(message)
+    cached = cache.get(cache_key) if cache is not None else None
+    # The identity checks make sure that the cache is invalidated if the message was modified
+    if (
+        isinstance(cached, EntityIndex)
+        and cached._text is text  # pylint: disable=protected-access
+        and cached.entities is entities
+    ):
+        return cached
+
+    # The UTF-16 encoding of the text is shared with `Message.parse_entities` and the like
+    index = EntityIndex(
+        text,
+        entities,
+        functools.partial(get_utf_16_text, message, "caption" if caption else "text"),
+    )
+    if cache is not None:
+        cache[cache_key] = index
+    return index
@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains helpers that compile combined filters into plain functions and share the
+results of the built-in filters between all handlers that check the same update.
+
+.. versionadded:: NEXT.VERSION
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+import contextlib
+from collections.abc import Generator
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Callable, Final, Optional, Union
+
+from telegram import Update
+from telegram.ext._utils.types import FilterDataDict
+
+if TYPE_CHECKING:
+    from telegram.ext.filters import BaseFilter
+
+FilterResult = Optional[Union[bool, FilterDataDict]]
+# Compiled filters receive the update and whether the update is a message update, i.e. the result
+# of `BaseFilter.check_update`, which is the same for all nodes of a filter tree
+_Evaluator = Callable[[Update, bool], FilterResult]
+
+_FILTERS_MODULE: Final = "telegram.ext.filters"
+_MISSING: Final = object()
+
+_FILTER_RESULTS: ContextVar[Optional[tuple[object, dict[int, FilterResult]]]] = ContextVar(
+    "_FILTER_RESULTS", default=None
+)
+
+
+@contextlib.contextmanager
+def cache_filter_results(update: object) -> Generator[None, None, None]:
+    """Within this context manager, the results of the cacheable filters are computed at most once
+    for :paramref:`update`. Used by :meth:`telegram.ext.Application.process_update`.
+
+    Args:
+        update (:obj:`object`): The update that is processed.
+    """
+    token = _FILTER_RESULTS.set((update, {}))
+    try:
+        yield
+    finally:
+        _FILTER_RESULTS.reset(token)
+
+
+def is_cacheable(filters: "BaseFilter") -> bool:
+    """Checks whether the results of a filter may be shared between handlers. This is the case
+    for the built-in filters, as their results only depend on the update, which is immutable.
+    Custom filters and data filters, whose results may be modified when being merged, are never
+    cached. The same goes for :class:`telegram.ext.filters.Chat` and similar filters, whose
+    allowed ids can be changed from within a handler callback.
+    """
+    # Import here to avoid circular imports
+    from telegram.ext.filters import _ChatUserBaseFilter
+
+    return (
+        type(filters).__module__ == _FILTERS_MODULE
+        and not filters.data_filter
+        and not isinstance(filters, _ChatUserBaseFilter)
+    )
+
+
+def _compile_leaf(filters: "BaseFilter") -> _Evaluator:
+    if not is_cacheable(filters):
+        return lambda update, _: filters.check_update(update)
+
+    key = id(filters)
+
+    def evaluate(update: Update, _: bool) -> FilterResult:
+        entry = _FILTER_RESULTS.get()
+        if entry is None or entry[0] is not update:
+            return filters.check_update(update)
+        results = entry[1]
+        result = results.get(key, _MISSING)
+        if result is _MISSING:
+            result = results[key] = filters.check_update(update)
+        return result  # type: ignore[return-value]
+
+    return evaluate
+
+
+def _compile(filters: "BaseFilter") -> _Evaluator:
+    # Import here to avoid circular imports
+    from telegram.ext.filters import _InvertedFilter, _MergedFilter, _XORFilter
+
+    # Only the exact types are compiled so that custom subclasses keep their behavior
+    filter_type = type(filters)
+    if filter_type is _XORFilter:
+        return _compile(filters.merged_filter)  # type: ignore[attr-defined]
+
+    if filter_type is _InvertedFilter:
+        inverted = _compile(filters.inv_filter)  # type: ignore[attr-defined]
+        return lambda update, is_message: is_message and not inverted(update, is_message)
+
+    if filter_type is not _MergedFilter:
+        return _compile_leaf(filters)
+
+    # The following mirrors _MergedFilter.filter
+    merge = _MergedFilter._merge  # pylint: disable=protected-access
+    data_filter = filters.data_filter
+    base = _compile(filters.base_filter)  # type: ignore[attr-defined]
+
+    if filters.and_filter:  # type: ignore[attr-defined]
+        and_filter = _compile(filters.and_filter)  # type: ignore[attr-defined]
+
+        def evaluate_and(update: Update, is_message: bool) -> FilterResult:
+            if not is_message:
+                return False
+            base_output = base(update, is_message)
+            if not base_output:
+                return False
+            comp_output = and_filter(update, is_message)
+            if not comp_output:
+                return False
+            if data_filter and (merged := merge(base_output, comp_output)):
+                return merged
+            return True
+
+        return evaluate_and
+
+    if filters.or_filter:  # type: ignore[attr-defined]
+        or_filter = _compile(filters.or_filter)  # type: ignore[attr-defined]
+
+        def evaluate_or(update: Update, is_message: bool) -> FilterResult:
+            if not is_message:
+                return False
+            base_output = base(update, is_message)
+            if base_output:
+                return base_output if data_filter else True
+            comp_output = or_filter(update, is_message)
+            if comp_output:
+                return comp_output if data_filter else True
+            return False
+
+        return evaluate_or
+
+    def evaluate_base(update: Update, is_message: bool) -> FilterResult:
+        if is_message:
+            base(update, is_message)
+        return False
+
+    return evaluate_base
+
+
+def _get_message_check(
+    filters: "BaseFilter",
+) -> Optional[Callable[["BaseFilter", Update], FilterResult]]:
+    # Import here to avoid circular imports
+    from telegram.ext.filters import BaseFilter, _InvertedFilter, _MergedFilter, _XORFilter
+
+    # Leaves check on their own whether the update is a message update
+    if type(filters) in (_InvertedFilter, _MergedFilter, _XORFilter):
+        return BaseFilter.check_update
+    return None
+
+
+class CompiledFilter:
+    """A filter that was compiled into nested functions. Compared to
+    :meth:`telegram.ext.filters.BaseFilter.check_update`, this saves the method calls for each
+    node of a combined filter as well as the repeated checks whether the update is a message
+    update. Moreover, results of cacheable filters are shared within
+    :func:`cache_filter_results`.
+
+    Args:
+        filters (:class:`telegram.ext.filters.BaseFilter`): The filter to compile.
+
+    Attributes:
+        filters (:class:`telegram.ext.filters.BaseFilter`): The compiled filter.
+    """
+
+    __slots__ = ("_evaluate", "_message_check", "filters")
+
+    def __init__(self, filters: "BaseFilter"):
+        self.filters: BaseFilter = filters
+        self._evaluate: _Evaluator = _compile(filters)
+        self._message_check: Optional[Callable[[BaseFilter, Update], FilterResult]] = (
+            _get_message_check(filters)
+        )
+
+    def _compile(self, filters: "BaseFilter") -> None:
+        self.filters = filters
+        self._evaluate = _compile(filters)
+        self._message_check = _get_message_check(filters)
+
+    def check_update(self, update: Update, filters: "BaseFilter") -> FilterResult:
+        """Checks the update against the compiled filter.
+
+        Args:
+            update (:class:`telegram.Update`): The update to check.
+            filters (:class:`telegram.ext.filters.BaseFilter`): The filter that is currently set
+                on the handler. If it differs from :attr:`filters`, it's compiled first.
+
+        Returns:
+            The same as :meth:`telegram.ext.filters.BaseFilter.check_update`.
+        """
+        if filters is not self.filters:
+            self._compile(filters)
+        if self._message_check is None:
+            return self._evaluate(update, True)
+        return self._evaluate(update, bool(self._message_check(filters, update)))
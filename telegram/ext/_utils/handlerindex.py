@@ -0,0 +1,568 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains helpers that allow to look up the handlers that can possibly handle an
+update based on the kind of the update, the command of a message or the data of a callback query.
+
+.. versionadded:: NEXT.VERSION
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+import itertools
+import re
+from collections.abc import Hashable, Sequence
+from re import Pattern
+from typing import TYPE_CHECKING, Any, Final, Optional, Union
+
+from telegram import CallbackQuery, Message, Update
+from telegram.constants import UpdateType
+from telegram.ext._utils.commandparsing import parse_command
+
+if TYPE_CHECKING:
+    from telegram.ext import BaseHandler, CallbackQueryHandler
+    from telegram.ext.filters import BaseFilter
+
+MESSAGE_UPDATE_TYPES: Final[frozenset[str]] = frozenset(
+    (
+        UpdateType.MESSAGE,
+        UpdateType.EDITED_MESSAGE,
+        UpdateType.CHANNEL_POST,
+        UpdateType.EDITED_CHANNEL_POST,
+        UpdateType.BUSINESS_MESSAGE,
+        UpdateType.EDITED_BUSINESS_MESSAGE,
+    )
+)
+"""The kinds of updates that :meth:`telegram.ext.filters.BaseFilter.check_update` accepts."""
+
+NOT_AN_UPDATE: Final = object()
+"""Kind of all objects that are not instances of :class:`telegram.Update`."""
+
+_ALL_UPDATE_TYPES: Final[tuple[str, ...]] = tuple(Update.ALL_TYPES)
+
+_QUANTIFIERS: Final = frozenset("*+?{")
+_META_CHARACTERS: Final = frozenset(".^$*+?{}[]|()")
+
+
+def get_update_kind(update: object) -> Optional[object]:
+    """Determines the kind of an update.
+
+    Args:
+        update (:obj:`object`): The update.
+
+    Returns:
+        :obj:`str` | :obj:`object` | :obj:`None`: The name of the attribute of the update that is
+        set, e.g. ``"message"``. :obj:`NOT_AN_UPDATE`, if :paramref:`update` is not a
+        :class:`telegram.Update`. :obj:`None`, if the kind can't be determined, i.e. if not
+        exactly one of the attributes is set.
+    """
+    if not isinstance(update, Update):
+        return NOT_AN_UPDATE
+
+    kind: Optional[str] = None
+    for update_type in _ALL_UPDATE_TYPES:
+        if getattr(update, update_type) is not None:
+            if kind is not None:
+                return None
+            kind = update_type
+    return kind
+
+
+def get_filter_update_types(filters: "BaseFilter") -> Optional[frozenset[str]]:
+    """Determines the kinds of updates that a filter can possibly accept.
+
+    Args:
+        filters (:class:`telegram.ext.filters.BaseFilter`): The filter.
+
+    Returns:
+        frozenset[:obj:`str`] | :obj:`None`: :obj:`MESSAGE_UPDATE_TYPES`, if the filter uses one
+        of the built-in implementations of
+        :meth:`~telegram.ext.filters.BaseFilter.check_update`, :obj:`None` otherwise.
+    """
+    # Import here to avoid circular imports
+    from telegram.ext.filters import BaseFilter, MessageFilter, UpdateFilter
+
+    check_update = type(filters).check_update
+    if check_update in (
+        BaseFilter.check_update,
+        MessageFilter.check_update,
+        UpdateFilter.check_update,
+    ):
+        return MESSAGE_UPDATE_TYPES
+    return None
+
+
+def get_handler_update_types(handler: "BaseHandler[Any, Any, Any]") -> Optional[frozenset[str]]:
+    """Determines the kinds of updates that a handler can possibly handle.
+
+    The value of :attr:`telegram.ext.BaseHandler.update_types` is only trusted if
+    :meth:`~telegram.ext.BaseHandler.check_update` is not overridden by a subclass of the class
+    that declares the update types. This ensures that custom subclasses of the built-in handlers
+    keep working.
+
+    Args:
+        handler (:class:`telegram.ext.BaseHandler`): The handler.
+
+    Returns:
+        frozenset[:obj:`str`] | :obj:`None`: The kinds of updates. :obj:`None`, if the handler
+        can potentially handle any update.
+    """
+    declaring_class = check_update_class = None
+    for cls in type(handler).__mro__:
+        if declaring_class is None and "update_types" in cls.__dict__:
+            declaring_class = cls
+        if check_update_class is None and "check_update" in cls.__dict__:
+            check_update_class = cls
+    if (
+        declaring_class is None
+        or check_update_class is None
+        or (
+            check_update_class is not declaring_class
+            and issubclass(check_update_class, declaring_class)
+        )
+    ):
+        return None
+    return handler.update_types
+
+
+def _get_child_handlers(
+    handler: "BaseHandler[Any, Any, Any]",
+) -> list["BaseHandler[Any, Any, Any]"]:
+    """Returns the entry points, fallbacks and state handlers of a
+    :class:`~telegram.ext.ConversationHandler`.
+    """
+    return [
+        *handler.entry_points,  # type: ignore[attr-defined]
+        *handler.fallbacks,  # type: ignore[attr-defined]
+        *itertools.chain.from_iterable(handler.states.values()),  # type: ignore[attr-defined]
+    ]
+
+
+def get_nested_handlers(
+    handlers: Sequence["BaseHandler[Any, Any, Any]"],
+) -> dict["BaseHandler[Any, Any, Any]", list["BaseHandler[Any, Any, Any]"]]:
+    """Finds the :class:`~telegram.ext.ConversationHandler` instances among the handlers,
+    including the ones nested in other conversation handlers.
+
+    Args:
+        handlers (Sequence[:class:`telegram.ext.BaseHandler`]): The handlers.
+
+    Returns:
+        dict[:class:`telegram.ext.BaseHandler`, list[:class:`telegram.ext.BaseHandler`]]: Maps the
+        conversation handlers to their entry points, fallbacks and state handlers.
+    """
+    # Import here to avoid circular imports
+    from telegram.ext import ConversationHandler
+
+    nested: dict[BaseHandler[Any, Any, Any], list[BaseHandler[Any, Any, Any]]] = {}
+    pending = [handler for handler in handlers if isinstance(handler, ConversationHandler)]
+    while pending:
+        handler = pending.pop()
+        if handler in nested:
+            continue
+        nested[handler] = _get_child_handlers(handler)
+        pending.extend(
+            child for child in nested[handler] if isinstance(child, ConversationHandler)
+        )
+    return nested
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    depth = 0
+    escaped = in_class = False
+    for character in pattern:
+        if escaped:
+            escaped = False
+        elif character == "\\":
+            escaped = True
+        elif in_class:
+            in_class = character != "]"
+        elif character == "[":
+            in_class = True
+        elif character == "(":
+            depth += 1
+        elif character == ")":
+            depth -= 1
+        elif character == "|" and depth == 0:
+            return True
+    return False
+
+
+def get_pattern_prefix(pattern: Union[str, Pattern[str]]) -> str:
+    """Determines the literal prefix that all strings matched by ``re.match(pattern, ...)``
+    start with.
+
+    Args:
+        pattern (:obj:`str` | :func:`re.Pattern <re.compile>`): The pattern.
+
+    Returns:
+        :obj:`str`: The prefix. Empty, if the pattern doesn't start with a literal or if the
+        prefix can't be determined reliably, e.g. because of flags like :data:`re.IGNORECASE`.
+    """
+    if isinstance(pattern, str):
+        pattern = re.compile(pattern)
+    if pattern.flags & ~(re.UNICODE | re.MULTILINE | re.DOTALL):
+        return ""
+    source = pattern.pattern
+    if _has_top_level_alternation(source):
+        return ""
+
+    # A leading ^ or \A is redundant for re.match
+    position = 1 if source.startswith("^") else 2 if source.startswith(r"\A") else 0
+    prefix: list[str] = []
+    while position < len(source):
+        character = source[position]
+        if character == "\\":
+            escaped = source[position + 1 : position + 2]
+            # Escapes of letters and digits are character classes, anchors or references
+            if not escaped or escaped.isalnum():
+                break
+            character = escaped
+            length = 2
+        elif character in _META_CHARACTERS:
+            break
+        else:
+            length = 1
+        position += length
+        if source[position : position + 1] in _QUANTIFIERS:
+            # The character may be optional or repeated
+            break
+        prefix.append(character)
+    return "".join(prefix)
+
+
+class _CallbackQueryRule:
+    """Describes which callback queries a :class:`~telegram.ext.CallbackQueryHandler` can
+    possibly handle. Mirrors :meth:`telegram.ext.CallbackQueryHandler.check_update`.
+    """
+
+    __slots__ = ("data_prefixes", "game_prefix", "handles_all", "pattern", "pattern_kind")
+
+    def __init__(self, handler: "CallbackQueryHandler[Any, Any]") -> None:
+        pattern = handler.pattern
+        self.handles_all: bool = not any([pattern, handler.game_pattern, handler.data_prefix])
+        self.pattern: object = pattern
+
+        data_prefixes = [handler.data_prefix] if handler.data_prefix else []
+        self.pattern_kind: Optional[str]
+        if not pattern:
+            self.pattern_kind = None
+        elif isinstance(pattern, type):
+            self.pattern_kind = "type"
+        elif callable(pattern):
+            self.pattern_kind = "callable"
+        else:
+            self.pattern_kind = "regex"
+            data_prefixes.append(get_pattern_prefix(pattern))  # type: ignore[arg-type]
+        self.data_prefixes: frozenset[str] = frozenset(filter(None, data_prefixes))
+        self.game_prefix: Optional[str] = (
+            get_pattern_prefix(handler.game_pattern) if handler.game_pattern else None
+        )
+
+    def handles_data(self, data_type: type, prefixes: frozenset[str]) -> bool:
+        """Whether the handler can handle callback data of the given type, which starts with the
+        given registered prefixes.
+        """
+        if self.handles_all:
+            return True
+        if issubclass(data_type, str):
+            if not self.data_prefixes <= prefixes:
+                return False
+            if self.pattern_kind == "type":
+                return issubclass(data_type, self.pattern)  # type: ignore[arg-type]
+            return self.pattern_kind is not None or bool(self.data_prefixes)
+
+        # Only strings can start with a prefix or be matched by a regex
+        if self.data_prefixes:
+            return False
+        if self.pattern_kind == "type":
+            return issubclass(data_type, self.pattern)  # type: ignore[arg-type]
+        return self.pattern_kind == "callable"
+
+    def handles_game(self, prefixes: frozenset[str]) -> bool:
+        """Whether the handler can handle a game short name that starts with the given registered
+        prefixes.
+        """
+        if self.handles_all:
+            return True
+        if self.game_prefix is None:
+            return False
+        return not self.game_prefix or self.game_prefix in prefixes
+
+
+def _get_prefixes(text: str, prefixes: frozenset[str], lengths: Sequence[int]) -> frozenset[str]:
+    """Returns the prefixes from :paramref:`prefixes` that :paramref:`text` starts with."""
+    return frozenset(
+        text[:length] for length in lengths if length <= len(text) and text[:length] in prefixes
+    )
+
+
+class _GroupIndex:
+    """The index of a single handler group."""
+
+    __slots__ = (
+        "by_kind",
+        "callback_query_routes",
+        "callback_query_rules",
+        "command_handlers",
+        "commands",
+        "data_prefix_lengths",
+        "data_prefixes",
+        "game_prefix_lengths",
+        "game_prefixes",
+        "handlers",
+        "nested_handlers",
+        "prefix_handlers",
+        "prefixes",
+        "routes",
+    )
+
+    def __init__(self, handlers: list["BaseHandler[Any, Any, Any]"]) -> None:
+        # Import here to avoid circular imports
+        from telegram.ext import CallbackQueryHandler, CommandHandler, PrefixHandler
+
+        # Copies, so that changes to the lists can be detected
+        self.handlers: list[BaseHandler[Any, Any, Any]] = list(handlers)
+        self.nested_handlers = get_nested_handlers(handlers)
+
+        update_types = [get_handler_update_types(handler) for handler in handlers]
+        self.by_kind: dict[object, Sequence[BaseHandler[Any, Any, Any]]] = {
+            kind: tuple(
+                handler
+                for handler, types in zip(handlers, update_types)
+                if types is None or kind in types
+            )
+            for kind in _ALL_UPDATE_TYPES
+        }
+        self.by_kind[NOT_AN_UPDATE] = tuple(
+            handler for handler, types in zip(handlers, update_types) if types is None
+        )
+
+        # Command-like handlers are only skipped if they use the built-in parsing logic
+        self.command_handlers: dict[BaseHandler[Any, Any, Any], frozenset[str]] = {
+            handler: handler.commands  # type: ignore[attr-defined]
+            for handler in handlers
+            if type(handler).check_update is CommandHandler.check_update
+        }
+        self.prefix_handlers: dict[BaseHandler[Any, Any, Any], frozenset[str]] = {
+            handler: handler.commands  # type: ignore[attr-defined]
+            for handler in handlers
+            if type(handler).check_update is PrefixHandler.check_update
+        }
+        self.commands: frozenset[str] = frozenset().union(*self.command_handlers.values())
+        self.prefixes: frozenset[str] = frozenset().union(*self.prefix_handlers.values())
+        self.routes: dict[
+            tuple[object, Optional[str], Optional[str]], Sequence[BaseHandler[Any, Any, Any]]
+        ] = {}
+
+        # Callback query handlers are only skipped if they use the built-in matching logic
+        self.callback_query_rules: dict[BaseHandler[Any, Any, Any], _CallbackQueryRule] = {
+            handler: _CallbackQueryRule(handler)  # type: ignore[arg-type]
+            for handler in handlers
+            if type(handler).check_update is CallbackQueryHandler.check_update
+        }
+        rules = self.callback_query_rules.values()
+        self.data_prefixes: frozenset[str] = frozenset().union(
+            *(rule.data_prefixes for rule in rules)
+        )
+        self.game_prefixes: frozenset[str] = frozenset(
+            rule.game_prefix for rule in rules if rule.game_prefix
+        )
+        self.data_prefix_lengths: tuple[int, ...] = tuple(
+            sorted({len(prefix) for prefix in self.data_prefixes})
+        )
+        self.game_prefix_lengths: tuple[int, ...] = tuple(
+            sorted({len(prefix) for prefix in self.game_prefixes})
+        )
+        self.callback_query_routes: dict[
+            tuple[Optional[type], frozenset[str]], Sequence[BaseHandler[Any, Any, Any]]
+        ] = {}
+
+    def is_outdated(self, handlers: list["BaseHandler[Any, Any, Any]"]) -> bool:
+        """Whether the handlers of the group changed since this index was built. This includes
+        the handlers of the conversation handlers in the group, since they determine
+        :attr:`telegram.ext.ConversationHandler.update_types`.
+        """
+        return self.handlers != handlers or any(
+            _get_child_handlers(handler) != children
+            for handler, children in self.nested_handlers.items()
+        )
+
+    def route_commands(
+        self, kind: object, candidates: Sequence["BaseHandler[Any, Any, Any]"], message: Message
+    ) -> Sequence["BaseHandler[Any, Any, Any]"]:
+        """Removes the command-like handlers that don't listen to the command in the message."""
+        parsed_command = parse_command(message)
+        command = prefix = None
+        if parsed_command:
+            if parsed_command.command in self.commands:
+                command = parsed_command.command
+            if parsed_command.first_word in self.prefixes:
+                prefix = parsed_command.first_word
+
+        # Only registered commands are used as keys, so the size of this cache is bounded
+        key = (kind, command, prefix)
+        if (routed := self.routes.get(key)) is None:
+            routed = self.routes[key] = tuple(
+                handler
+                for handler in candidates
+                if (
+                    command in self.command_handlers[handler]
+                    if handler in self.command_handlers
+                    else (
+                        prefix in self.prefix_handlers[handler]
+                        if handler in self.prefix_handlers
+                        else True
+                    )
+                )
+            )
+        return routed
+
+    def route_callback_query(
+        self, candidates: Sequence["BaseHandler[Any, Any, Any]"], callback_query: CallbackQuery
+    ) -> Sequence["BaseHandler[Any, Any, Any]"]:
+        """Removes the callback query handlers that can't handle the callback query."""
+        data = callback_query.data
+        game_short_name = callback_query.game_short_name
+        # The key consists of the type of the data (None for games) and the registered prefixes
+        # of the data or game short name, so the size of this cache is bounded in practice
+        key: tuple[Optional[type], frozenset[str]]
+        if data:
+            prefixes = (
+                _get_prefixes(data, self.data_prefixes, self.data_prefix_lengths)
+                if isinstance(data, str)
+                else frozenset()
+            )
+            key = (type(data), prefixes)
+        elif game_short_name:
+            key = (
+                None,
+                _get_prefixes(game_short_name, self.game_prefixes, self.game_prefix_lengths),
+            )
+        else:
+            # All callback query handlers handle queries without data and game short name
+            return candidates
+
+        if (routed := self.callback_query_routes.get(key)) is None:
+            data_type, prefixes = key
+            routed = self.callback_query_routes[key] = tuple(
+                handler
+                for handler in candidates
+                if handler not in self.callback_query_rules
+                or (
+                    self.callback_query_rules[handler].handles_game(prefixes)
+                    if data_type is None
+                    else self.callback_query_rules[handler].handles_data(data_type, prefixes)
+                )
+            )
+        return routed
+
+
+class HandlerIndex:
+    """Maps the kinds of updates to the handlers that can possibly handle them, separately for
+    each handler group. The order of the handlers within a group is preserved. For message
+    updates, :class:`~telegram.ext.CommandHandler` and :class:`~telegram.ext.PrefixHandler`
+    instances that don't listen to the command in the message are skipped as well. Likewise, for
+    callback queries, :class:`~telegram.ext.CallbackQueryHandler` instances are skipped based on
+    the literal prefixes of their patterns and the type of the callback data.
+
+    The index of a group is rebuilt lazily when it was invalidated via :meth:`invalidate` or when
+    the handlers of the group changed in any way, including the entry points, fallbacks and states
+    of the :class:`~telegram.ext.ConversationHandler` instances in the group. Handlers remember the
+    groups that they are part of, and :class:`~telegram.ext.BaseHandler` calls
+    :meth:`invalidate_handler` when one of the attributes that the index depends on is reassigned,
+    e.g. :attr:`telegram.ext.CommandHandler.commands`.
+
+    Besides the handler groups of :class:`~telegram.ext.Application`, the "groups" may be
+    identified by any hashable key. :class:`~telegram.ext.ConversationHandler` uses this to index
+    its entry points, fallbacks and the handlers of each state.
+    """
+
+    __slots__ = ("_groups",)
+
+    def __init__(self) -> None:
+        self._groups: dict[Hashable, _GroupIndex] = {}
+
+    @staticmethod
+    def invalidate_handler(handler: "BaseHandler[Any, Any, Any]") -> None:
+        """Discards the indices of all groups that the handler is part of, either directly or
+        via a :class:`~telegram.ext.ConversationHandler`.
+
+        Args:
+            handler (:class:`telegram.ext.BaseHandler`): The handler.
+        """
+        for index, group in getattr(handler, "_indexed_groups", ()):
+            index.invalidate(group)
+
+    def invalidate(self, group: Optional[Hashable] = None) -> None:
+        """Discards the index of the given group or of all groups.
+
+        Args:
+            group (:obj:`int` | :class:`~collections.abc.Hashable`, optional): The group. If not
+                passed, all groups are invalidated.
+        """
+        if group is None:
+            self._groups.clear()
+        else:
+            self._groups.pop(group, None)
+
+    def get_candidates(
+        self,
+        group: Hashable,
+        handlers: list["BaseHandler[Any, Any, Any]"],
+        kind: Optional[object],
+        update: object,
+    ) -> Sequence["BaseHandler[Any, Any, Any]"]:
+        """Returns the handlers of a group that can possibly handle the update.
+
+        Args:
+            group (:obj:`int` | :class:`~collections.abc.Hashable`): The group.
+            handlers (list[:class:`telegram.ext.BaseHandler`]): All handlers of the group.
+            kind (:obj:`object`): The return value of :func:`get_update_kind`.
+            update (:obj:`object`): The update.
+
+        Returns:
+            Sequence[:class:`telegram.ext.BaseHandler`]: The candidates in the same order as in
+            :paramref:`handlers`.
+        """
+        if kind is None:
+            return handlers
+
+        entry = self._groups.get(group)
+        if entry is None or entry.is_outdated(handlers):
+            entry = self._groups[group] = _GroupIndex(handlers)
+            for handler in itertools.chain(handlers, *entry.nested_handlers.values()):
+                # pylint: disable=protected-access
+                try:
+                    handler._indexed_groups.add((self, group))
+                except AttributeError:
+                    # Custom handlers may not call BaseHandler.__init__
+                    handler._indexed_groups = {(self, group)}
+
+        candidates = entry.by_kind.get(kind, handlers)
+        if (entry.commands or entry.prefixes) and kind in MESSAGE_UPDATE_TYPES:
+            return entry.route_commands(
+                kind, candidates, update.effective_message  # type: ignore[attr-defined]
+            )
+        if entry.callback_query_rules and kind == UpdateType.CALLBACK_QUERY:
+            return entry.route_callback_query(
+                candidates, update.callback_query  # type: ignore[attr-defined]
+            )
+        return candidates
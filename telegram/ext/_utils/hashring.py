@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains a consistent hash ring that maps keys to a fixed number of nodes.
+
+.. versionadded:: NEXT.VERSION
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+import bisect
+import hashlib
+from collections.abc import Hashable
+
+
+def _hash(value: str) -> int:
+    # The built-in `hash` is randomized per process, so we use a stable hash instead
+    return int.from_bytes(hashlib.md5(value.encode(), usedforsecurity=False).digest()[:8], "big")
+
+
+class HashRing:
+    """A consistent hash ring. Each node is placed on the ring several times such that the keys
+    are distributed evenly. When the number of nodes changes, only about ``1/nodes`` of the keys
+    are mapped to a different node.
+
+    Args:
+        nodes (:obj:`int`): The number of nodes. The nodes are identified by ``0, ..., nodes-1``.
+        virtual_nodes (:obj:`int`, optional): How often each node is placed on the ring.
+            Defaults to ``64``.
+    """
+
+    __slots__ = ("_hashes", "_nodes", "nodes")
+
+    def __init__(self, nodes: int, virtual_nodes: int = 64) -> None:
+        if nodes < 1 or virtual_nodes < 1:
+            raise ValueError("`nodes` and `virtual_nodes` must be positive integers!")
+
+        self.nodes: int = nodes
+        points = sorted(
+            (_hash(f"{node}-{replica}"), node)
+            for node in range(nodes)
+            for replica in range(virtual_nodes)
+        )
+        self._hashes: list[int] = [point[0] for point in points]
+        self._nodes: list[int] = [point[1] for point in points]
+
+    def get_node(self, key: Hashable) -> int:
+        """Returns the node that the key is mapped to. Keys are compared by their :func:`repr`.
+
+        Args:
+            key (:class:`~collections.abc.Hashable`): The key.
+
+        Returns:
+            :obj:`int`: The node.
+        """
+        index = bisect.bisect(self._hashes, _hash(repr(key)))
+        return self._nodes[index % len(self._nodes)]
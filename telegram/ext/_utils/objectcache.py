@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains a cache for values that are derived from the objects of an update, e.g.
+the parsed command of a message. The values are shared by all handlers and filters that check the
+update, without being stored on the (pickleable) objects themselves.
+
+.. versionadded:: NEXT.VERSION
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+import contextlib
+from collections.abc import Generator
+from contextvars import ContextVar
+from typing import Optional
+
+# Maps the ids of the objects to the objects themselves and their caches. Keeping a reference to
+# the object ensures that its id is not reused while the cache exists.
+_OBJECT_CACHES: ContextVar[Optional[dict[int, tuple[object, dict[str, object]]]]] = ContextVar(
+    "_OBJECT_CACHES", default=None
+)
+
+
+@contextlib.contextmanager
+def cache_object_data() -> Generator[None, None, None]:
+    """Within this context manager, :func:`get_object_cache` returns a cache for each object,
+    which is discarded when the context manager exits. Used by
+    :meth:`telegram.ext.Application.process_update`.
+    """
+    token = _OBJECT_CACHES.set({})
+    try:
+        yield
+    finally:
+        _OBJECT_CACHES.reset(token)
+
+
+def get_object_cache(obj: object) -> Optional[dict[str, object]]:
+    """Returns the cache of an object.
+
+    Args:
+        obj (:obj:`object`): The object.
+
+    Returns:
+        dict[:obj:`str`, :obj:`object`] | :obj:`None`: The cache. :obj:`None`, if called outside
+        of :func:`cache_object_data`.
+    """
+    caches = _OBJECT_CACHES.get()
+    if caches is None:
+        return None
+    entry = caches.get(id(obj))
+    if entry is None:
+        entry = caches[id(obj)] = (obj, {})
+    return entry[1]
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains helpers for running synchronous callbacks in a thread pool.
+
+.. versionadded:: NEXT.VERSION
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+import functools
+import inspect
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+_T = TypeVar("_T")
+
+
+def is_coroutine_callable(obj: object) -> bool:
+    """Checks whether calling the object returns a coroutine. In addition to plain
+    :term:`coroutine functions <coroutine function>`, this also detects :func:`functools.partial`
+    objects wrapping them and instances of classes with an ``async def __call__``.
+    """
+    while isinstance(obj, functools.partial):
+        obj = obj.func
+    if inspect.iscoroutinefunction(obj):
+        return True
+    return inspect.iscoroutinefunction(getattr(obj, "__call__", None))  # noqa: B004
+
+
+class TrackedThreadPoolExecutor(ThreadPoolExecutor):
+    """Simple subclass of :class:`concurrent.futures.ThreadPoolExecutor` that tracks how many of
+    the submitted tasks are currently running and how many are still waiting for a free thread.
+    """
+
+    __slots__ = ("_pending_tasks", "_running_tasks", "_tracking_lock")
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "") -> None:
+        super().__init__(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self._tracking_lock = threading.Lock()
+        self._pending_tasks = 0
+        self._running_tasks = 0
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def pending_tasks(self) -> int:
+        return self._pending_tasks
+
+    @property
+    def running_tasks(self) -> int:
+        return self._running_tasks
+
+    def _run_tracked(self, fn: Callable[..., _T], /, *args: Any, **kwargs: Any) -> _T:
+        with self._tracking_lock:
+            self._pending_tasks -= 1
+            self._running_tasks += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._tracking_lock:
+                self._running_tasks -= 1
+
+    def _on_done(self, future: "Future[Any]") -> None:
+        # Tasks that were cancelled before they started never reach `_run_tracked`
+        if future.cancelled():
+            with self._tracking_lock:
+                self._pending_tasks -= 1
+
+    def submit(  # type: ignore[override]
+        self, fn: Callable[..., _T], /, *args: Any, **kwargs: Any
+    ) -> "Future[_T]":
+        with self._tracking_lock:
+            self._pending_tasks += 1
+        try:
+            future = super().submit(self._run_tracked, fn, *args, **kwargs)
+        except BaseException:
+            with self._tracking_lock:
+                self._pending_tasks -= 1
+            raise
+        future.add_done_callback(self._on_done)
+        return future
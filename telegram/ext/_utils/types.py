@@ -42,15 +42,19 @@ CCT = TypeVar("CCT", bound="CallbackContext[Any, Any, Any, Any]")
 
 RT = TypeVar("RT")
 UT = TypeVar("UT")
-HandlerCallback = Callable[[UT, CCT], Coroutine[Any, Any, RT]]
+HandlerCallback = Callable[[UT, CCT], Union[Coroutine[Any, Any, RT], RT]]
 """Type of a handler callback
 
     .. versionadded:: 20.0
+    .. versionchanged:: NEXT.VERSION
+        Synchronous callbacks are accepted as well.
 """
-JobCallback = Callable[[CCT], Coroutine[Any, Any, Any]]
+JobCallback = Callable[[CCT], Union[Coroutine[Any, Any, Any], Any]]
 """Type of a job callback
 
     .. versionadded:: 20.0
+    .. versionchanged:: NEXT.VERSION
+        Synchronous callbacks are accepted as well.
 """
 
 ConversationKey = tuple[Union[int, str], ...]
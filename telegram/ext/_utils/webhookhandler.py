@@ -40,7 +40,9 @@ except ImportError:
 
 from telegram import Update
 from telegram._utils.logging import get_logger
+from telegram.ext._boundedupdatequeue import BoundedUpdateQueue
 from telegram.ext._extbot import ExtBot
+from telegram.ext._updatededuplicator import UpdateDeduplicator
 
 if TYPE_CHECKING:
     from telegram import Bot
@@ -117,11 +119,13 @@ class WebhookAppClass(tornado.web.Application):
         bot: "Bot",
         update_queue: asyncio.Queue,
         secret_token: Optional[str] = None,
+        update_deduplicator: Optional[UpdateDeduplicator] = None,
     ):
         self.shared_objects = {
             "bot": bot,
             "update_queue": update_queue,
             "secret_token": secret_token,
+            "update_deduplicator": update_deduplicator,
         }
         handlers = [(rf"{webhook_path}/?", TelegramHandler, self.shared_objects)]
         tornado.web.Application.__init__(self, handlers)  # type: ignore
@@ -134,16 +138,23 @@ class WebhookAppClass(tornado.web.Application):
 class TelegramHandler(tornado.web.RequestHandler):
     """BaseHandler that processes incoming requests from Telegram"""
 
-    __slots__ = ("bot", "secret_token", "update_queue")
+    __slots__ = ("bot", "secret_token", "update_deduplicator", "update_queue")
 
     SUPPORTED_METHODS = ("POST",)  # type: ignore[assignment]
 
-    def initialize(self, bot: "Bot", update_queue: asyncio.Queue, secret_token: str) -> None:
+    def initialize(
+        self,
+        bot: "Bot",
+        update_queue: asyncio.Queue,
+        secret_token: str,
+        update_deduplicator: Optional[UpdateDeduplicator] = None,
+    ) -> None:
         """Initialize for each request - that's the interface provided by tornado"""
         # pylint: disable=attribute-defined-outside-init
         self.bot = bot
         self.update_queue = update_queue
         self.secret_token = secret_token
+        self.update_deduplicator = update_deduplicator
         if secret_token:
             _LOGGER.debug(
                 "The webhook server has a secret token, expecting it in incoming requests now"
@@ -158,11 +169,28 @@ class TelegramHandler(tornado.web.RequestHandler):
         _LOGGER.debug("Webhook triggered")
         self._validate_post()
 
+        if isinstance(self.update_queue, BoundedUpdateQueue) and self.update_queue.overloaded:
+            # Telegram delivers the update again later
+            _LOGGER.debug("Update queue is overloaded. Rejecting incoming update.")
+            raise tornado.web.HTTPError(
+                HTTPStatus.SERVICE_UNAVAILABLE, reason="Too many pending updates"
+            )
+
         json_string = self.request.body.decode()
         data = json.loads(json_string)
         self.set_status(HTTPStatus.OK)
         _LOGGER.debug("Webhook received data: %s", json_string)
 
+        # Drop duplicates before spending time on parsing them. Telegram only needs the 200 OK
+        if (
+            self.update_deduplicator is not None
+            and isinstance(data, dict)
+            and isinstance(update_id := data.get("update_id"), int)
+            and not self.update_deduplicator.record(update_id)
+        ):
+            _LOGGER.debug("Dropping duplicate update with ID %d", update_id)
+            return
+
         try:
             update = Update.de_json(data, self.bot)
         except Exception as exc:
@@ -91,6 +91,7 @@ __all__ = (
     "Mention",
     "MessageFilter",
     "Regex",
+    "RegexSet",
     "SenderChat",
     "StatusUpdate",
     "Sticker",
@@ -121,6 +122,7 @@ from telegram import User as TGUser
 from telegram._utils.types import SCT
 from telegram.constants import DiceEmoji as DiceEmojiEnum
 from telegram.ext._utils._update_parsing import parse_chat_id, parse_username
+from telegram.ext._utils.entityindex import get_entity_index
 from telegram.ext._utils.types import FilterDataDict
 
 
@@ -617,7 +619,7 @@ class CaptionEntity(MessageFilter):
         super().__init__(name=f"filters.CaptionEntity({self.entity_type})")
 
     def filter(self, message: Message) -> bool:
-        return any(entity.type == self.entity_type for entity in message.caption_entities)
+        return self.entity_type in get_entity_index(message, caption=True).types
 
 
 class CaptionRegex(MessageFilter):
@@ -1361,7 +1363,7 @@ class Entity(MessageFilter):
         super().__init__(name=f"filters.Entity({self.entity_type})")
 
     def filter(self, message: Message) -> bool:
-        return any(entity.type == self.entity_type for entity in message.entities)
+        return self.entity_type in get_entity_index(message).types
 
 
 class _Forwarded(MessageFilter):
@@ -1646,7 +1648,7 @@ class Mention(MessageFilter):
             will be discarded.
     """
 
-    __slots__ = ("_mentions",)
+    __slots__ = ("_ids", "_mentions", "_usernames", "_users")
 
     def __init__(self, mentions: SCT[Union[int, str, TGUser]]):
         super().__init__(name=f"filters.Mention({mentions})")
@@ -1655,6 +1657,17 @@ class Mention(MessageFilter):
         else:
             self._mentions = {self._fix_mention_username(mentions)}
 
+        # Grouped by type such that most checks are set lookups
+        self._ids: frozenset[int] = frozenset(
+            mention for mention in self._mentions if isinstance(mention, int)
+        )
+        self._usernames: frozenset[str] = frozenset(
+            mention for mention in self._mentions if isinstance(mention, str)
+        )
+        self._users: tuple[TGUser, ...] = tuple(
+            mention for mention in self._mentions if isinstance(mention, TGUser)
+        )
+
     @staticmethod
     def _fix_mention_username(mention: Union[int, str, TGUser]) -> Union[int, str, TGUser]:
         if not isinstance(mention, str):
@@ -1666,32 +1679,29 @@ class Mention(MessageFilter):
         if not message.entities:
             return False
 
-        entity_texts = message.parse_entities(
-            types=[MessageEntity.MENTION, MessageEntity.TEXT_MENTION]
-        )
-
+        index = get_entity_index(message)
         if isinstance(mention, TGUser):
             return any(
                 mention.id == entity.user.id
                 or mention.username == entity.user.username
-                or mention.username == cls._fix_mention_username(entity_texts[entity])
+                or mention.username == cls._fix_mention_username(index.texts.get(entity, ""))
                 for entity in message.entities
                 if entity.user
-            ) or any(
-                mention.username == cls._fix_mention_username(entity_text)
-                for entity_text in entity_texts.values()
-            )
+            ) or (mention.username in index.mentions)
         if isinstance(mention, int):
-            return bool(
-                any(mention == entity.user.id for entity in message.entities if entity.user)
-            )
-        return any(
-            mention == cls._fix_mention_username(entity_text)
-            for entity_text in entity_texts.values()
-        )
+            return mention in index.user_ids
+        return mention in index.mentions
 
     def filter(self, message: Message) -> bool:
-        return any(self._check_mention(message, mention) for mention in self._mentions)
+        if not message.entities:
+            return False
+
+        index = get_entity_index(message)
+        if not self._ids.isdisjoint(index.user_ids):
+            return True
+        if not self._usernames.isdisjoint(index.mentions):
+            return True
+        return any(self._check_mention(message, user) for user in self._users)
 
 
 class _PaidMedia(MessageFilter):
@@ -1788,6 +1798,283 @@ class Regex(MessageFilter):
         return {}
 
 
+class RegexSet:
+    """Combines many regular expressions such that searching a text for them usually requires
+    only a single pass over the text. This is useful if many handlers are distinguished by
+    :class:`Regex` filters, e.g. for keyword-based bots, where otherwise each handler would
+    search the message text on its own.
+
+    Use :meth:`add` to create a filter for each pattern. The filters behave exactly like
+    :class:`Regex` filters for the respective patterns, but share the work between each other:
+    The patterns are combined into a single alternation, which determines in one pass whether
+    *any* of the patterns matches the text and at which position the first match starts. If
+    none of the patterns matches, which is the most common case for keyword-based bots, all
+    filters return immediately. Otherwise, each filter searches the text from that position on.
+    Patterns that consist of a literal keyword, optionally enclosed in ``\\b``, are merged into a
+    prefix tree, such that the combined pattern stays fast even for hundreds of keywords.
+
+    Examples:
+        .. code:: python
+
+            keywords = filters.RegexSet()
+            application.add_handlers(
+                [
+                    MessageHandler(keywords.add("help"), help_callback),
+                    MessageHandler(keywords.add("price"), price_callback),
+                ]
+            )
+
+        Alternatively, :meth:`search` can be used to determine the first matching pattern
+        directly, e.g. within a single handler that dispatches to one of many callbacks.
+        :meth:`search_all` returns all matching patterns.
+
+    Note:
+        Patterns that can't be combined with others are searched on their own. This is the case
+        for patterns that use flags other than :data:`re.IGNORECASE`, :data:`re.MULTILINE` and
+        :data:`re.DOTALL`, numbered backreferences or global inline flags, as well as for
+        patterns that use group names that were already used by a previous pattern.
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        patterns (Iterable[:obj:`str` | :func:`re.Pattern <re.compile>`], optional): Patterns to
+            add right away. Use :attr:`filters` to get the corresponding filters.
+    """
+
+    __slots__ = ("_combinable", "_combined", "_filters", "_last_start")
+
+    # Flags that can be applied to a part of a pattern via (?flags:...)
+    _SCOPED_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"))
+    _NOT_COMBINABLE = re.compile(r"\\[1-9]|\(\?\(\d|^\(\?[a-zA-Z]+\)")
+    _META_CHARACTERS = frozenset(".^$*+?{}[]|()")
+
+    def __init__(self, patterns: Iterable[Union[str, Pattern[str]]] = ()):
+        self._filters: list[_RegexSetMember] = []
+        # The combined pattern and the indices of the patterns that are part of it. Both are
+        # built on the first search after adding patterns.
+        self._combined: Optional[Pattern[str]] = None
+        self._combinable: Optional[frozenset[int]] = None
+        # The text that was searched last and the position of the first match of the
+        # combined pattern in it
+        self._last_start: tuple[Optional[str], int] = (None, -1)
+        for pattern in patterns:
+            self.add(pattern)
+
+    def __len__(self) -> int:
+        return len(self._filters)
+
+    @property
+    def filters(self) -> tuple["Regex", ...]:
+        """tuple[:class:`Regex`]: The filters for the added patterns, in the order in which the
+        patterns were added.
+        """
+        return tuple(self._filters)
+
+    def add(self, pattern: Union[str, Pattern[str]]) -> "Regex":
+        """Adds a pattern to this set.
+
+        Args:
+            pattern (:obj:`str` | :func:`re.Pattern <re.compile>`): The regex pattern.
+
+        Returns:
+            :class:`Regex`: A filter that accepts the same messages as
+            ``filters.Regex(pattern)`` and returns the same data.
+        """
+        regex_filter = _RegexSetMember(pattern, self, len(self._filters))
+        self._filters.append(regex_filter)
+        # Rebuild the combined pattern on the next search
+        self._combined = None
+        self._combinable = None
+        self._last_start = (None, -1)
+        return regex_filter
+
+    @classmethod
+    def _parse_literal(cls, source: str) -> Optional[tuple[str, str, str]]:
+        """Splits patterns like ``\\bkeyword\\b`` into the anchors and the unescaped keyword.
+        Returns :obj:`None` if the pattern is not of that form.
+        """
+        prefix = r"\b" if source.startswith(r"\b") else ""
+        suffix = r"\b" if source.endswith(r"\b") and not source.endswith(r"\\b") else ""
+        body = source[len(prefix) : len(source) - len(suffix)]
+        literal = []
+        escaped = False
+        for character in body:
+            if escaped:
+                if character.isalnum():  # e.g. \d or \b
+                    return None
+                literal.append(character)
+                escaped = False
+            elif character == "\\":
+                escaped = True
+            elif character in cls._META_CHARACTERS:
+                return None
+            else:
+                literal.append(character)
+        if escaped or not literal:
+            return None
+        return prefix, "".join(literal), suffix
+
+    @staticmethod
+    def _build_trie(keywords: Iterable[str]) -> str:
+        """Builds a pattern that matches any of the keywords by merging common prefixes."""
+        trie: dict[str, dict] = {}
+        for keyword in keywords:
+            node = trie
+            for character in keyword:
+                node = node.setdefault(character, {})
+            node[""] = {}
+
+        def build(node: dict[str, dict]) -> str:
+            alternatives = [
+                re.escape(character) + build(child)
+                for character, child in sorted(node.items())
+                if character
+            ]
+            if not alternatives:
+                return ""
+            pattern = (
+                alternatives[0] if len(alternatives) == 1 else f"(?:{'|'.join(alternatives)})"
+            )
+            # The keyword may also end here
+            return f"(?:{pattern})?" if "" in node else pattern
+
+        return build(trie)
+
+    def _build(self) -> None:
+        alternatives = []
+        keyword_groups: dict[tuple[str, str, str], list[str]] = {}
+        combinable = set()
+        group_names: set[str] = set()
+        for index, regex_filter in enumerate(self._filters):
+            pattern = regex_filter.pattern
+            flags = pattern.flags & ~re.UNICODE
+            names = set(pattern.groupindex)
+            if (
+                flags & ~(re.IGNORECASE | re.MULTILINE | re.DOTALL)
+                or self._NOT_COMBINABLE.search(pattern.pattern)
+                or names & group_names
+            ):
+                continue
+
+            combinable.add(index)
+            group_names |= names
+            scoped_flags = "".join(letter for flag, letter in self._SCOPED_FLAGS if flags & flag)
+            if literal := self._parse_literal(pattern.pattern):
+                prefix, keyword, suffix = literal
+                keyword_groups.setdefault((scoped_flags, prefix, suffix), []).append(keyword)
+            elif scoped_flags:
+                alternatives.append(f"(?{scoped_flags}:{pattern.pattern})")
+            else:
+                alternatives.append(f"(?:{pattern.pattern})")
+
+        for (scoped_flags, prefix, suffix), keywords in keyword_groups.items():
+            source = f"{prefix}{self._build_trie(keywords)}{suffix}"
+            alternatives.append(f"(?{scoped_flags}:{source})" if scoped_flags else source)
+
+        try:
+            self._combined = re.compile("|".join(alternatives)) if alternatives else None
+            self._combinable = frozenset(combinable)
+        except re.error:
+            self._combined = None
+            self._combinable = frozenset()
+
+    def _get_start(self, text: str, index: int) -> int:
+        """Returns the position from which on the pattern with the given index needs to be
+        searched or ``-1`` if it can't match the text.
+        """
+        if self._combinable is None:
+            self._build()
+        if index not in self._combinable:  # type: ignore[operator]
+            return 0
+
+        last_text, start = self._last_start
+        if text is not last_text:
+            match = self._combined.search(text)  # type: ignore[union-attr]
+            start = match.start() if match else -1
+            self._last_start = (text, start)
+        return start
+
+    def search(self, text: str) -> Optional[tuple["Regex", Match[str]]]:
+        """Determines the pattern that matches first in the text, i.e. the pattern with the
+        leftmost match. If multiple patterns match at the same position, the pattern that was
+        added first is chosen.
+
+        Args:
+            text (:obj:`str`): The text to search.
+
+        Returns:
+            tuple[:class:`Regex`, :func:`re.Match <re.match>`] | :obj:`None`: The filter of the
+            pattern that matches first along with the match, which is the same that
+            :meth:`re.Pattern.search` would return, or :obj:`None`, if no pattern matches.
+        """
+        first: Optional[tuple[int, int, Match[str]]] = None  # (start, index, match)
+        for index, regex_filter in enumerate(self._filters):
+            start = self._get_start(text, index)
+            if start < 0:
+                continue
+            if index in self._combinable:  # type: ignore[operator]
+                # No combinable pattern matches before `start`
+                match = regex_filter.pattern.match(text, start)
+            else:
+                match = regex_filter.pattern.search(text)
+            if match and (first is None or match.start() < first[0]):
+                first = (match.start(), index, match)
+
+        if first is None:
+            return None
+        return self._filters[first[1]], first[2]
+
+    def search_all(self, text: str) -> list[tuple["Regex", Match[str]]]:
+        """Determines all patterns that match the text.
+
+        Args:
+            text (:obj:`str`): The text to search.
+
+        Returns:
+            list[tuple[:class:`Regex`, :func:`re.Match <re.match>`]]: The filters of the matching
+            patterns along with their first match, which is the same that
+            :meth:`re.Pattern.search` would return. The filters are in the order in which the
+            patterns were added.
+        """
+        matches = []
+        for index, regex_filter in enumerate(self._filters):
+            start = self._get_start(text, index)
+            # No combinable pattern matches before `start`, so the result is the same as
+            # searching the whole text
+            if start >= 0 and (match := regex_filter.pattern.search(text, start)):
+                matches.append((regex_filter, match))
+        return matches
+
+
+class _RegexSetMember(Regex):
+    """A :class:`Regex` filter whose pattern is part of a :class:`RegexSet`."""
+
+    __slots__ = ("_index", "_regex_set")
+
+    def __init__(
+        self,
+        pattern: Union[str, Pattern[str]],
+        regex_set: Optional[RegexSet] = None,
+        index: int = 0,
+    ):
+        super().__init__(pattern)
+        self._regex_set: Optional[RegexSet] = regex_set
+        self._index: int = index
+
+    def filter(self, message: Message) -> Optional[dict[str, list[Match[str]]]]:
+        if not message.text or self._regex_set is None:
+            return super().filter(message)
+
+        start = self._regex_set._get_start(  # pylint: disable=protected-access
+            message.text, self._index
+        )
+        # No other pattern of the set matches before `start`, so the result is the same as
+        # searching the whole text
+        if start >= 0 and (match := self.pattern.search(message.text, start)):
+            return {"matches": [match]}
+        return {}
+
+
 class _Reply(MessageFilter):
     __slots__ = ()
 
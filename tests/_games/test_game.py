@@ -136,3 +136,13 @@ class TestGameWithoutRequest(GameTestBase):
 
         assert game.parse_text_entities(MessageEntity.URL) == {entity: "http://google.com"}
         assert game.parse_text_entities() == {entity: "http://google.com", entity_2: "h"}
+
+    def test_parse_entities_utf_16_text_cached(self, game):
+        entity = MessageEntity(type=MessageEntity.URL, offset=13, length=17)
+        game.text_entities = [entity]
+
+        assert game.parse_text_entities() == {entity: "http://google.com"}
+        utf_16_text = game._utf_16_text[1]
+        assert utf_16_text == game.text.encode("utf-16-le")
+        assert game.parse_text_entity(entity) == "http://google.com"
+        assert game._utf_16_text[1] is utf_16_text
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Compares the time for checking a Mention filter with many usernames, which uses the entity
+index, with the time for parsing the entities once per username.
+"""
+import time
+
+from telegram import Chat, Message, MessageEntity
+from telegram.ext import filters
+
+
+def main() -> None:
+    usernames = [f"user{i}" for i in range(50)]
+    mention_filter = filters.Mention(usernames)
+    text = ""
+    entities = []
+    for i in range(100):
+        text += f"word{i} "
+        entities.append(MessageEntity(MessageEntity.MENTION, len(text), len(f"@someone{i}")))
+        text += f"@someone{i} "
+    messages = [
+        Message(1, None, Chat(1, Chat.PRIVATE), text=text, entities=entities) for _ in range(20)
+    ]
+
+    start = time.perf_counter()
+    for message in messages:
+        for username in usernames:
+            assert username not in {
+                text.lstrip("@")
+                for text in message.parse_entities(
+                    [MessageEntity.MENTION, MessageEntity.TEXT_MENTION]
+                ).values()
+            }
+    parse_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for message in messages:
+        assert not mention_filter.filter(message)
+    index_time = time.perf_counter() - start
+
+    print(f"{len(usernames)} usernames, {len(messages)} messages with {len(entities)} mentions:")
+    print(f"Parsing: {parse_time * 1000:.1f} ms, index: {index_time * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Measures the time for rendering messages with many entities as HTML and Markdown V2.
+
+Rendering takes linear time, so 8 times as many entities should take about 8 times as long,
+while a quadratic implementation would take about 64 times as long.
+"""
+import time
+
+from telegram import Chat, Message, MessageEntity
+
+
+def build_message(count: int) -> Message:
+    # Each chunk is a bold word with a nested italic word, followed by a plain word
+    chunk = "<😎 bold italic> & "
+    entities = []
+    for i in range(count):
+        offset = i * 19
+        entities.append(MessageEntity(MessageEntity.BOLD, offset, 15))
+        entities.append(MessageEntity(MessageEntity.ITALIC, offset + 9, 6))
+    return Message(1, None, Chat(1, Chat.PRIVATE), text=chunk * count, entities=entities)
+
+
+def render(message: Message) -> float:
+    start = time.perf_counter()
+    for attr in ("text_html", "text_html_urled", "text_markdown_v2"):
+        getattr(message, attr)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    small, large = build_message(250), build_message(2000)
+    small_time, large_time = render(small), render(large)
+    print(f"500 entities: {small_time * 1000:.1f} ms")
+    print(
+        f"4000 entities: {large_time * 1000:.1f} ms ({large_time / small_time:.1f} times as long)"
+    )
+
+
+if __name__ == "__main__":
+    main()
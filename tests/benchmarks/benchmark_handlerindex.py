@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Compares the time for checking all callback query handlers with the time for checking only
+the candidates returned by the handler index.
+
+The candidates for each combination of prefixes are computed once, so the updates are processed
+repeatedly.
+"""
+import time
+from collections.abc import Callable, Sequence
+
+from telegram import CallbackQuery, Update, User
+from telegram.ext import BaseHandler, CallbackQueryHandler
+from telegram.ext._utils.handlerindex import HandlerIndex, get_update_kind
+
+
+async def callback(update: object, context: object) -> None:
+    pass
+
+
+def run(
+    updates: Sequence[Update],
+    get_handlers: Callable[[Update], Sequence[BaseHandler]],
+) -> float:
+    start = time.perf_counter()
+    for _ in range(10):
+        for update in updates:
+            for handler in get_handlers(update):
+                if handler.check_update(update):
+                    break
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    handlers: list[BaseHandler] = [
+        CallbackQueryHandler(callback, pattern=rf"menu_{i}_(\d+)") for i in range(300)
+    ]
+    index = HandlerIndex()
+    updates = [
+        Update(
+            1,
+            callback_query=CallbackQuery("1", User(1, "user", False), "chat", data=f"menu_{i}_1"),
+        )
+        for i in range(0, 300, 15)
+    ]
+
+    all_time = run(updates, lambda update: handlers)
+    index_time = run(
+        updates,
+        lambda update: index.get_candidates(0, handlers, get_update_kind(update), update),
+    )
+    print(f"{len(handlers)} handlers, {len(updates)} callback queries processed 10 times:")
+    print(f"All handlers: {all_time * 1000:.1f} ms, index: {index_time * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
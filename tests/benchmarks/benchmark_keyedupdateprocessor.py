@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Compares the throughput of KeyedUpdateProcessor with SimpleUpdateProcessor.
+
+KeyedUpdateProcessor is expected to be slower for a workload where few chats send many updates
+due to the ordering guarantees, but not slower than processing everything sequentially. If all
+updates belong to different chats, the overhead should be small.
+"""
+import asyncio
+import time
+
+from telegram import Chat, Message, Update, User
+from telegram.ext import BaseUpdateProcessor, KeyedUpdateProcessor, SimpleUpdateProcessor
+
+DELAY = 0.01
+
+
+def make_update(update_id: int, chat_id: int) -> Update:
+    return Update(
+        update_id,
+        message=Message(
+            update_id,
+            None,
+            Chat(chat_id, Chat.PRIVATE),
+            from_user=User(2, "user", False),
+            text="text",
+        ),
+    )
+
+
+async def callback() -> None:
+    await asyncio.sleep(DELAY)
+
+
+async def run(processor: BaseUpdateProcessor, updates: list[Update]) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*(processor.process_update(update, callback()) for update in updates))
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    workloads = {
+        "4 chats with 10 updates each": [make_update(i, chat_id=i % 4) for i in range(40)],
+        "40 distinct chats": [make_update(i, chat_id=i) for i in range(40)],
+    }
+    print(f"Each callback takes {DELAY * 1000:.0f} ms.")
+    for name, updates in workloads.items():
+        keyed = await run(KeyedUpdateProcessor(64), updates)
+        simple = await run(SimpleUpdateProcessor(64), updates)
+        print(f"{name}: keyed {keyed * 1000:.1f} ms, simple {simple * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Compares the time for checking many Regex filters with the time for checking the
+corresponding filters of a RegexSet.
+
+Most messages don't contain any of the keywords, in which case a single search suffices for the
+RegexSet, while each Regex filter searches the whole text on its own.
+"""
+import time
+from collections.abc import Sequence
+
+from telegram import Chat, Message, Update
+from telegram.ext import filters
+
+
+def run(filters_: Sequence[filters.BaseFilter]) -> float:
+    start = time.perf_counter()
+    for i in range(20):
+        update = Update(
+            i,
+            message=Message(
+                i,
+                None,
+                Chat(1, Chat.PRIVATE),
+                text=f"message number {i} without any of the keywords " * 10,
+            ),
+        )
+        for regex_filter in filters_:
+            regex_filter.check_update(update)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    keywords = [rf"\bkeyword{i}\b" for i in range(300)]
+    regex_time = run([filters.Regex(keyword) for keyword in keywords])
+    set_time = run(filters.RegexSet(keywords).filters)
+    print(f"{len(keywords)} keywords, 20 messages without a match:")
+    print(f"Regex: {regex_time * 1000:.1f} ms, RegexSet: {set_time * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import pytest
+
+from telegram import MessageEntity
+from telegram.ext._utils.commandparsing import ParsedCommand, parse_command
+from telegram.ext._utils.objectcache import cache_object_data
+from tests.auxil.build_messages import make_command_message, make_message
+
+
+class TestParseCommand:
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("/start", ParsedCommand(("/start",), "/start", "start", None)),
+            (
+                "/start@Bot_Name  a b",
+                ParsedCommand(
+                    ("/start@Bot_Name", "a", "b"), "/start@bot_name", "start", "bot_name"
+                ),
+            ),
+            ("text /start", ParsedCommand(("text", "/start"), "text", None, None)),
+            ("!Help me", ParsedCommand(("!Help", "me"), "!help", None, None)),
+            ("   ", ParsedCommand((), None, None, None)),
+        ],
+    )
+    def test_parse_command(self, text, expected):
+        assert parse_command(make_command_message(text)) == expected
+
+    def test_empty_bot_username(self):
+        message = make_message(
+            "/start@", entities=[MessageEntity(MessageEntity.BOT_COMMAND, 0, 7)]
+        )
+        assert parse_command(message) == ParsedCommand(("/start@",), "/start@", "start", "")
+
+    def test_no_text(self):
+        assert parse_command(make_message(None)) is None
+
+    def test_entity_not_bot_command(self):
+        message = make_message("/start", entities=[MessageEntity(MessageEntity.BOLD, 0, 6)])
+        assert parse_command(message).command is None
+
+    def test_cached(self):
+        message = make_command_message("/start arg")
+        with cache_object_data():
+            parsed = parse_command(message)
+            assert parse_command(message) is parsed
+
+        # Outside of the cache context, nothing is cached and the message stays untouched
+        assert parse_command(message) is not parsed
+        assert parse_command(message) == parsed
+        assert not any("command" in name for name in message.__getstate__())
+
+    def test_cache_invalidation(self):
+        message = make_command_message("/start arg")
+        with cache_object_data():
+            assert parse_command(message).command == "start"
+
+            with message._unfrozen():
+                message.text = "/help"
+                message.entities[0]._unfreeze()
+                message.entities[0].length = 5
+            assert parse_command(message).command == "help"
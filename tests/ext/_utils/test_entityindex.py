@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+
+
+from telegram import MessageEntity, User
+from telegram.ext._utils.entityindex import EntityIndex, get_entity_index
+from telegram.ext._utils.objectcache import cache_object_data
+from tests.auxil.build_messages import make_message
+from tests.auxil.slots import mro_slots
+
+TEXT = "Hi @alice, #news 😀 $USD @bob"
+ENTITIES = [
+    MessageEntity(MessageEntity.MENTION, 3, 6),
+    MessageEntity(MessageEntity.HASHTAG, 11, 5),
+    MessageEntity(MessageEntity.CASHTAG, 20, 4),
+    MessageEntity(MessageEntity.MENTION, 25, 4),
+    MessageEntity(MessageEntity.TEXT_MENTION, 0, 2, user=User(1, "user", False)),
+]
+
+
+class TestEntityIndex:
+    def test_slot_behaviour(self):
+        inst = EntityIndex(TEXT, ENTITIES)
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_index(self):
+        message = make_message(TEXT, entities=ENTITIES)
+        index = EntityIndex(message.text, message.entities)
+        assert index.types == {"mention", "hashtag", "cashtag", "text_mention"}
+        assert index.user_ids == {1}
+        assert index.texts == message.parse_entities()
+        assert index.get_texts(MessageEntity.MENTION) == {"@alice", "@bob"}
+        assert index.get_texts(MessageEntity.HASHTAG, MessageEntity.CASHTAG) == {"#news", "$USD"}
+        assert index.get_texts(MessageEntity.URL) == frozenset()
+        assert index.mentions == {"alice", "bob", "Hi"}
+
+    def test_no_text(self):
+        index = EntityIndex(None, ENTITIES)
+        assert index.types == {"mention", "hashtag", "cashtag", "text_mention"}
+        assert index.texts == {}
+        assert index.mentions == frozenset()
+
+
+class TestGetEntityIndex:
+    def test_cached(self):
+        message = make_message(TEXT, entities=ENTITIES, caption="#tag")
+        with cache_object_data():
+            index = get_entity_index(message)
+            assert get_entity_index(message) is index
+            caption_index = get_entity_index(message, caption=True)
+            assert caption_index is not index
+            assert get_entity_index(message, caption=True) is caption_index
+            assert caption_index.types == frozenset()
+
+        # Outside of the cache context, nothing is cached and the message stays untouched
+        assert get_entity_index(message) is not index
+        assert not any("index" in name for name in message.__getstate__())
+
+    def test_cache_invalidation(self):
+        message = make_message(TEXT, entities=ENTITIES)
+        with cache_object_data():
+            assert "alice" in get_entity_index(message).mentions
+
+            with message._unfrozen():
+                message.text = "@carol"
+                message.entities = (MessageEntity(MessageEntity.MENTION, 0, 6),)
+            assert get_entity_index(message).mentions == {"carol"}
+
+    def test_shares_utf_16_text(self):
+        message = make_message(TEXT, entities=ENTITIES)
+        assert get_entity_index(message).texts == message.parse_entities()
+        utf_16_text = message._utf_16_text[1]
+        message.parse_entities()
+        assert message._utf_16_text[1] is utf_16_text
@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import copy
+import re
+
+import pytest
+
+from telegram import CallbackQuery, Chat, Update, User
+from telegram.ext import ApplicationBuilder, MessageHandler, filters
+from telegram.ext._utils.filtercompiler import CompiledFilter, cache_filter_results, is_cacheable
+from tests.auxil.build_messages import make_command_message, make_message
+from tests.auxil.slots import mro_slots
+
+
+class CountingFilter(filters.MessageFilter):
+    __slots__ = ("calls", "result")
+
+    def __init__(self, result, data_filter=False):
+        super().__init__(data_filter=data_filter)
+        self.calls = 0
+        self.result = result
+
+    def filter(self, message):
+        self.calls += 1
+        return copy.deepcopy(self.result)
+
+
+def data_filter(key):
+    return CountingFilter({key: [key]}, data_filter=True)
+
+
+def normalize(result):
+    # Match objects can't be compared
+    if isinstance(result, dict):
+        return {
+            key: [value.span() if isinstance(value, re.Match) else value for value in values]
+            for key, values in result.items()
+        }
+    return result
+
+
+UPDATES = [
+    Update(1, message=make_message("text")),
+    Update(2, message=make_command_message("/start", chat=Chat(1, Chat.GROUP))),
+    Update(3, edited_message=make_message("edited", chat=Chat(1, Chat.SUPERGROUP))),
+    Update(4, callback_query=CallbackQuery("1", User(1, "user", False), "chat")),
+]
+
+FILTERS = [
+    filters.TEXT,
+    ~filters.TEXT,
+    filters.TEXT & ~filters.COMMAND & filters.ChatType.GROUPS,
+    filters.COMMAND | filters.UpdateType.EDITED_MESSAGE,
+    filters.TEXT ^ filters.COMMAND,
+    ~(filters.PHOTO | filters.ChatType.PRIVATE),
+    filters.Regex("t") & filters.Regex("e"),
+    filters.Regex("x") | filters.Regex("t"),
+    data_filter("a") & (data_filter("b") | filters.TEXT),
+    data_filter("a") ^ filters.COMMAND,
+    filters.User(1, allow_empty=True) & filters.TEXT,
+]
+
+
+class TestFilterCompiler:
+    def test_slot_behaviour(self):
+        inst = CompiledFilter(filters.TEXT)
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    @pytest.mark.parametrize("filter_", FILTERS, ids=repr)
+    @pytest.mark.parametrize("update", UPDATES, ids=lambda update: str(update.update_id))
+    @pytest.mark.parametrize("cached", [False, True])
+    def test_same_result_as_check_update(self, filter_, update, cached):
+        expected = normalize(filter_.check_update(update))
+        compiled = CompiledFilter(filter_)
+        if cached:
+            with cache_filter_results(update):
+                assert normalize(compiled.check_update(update, filter_)) == expected
+                assert normalize(compiled.check_update(update, filter_)) == expected
+        else:
+            assert normalize(compiled.check_update(update, filter_)) == expected
+
+    def test_is_cacheable(self):
+        assert is_cacheable(filters.TEXT)
+        assert is_cacheable(filters.ChatType.GROUPS)
+        assert not is_cacheable(filters.Regex("a"))
+        assert not is_cacheable(filters.Chat(1))
+        assert not is_cacheable(CountingFilter(True))
+
+    def test_cache(self, monkeypatch):
+        calls = []
+        text_filter_type = type(filters.TEXT)
+        original = text_filter_type.filter
+
+        def counting_filter(self, message):
+            calls.append(message)
+            return original(self, message)
+
+        monkeypatch.setattr(text_filter_type, "filter", counting_filter)
+        update = UPDATES[0]
+        first = CompiledFilter(filters.TEXT & ~filters.COMMAND)
+        second = CompiledFilter(filters.TEXT | filters.PHOTO)
+
+        with cache_filter_results(update):
+            assert first.check_update(update, first.filters)
+            assert second.check_update(update, second.filters)
+            assert len(calls) == 1
+            # The cache is bound to the update
+            assert first.check_update(UPDATES[2], first.filters)
+            assert len(calls) == 2
+
+        # Outside the context manager, nothing is cached
+        first.check_update(update, first.filters)
+        first.check_update(update, first.filters)
+        assert len(calls) == 4
+
+    def test_custom_filters_not_cached(self):
+        custom = CountingFilter(True)
+        compiled = CompiledFilter(custom & filters.TEXT)
+        update = UPDATES[0]
+        with cache_filter_results(update):
+            compiled.check_update(update, compiled.filters)
+            compiled.check_update(update, compiled.filters)
+        assert custom.calls == 2
+
+    def test_data_filter_results_not_shared(self):
+        update = UPDATES[0]
+        filter_ = data_filter("a") & data_filter("b")
+        compiled = CompiledFilter(filter_)
+        with cache_filter_results(update):
+            assert compiled.check_update(update, filter_) == {"a": ["a"], "b": ["b"]}
+            assert compiled.check_update(update, filter_) == {"a": ["a"], "b": ["b"]}
+
+    def test_recompile(self):
+        compiled = CompiledFilter(filters.TEXT)
+        update = Update(1, message=make_message(None, photo=[]))
+        assert not compiled.check_update(update, filters.TEXT)
+        assert compiled.check_update(update, ~filters.TEXT)
+        assert repr(compiled.filters) == "<inverted filters.TEXT>"
+
+    async def test_application_shares_results(self, one_time_bot, monkeypatch):
+        calls = []
+        text_filter_type = type(filters.TEXT)
+        original = text_filter_type.filter
+
+        def counting_filter(self, message):
+            calls.append(message)
+            return original(self, message)
+
+        monkeypatch.setattr(text_filter_type, "filter", counting_filter)
+        handled = []
+
+        async def callback(update, context):
+            handled.append(update)
+
+        app = ApplicationBuilder().bot(one_time_bot).build()
+        app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, callback))
+        app.add_handler(MessageHandler(filters.TEXT, callback), group=1)
+        app.add_handler(MessageHandler(filters.COMMAND | filters.TEXT, callback), group=2)
+
+        async with app:
+            await app.process_update(UPDATES[0])
+            await app.process_update(UPDATES[0])
+
+        assert len(handled) == 6
+        # once per call of process_update
+        assert len(calls) == 2
@@ -0,0 +1,401 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import re
+
+import pytest
+
+from telegram import CallbackQuery, Poll, Update, User
+from telegram.ext import (
+    CallbackQueryHandler,
+    ChatMemberHandler,
+    CommandHandler,
+    ConversationHandler,
+    MessageHandler,
+    PollHandler,
+    PrefixHandler,
+    StringCommandHandler,
+    TypeHandler,
+    filters,
+)
+from telegram.ext._utils.handlerindex import (
+    MESSAGE_UPDATE_TYPES,
+    NOT_AN_UPDATE,
+    HandlerIndex,
+    get_filter_update_types,
+    get_handler_update_types,
+    get_pattern_prefix,
+    get_update_kind,
+)
+from tests.auxil.build_messages import make_command_update, make_message
+from tests.auxil.slots import mro_slots
+
+
+async def callback(update, context):
+    pass
+
+
+class CustomFilter(filters.MessageFilter):
+    def check_update(self, update):
+        return True
+
+    def filter(self, message):
+        return True
+
+
+@pytest.fixture(scope="module")
+def message_update():
+    return Update(1, message=make_message("text"))
+
+
+@pytest.fixture(scope="module")
+def callback_query_update():
+    return Update(1, callback_query=CallbackQuery("1", User(1, "user", False), "chat"))
+
+
+@pytest.fixture(scope="module")
+def poll_update():
+    return Update(1, poll=Poll("1", "question", [], 0, False, False, Poll.REGULAR, False))
+
+
+class TestGetUpdateKind:
+    def test_update(self, message_update, callback_query_update, poll_update):
+        assert get_update_kind(message_update) == Update.MESSAGE
+        assert get_update_kind(callback_query_update) == Update.CALLBACK_QUERY
+        assert get_update_kind(poll_update) == Update.POLL
+
+    @pytest.mark.parametrize("update", ["/start", {"key": "value"}, None])
+    def test_not_an_update(self, update):
+        assert get_update_kind(update) is NOT_AN_UPDATE
+
+    def test_undetermined(self):
+        assert get_update_kind(Update(1)) is None
+        assert get_update_kind(Update(1, message=make_message("a"), edited_message=True)) is None
+
+
+class TestGetPatternPrefix:
+    @pytest.mark.parametrize(
+        ("pattern", "prefix"),
+        [
+            ("menu_", "menu_"),
+            (r"menu_(\d+)", "menu_"),
+            ("^page:[0-9]+$", "page:"),
+            (r"\Aitem\.", "item."),
+            ("abc?", "ab"),
+            ("ab+", "a"),
+            ("ab{2}", "a"),
+            (r"a\db", "a"),
+            ("(menu)", ""),
+            ("a|b", ""),
+            ("menu_(a|b)", "menu_"),
+            ("menu_[|]|x", ""),
+            (re.compile("menu", re.IGNORECASE), ""),
+            ("", ""),
+        ],
+    )
+    def test_get_pattern_prefix(self, pattern, prefix):
+        assert get_pattern_prefix(pattern) == prefix
+        assert get_pattern_prefix(re.compile(pattern)) == prefix
+
+
+class TestGetUpdateTypes:
+    @pytest.mark.parametrize(
+        "filter_",
+        [filters.ALL, filters.TEXT, ~filters.COMMAND, filters.TEXT & filters.Regex("a")],
+    )
+    def test_builtin_filters(self, filter_):
+        assert get_filter_update_types(filter_) == MESSAGE_UPDATE_TYPES
+
+    def test_custom_filter(self):
+        assert get_filter_update_types(CustomFilter()) is None
+
+    def test_handlers(self):
+        assert get_handler_update_types(CallbackQueryHandler(callback)) == {"callback_query"}
+        assert get_handler_update_types(PollHandler(callback)) == {"poll"}
+        assert get_handler_update_types(MessageHandler(None, callback)) == MESSAGE_UPDATE_TYPES
+        assert get_handler_update_types(CommandHandler("a", callback)) == MESSAGE_UPDATE_TYPES
+        assert get_handler_update_types(PrefixHandler("!", "a", callback)) == (
+            MESSAGE_UPDATE_TYPES
+        )
+        assert get_handler_update_types(MessageHandler(CustomFilter(), callback)) is None
+        assert get_handler_update_types(TypeHandler(Update, callback)) is None
+        assert get_handler_update_types(StringCommandHandler("a", callback)) is None
+
+    def test_overridden_check_update(self):
+        class CustomHandler(CallbackQueryHandler):
+            def check_update(self, update):
+                return True
+
+        class CustomHandlerWithTypes(CustomHandler):
+            @property
+            def update_types(self):
+                return frozenset(("poll",))
+
+        assert get_handler_update_types(CustomHandler(callback)) is None
+        assert get_handler_update_types(CustomHandlerWithTypes(callback)) == {"poll"}
+
+    def test_conversation_handler(self):
+        conv_handler = ConversationHandler(
+            entry_points=[CommandHandler("start", callback)],
+            states={1: [ChatMemberHandler(callback)]},
+            fallbacks=[CommandHandler("cancel", callback)],
+        )
+        assert conv_handler.update_types == (
+            MESSAGE_UPDATE_TYPES - {"channel_post", "edited_channel_post"}
+        ) | {"chat_member", "my_chat_member"}
+
+        conv_handler = ConversationHandler(
+            entry_points=[CommandHandler("start", callback)],
+            states={1: [TypeHandler(Update, callback)]},
+            fallbacks=[],
+        )
+        assert conv_handler.update_types is None
+
+
+class TestHandlerIndex:
+    def test_slot_behaviour(self):
+        inst = HandlerIndex()
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_get_candidates(self, message_update, callback_query_update, poll_update):
+        handlers = [
+            MessageHandler(filters.TEXT, callback),
+            CallbackQueryHandler(callback),
+            TypeHandler(Update, callback),
+            CommandHandler("start", callback),
+            MessageHandler(CustomFilter(), callback),
+        ]
+        index = HandlerIndex()
+
+        def candidates(update):
+            return list(index.get_candidates(0, handlers, get_update_kind(update), update))
+
+        # The CommandHandler is skipped since the message does not contain a command
+        assert candidates(message_update) == [handlers[0], handlers[2], handlers[4]]
+        assert candidates(callback_query_update) == [handlers[1], handlers[2], handlers[4]]
+        assert candidates(poll_update) == [handlers[2], handlers[4]]
+        assert candidates("/start") == [handlers[2], handlers[4]]
+        assert candidates(Update(1)) == handlers
+
+    def test_rebuild(self, poll_update):
+        index = HandlerIndex()
+        handlers = [CallbackQueryHandler(callback)]
+        kind = get_update_kind(poll_update)
+        assert index.get_candidates(0, handlers, kind, poll_update) == ()
+
+        # Changing the length of the list is detected automatically
+        handlers.append(PollHandler(callback))
+        assert index.get_candidates(0, handlers, kind, poll_update) == (handlers[1],)
+
+        # Replacing a handler is detected as well
+        handlers[1] = TypeHandler(Update, callback)
+        assert index.get_candidates(0, handlers, kind, poll_update) == (handlers[1],)
+
+        handlers[1] = PollHandler(callback)
+        index.invalidate()
+        assert index.get_candidates(0, handlers, kind, poll_update) == (handlers[1],)
+
+        # A new list object is detected automatically
+        new_handlers = [TypeHandler(Update, callback)]
+        assert index.get_candidates(0, new_handlers, kind, poll_update) == (new_handlers[0],)
+
+    def test_rebuild_on_conversation_handler_change(self, callback_query_update, poll_update):
+        nested = ConversationHandler(
+            entry_points=[CommandHandler("start", callback)], states={}, fallbacks=[]
+        )
+        conv_handler = ConversationHandler(
+            entry_points=[CommandHandler("start", callback)],
+            states={1: [nested]},
+            fallbacks=[],
+        )
+        handlers = [conv_handler]
+        index = HandlerIndex()
+
+        def candidates(update):
+            return list(index.get_candidates(0, handlers, get_update_kind(update), update))
+
+        assert candidates(callback_query_update) == []
+        # Adding a handler to a state changes the update types of the conversation handler
+        conv_handler.states[1].append(CallbackQueryHandler(callback))
+        assert candidates(callback_query_update) == [conv_handler]
+        assert candidates(poll_update) == []
+        # This works for nested conversation handlers as well
+        nested.states[2] = [PollHandler(callback)]
+        assert candidates(poll_update) == [conv_handler]
+        nested.states[2][0] = CommandHandler("start", callback)
+        assert candidates(poll_update) == []
+
+    def test_rebuild_on_handler_change(self):
+        command_handler = CommandHandler("start", callback)
+        query_handler = CallbackQueryHandler(callback, pattern="menu_")
+        handlers = [command_handler, query_handler]
+        index = HandlerIndex()
+        command_update = make_command_update("/help")
+        query_update = Update(
+            1, callback_query=CallbackQuery("1", User(1, "user", False), "chat", data="page:1")
+        )
+
+        def candidates(update):
+            return list(index.get_candidates(0, handlers, get_update_kind(update), update))
+
+        assert candidates(command_update) == []
+        assert candidates(query_update) == []
+
+        # Reassigning the attributes that the routing depends on invalidates the index
+        command_handler.commands = frozenset(("help",))
+        assert candidates(command_update) == [command_handler]
+        query_handler.pattern = re.compile("page:")
+        assert candidates(query_update) == [query_handler]
+
+        # Other attributes don't invalidate the index
+        entry = index._groups[0]
+        command_handler.block = False
+        assert index._groups[0] is entry
+
+    def test_rebuild_only_groups_of_handler(self, message_update):
+        command_handler = CommandHandler("start", callback)
+        nested_handler = CommandHandler("start", callback)
+        conv_handler = ConversationHandler(entry_points=[nested_handler], states={}, fallbacks=[])
+        groups = {0: [command_handler], 1: [conv_handler], 2: [MessageHandler(None, callback)]}
+        index = HandlerIndex()
+        other_index = HandlerIndex()
+        for group, handlers in groups.items():
+            index.get_candidates(group, handlers, Update.MESSAGE, message_update)
+        entries = dict(index._groups)
+
+        # Creating a handler doesn't invalidate any group
+        CommandHandler("start", callback)
+        assert index._groups == entries
+
+        command_handler.commands = frozenset(("help",))
+        assert index._groups.keys() == {1, 2}
+        # Handlers in conversation handlers are tracked as well
+        nested_handler.commands = frozenset(("help",))
+        assert index._groups.keys() == {2}
+        assert index._groups[2] is entries[2]
+
+        # Handlers may be part of several indices
+        other_index.get_candidates(0, groups[0], Update.MESSAGE, message_update)
+        index.get_candidates(0, groups[0], Update.MESSAGE, message_update)
+        command_handler.filters = filters.TEXT
+        assert not index._groups.keys() & {0}
+        assert not other_index._groups
+
+    def test_command_routing(self):
+        class CustomCommandHandler(CommandHandler):
+            def check_update(self, update):
+                return super().check_update(update)
+
+        handlers = [
+            CommandHandler("start", callback),
+            PrefixHandler(["!", "#"], ["start", "help"], callback),
+            MessageHandler(filters.TEXT, callback),
+            CommandHandler(["help", "settings"], callback),
+            CustomCommandHandler("other", callback),
+        ]
+        index = HandlerIndex()
+
+        def candidates(text):
+            update = (
+                make_command_update(text)
+                if text.startswith("/")
+                else Update(1, message=make_message(text))
+            )
+            return list(index.get_candidates(0, handlers, get_update_kind(update), update))
+
+        assert candidates("/start") == [handlers[0], handlers[2], handlers[4]]
+        assert candidates("/start@bot arg") == [handlers[0], handlers[2], handlers[4]]
+        assert candidates("/help") == [handlers[2], handlers[3], handlers[4]]
+        assert candidates("/unknown") == [handlers[2], handlers[4]]
+        assert candidates("!help me") == [handlers[1], handlers[2], handlers[4]]
+        assert candidates("#HELP") == [handlers[1], handlers[2], handlers[4]]
+        assert candidates("text") == [handlers[2], handlers[4]]
+
+        # Callback queries are not routed by command
+        callback_query_update = Update(
+            1,
+            callback_query=CallbackQuery(
+                "1", User(1, "user", False), "chat", message=make_message("/start")
+            ),
+        )
+        assert list(
+            index.get_candidates(
+                0, handlers, get_update_kind(callback_query_update), callback_query_update
+            )
+        ) == [handlers[4]]
+
+    def test_callback_query_routing(self):
+        class CustomCallbackQueryHandler(CallbackQueryHandler):
+            def check_update(self, update):
+                return super().check_update(update)
+
+        class CallbackData:
+            pass
+
+        class StrSubclass(str):
+            __slots__ = ()
+
+        handlers = [
+            CallbackQueryHandler(callback, pattern=r"menu_(\d+)"),
+            CallbackQueryHandler(callback, pattern="menu_settings"),
+            CallbackQueryHandler(callback, pattern="page:"),
+            CallbackQueryHandler(callback, pattern=re.compile("PAGE", re.IGNORECASE)),
+            CallbackQueryHandler(callback, pattern=CallbackData),
+            CallbackQueryHandler(callback, pattern=str),
+            CallbackQueryHandler(callback, pattern=lambda data: True, data_prefix="page:"),
+            CallbackQueryHandler(callback, data_prefix="menu_"),
+            CallbackQueryHandler(callback, game_pattern="game_"),
+            CallbackQueryHandler(callback, pattern="menu_", game_pattern="tetris"),
+            CallbackQueryHandler(callback),
+            CustomCallbackQueryHandler(callback, pattern="other"),
+            MessageHandler(filters.TEXT, callback),
+        ]
+        index = HandlerIndex()
+
+        def candidates(data=None, game_short_name=None):
+            update = Update(
+                1,
+                callback_query=CallbackQuery(
+                    "1",
+                    User(1, "user", False),
+                    "chat",
+                    data=data,
+                    game_short_name=game_short_name,
+                ),
+            )
+            result = list(index.get_candidates(0, handlers, get_update_kind(update), update))
+            # The routing must not skip any handler that would handle the update
+            assert [handler for handler in handlers if handler.check_update(update)] == [
+                handler for handler in result if handler.check_update(update)
+            ]
+            return [handlers.index(handler) for handler in result]
+
+        # The pattern with re.IGNORECASE has no reliable prefix
+        assert candidates("menu_1") == [0, 3, 5, 7, 9, 10, 11]
+        assert candidates("menu_settings") == [0, 1, 3, 5, 7, 9, 10, 11]
+        assert candidates("page:2") == [2, 3, 5, 6, 10, 11]
+        assert candidates("other") == [3, 5, 10, 11]
+        assert candidates(StrSubclass("menu_1")) == [0, 3, 5, 7, 9, 10, 11]
+        assert candidates(CallbackData()) == [4, 10, 11]
+        assert candidates(123) == [10, 11]
+        assert candidates(game_short_name="game_1") == [8, 10, 11]
+        assert candidates(game_short_name="tetris") == [9, 10, 11]
+        assert candidates(game_short_name="chess") == [10, 11]
+        assert candidates() == list(range(12))
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+from collections import Counter
+
+import pytest
+
+from telegram.ext._utils.hashring import HashRing
+
+
+class TestHashRing:
+    @pytest.mark.parametrize(("nodes", "virtual_nodes"), [(0, 1), (-1, 1), (1, 0)])
+    def test_init_errors(self, nodes, virtual_nodes):
+        with pytest.raises(ValueError, match="must be positive integers"):
+            HashRing(nodes, virtual_nodes)
+
+    def test_single_node(self):
+        ring = HashRing(1)
+        assert {ring.get_node(key) for key in range(100)} == {0}
+
+    def test_deterministic(self):
+        # The mapping must not depend on the process, i.e. not on `hash`
+        assert [HashRing(4).get_node(key) for key in range(50)] == [
+            HashRing(4).get_node(key) for key in range(50)
+        ]
+        assert HashRing(4).get_node(123) == HashRing(4).get_node(123)
+
+    def test_distribution(self):
+        counts = Counter(HashRing(4).get_node(key) for key in range(10_000))
+        assert set(counts) == {0, 1, 2, 3}
+        # Each node gets roughly a quarter of the keys
+        assert all(1_500 < count < 3_500 for count in counts.values())
+
+    def test_consistency(self):
+        keys = range(10_000)
+        before = [HashRing(4).get_node(key) for key in keys]
+        after = [HashRing(5).get_node(key) for key in keys]
+        moved = [(old, new) for old, new in zip(before, after) if old != new]
+        # Only keys that move to the new node change their node
+        assert all(new == 4 for _, new in moved)
+        assert len(moved) < 0.35 * len(keys)
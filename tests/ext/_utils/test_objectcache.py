@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+
+from telegram.ext._utils.objectcache import cache_object_data, get_object_cache
+
+
+class TestObjectCache:
+    def test_outside_context(self):
+        assert get_object_cache(object()) is None
+
+    def test_cache(self):
+        first, second = object(), object()
+        with cache_object_data():
+            cache = get_object_cache(first)
+            assert cache == {}
+            cache["key"] = "value"
+            assert get_object_cache(first) is cache
+            assert get_object_cache(second) == {}
+        assert get_object_cache(first) is None
+
+        with cache_object_data():
+            assert get_object_cache(first) == {}
+
+    async def test_concurrent_updates(self):
+        obj = object()
+        event = asyncio.Event()
+
+        async def process(value):
+            with cache_object_data():
+                get_object_cache(obj)["key"] = value
+                await event.wait()
+                return get_object_cache(obj)["key"]
+
+        tasks = [asyncio.create_task(process(value)) for value in range(3)]
+        await asyncio.sleep(0)
+        event.set()
+        assert await asyncio.gather(*tasks) == [0, 1, 2]
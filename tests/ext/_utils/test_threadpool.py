@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import functools
+import threading
+
+import pytest
+
+from telegram.ext._utils.threadpool import TrackedThreadPoolExecutor, is_coroutine_callable
+
+
+async def coroutine_function(arg):
+    pass
+
+
+def sync_function(arg):
+    pass
+
+
+class AsyncCallable:
+    async def __call__(self, arg):
+        pass
+
+
+class SyncCallable:
+    def __call__(self, arg):
+        pass
+
+
+class TestIsCoroutineCallable:
+    @pytest.mark.parametrize(
+        ("obj", "expected"),
+        [
+            (coroutine_function, True),
+            (functools.partial(coroutine_function, 1), True),
+            (functools.partial(functools.partial(coroutine_function), 1), True),
+            (AsyncCallable(), True),
+            (sync_function, False),
+            (functools.partial(sync_function, 1), False),
+            (SyncCallable(), False),
+            (lambda arg: coroutine_function(arg), False),
+        ],
+    )
+    def test_is_coroutine_callable(self, obj, expected):
+        assert is_coroutine_callable(obj) is expected
+
+
+class TestTrackedThreadPoolExecutor:
+    def test_tracking(self):
+        executor = TrackedThreadPoolExecutor(max_workers=2)
+        assert executor.max_workers == 2
+        event = threading.Event()
+        started = threading.Barrier(3)
+
+        def blocking():
+            started.wait(timeout=5)
+            event.wait(timeout=5)
+
+        futures = [executor.submit(blocking) for _ in range(2)]
+        futures.append(executor.submit(event.wait, 5))
+        started.wait(timeout=5)
+        assert executor.running_tasks == 2
+        assert executor.pending_tasks == 1
+
+        event.set()
+        for future in futures:
+            future.result(timeout=5)
+        executor.shutdown(wait=True)
+        assert executor.running_tasks == 0
+        assert executor.pending_tasks == 0
+
+    def test_exception(self):
+        executor = TrackedThreadPoolExecutor(max_workers=1)
+
+        def fail():
+            raise RuntimeError("fail")
+
+        with pytest.raises(RuntimeError, match="fail"):
+            executor.submit(fail).result(timeout=5)
+        executor.shutdown(wait=True)
+        assert executor.running_tasks == 0
+        assert executor.pending_tasks == 0
+
+    def test_cancel_pending(self):
+        executor = TrackedThreadPoolExecutor(max_workers=1)
+        event = threading.Event()
+        running = executor.submit(event.wait, 5)
+        pending = executor.submit(print)
+        assert executor.pending_tasks >= 1
+        assert pending.cancel()
+        event.set()
+        running.result(timeout=5)
+        executor.shutdown(wait=True)
+        assert executor.running_tasks == 0
+        assert executor.pending_tasks == 0
+
+    def test_submit_after_shutdown(self):
+        executor = TrackedThreadPoolExecutor(max_workers=1)
+        executor.shutdown()
+        with pytest.raises(RuntimeError, match="shutdown"):
+            executor.submit(print)
+        assert executor.pending_tasks == 0
@@ -19,9 +19,11 @@
 """The integration of persistence into the application is tested in test_basepersistence.
 """
 import asyncio
+import contextvars
 import functools
 import inspect
 import logging
+import math
 import os
 import platform
 import signal
@@ -29,6 +31,7 @@ import sys
 import threading
 import time
 from collections import defaultdict
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from queue import Queue
 from random import randrange
@@ -48,8 +51,10 @@ from telegram.ext import (
     CommandHandler,
     ContextTypes,
     Defaults,
+    DictPersistence,
     JobQueue,
     MessageHandler,
+    PersistenceInput,
     PicklePersistence,
     SimpleUpdateProcessor,
     TypeHandler,
@@ -193,6 +198,9 @@ class TestApplication:
         assert app.post_init is post_init
         assert app.post_shutdown is post_shutdown
         assert app.post_stop is post_stop
+        assert app.thread_pool_size is None
+        assert app.process_pool_size is None
+        assert app.max_pending_cpu_tasks is None
 
         # These should be done by the builder
         assert app.persistence.bot is None
@@ -963,6 +971,47 @@ class TestApplication:
             else:
                 assert self.received is None
 
+    async def test_skip_handlers_by_update_type(self, app):
+        checked = []
+
+        class MyHandler(BaseHandler):
+            def __init__(self, name, update_types, check):
+                super().__init__(self.callback)
+                self.name = name
+                self._update_types = update_types
+                self.check = check
+
+            @property
+            def update_types(self):
+                return self._update_types
+
+            def check_update(self, update: object):
+                checked.append(self.name)
+                return self.check
+
+            @staticmethod
+            async def callback(update, context):
+                checked.append("callback")
+
+        app.add_handler(MyHandler("poll", frozenset({"poll"}), True))
+        app.add_handler(MyHandler("any", None, False))
+        app.add_handler(MyHandler("message", frozenset({"message"}), True))
+        app.add_handler(MyHandler("poll", frozenset({"poll"}), True), group=1)
+
+        async with app:
+            await app.process_update(self.message_update)
+            assert checked == ["any", "message", "callback"]
+
+            checked.clear()
+            await app.process_update(1)
+            assert checked == ["any"]
+
+            # Adding a handler invalidates the index
+            checked.clear()
+            app.add_handler(MyHandler("message", frozenset({"message"}), False), group=1)
+            await app.process_update(self.message_update)
+            assert checked == ["any", "message", "callback", "message"]
+
     async def test_non_blocking_handler(self, app):
         event = asyncio.Event()
 
@@ -1346,6 +1395,173 @@ class TestApplication:
         assert recwarn[1].category is PTBDeprecationWarning
         assert "Generator-based coroutines are deprecated" in str(recwarn[1].message)
 
+    def test_task_limit_errors(self, one_time_bot):
+        with pytest.raises(ValueError, match="`max_concurrent_tasks` must be a positive integer"):
+            ApplicationBuilder().bot(one_time_bot).max_concurrent_tasks(0).build()
+        with pytest.raises(ValueError, match="`max_queued_tasks` must be a non-negative int"):
+            ApplicationBuilder().bot(one_time_bot).max_concurrent_tasks(1).max_queued_tasks(
+                -1
+            ).build()
+        with pytest.raises(ValueError, match="requires `max_concurrent_tasks`"):
+            ApplicationBuilder().bot(one_time_bot).max_queued_tasks(1).build()
+
+    async def test_create_task_max_concurrent_tasks(self, one_time_bot):
+        app = ApplicationBuilder().bot(one_time_bot).max_concurrent_tasks(2).build()
+        event = asyncio.Event()
+        running = []
+
+        async def callback(number):
+            running.append(number)
+            await event.wait()
+
+        async with app:
+            await app.start()
+            tasks = [app.create_task(callback(i), name=f"task_{i % 2}") for i in range(5)]
+            tasks += [app.create_task(callback(i)) for i in range(5, 7)]
+            assert app.pending_tasks == {"task_0": 3, "task_1": 2, "<unnamed>": 2}
+            await asyncio.sleep(0.05)
+            assert running == [0, 1]
+            assert app.queued_tasks == 5
+
+            event.set()
+            await asyncio.gather(*tasks)
+            assert sorted(running) == [0, 1, 2, 3, 4, 5, 6]
+            assert app.queued_tasks == 0
+            assert app.pending_tasks == {}
+            await app.stop()
+
+    async def test_create_task_max_queued_tasks(self, one_time_bot):
+        app = (
+            ApplicationBuilder().bot(one_time_bot).max_concurrent_tasks(1).max_queued_tasks(1)
+        ).build()
+        event = asyncio.Event()
+
+        async def callback():
+            await event.wait()
+
+        async with app:
+            await app.start()
+            tasks = [app.create_task(callback()), app.create_task(callback())]
+            rejected = callback()
+            with pytest.raises(RuntimeError, match="1 tasks are already waiting"):
+                app.create_task(rejected, name="rejected")
+            # The rejected coroutine is closed such that no warning is issued
+            assert rejected.cr_frame is None
+
+            event.set()
+            await asyncio.gather(*tasks)
+            await app.create_task(callback())
+            await app.stop()
+
+    async def test_non_blocking_handler_rejected(self, one_time_bot):
+        app = (
+            ApplicationBuilder().bot(one_time_bot).max_concurrent_tasks(1).max_queued_tasks(0)
+        ).build()
+        event = asyncio.Event()
+        errors = []
+
+        async def callback(update, context):
+            await event.wait()
+
+        async def error_handler(update, context):
+            errors.append(context.error)
+
+        app.add_handler(TypeHandler(object, callback, block=False))
+        app.add_error_handler(error_handler)
+
+        async with app:
+            await app.start()
+            await app.process_update(1)
+            await app.process_update(2)
+            assert len(errors) == 1
+            assert isinstance(errors[0], RuntimeError)
+
+            event.set()
+            await app.stop()
+
+    async def test_concurrent_updates_wait_for_free_slot(self, one_time_bot):
+        app = (
+            ApplicationBuilder()
+            .bot(one_time_bot)
+            .concurrent_updates(3)
+            .max_concurrent_tasks(1)
+            .max_queued_tasks(0)
+            .build()
+        )
+        event = asyncio.Event()
+        processed = []
+        errors = []
+
+        async def callback(update, context):
+            await event.wait()
+            processed.append(update)
+
+        async def error_handler(update, context):
+            errors.append(context.error)
+
+        app.add_handler(TypeHandler(int, callback))
+        app.add_error_handler(error_handler)
+
+        async with app:
+            await app.start()
+            for i in range(3):
+                await app.update_queue.put(i)
+            await asyncio.sleep(0.05)
+            # The fetcher waits for a free slot instead of getting its task rejected
+            assert app.update_queue.qsize() == 1
+            assert app.queued_tasks == 0
+            assert processed == []
+
+            event.set()
+            await asyncio.sleep(0.05)
+            assert sorted(processed) == [0, 1, 2]
+            assert errors == []
+            await app.stop()
+
+    async def test_create_task_cancel_queued_task(self, one_time_bot):
+        app = ApplicationBuilder().bot(one_time_bot).max_concurrent_tasks(1).build()
+        event = asyncio.Event()
+
+        async def callback():
+            await event.wait()
+
+        async with app:
+            await app.start()
+            first = app.create_task(callback())
+            await asyncio.sleep(0.01)
+            queued = app.create_task(callback(), name="queued")
+            await asyncio.sleep(0.01)
+            assert app.queued_tasks == 1
+            queued.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+            assert app.queued_tasks == 0
+            assert "queued" not in app.pending_tasks
+
+            event.set()
+            await first
+            await app.stop()
+
+    async def test_create_task_timeout(self, app):
+        errors = []
+
+        async def callback():
+            await asyncio.sleep(5)
+
+        async def error_handler(update, context):
+            errors.append(context.error)
+
+        app.add_error_handler(error_handler)
+        async with app:
+            await app.start()
+            task = app.create_task(callback(), timeout=0.05)
+            with pytest.raises(asyncio.TimeoutError):
+                await task
+            assert len(errors) == 1
+            assert isinstance(errors[0], asyncio.TimeoutError)
+            assert await app.create_task(asyncio.sleep(0, result=1), timeout=1) == 1
+            await app.stop()
+
     async def test_no_update_processor(self, app):
         queue = asyncio.Queue()
         event_1 = asyncio.Event()
@@ -2625,3 +2841,312 @@ class TestApplication:
 
             assert received_errors == {2}
             assert len(caplog.records) == 0
+
+    def test_thread_pool_size_error(self, one_time_bot):
+        with pytest.raises(ValueError, match="must be a positive integer"):
+            ApplicationBuilder().bot(one_time_bot).thread_pool_size(0).build()
+
+    async def test_thread_pool_lifecycle(self, one_time_bot):
+        app = ApplicationBuilder().bot(one_time_bot).thread_pool_size(2).build()
+        assert app.thread_pool_size == 2
+        assert app.running_thread_pool_tasks == 0
+        assert app.pending_thread_pool_tasks == 0
+        with pytest.raises(RuntimeError, match="not initialized"):
+            await app.run_in_thread(threading.current_thread)
+
+        async with app:
+            thread = await app.run_in_thread(threading.current_thread)
+            assert thread is not threading.current_thread()
+            assert thread.name.startswith(f"Application:{one_time_bot.id}")
+            assert await app.run_in_thread(max, 1, 3, key=lambda x: -x) == 1
+            thread_pool = app._thread_pool
+
+        assert app._thread_pool is None
+        with pytest.raises(RuntimeError, match="shutdown"):
+            thread_pool.submit(print)
+
+    async def test_run_in_thread_without_thread_pool(self, app):
+        variable = contextvars.ContextVar("variable")
+        variable.set("value")
+
+        def target():
+            return threading.current_thread(), variable.get()
+
+        # Doesn't require initialization and falls back to the default executor
+        thread, value = await app.run_in_thread(target)
+        assert thread is not threading.current_thread()
+        assert value == "value"
+
+        async with app:
+            thread, value = await app.run_in_thread(target)
+            assert not thread.name.startswith("Application:")
+            assert value == "value"
+
+    async def test_sync_callbacks_with_thread_pool(self, one_time_bot):
+        app = ApplicationBuilder().bot(one_time_bot).thread_pool_size(1).build()
+        threads = []
+        event = threading.Event()
+
+        def callback(update, context):
+            threads.append(threading.current_thread())
+            assert isinstance(context, CallbackContext)
+            event.wait(timeout=5)
+
+        app.add_handler(TypeHandler(object, callback))
+
+        async with app:
+            tasks = [
+                asyncio.create_task(app.process_update(self.message_update)) for _ in range(3)
+            ]
+            await asyncio.sleep(0.05)
+            # The event loop is not blocked and the thread pool is saturated
+            assert app.running_thread_pool_tasks == 1
+            assert app.pending_thread_pool_tasks == 2
+            event.set()
+            await asyncio.gather(*tasks)
+            await asyncio.sleep(0.05)
+            assert app.running_thread_pool_tasks == 0
+            assert app.pending_thread_pool_tasks == 0
+
+        assert len(threads) == 3
+        assert all(thread is not threading.current_thread() for thread in threads)
+
+    async def test_sync_callbacks_without_thread_pool(self, app):
+        threads = []
+
+        def callback(update, context):
+            threads.append(threading.current_thread())
+
+        async def coroutine_callback(update, context):
+            threads.append("coroutine")
+
+        app.add_handler(TypeHandler(object, callback))
+        # Sync functions returning coroutines are still supported
+        app.add_handler(TypeHandler(object, lambda u, c: coroutine_callback(u, c)), group=1)
+
+        async with app:
+            await app.process_update(self.message_update)
+
+        assert threads == [threading.current_thread(), "coroutine"]
+
+    async def test_sync_callback_error_in_thread_pool(self, one_time_bot):
+        app = ApplicationBuilder().bot(one_time_bot).thread_pool_size(1).build()
+        errors = []
+
+        def callback(update, context):
+            raise TelegramError("sync error")
+
+        async def error_handler(update, context):
+            errors.append(context.error)
+
+        app.add_handler(TypeHandler(object, callback))
+        app.add_error_handler(error_handler)
+
+        async with app:
+            await app.process_update(self.message_update)
+
+        assert len(errors) == 1
+        assert errors[0].message == "sync error"
+
+    def test_process_pool_errors(self, one_time_bot):
+        with pytest.raises(ValueError, match="`process_pool_size` must be a positive integer"):
+            ApplicationBuilder().bot(one_time_bot).process_pool_size(0).build()
+        with pytest.raises(ValueError, match="`max_pending_cpu_tasks` must be a positive int"):
+            ApplicationBuilder().bot(one_time_bot).max_pending_cpu_tasks(0).build()
+
+    def test_max_pending_cpu_tasks_default(self, one_time_bot):
+        app = ApplicationBuilder().bot(one_time_bot).process_pool_size(3).build()
+        assert app.process_pool_size == 3
+        assert app.max_pending_cpu_tasks == 6
+        assert app.pending_cpu_tasks == 0
+
+    async def test_run_cpu(self, one_time_bot):
+        app = ApplicationBuilder().bot(one_time_bot).process_pool_size(1).build()
+        async with app:
+            with pytest.raises(RuntimeError, match="No process pool available"):
+                await app.run_cpu(pow, 2, 10)
+
+            await app.start()
+            assert await app.run_cpu(pow, 2, 10) == 1024
+            assert await app.run_cpu(int, "ff", base=16) == 255
+            assert await app.run_cpu(os.getpid) != os.getpid()
+            with pytest.raises(ValueError, match="math domain error"):
+                await app.run_cpu(math.sqrt, -1)
+            assert app.pending_cpu_tasks == 0
+            await app.stop()
+
+            with pytest.raises(RuntimeError, match="No process pool available"):
+                await app.run_cpu(pow, 2, 10)
+
+    async def test_run_cpu_without_process_pool(self, app):
+        async with app:
+            await app.start()
+            with pytest.raises(RuntimeError, match="process_pool_size"):
+                await app.run_cpu(pow, 2, 10)
+            await app.stop()
+
+    async def test_run_cpu_backpressure(self, one_time_bot):
+        app = (
+            ApplicationBuilder()
+            .bot(one_time_bot)
+            .process_pool_size(1)
+            .max_pending_cpu_tasks(1)
+            .build()
+        )
+        async with app:
+            await app.start()
+            first = asyncio.create_task(app.run_cpu(time.sleep, 0.5))
+            await asyncio.sleep(0.05)
+            second = asyncio.create_task(app.run_cpu(pow, 2, 2))
+            await asyncio.sleep(0.05)
+            assert app.pending_cpu_tasks == 1
+            assert not second.done()
+            assert await second == 4
+            assert first.done()
+            assert app.pending_cpu_tasks == 0
+
+            # Stopping waits for pending work
+            third = asyncio.create_task(app.run_cpu(time.sleep, 0.2))
+            await asyncio.sleep(0.05)
+            await app.stop()
+            assert third.done()
+
+    async def test_run_cpu_broken_process_pool(self, one_time_bot, caplog):
+        app = ApplicationBuilder().bot(one_time_bot).process_pool_size(1).build()
+        async with app:
+            await app.start()
+            with caplog.at_level(logging.WARNING), pytest.raises(BrokenProcessPool):
+                await app.run_cpu(os._exit, 1)
+            assert "Starting a new process pool" in caplog.text
+            # The application can continue to use the process pool
+            assert await app.run_cpu(pow, 2, 3) == 8
+            await app.stop()
+
+    async def test_run_cpu_error_in_handler(self, one_time_bot):
+        app = ApplicationBuilder().bot(one_time_bot).process_pool_size(1).build()
+        errors = []
+
+        async def callback(update, context):
+            await context.application.run_cpu(math.sqrt, -1)
+
+        async def error_handler(update, context):
+            errors.append(context.error)
+
+        app.add_handler(TypeHandler(object, callback))
+        app.add_error_handler(error_handler)
+
+        async with app:
+            await app.start()
+            await app.update_queue.put(self.message_update)
+            for _ in range(100):
+                await asyncio.sleep(0.05)
+                if errors:
+                    break
+            await app.stop()
+
+        assert len(errors) == 1
+        assert isinstance(errors[0], ValueError)
+
+    async def test_refresh_data_skipped_for_noop_persistence(self, one_time_bot):
+        app = ApplicationBuilder().bot(one_time_bot).persistence(DictPersistence()).build()
+        contexts = []
+
+        async def callback(update, context):
+            contexts.append(context)
+
+        app.add_handler(TypeHandler(object, callback))
+
+        async with app:
+            assert app._get_data_to_refresh() == PersistenceInput(False, False, False, False)
+            await app.process_update(self.message_update)
+
+            assert len(contexts) == 1
+            # DictPersistence.refresh_chat/user_data do nothing, so the data was never accessed
+            assert self.message_update.effective_chat.id not in app._chat_data
+            assert self.message_update.effective_user.id not in app._user_data
+
+    def test_data_to_refresh_by_identity(self, one_time_bot, tmp_path):
+        class NoopSubclass(DictPersistence):
+            async def refresh_bot_data(self, bot_data):
+                pass
+
+        app = ApplicationBuilder().bot(one_time_bot).build()
+        app.persistence = PicklePersistence(tmp_path / "file")
+        assert app._get_data_to_refresh() == PersistenceInput(False, False, False, False)
+
+        # Only the built-in implementations are known to do nothing. Overridden methods are
+        # always called, even if they don't do anything either.
+        app.persistence = NoopSubclass()
+        assert app._get_data_to_refresh() == PersistenceInput(True, False, False, False)
+
+    async def test_refresh_data_context_data(self, one_time_bot):
+        class RefreshingPersistence(DictPersistence):
+            def __init__(self):
+                super().__init__()
+                self.refreshed = []
+
+            async def refresh_chat_data(self, chat_id, chat_data):
+                self.refreshed.append(("chat", chat_id))
+
+            async def refresh_user_data(self, user_id, user_data):
+                self.refreshed.append(("user", user_id))
+
+        persistence = RefreshingPersistence()
+        app = ApplicationBuilder().bot(one_time_bot).persistence(persistence).build()
+        no_data = PersistenceInput(bot_data=False, chat_data=False, user_data=False)
+        bot_data_only = PersistenceInput(bot_data=True, chat_data=False, user_data=False)
+        called = []
+
+        async def callback(update, context):
+            called.append(update)
+
+        first = TypeHandler(object, callback)
+        first.context_data = no_data
+        second = TypeHandler(object, callback)
+        second.context_data = bot_data_only
+        app.add_handler(first)
+        app.add_handler(second, group=1)
+        chat_id = self.message_update.effective_chat.id
+        user_id = self.message_update.effective_user.id
+
+        async with app:
+            assert app._get_data_to_refresh() == PersistenceInput(False, True, True, False)
+
+            # The handlers don't need any of the data that the persistence refreshes
+            await app.process_update(self.message_update)
+            assert len(called) == 2
+            assert persistence.refreshed == []
+            assert chat_id not in app._chat_data
+
+            # The first handler that needs data triggers a single refresh
+            app.add_handler(TypeHandler(object, callback), group=2)
+            app.add_handler(TypeHandler(object, callback), group=3)
+            await app.process_update(self.message_update)
+            assert len(called) == 6
+            assert persistence.refreshed == [("chat", chat_id), ("user", user_id)]
+
+    async def test_refresh_data_custom_context(self, one_time_bot):
+        refreshed = []
+
+        class CustomContext(CallbackContext):
+            async def refresh_data(self):
+                refreshed.append(self)
+
+        async def callback(update, context):
+            pass
+
+        app = (
+            ApplicationBuilder()
+            .bot(one_time_bot)
+            .context_types(ContextTypes(context=CustomContext))
+            .build()
+        )
+        handler = TypeHandler(object, callback)
+        handler.context_data = PersistenceInput(bot_data=False, chat_data=False, user_data=False)
+        app.add_handler(handler)
+
+        async with app:
+            await app.process_update(self.message_update)
+
+        # Custom implementations are always called, even without persistence
+        assert len(refreshed) == 1
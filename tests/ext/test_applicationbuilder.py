@@ -30,11 +30,13 @@ from telegram.ext import (
     AIORateLimiter,
     Application,
     ApplicationBuilder,
+    ApplicationMetrics,
     CallbackDataCache,
     ContextTypes,
     Defaults,
     ExtBot,
     JobQueue,
+    LoadSheddingPolicy,
     PicklePersistence,
     Updater,
 )
@@ -179,6 +181,13 @@ class TestApplicationBuilder:
         assert app.post_init is None
         assert app.post_shutdown is None
         assert app.post_stop is None
+        assert app.thread_pool_size is None
+        assert app.process_pool_size is None
+        assert app.max_pending_cpu_tasks is None
+        assert app.metrics is None
+        assert app.load_shedding_policies == ()
+        assert app.max_concurrent_tasks is None
+        assert app.max_queued_tasks is None
 
     @pytest.mark.parametrize(
         ("method", "description"), _BOT_CHECKS, ids=[entry[0] for entry in _BOT_CHECKS]
@@ -492,6 +501,8 @@ class TestApplicationBuilder:
         persistence = PicklePersistence("file_path")
         update_queue = asyncio.Queue()
         context_types = ContextTypes()
+        metrics = ApplicationMetrics()
+        policy = LoadSheddingPolicy(["edited_message"], max_pending_updates=10)
 
         async def post_init(app: Application) -> None:
             pass
@@ -513,6 +524,13 @@ class TestApplicationBuilder:
             .post_shutdown(post_shutdown)
             .post_stop(post_stop)
             .arbitrary_callback_data(True)
+            .thread_pool_size(4)
+            .process_pool_size(2)
+            .max_pending_cpu_tasks(3)
+            .metrics(metrics)
+            .load_shedding_policies([policy])
+            .max_concurrent_tasks(8)
+            .max_queued_tasks(16)
         ).build()
 
         assert app.job_queue is job_queue
@@ -529,6 +547,13 @@ class TestApplicationBuilder:
         assert app.post_init is post_init
         assert app.post_shutdown is post_shutdown
         assert app.post_stop is post_stop
+        assert app.thread_pool_size == 4
+        assert app.process_pool_size == 2
+        assert app.max_pending_cpu_tasks == 3
+        assert app.metrics is metrics
+        assert app.load_shedding_policies == (policy,)
+        assert app.max_concurrent_tasks == 8
+        assert app.max_queued_tasks == 16
         assert isinstance(app.bot.callback_data_cache, CallbackDataCache)
 
         updater = Updater(bot=bot, update_queue=update_queue)
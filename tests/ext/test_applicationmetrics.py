@@ -0,0 +1,295 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+
+import pytest
+
+from telegram.ext import (
+    ApplicationBuilder,
+    ApplicationHandlerStop,
+    ApplicationMetrics,
+    CommandHandler,
+    ConversationHandler,
+    DurationStatistics,
+    HandlerStatistics,
+    TypeHandler,
+)
+from tests.auxil.slots import mro_slots
+
+
+@pytest.fixture
+def metrics():
+    return ApplicationMetrics()
+
+
+@pytest.fixture
+def metrics_app(one_time_bot, metrics):
+    return ApplicationBuilder().bot(one_time_bot).metrics(metrics).build()
+
+
+async def callback(update, context):
+    pass
+
+
+class TestDurationStatistics:
+    def test_slot_behaviour(self):
+        inst = DurationStatistics()
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_observe(self):
+        stats = DurationStatistics()
+        assert stats.count == 0
+        assert stats.mean == 0
+
+        stats.observe(1.0)
+        stats.observe(3.0)
+        stats.observe(2.0)
+        assert stats.count == 3
+        assert stats.total == 6.0
+        assert stats.maximum == 3.0
+        assert stats.mean == 2.0
+        assert repr(stats) == "DurationStatistics[count=3, total=6.0, maximum=3.0]"
+
+
+class TestApplicationMetrics:
+    def test_slot_behaviour(self, metrics):
+        for attr in metrics.__slots__:
+            assert getattr(metrics, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(metrics)) == len(set(mro_slots(metrics))), "duplicate slot"
+
+        stats = HandlerStatistics(TypeHandler(object, callback), 0)
+        for attr in stats.__slots__:
+            assert getattr(stats, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(stats)) == len(set(mro_slots(stats))), "duplicate slot"
+
+    def test_record_and_reset(self, metrics):
+        handler = TypeHandler(object, callback)
+        metrics.record_update_fetched(3)
+        metrics.record_update_fetched(1)
+        metrics.record_queue_wait(0.5)
+        metrics.record_refresh_data(0.25)
+        metrics.record_check(handler, 1, 0.1, matched=True)
+        metrics.record_check(handler, 1, 0.3, matched=False)
+        metrics.record_callback(handler, 1, 2.0, failed=True)
+        metrics.record_non_blocking_task(handler, 1)
+        metrics.record_update_processed(2.5)
+        metrics.record_error()
+
+        assert metrics.update_queue_size == 1
+        assert metrics.max_update_queue_size == 3
+        assert metrics.queue_wait.total == 0.5
+        assert metrics.refresh_data_duration.total == 0.25
+        assert metrics.processed_updates == 1
+        assert metrics.processing_duration.total == 2.5
+        assert metrics.errors == 1
+        assert repr(metrics) == "ApplicationMetrics[processed_updates=1, errors=1]"
+
+        stats = metrics.get_handler_statistics(handler, 1)
+        assert metrics.handler_statistics == (stats,)
+        assert dict(metrics.handlers) == {(1, handler): stats}
+        assert stats.handler is handler
+        assert stats.group == 1
+        assert stats.check_duration.count == 2
+        assert stats.check_duration.maximum == 0.3
+        assert stats.matches == 1
+        assert stats.callback_duration.total == 2.0
+        assert stats.errors == 1
+        assert stats.non_blocking_tasks == 1
+        assert repr(stats) == f"HandlerStatistics[handler={handler!r}, group=1]"
+        # Unknown handlers get empty statistics
+        assert metrics.get_handler_statistics(handler).matches == 0
+
+        metrics.reset()
+        assert metrics.processed_updates == 0
+        assert metrics.errors == 0
+        assert metrics.max_update_queue_size == 0
+        assert metrics.queue_wait.count == 0
+        assert metrics.handler_statistics == ()
+
+    def test_to_prometheus(self, metrics):
+        handler = TypeHandler(object, callback)
+        other_handler = TypeHandler(object, callback)
+        metrics.record_check(handler, 0, 0.5, matched=True)
+        metrics.record_callback(handler, 0, 1.5, failed=False)
+        metrics.record_check(other_handler, 0, 0.25, matched=False)
+        metrics.record_update_processed(2.0)
+
+        text = metrics.to_prometheus(namespace="bot")
+        assert text.endswith("\n")
+        lines = text.splitlines()
+        assert "# TYPE bot_updates_processed_total counter" in lines
+        assert "bot_updates_processed_total 1" in lines
+        assert "# TYPE bot_processing_duration_seconds summary" in lines
+        assert "bot_processing_duration_seconds_count 1" in lines
+        assert "bot_processing_duration_seconds_sum 2.0" in lines
+
+        labels = f'group="0",handler="{handler!r}"'
+        other_labels = f'group="0",handler="{handler!r}#2"'
+        assert f"bot_handler_check_seconds_count{{{labels}}} 1" in lines
+        assert f"bot_handler_check_seconds_sum{{{labels}}} 0.5" in lines
+        assert f"bot_handler_callback_seconds_sum{{{labels}}} 1.5" in lines
+        assert f"bot_handler_matches_total{{{labels}}} 1" in lines
+        assert f"bot_handler_matches_total{{{other_labels}}} 0" in lines
+        assert f"bot_handler_errors_total{{{labels}}} 0" in lines
+        assert f"bot_handler_non_blocking_tasks_total{{{labels}}} 0" in lines
+
+        # Every metric has exactly one HELP and TYPE line
+        type_lines = [line for line in lines if line.startswith("# TYPE")]
+        assert len(type_lines) == len(set(type_lines))
+        assert len(type_lines) == len([line for line in lines if line.startswith("# HELP")])
+
+    def test_to_prometheus_conversations(self, metrics):
+        handler = ConversationHandler(
+            entry_points=[CommandHandler("start", callback)], states={}, fallbacks=[]
+        )
+        handler._conversations[(1,)] = 1
+        handler._evicted_conversations = 3
+        metrics.record_check(handler, 0, 0.5, matched=True)
+        metrics.record_check(TypeHandler(object, callback), 0, 0.5, matched=True)
+
+        lines = metrics.to_prometheus().splitlines()
+        labels = f'group="0",handler="{handler!r}"'
+        assert "# TYPE ptb_handler_active_conversations gauge" in lines
+        assert f"ptb_handler_active_conversations{{{labels}}} 1" in lines
+        assert "# TYPE ptb_handler_evicted_conversations_total counter" in lines
+        assert f"ptb_handler_evicted_conversations_total{{{labels}}} 3" in lines
+        assert len([line for line in lines if "conversations" in line]) == 6
+
+    def test_to_prometheus_escaping(self, metrics):
+        class Handler(TypeHandler):
+            __slots__ = ()
+
+            def __repr__(self):
+                return 'Handler["quoted"\\path\n]'
+
+        metrics.record_check(Handler(object, callback), 0, 0.5, matched=True)
+        assert (
+            'ptb_handler_matches_total{group="0",handler="Handler[\\"quoted\\"\\\\path\\n]"} 1'
+            in metrics.to_prometheus().splitlines()
+        )
+
+    async def test_process_update(self, metrics_app, metrics):
+        async def failing(update, context):
+            raise RuntimeError("test")
+
+        async def stopping(update, context):
+            raise ApplicationHandlerStop
+
+        errors = []
+
+        async def error_handler(update, context):
+            errors.append(context.error)
+
+        unmatched = TypeHandler(int, callback)
+        matched = TypeHandler(str, failing)
+        stop = TypeHandler(str, stopping)
+        metrics_app.add_handler(unmatched)
+        metrics_app.add_handler(matched)
+        metrics_app.add_handler(stop, group=1)
+        metrics_app.add_error_handler(error_handler)
+
+        async with metrics_app:
+            await metrics_app.process_update("update")
+            await metrics_app.process_update("update")
+
+        assert len(errors) == 2
+        assert metrics.errors == 2
+        assert metrics.processed_updates == 2
+        assert metrics.processing_duration.count == 2
+        # Without persistence, there is no data to refresh
+        assert metrics.refresh_data_duration.count == 0
+        # queue wait is only measured for updates from the update_queue
+        assert metrics.queue_wait.count == 0
+
+        unmatched_stats = metrics.get_handler_statistics(unmatched)
+        assert unmatched_stats.check_duration.count == 2
+        assert unmatched_stats.matches == 0
+        assert unmatched_stats.callback_duration.count == 0
+
+        matched_stats = metrics.get_handler_statistics(matched)
+        assert matched_stats.matches == 2
+        assert matched_stats.callback_duration.count == 2
+        assert matched_stats.errors == 2
+
+        stop_stats = metrics.get_handler_statistics(stop, group=1)
+        assert stop_stats.matches == 2
+        assert stop_stats.callback_duration.count == 2
+        # ApplicationHandlerStop is not an error
+        assert stop_stats.errors == 0
+
+    async def test_non_blocking_callback(self, metrics_app, metrics):
+        event = asyncio.Event()
+
+        async def slow_callback(update, context):
+            await event.wait()
+
+        handler = TypeHandler(object, slow_callback, block=False)
+        metrics_app.add_handler(handler)
+
+        async with metrics_app:
+            await metrics_app.start()
+            await metrics_app.process_update("update")
+            stats = metrics.get_handler_statistics(handler)
+            assert stats.non_blocking_tasks == 1
+            assert stats.callback_duration.count == 0
+
+            await asyncio.sleep(0.05)
+            event.set()
+            await asyncio.sleep(0.05)
+            assert stats.callback_duration.count == 1
+            assert stats.callback_duration.total >= 0.05
+            await metrics_app.stop()
+
+    async def test_queue_wait(self, metrics_app, metrics):
+        event = asyncio.Event()
+
+        async def slow_callback(update, context):
+            await event.wait()
+
+        metrics_app.add_handler(TypeHandler(object, slow_callback))
+
+        async with metrics_app:
+            await metrics_app.update_queue.put(1)
+            await metrics_app.update_queue.put(2)
+            await metrics_app.update_queue.put(3)
+            await metrics_app.start()
+            await asyncio.sleep(0.05)
+            assert metrics.max_update_queue_size == 2
+            event.set()
+            await asyncio.sleep(0.05)
+            await metrics_app.stop()
+
+        assert metrics.queue_wait.count == 3
+        assert metrics.processed_updates == 3
+        assert metrics.update_queue_size == 0
+
+    async def test_no_metrics(self, app):
+        # Make sure that processing works without metrics
+        assert app.metrics is None
+        called = []
+
+        async def cb(update, context):
+            called.append(update)
+
+        app.add_handler(TypeHandler(object, cb))
+        async with app:
+            await app.process_update("update")
+        assert called == ["update"]
@@ -17,7 +17,7 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 
-from telegram.ext import BaseHandler
+from telegram.ext import BaseHandler, PersistenceInput
 from tests.auxil.slots import mro_slots
 
 
@@ -37,6 +37,18 @@ class TestHandler:
             assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
         assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
 
+    def test_context_data(self):
+        class SubclassHandler(BaseHandler):
+            __slots__ = ()
+
+            def __init__(self):
+                super().__init__(lambda x: None)
+
+            def check_update(self, update: object):
+                pass
+
+        assert SubclassHandler().context_data == PersistenceInput()
+
     def test_repr(self):
         async def some_func():
             return None
@@ -72,3 +84,15 @@ class TestHandler:
 
         sh = SubclassHandler()
         assert repr(sh) == "SubclassHandler[callback=Repr of ClassBasedCallback]"
+
+    def test_update_types(self):
+        class SubclassHandler(BaseHandler):
+            __slots__ = ()
+
+            def __init__(self):
+                super().__init__(lambda x: None)
+
+            def check_update(self, update: object):
+                pass
+
+        assert SubclassHandler().update_types is None
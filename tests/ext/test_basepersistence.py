@@ -1449,6 +1449,34 @@ class TestBasePersistence:
             # This is the important part: the persistence is updated with `None` when the conv ends
             assert papp.persistence.conversations == {"conv_1": {(1, 1): None}}
 
+    @default_papp
+    async def test_update_conversations_batched(self, papp, monkeypatch):
+        batches = []
+
+        async def update_conversations(self, name, changes):
+            batches.append((name, dict(changes)))
+            await BasePersistence.update_conversations(self, name, changes)
+
+        monkeypatch.setattr(TrackingPersistence, "update_conversations", update_conversations)
+
+        async with papp:
+            for chat_id in range(1, 4):
+                # second pass processes update in conv_2
+                for _ in range(2):
+                    await papp.process_update(
+                        TrackingConversationHandler.build_update(HandlerStates.END, chat_id)
+                    )
+            await papp.update_persistence()
+
+        # One call per conversation handler with all of its changes
+        changes = {(i, i): HandlerStates.STATE_1 for i in range(1, 4)}
+        assert sorted(batches) == [("conv_1", changes), ("conv_2", changes)]
+        # The default implementation calls update_conversation for each change
+        assert papp.persistence.updated_conversations == {
+            "conv_1": {(1, 1): 1, (2, 2): 1, (3, 3): 1},
+            "conv_2": {(1, 1): 1, (2, 2): 1, (3, 3): 1},
+        }
+
     async def test_non_blocking_conversation_ends(self, bot):
         papp = build_papp(token=bot.token, update_interval=100)
         event = asyncio.Event()
@@ -54,6 +54,31 @@ class TestSimpleUpdateProcessor:
         with pytest.raises(ValueError, match="must be a positive integer"):
             SimpleUpdateProcessor(concurrent_updates)
 
+    def test_concurrent_dispatch(self):
+        assert not SimpleUpdateProcessor(1).concurrent_dispatch
+        assert SimpleUpdateProcessor(2).concurrent_dispatch
+
+    async def test_acquire_and_release_slot(self):
+        calls = []
+
+        class SlotProcessor(SimpleUpdateProcessor):
+            async def acquire_slot(self, update):
+                calls.append(("acquire", update))
+                await super().acquire_slot(update)
+
+            def release_slot(self):
+                calls.append(("release", self.current_concurrent_updates))
+                super().release_slot()
+
+        processor = SlotProcessor(1)
+
+        async def coroutine():
+            calls.append(("process", processor.current_concurrent_updates))
+
+        await processor.process_update(1, coroutine())
+        assert calls == [("acquire", 1), ("process", 1), ("release", 1)]
+        assert processor.current_concurrent_updates == 0
+
     async def test_process_update(self, mock_processor):
         """Test that process_update calls do_process_update."""
         update = Update(1)
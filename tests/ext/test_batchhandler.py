@@ -0,0 +1,273 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import threading
+from pathlib import Path
+
+import pytest
+
+from telegram import CallbackQuery, Chat, Message, Update, User
+from telegram.ext import (
+    ApplicationBuilder,
+    ApplicationHandlerStop,
+    BatchHandler,
+    CallbackContext,
+    MessageHandler,
+    filters,
+)
+from telegram.warnings import PTBUserWarning
+from tests.auxil.files import PROJECT_ROOT_PATH
+from tests.auxil.slots import mro_slots
+
+
+def message_update(update_id, text="text"):
+    user = User(update_id, "user", False)
+    chat = Chat(update_id, Chat.PRIVATE)
+    return Update(update_id, message=Message(update_id, None, chat, from_user=user, text=text))
+
+
+class TestBatchHandler:
+    batches = None
+
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        self.batches = []
+
+    async def callback(self, updates, context):
+        self.batches.append(updates)
+
+    def test_slot_behaviour(self):
+        inst = BatchHandler(None, self.callback)
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_init(self):
+        handler = BatchHandler(None, self.callback)
+        assert handler.filters is filters.ALL
+        assert handler.max_batch_size == 100
+        assert handler.max_delay == 1.0
+        assert handler.pending_updates == 0
+
+        with pytest.raises(ValueError, match="`max_batch_size` must be a positive integer"):
+            BatchHandler(None, self.callback, max_batch_size=0)
+        with pytest.raises(ValueError, match="`max_delay` must be a positive number"):
+            BatchHandler(None, self.callback, max_delay=0)
+
+    def test_check_update(self):
+        handler = BatchHandler(filters.Regex("match"), self.callback)
+        assert BatchHandler(filters.TEXT, self.callback).update_types == frozenset(
+            MessageHandler(filters.TEXT, self.callback).update_types
+        )
+        assert handler.check_update(message_update(1, "match"))
+        assert not handler.check_update(message_update(1, "no"))
+        assert handler.check_update("not an update") is None
+        query = CallbackQuery("1", User(1, "user", False), "chat_instance")
+        assert not BatchHandler(filters.TEXT, self.callback).check_update(
+            Update(1, callback_query=query)
+        )
+
+    async def test_max_batch_size(self, app):
+        handler = BatchHandler(None, self.callback, max_batch_size=3, max_delay=0.2)
+        app.add_handler(handler)
+        updates = [message_update(i) for i in range(7)]
+
+        async with app:
+            await app.start()
+            for update in updates:
+                await app.process_update(update)
+            assert self.batches == [updates[:3], updates[3:6]]
+            assert handler.pending_updates == 1
+
+            await asyncio.sleep(0.3)
+            assert self.batches == [updates[:3], updates[3:6], updates[6:]]
+            assert handler.pending_updates == 0
+            await app.stop()
+
+    async def test_max_delay(self, app):
+        app.add_handler(BatchHandler(None, self.callback, max_delay=0.1))
+        updates = [message_update(i) for i in range(3)]
+
+        async with app:
+            await app.start()
+            for update in updates[:2]:
+                await app.process_update(update)
+            await asyncio.sleep(0.05)
+            assert self.batches == []
+            await asyncio.sleep(0.1)
+            assert self.batches == [updates[:2]]
+
+            # A new timer is started for the next batch
+            await app.process_update(updates[2])
+            await asyncio.sleep(0.15)
+            assert self.batches == [updates[:2], updates[2:]]
+            await app.stop()
+
+    async def test_stop_processes_pending_batch(self, app):
+        app.add_handler(BatchHandler(None, self.callback, max_delay=0.1))
+        updates = [message_update(i) for i in range(3)]
+
+        async with app:
+            await app.start()
+            for update in updates:
+                await app.update_queue.put(update)
+            await asyncio.sleep(0.05)
+            await app.stop()
+
+        assert self.batches == [updates]
+
+    async def test_delayed_flush_rejected(self, one_time_bot):
+        app = (
+            ApplicationBuilder().bot(one_time_bot).max_concurrent_tasks(1).max_queued_tasks(0)
+        ).build()
+        app.add_handler(BatchHandler(None, self.callback, max_delay=5))
+        event = asyncio.Event()
+        update = message_update(1)
+
+        async with app:
+            await app.start()
+            blocking = app.create_task(event.wait())
+            await asyncio.sleep(0.01)
+            # No task can be created for the delayed flush, so the batch is processed right away
+            await app.process_update(update)
+            assert self.batches == [[update]]
+
+            event.set()
+            await blocking
+            await app.stop()
+
+    async def test_context_and_persistence(self, app):
+        contexts = []
+
+        async def callback(updates, context):
+            contexts.append(context)
+
+        app.add_handler(BatchHandler(None, callback, max_batch_size=2))
+
+        async with app:
+            await app.start()
+            updates = [message_update(1), message_update(2)]
+            for update in updates:
+                await app.process_update(update)
+            await app.stop()
+
+        assert len(contexts) == 1
+        assert isinstance(contexts[0], CallbackContext)
+        assert contexts[0].batch == updates
+        assert contexts[0].application is app
+        assert contexts[0].chat_data is None
+        assert contexts[0].user_data is None
+        assert isinstance(contexts[0].bot_data, dict)
+        assert app._chat_ids_to_be_updated_in_persistence >= {1, 2}
+        assert app._user_ids_to_be_updated_in_persistence >= {1, 2}
+
+    @pytest.mark.parametrize("full", [True, False])
+    async def test_error_handling(self, app, full):
+        errors = []
+
+        async def callback(updates, context):
+            raise ValueError("batch error")
+
+        async def error_handler(update, context):
+            errors.append((update, context.error, context.batch))
+
+        app.add_handler(BatchHandler(None, callback, max_batch_size=2, max_delay=0.1))
+        app.add_error_handler(error_handler)
+        updates = [message_update(i) for i in range(2 if full else 1)]
+
+        async with app:
+            await app.start()
+            for update in updates:
+                await app.process_update(update)
+            await asyncio.sleep(0.15)
+            await app.stop()
+
+        assert len(errors) == 1
+        assert errors[0][0] is None
+        assert str(errors[0][1]) == "batch error"
+        assert errors[0][2] == updates
+
+    @pytest.mark.parametrize("full", [True, False])
+    async def test_application_handler_stop(self, app, recwarn, full):
+        errors = []
+
+        async def callback(updates, context):
+            self.batches.append(updates)
+            raise ApplicationHandlerStop
+
+        async def error_handler(update, context):
+            errors.append(context.error)
+
+        app.add_handler(BatchHandler(None, callback, max_batch_size=2, max_delay=0.1))
+        app.add_error_handler(error_handler)
+        updates = [message_update(i) for i in range(2 if full else 1)]
+
+        async with app:
+            await app.start()
+            for update in updates:
+                await app.process_update(update)
+            await asyncio.sleep(0.15)
+            await app.stop()
+
+        assert self.batches == [updates]
+        assert errors == []
+        assert len(recwarn) == 1
+        assert str(recwarn[0].message).startswith("ApplicationHandlerStop in the callback")
+        assert recwarn[0].category is PTBUserWarning
+        assert (
+            Path(recwarn[0].filename)
+            == PROJECT_ROOT_PATH / "telegram" / "ext" / "_handlers" / "batchhandler.py"
+        ), "wrong stacklevel!"
+
+    async def test_sync_callback(self, app):
+        threads = []
+
+        def callback(updates, context):
+            threads.append(threading.current_thread())
+            self.batches.append(updates)
+
+        app.add_handler(BatchHandler(None, callback, max_batch_size=1))
+        update = message_update(1)
+
+        async with app:
+            await app.start()
+            await app.process_update(update)
+            await app.stop()
+
+        assert self.batches == [[update]]
+        assert threads == [threading.current_thread()]
+
+    async def test_non_blocking(self, app):
+        event = asyncio.Event()
+
+        async def callback(updates, context):
+            await event.wait()
+            self.batches.append(updates)
+
+        app.add_handler(BatchHandler(None, callback, max_batch_size=1, block=False))
+        update = message_update(1)
+
+        async with app:
+            await app.start()
+            await app.process_update(update)
+            assert self.batches == []
+            event.set()
+            await asyncio.sleep(0.05)
+            assert self.batches == [[update]]
+            await app.stop()
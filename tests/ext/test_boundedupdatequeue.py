@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+
+import pytest
+
+from telegram.ext import ApplicationBuilder, BoundedUpdateQueue, TypeHandler
+
+
+class TestBoundedUpdateQueue:
+    def test_init(self):
+        queue = BoundedUpdateQueue(10)
+        assert queue.high_watermark == 10
+        assert queue.low_watermark == 5
+        assert queue.pending_updates == 0
+        assert queue.free_capacity == 10
+        assert not queue.overloaded
+        assert queue.maxsize == 0
+
+        queue = BoundedUpdateQueue(10, 0)
+        assert queue.low_watermark == 0
+
+    @pytest.mark.parametrize(
+        ("high", "low", "match"),
+        [
+            (0, None, "`high_watermark` must be"),
+            (-1, None, "`high_watermark` must be"),
+            (5, 5, r"`low_watermark` must be"),
+            (5, -1, r"`low_watermark` must be"),
+        ],
+    )
+    def test_init_errors(self, high, low, match):
+        with pytest.raises(ValueError, match=match):
+            BoundedUpdateQueue(high, low)
+
+    async def test_watermarks(self):
+        queue = BoundedUpdateQueue(3, 1)
+        for i in range(3):
+            assert not queue.overloaded
+            await queue.put(i)
+        assert queue.overloaded
+        assert queue.free_capacity == 0
+        assert queue.pending_updates == 3
+
+        # Getting an item does not change the number of pending updates, only task_done does
+        await queue.get()
+        assert queue.pending_updates == 3
+        queue.task_done()
+        assert queue.pending_updates == 2
+        # Hysteresis: the queue stays overloaded until the low watermark is reached
+        assert queue.overloaded
+
+        await queue.get()
+        queue.task_done()
+        assert not queue.overloaded
+        assert queue.free_capacity == 2
+
+        # put never blocks
+        for i in range(5):
+            queue.put_nowait(i)
+        assert queue.qsize() == 6
+        assert queue.free_capacity == 0
+
+    async def test_task_done_too_often(self):
+        queue = BoundedUpdateQueue(3)
+        with pytest.raises(ValueError, match="too many times"):
+            queue.task_done()
+        assert queue.pending_updates == 0
+
+    async def test_wait_for_capacity(self):
+        queue = BoundedUpdateQueue(2, 0)
+        await asyncio.wait_for(queue.wait_for_capacity(), 1)
+
+        queue.put_nowait(1)
+        queue.put_nowait(2)
+        task = asyncio.create_task(queue.wait_for_capacity())
+        await asyncio.sleep(0.01)
+        assert not task.done()
+
+        queue.task_done()
+        await asyncio.sleep(0.01)
+        assert not task.done()
+        queue.task_done()
+        await asyncio.wait_for(task, 1)
+
+    async def test_application(self, one_time_bot):
+        queue = BoundedUpdateQueue(2, 0)
+        app = (
+            ApplicationBuilder()
+            .bot(one_time_bot)
+            .update_queue(queue)
+            .concurrent_updates(4)
+            .build()
+        )
+        event = asyncio.Event()
+
+        async def callback(*_):
+            await event.wait()
+
+        app.add_handler(TypeHandler(object, callback))
+        async with app:
+            await app.start()
+            await queue.put(1)
+            await queue.put(2)
+            await asyncio.sleep(0.05)
+            # The updates have left the queue, but are still being processed
+            assert queue.qsize() == 0
+            assert queue.pending_updates == 2
+            assert queue.overloaded
+
+            event.set()
+            await asyncio.sleep(0.05)
+            assert queue.pending_updates == 0
+            assert not queue.overloaded
+            await app.stop()
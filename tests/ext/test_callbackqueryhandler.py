@@ -177,6 +177,27 @@ class TestCallbackQueryHandler:
         callback_query.callback_query.data = "callback_data"
         assert not handler.check_update(callback_query)
 
+    def test_with_data_prefix(self, callback_query):
+        handler = CallbackQueryHandler(self.callback_basic, data_prefix="menu_")
+        assert handler.data_prefix == "menu_"
+
+        callback_query.callback_query.data = "menu_1"
+        assert handler.check_update(callback_query) is True
+        callback_query.callback_query.data = "settings"
+        assert not handler.check_update(callback_query)
+        callback_query.callback_query.data = object()
+        assert not handler.check_update(callback_query)
+
+        handler = CallbackQueryHandler(
+            self.callback_basic, pattern=lambda data: data.endswith("1"), data_prefix="menu_"
+        )
+        callback_query.callback_query.data = "menu_1"
+        assert handler.check_update(callback_query)
+        callback_query.callback_query.data = "menu_2"
+        assert not handler.check_update(callback_query)
+        callback_query.callback_query.data = "settings_1"
+        assert not handler.check_update(callback_query)
+
     def test_other_update_types(self, false_update):
         handler = CallbackQueryHandler(self.callback_basic)
         assert not handler.check_update(false_update)
@@ -18,9 +18,11 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """Persistence of conversations is tested in test_basepersistence.py"""
 import asyncio
+import datetime as dtm
 import functools
 import logging
 from pathlib import Path
+from types import SimpleNamespace
 from warnings import filterwarnings
 
 import pytest
@@ -42,6 +44,7 @@ from telegram.ext import (
     ApplicationHandlerStop,
     CallbackContext,
     CallbackQueryHandler,
+    ChatMemberHandler,
     ChosenInlineResultHandler,
     CommandHandler,
     ConversationHandler,
@@ -58,7 +61,8 @@ from telegram.ext import (
     TypeHandler,
     filters,
 )
-from telegram.warnings import PTBUserWarning
+from telegram.ext._handlers.conversationhandler import PendingState
+from telegram.warnings import PTBDeprecationWarning, PTBUserWarning
 from tests.auxil.build_messages import make_command_message
 from tests.auxil.files import PROJECT_ROOT_PATH
 from tests.auxil.pytest_classes import PytestBot, make_bot
@@ -273,6 +277,8 @@ class TestConversationHandler:
             allow_reentry="allow_reentry",
             conversation_timeout=42,
             map_to_parent=map_to_parent,
+            max_conversations=10,
+            conversation_ttl=dtm.timedelta(minutes=1),
         )
         assert ch.entry_points is entry_points
         assert ch.states is states
@@ -284,6 +290,22 @@ class TestConversationHandler:
         assert ch.persistent == "persistent"
         assert ch.name == "name"
         assert ch.allow_reentry == "allow_reentry"
+        assert ch.max_conversations == 10
+        assert ch.conversation_ttl == 60
+        assert ch.active_conversations == 0
+        assert ch.evicted_conversations == 0
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"max_conversations": 0}, "`max_conversations` must be a positive integer"),
+            ({"conversation_ttl": 0}, "`conversation_ttl` must be positive"),
+            ({"conversation_ttl": dtm.timedelta(seconds=-1)}, "`conversation_ttl` must be"),
+        ],
+    )
+    def test_init_invalid_bounds(self, kwargs, match):
+        with pytest.raises(ValueError, match=match):
+            ConversationHandler(entry_points=[], states={}, fallbacks=[], **kwargs)
 
     def test_init_persistent_no_name(self):
         with pytest.raises(ValueError, match="can't be persistent when handler is unnamed"):
@@ -520,6 +542,8 @@ class TestConversationHandler:
             "allow_reentry",
             "conversation_timeout",
             "map_to_parent",
+            "max_conversations",
+            "conversation_ttl",
         ],
         indirect=False,
     )
@@ -1063,6 +1087,65 @@ class TestConversationHandler:
         assert not handler.check_update(Update(0, pre_checkout_query=pre_checkout_query))
         assert not handler.check_update(Update(0, shipping_query=shipping_query))
 
+    async def test_dispatch_tables(self, monkeypatch):
+        checked = []
+
+        def counting(original):
+            def check_update(handler, update):
+                checked.append(handler)
+                return original(handler, update)
+
+            return check_update
+
+        for cls in (CommandHandler, ChatMemberHandler):
+            monkeypatch.setattr(cls, "check_update", counting(cls.check_update))
+        commands = [CommandHandler(f"command{i}", self.start) for i in range(20)]
+        chat_member_handler = ChatMemberHandler(self.start)
+        waiting = [CommandHandler("command5", self.start)]
+        fallback = CommandHandler("eat", self.start)
+        handler = ConversationHandler(
+            entry_points=[CommandHandler("start", self.start)],
+            states={
+                self.THIRSTY: [chat_member_handler, *commands],
+                ConversationHandler.WAITING: waiting,
+            },
+            fallbacks=[fallback],
+        )
+        handler._conversations[(1, 1)] = self.THIRSTY
+
+        def update(text):
+            return Update(0, message=make_command_message(text))
+
+        # Only the handler that listens to the command is checked
+        assert handler.check_update(update("/command5"))[2] is commands[5]
+        assert checked == [commands[5]]
+
+        checked.clear()
+        assert handler.check_update(update("/eat"))[2] is fallback
+        assert checked == [fallback]
+
+        # Handlers that are added later are taken into account
+        checked.clear()
+        commands.append(CommandHandler("late", self.start))
+        handler.states[self.THIRSTY].append(commands[-1])
+        assert handler.check_update(update("/late"))[2] is commands[-1]
+        assert checked == [commands[-1]]
+
+        # The same goes for the WAITING state
+        checked.clear()
+        event = asyncio.Event()
+        task = asyncio.create_task(event.wait())
+        handler._conversations[(1, 1)] = PendingState(old_state=self.THIRSTY, task=task)
+        assert handler.check_update(update("/command5"))[:3] == (
+            ConversationHandler.WAITING,
+            (1, 1),
+            waiting[0],
+        )
+        assert checked == [waiting[0]]
+        assert handler.check_update(update("/command6")) is None
+        event.set()
+        await task
+
     @pytest.mark.parametrize("jq", [True, False])
     async def test_no_running_job_queue_warning(self, app, bot, user1, recwarn, jq):
         handler = ConversationHandler(
@@ -1600,6 +1683,257 @@ class TestConversationHandler:
 
             await app.stop()
 
+    async def test_conversation_timeout_single_job(self, app, bot):
+        timed_out = []
+
+        async def timeout(update, context):
+            timed_out.append(update.effective_user.id)
+
+        handler = ConversationHandler(
+            entry_points=[CommandHandler("start", self.start)],
+            states={ConversationHandler.TIMEOUT: [TypeHandler(Update, timeout)]},
+            fallbacks=[],
+            conversation_timeout=0.5,
+        )
+        app.add_handler(handler)
+
+        def start_update(user_id):
+            message = Message(
+                0,
+                None,
+                self.group,
+                from_user=User(user_id, "user", False),
+                text="/start",
+                entities=[
+                    MessageEntity(type=MessageEntity.BOT_COMMAND, offset=0, length=len("/start"))
+                ],
+            )
+            message.set_bot(bot)
+            return Update(0, message=message)
+
+        async with app:
+            await app.start()
+
+            for user_id in range(100):
+                await app.process_update(start_update(user_id))
+            # The timeouts of all conversations are checked by a single job
+            assert len(app.job_queue.jobs()) == 1
+            # Extending the timeout of a conversation moves it to the end of the queue and does
+            # not schedule another job
+            await app.process_update(start_update(0))
+            assert len(app.job_queue.jobs()) == 1
+            assert list(handler._timeouts)[-1] == (self.group.id, 0)
+
+            await asyncio.sleep(1)
+            assert timed_out == [*range(1, 100), 0]
+            assert app.job_queue.jobs() == ()
+
+            await app.stop()
+
+    async def test_conversation_timeout_cancelled_before_trigger(self, app, bot):
+        timed_out = []
+
+        async def timeout(update, context):
+            timed_out.append(update)
+
+        handler = ConversationHandler(
+            entry_points=[CommandHandler("start", self.start)],
+            states={
+                self.THIRSTY: [CommandHandler("start", self.start)],
+                ConversationHandler.TIMEOUT: [TypeHandler(Update, timeout)],
+            },
+            fallbacks=[],
+            conversation_timeout=5,
+        )
+        app.add_handler(handler)
+        key = (self.group.id, 1)
+
+        async with app:
+            await app.start()
+            await app.process_update(self._start_update(bot, 1))
+            # Simulate that the timeout expired and a new update arrived before it was triggered
+            ctxt = handler._timeouts.pop(key)
+            handler._expired_timeouts[key] = ctxt
+            await app.process_update(self._start_update(bot, 1))
+            await handler._trigger_timeout(SimpleNamespace(job=SimpleNamespace(data=ctxt)))
+
+            assert timed_out == []
+            assert handler._conversations[key] == self.THIRSTY
+            assert handler._timeouts[key] is not ctxt
+            assert not handler._expired_timeouts
+            await app.stop()
+
+    async def test_conversation_timeout_non_blocking_update_during_trigger(self, app, bot):
+        # An update that is handled by a non-blocking handler while the TIMEOUT handlers run
+        # must not be overwritten by ending the conversation
+        timeout_running = asyncio.Event()
+        resume_timeout = asyncio.Event()
+        resume_handler = asyncio.Event()
+
+        async def timeout(update, context):
+            timeout_running.set()
+            await resume_timeout.wait()
+
+        async def slow_start(update, context):
+            await resume_handler.wait()
+            return self.BREWING
+
+        handler = ConversationHandler(
+            entry_points=[CommandHandler("start", self.start)],
+            states={
+                self.THIRSTY: [CommandHandler("brew", slow_start, block=False)],
+                self.BREWING: [CommandHandler("start", self.start)],
+                ConversationHandler.TIMEOUT: [TypeHandler(Update, timeout)],
+            },
+            fallbacks=[],
+            conversation_timeout=0.2,
+        )
+        app.add_handler(handler)
+        key = (self.group.id, 1)
+
+        async with app:
+            await app.start()
+            await app.process_update(self._start_update(bot, 1))
+            await asyncio.wait_for(timeout_running.wait(), 2)
+            await app.process_update(self._start_update(bot, 1, "/brew"))
+            assert isinstance(handler._conversations[key], PendingState)
+
+            resume_timeout.set()
+            await asyncio.sleep(0.05)
+            # The conversation was not ended
+            assert isinstance(handler._conversations[key], PendingState)
+            assert not handler._expired_timeouts
+
+            resume_handler.set()
+            await asyncio.sleep(0.05)
+            assert handler.check_update(self._start_update(bot, 1))[0] == self.BREWING
+            await app.stop()
+
+    async def test_timeout_jobs_deprecated(self, app, bot):
+        handler = ConversationHandler(
+            entry_points=[CommandHandler("start", self.start)],
+            states={},
+            fallbacks=[],
+            conversation_timeout=5,
+        )
+        app.add_handler(handler)
+
+        async with app:
+            await app.start()
+            with pytest.warns(PTBDeprecationWarning, match="timeout_jobs") as record:
+                assert handler.timeout_jobs == {}
+            assert record[0].filename == __file__, "wrong stacklevel!"
+
+            await app.process_update(self._start_update(bot, 1))
+            with pytest.warns(PTBDeprecationWarning):
+                timeout_jobs = handler.timeout_jobs
+            assert timeout_jobs == {(self.group.id, 1): handler._timeout_job}
+            with pytest.raises(TypeError):
+                timeout_jobs[(self.group.id, 2)] = None
+            await app.stop()
+
+    def _start_update(self, bot, user_id, text="/start"):
+        message = Message(
+            0,
+            None,
+            self.group,
+            from_user=User(user_id, "user", False),
+            text=text,
+            entities=(
+                [MessageEntity(type=MessageEntity.BOT_COMMAND, offset=0, length=len(text))]
+                if text.startswith("/")
+                else []
+            ),
+        )
+        message.set_bot(bot)
+        return Update(0, message=message)
+
+    async def test_max_conversations(self, app, bot):
+        handler = ConversationHandler(
+            entry_points=[CommandHandler("start", self.start)],
+            states=self.states,
+            fallbacks=[CommandHandler("end", self.end)],
+            max_conversations=2,
+        )
+        app.add_handler(handler)
+
+        async with app:
+            await app.process_update(self._start_update(bot, 1))
+            await app.process_update(self._start_update(bot, 2))
+            # Activity of the first conversation makes the second one the least recently active
+            await app.process_update(self._start_update(bot, 1, "/brew"))
+            await app.process_update(self._start_update(bot, 3))
+
+            assert handler.active_conversations == 2
+            assert handler.evicted_conversations == 1
+            assert handler._conversations == {
+                (self.group.id, 1): self.BREWING,
+                (self.group.id, 3): self.THIRSTY,
+            }
+
+            # Conversations that ended don't count towards the limit
+            await app.process_update(self._start_update(bot, 1, "/end"))
+            await app.process_update(self._start_update(bot, 4))
+            assert handler.active_conversations == 2
+            assert handler.evicted_conversations == 1
+
+    async def test_conversation_ttl(self, app, bot):
+        handler = ConversationHandler(
+            entry_points=[CommandHandler("start", self.start)],
+            states=self.states,
+            fallbacks=[],
+            conversation_ttl=0.2,
+        )
+        app.add_handler(handler)
+
+        async with app:
+            await app.process_update(self._start_update(bot, 1))
+            await app.process_update(self._start_update(bot, 2))
+            await asyncio.sleep(0.15)
+            await app.process_update(self._start_update(bot, 2, "/brew"))
+            await asyncio.sleep(0.1)
+
+            # The first conversation is dropped on the next update, without a job queue
+            assert handler.active_conversations == 2
+            await app.process_update(self._start_update(bot, 3, "not a command"))
+            assert handler._conversations == {(self.group.id, 2): self.BREWING}
+            assert handler.evicted_conversations == 1
+
+            # The dropped conversation starts over
+            await app.process_update(self._start_update(bot, 1, "/brew"))
+            assert (self.group.id, 1) not in handler._conversations
+
+    async def test_max_conversations_keeps_pending(self, app, bot):
+        event = asyncio.Event()
+
+        async def slow_start(update, context):
+            await event.wait()
+            return self.THIRSTY
+
+        handler = ConversationHandler(
+            entry_points=[CommandHandler("start", slow_start, block=False)],
+            states=self.states,
+            fallbacks=[],
+            max_conversations=1,
+        )
+        app.add_handler(handler)
+
+        async with app:
+            await app.start()
+            await app.process_update(self._start_update(bot, 1))
+            await app.process_update(self._start_update(bot, 2))
+            await asyncio.sleep(0.05)
+            # Both conversations wait for the callback, so none of them is dropped
+            assert handler.active_conversations == 2
+            assert handler.evicted_conversations == 0
+
+            event.set()
+            await asyncio.sleep(0.05)
+            await app.process_update(self._start_update(bot, 3, "not a command"))
+            assert handler.active_conversations == 1
+            assert handler.evicted_conversations == 1
+            await app.stop()
+
     async def test_conversation_handler_timeout_state(self, app, bot, user1):
         states = self.states
         states.update(
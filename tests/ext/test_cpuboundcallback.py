@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import operator
+
+import pytest
+
+from telegram.ext import ApplicationBuilder, CPUBoundCallback, MessageHandler, filters
+from tests.auxil.build_messages import make_message_update
+from tests.auxil.slots import mro_slots
+
+
+@pytest.fixture
+async def app(one_time_bot):
+    application = ApplicationBuilder().bot(one_time_bot).process_pool_size(1).build()
+    async with application:
+        await application.start()
+        yield application
+        await application.stop()
+
+
+class TestCPUBoundCallback:
+    def test_slot_behaviour(self):
+        inst = CPUBoundCallback(len)
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_init(self):
+        async def result_callback(update, context, result):
+            pass
+
+        callback = CPUBoundCallback(len, result_callback)
+        assert callback.func is len
+        assert callback.result_callback is result_callback
+        assert CPUBoundCallback(len).result_callback is None
+
+    def test_repr(self):
+        assert repr(CPUBoundCallback(len)) == "CPUBoundCallback[func=len]"
+        handler = MessageHandler(filters.ALL, CPUBoundCallback(len))
+        assert repr(handler) == "MessageHandler[callback=CPUBoundCallback[func=len]]"
+
+    async def test_result_callback(self, app):
+        results = []
+
+        async def result_callback(update, context, result):
+            results.append((update, context.application, result))
+            return "next_state"
+
+        callback = CPUBoundCallback(operator.attrgetter("message.text"), result_callback)
+        update = make_message_update("some text")
+        context = app.context_types.context.from_update(update, app)
+        assert await callback(update, context) == "next_state"
+        assert results == [(update, app, "some text")]
+
+    async def test_without_result_callback(self, app):
+        callback = CPUBoundCallback(operator.attrgetter("message.text"))
+        update = make_message_update("some text")
+        context = app.context_types.context.from_update(update, app)
+        assert await callback(update, context) is None
+
+    async def test_error_handling(self, app):
+        errors = []
+
+        async def error_handler(update, context):
+            errors.append((update, context.error))
+
+        app.add_handler(MessageHandler(filters.ALL, CPUBoundCallback(operator.attrgetter("foo"))))
+        app.add_error_handler(error_handler)
+        update = make_message_update("some text")
+        await app.process_update(update)
+
+        assert len(errors) == 1
+        assert errors[0][0] == update
+        assert isinstance(errors[0][1], AttributeError)
@@ -322,6 +322,20 @@ class TestDictPersistence:
             == DictPersistence._encode_conversations_to_json({"name1": {(123, 123): 5}})
         )
 
+    async def test_update_conversations(self):
+        conversations_json = DictPersistence._encode_conversations_to_json({"name": {(1, 1): 1}})
+        dict_persistence = DictPersistence(conversations_json=conversations_json)
+
+        # The json is only dropped if something changed
+        await dict_persistence.update_conversations("name", {(1, 1): 1, (2, 2): None})
+        assert dict_persistence._conversations_json == conversations_json
+
+        await dict_persistence.update_conversations("name", {(1, 1): 2, (2, 2): 3})
+        assert dict_persistence.conversations == {"name": {(1, 1): 2, (2, 2): 3}}
+        assert dict_persistence.conversations_json == (
+            DictPersistence._encode_conversations_to_json({"name": {(1, 1): 2, (2, 2): 3}})
+        )
+
     async def test_no_data_on_init(
         self, bot_data, user_data, chat_data, conversations, callback_data
     ):
@@ -404,6 +404,91 @@ class TestFilters:
         result = inv.check_update(update)
         assert result
 
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "nothing to see",
+            "please help me",
+            "HELP and price",
+            "price? help!",
+            "aa bb",
+            "foo bar",
+            "multi\nline",
+            "helpful helper",
+            "what's the price.list?",
+            "",
+        ],
+    )
+    def test_regex_set(self, update, text):
+        patterns = [
+            r"\bhelp\b",
+            r"\bhelper\b",
+            "helpful",
+            r"price\.list",
+            re.compile("PRICE", re.IGNORECASE),
+            r"(\w)\1",  # backreferences can't be combined
+            "(?i)HELP",  # neither can global inline flags
+            r"(?P<word>foo)",
+            r"(?P<word>bar)",  # duplicate group name
+            re.compile("^line", re.MULTILINE),
+            re.compile("price", re.ASCII),  # unsupported flag
+            "e",
+        ]
+        regex_set = filters.RegexSet(patterns)
+        assert len(regex_set) == len(patterns)
+        update.message.text = text
+
+        for pattern, regex_filter in zip(patterns, regex_set.filters):
+            assert isinstance(regex_filter, filters.Regex)
+            expected = filters.Regex(pattern).check_update(update)
+            result = regex_filter.check_update(update)
+            assert bool(result) == bool(expected)
+            if expected:
+                assert result["matches"][0].span() == expected["matches"][0].span()
+                assert result["matches"][0].re is expected["matches"][0].re
+
+        first = None
+        for pattern in patterns:
+            match = re.compile(pattern).search(text)
+            if match and (first is None or match.start() < first[1].start()):
+                first = (pattern, match)
+        result = regex_set.search(text)
+        if first is None:
+            assert result is None
+        else:
+            assert result[0].pattern.pattern == re.compile(first[0]).pattern
+            assert result[1].span() == first[1].span()
+
+        expected_all = [
+            (regex_filter, match)
+            for regex_filter, pattern in zip(regex_set.filters, patterns)
+            if (match := re.compile(pattern).search(text))
+        ]
+        result_all = regex_set.search_all(text)
+        assert [regex_filter for regex_filter, _ in result_all] == [
+            regex_filter for regex_filter, _ in expected_all
+        ]
+        assert [match.span() for _, match in result_all] == [
+            match.span() for _, match in expected_all
+        ]
+
+    def test_regex_set_add(self, update):
+        regex_set = filters.RegexSet()
+        assert regex_set.search("abc") is None
+        assert regex_set.search_all("abc") == []
+        first = regex_set.add("b")
+        update.message.text = "abc"
+        assert first.check_update(update)
+        assert regex_set.search("abc")[0] is first
+
+        # Adding patterns resets the combined pattern
+        second = regex_set.add("a")
+        assert regex_set.filters == (first, second)
+        assert regex_set.search("abc")[0] is second
+        assert [regex_filter for regex_filter, _ in regex_set.search_all("abc")] == [first, second]
+        assert str(second) == "filters.Regex(re.compile('a'))"
+        assert (first & second).check_update(update)["matches"][1].group() == "a"
+
     def test_filters_caption_regex(self, update):
         sre_type = type(re.match("", ""))
         update.message.caption = "/start deep-linked param"
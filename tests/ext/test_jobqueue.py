@@ -23,6 +23,7 @@ import datetime as dtm
 import logging
 import platform
 import re
+import threading
 import time
 
 import pytest
@@ -173,6 +174,34 @@ class TestJobQueue:
         await asyncio.sleep(0.2)
         assert self.result == 1
 
+    async def test_run_once_sync_callback(self, job_queue):
+        threads = []
+
+        def callback(context):
+            threads.append(threading.current_thread())
+            self.result += 1
+
+        job_queue.run_once(callback, 0.05)
+        await asyncio.sleep(0.15)
+        assert self.result == 1
+        assert threads == [threading.current_thread()]
+
+    async def test_run_once_sync_callback_thread_pool(self, one_time_bot):
+        app = ApplicationBuilder().bot(one_time_bot).thread_pool_size(1).build()
+        threads = []
+
+        def callback(context):
+            threads.append(threading.current_thread())
+
+        async with app:
+            await app.job_queue.start()
+            app.job_queue.run_once(callback, 0.05)
+            await asyncio.sleep(0.15)
+            await app.job_queue.stop()
+
+        assert len(threads) == 1
+        assert threads[0].name.startswith("Application:")
+
     async def test_run_once_timezone(self, job_queue, timezone):
         """Test the correct handling of aware datetimes"""
         # we're parametrizing this with two different UTC offsets to exclude the possibility
@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+
+import pytest
+
+from telegram import CallbackQuery, Chat, Message, Update, User
+from telegram.ext import KeyedUpdateProcessor
+from tests.auxil.slots import mro_slots
+
+
+def make_update(update_id, chat_id=1, user_id=2):
+    return Update(
+        update_id,
+        message=Message(
+            update_id,
+            None,
+            Chat(chat_id, Chat.PRIVATE),
+            from_user=User(user_id, "user", False),
+            text="text",
+        ),
+    )
+
+
+class TestKeyedUpdateProcessor:
+    def test_slot_behaviour(self):
+        inst = KeyedUpdateProcessor(1)
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    @pytest.mark.parametrize("concurrent_updates", [0, -1])
+    def test_init(self, concurrent_updates):
+        processor = KeyedUpdateProcessor(3)
+        assert processor.max_concurrent_updates == 3
+        assert processor.pending_keys == 0
+        with pytest.raises(ValueError, match="must be a positive integer"):
+            KeyedUpdateProcessor(concurrent_updates)
+        with pytest.raises(ValueError, match="must be set"):
+            KeyedUpdateProcessor(3, per_chat=False)
+
+    @pytest.mark.parametrize(
+        ("per_chat", "per_user", "expected"),
+        [(True, False, (1,)), (False, True, (2,)), (True, True, (1, 2))],
+    )
+    def test_get_key(self, per_chat, per_user, expected):
+        processor = KeyedUpdateProcessor(1, per_chat=per_chat, per_user=per_user)
+        assert processor.get_key(make_update(1)) == expected
+        assert processor.get_key(object()) is None
+        assert processor.get_key(Update(1)) is None
+
+    def test_get_key_no_chat(self):
+        update = Update(
+            1,
+            callback_query=CallbackQuery("1", User(2, "user", False), "chat_instance"),
+        )
+        assert KeyedUpdateProcessor(1).get_key(update) is None
+        assert KeyedUpdateProcessor(1, per_chat=False, per_user=True).get_key(update) == (2,)
+
+    def test_get_key_custom(self):
+        processor = KeyedUpdateProcessor(1, per_chat=False, key=lambda u: u.update_id % 2)
+        assert processor.get_key(make_update(1)) == 1
+        assert processor.get_key(make_update(2)) == 0
+
+    async def test_sequential_within_key(self):
+        processor = KeyedUpdateProcessor(10)
+        order = []
+
+        async def callback(i, delay):
+            order.append(("start", i))
+            await asyncio.sleep(delay)
+            order.append(("end", i))
+
+        # The first update takes longest, but must still be completed first
+        await asyncio.gather(
+            *(
+                processor.process_update(make_update(i), callback(i, 0.1 - i * 0.02))
+                for i in range(4)
+            )
+        )
+        assert order == [(event, i) for i in range(4) for event in ("start", "end")]
+        assert processor.pending_keys == 0
+
+    async def test_concurrent_across_keys(self):
+        processor = KeyedUpdateProcessor(10)
+        running = 0
+        max_running = 0
+
+        async def callback():
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+
+        await asyncio.gather(
+            *(processor.process_update(make_update(i, chat_id=i), callback()) for i in range(5))
+        )
+        assert max_running == 5
+        assert processor.pending_keys == 0
+
+    async def test_unordered_updates(self):
+        processor = KeyedUpdateProcessor(10)
+        events = [asyncio.Event() for _ in range(3)]
+
+        async def callback(event):
+            await event.wait()
+
+        tasks = [
+            asyncio.create_task(processor.process_update(object(), callback(event)))
+            for event in events
+        ]
+        await asyncio.sleep(0.01)
+        assert processor.current_concurrent_updates == 3
+        assert processor.pending_keys == 0
+        for event in events:
+            event.set()
+        await asyncio.gather(*tasks)
+
+    async def test_waiting_updates_dont_occupy_slots(self):
+        processor = KeyedUpdateProcessor(2)
+        busy_event = asyncio.Event()
+        other_done = asyncio.Event()
+
+        async def busy():
+            await busy_event.wait()
+
+        async def other():
+            other_done.set()
+
+        # Chat 1 has three updates, the first of which blocks. The other two must not occupy
+        # the second slot, such that the update of chat 2 can be processed.
+        tasks = [
+            asyncio.create_task(processor.process_update(make_update(i), busy())) for i in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        assert processor.current_concurrent_updates == 1
+        assert processor.pending_keys == 1
+
+        await asyncio.wait_for(
+            processor.process_update(make_update(3, chat_id=2), other()), timeout=1
+        )
+        assert other_done.is_set()
+
+        busy_event.set()
+        await asyncio.gather(*tasks)
+        assert processor.current_concurrent_updates == 0
+        assert processor.pending_keys == 0
+
+    async def test_exception_releases_key(self):
+        processor = KeyedUpdateProcessor(1)
+        test_flag = False
+
+        async def raising():
+            raise RuntimeError("test")
+
+        async def callback():
+            nonlocal test_flag
+            test_flag = True
+
+        results = await asyncio.gather(
+            processor.process_update(make_update(1), raising()),
+            processor.process_update(make_update(2), callback()),
+            return_exceptions=True,
+        )
+        assert isinstance(results[0], RuntimeError)
+        assert test_flag
+        assert processor.pending_keys == 0
+        assert processor.current_concurrent_updates == 0
+
+    async def test_cancel_waiting_update(self):
+        processor = KeyedUpdateProcessor(2)
+        event = asyncio.Event()
+
+        async def callback():
+            await event.wait()
+
+        first = asyncio.create_task(processor.process_update(make_update(1), callback()))
+        await asyncio.sleep(0.01)
+        coroutine = callback()
+        second = asyncio.create_task(processor.process_update(make_update(2), coroutine))
+        await asyncio.sleep(0.01)
+        second.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        coroutine.close()
+
+        event.set()
+        await first
+        assert processor.pending_keys == 0
+        assert processor.current_concurrent_updates == 0
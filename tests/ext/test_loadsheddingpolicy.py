@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import datetime as dtm
+
+import pytest
+
+from telegram import Update
+from telegram.constants import UpdateType
+from telegram.ext import ApplicationBuilder, LoadSheddingPolicy, TypeHandler
+from telegram.ext._loadsheddingpolicy import _get_update_date
+from tests.auxil.build_messages import make_message, make_message_update
+from tests.auxil.slots import mro_slots
+
+
+def edited_update(update_id, date=None):
+    message = make_message("edited", date=date or dtm.datetime.now(dtm.timezone.utc))
+    return Update(update_id, edited_message=message)
+
+
+def message_update(update_id):
+    return Update(update_id, message=make_message("text"))
+
+
+class TestLoadSheddingPolicy:
+    def test_slot_behaviour(self):
+        inst = LoadSheddingPolicy([UpdateType.EDITED_MESSAGE], max_pending_updates=1)
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_init(self):
+        policy = LoadSheddingPolicy(
+            [UpdateType.EDITED_MESSAGE, UpdateType.CHAT_BOOST],
+            max_update_age=dtm.timedelta(minutes=1),
+        )
+        assert policy.update_types == {"edited_message", "chat_boost"}
+        assert policy.max_pending_updates is None
+        assert policy.max_update_age == 60
+        assert policy.sample_rate == 0
+        assert policy.degraded_handler is None
+        assert policy.shed_updates == 0
+        assert repr(policy) == (
+            "LoadSheddingPolicy[update_types=['chat_boost', 'edited_message'], shed_updates=0]"
+        )
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"update_types": [], "max_pending_updates": 1}, "must not be empty"),
+            ({"update_types": ["message"]}, "Either `max_pending_updates` or `max_update_age`"),
+            (
+                {"update_types": ["message"], "max_pending_updates": 1, "sample_rate": 1},
+                "in the range",
+            ),
+        ],
+    )
+    def test_init_errors(self, kwargs, match):
+        with pytest.raises(ValueError, match=match):
+            LoadSheddingPolicy(**kwargs)
+
+    def test_get_update_date(self):
+        date = dtm.datetime(2024, 1, 1, tzinfo=dtm.timezone.utc)
+        edit_date = dtm.datetime(2024, 1, 2, tzinfo=dtm.timezone.utc)
+        assert _get_update_date(make_message_update(make_message("text", date=date))) == date
+        assert (
+            _get_update_date(make_message_update(make_message("text", edit_date=edit_date)))
+            == edit_date
+        )
+        assert _get_update_date(Update(1)) is None
+        assert _get_update_date("not an update") is None
+
+    def test_should_shed_pending_updates(self):
+        policy = LoadSheddingPolicy([UpdateType.EDITED_MESSAGE], max_pending_updates=10)
+        update = edited_update(1)
+        assert not policy._should_shed(update, "message", 100)
+        assert not policy._should_shed(update, "edited_message", 9)
+        assert policy._should_shed(update, "edited_message", 10)
+        assert policy.dropped_updates == 1
+        assert policy.degraded_updates == 0
+
+    def test_should_shed_update_age(self):
+        policy = LoadSheddingPolicy([UpdateType.EDITED_MESSAGE], max_update_age=60)
+        old = dtm.datetime.now(dtm.timezone.utc) - dtm.timedelta(minutes=2)
+        assert not policy._should_shed(edited_update(1), "edited_message", 1000)
+        assert policy._should_shed(edited_update(1, date=old), "edited_message", 0)
+        # Updates without date are never too old
+        assert not policy._should_shed(Update(1), "edited_message", 0)
+
+    def test_should_shed_sample_rate(self, monkeypatch):
+        handler = TypeHandler(object, lambda update, context: None)
+        policy = LoadSheddingPolicy(
+            [UpdateType.EDITED_MESSAGE],
+            max_pending_updates=0,
+            sample_rate=0.5,
+            degraded_handler=handler,
+        )
+        monkeypatch.setattr("random.random", lambda: 0.4)
+        assert not policy._should_shed(edited_update(1), "edited_message", 0)
+        monkeypatch.setattr("random.random", lambda: 0.6)
+        assert policy._should_shed(edited_update(1), "edited_message", 0)
+        assert policy.degraded_updates == 1
+        assert policy.dropped_updates == 0
+
+    async def test_application_drops_updates(self, one_time_bot):
+        policy = LoadSheddingPolicy([UpdateType.EDITED_MESSAGE], max_pending_updates=2)
+        app = ApplicationBuilder().bot(one_time_bot).load_shedding_policies([policy]).build()
+        assert app.load_shedding_policies == (policy,)
+        processed = []
+
+        async def callback(update, context):
+            processed.append(update.update_id)
+
+        app.add_handler(TypeHandler(Update, callback))
+
+        async with app:
+            for update_id in range(1, 6):
+                await app.update_queue.put(edited_update(update_id))
+            await app.update_queue.put(message_update(6))
+            await app.start()
+            await asyncio.wait_for(app.update_queue.join(), timeout=5)
+            await app.stop()
+
+        # The first edited messages are dropped while at least 2 more updates are waiting
+        assert processed == [5, 6]
+        assert policy.dropped_updates == 4
+
+    async def test_application_degraded_handler(self, one_time_bot):
+        degraded = []
+        processed = []
+
+        async def degraded_callback(update, context):
+            degraded.append(update.update_id)
+
+        async def callback(update, context):
+            processed.append(update.update_id)
+
+        policy = LoadSheddingPolicy(
+            [UpdateType.EDITED_MESSAGE],
+            max_pending_updates=1,
+            degraded_handler=TypeHandler(Update, degraded_callback),
+        )
+        app = (
+            ApplicationBuilder()
+            .bot(one_time_bot)
+            .concurrent_updates(4)
+            .load_shedding_policies([policy])
+            .build()
+        )
+        app.add_handler(TypeHandler(Update, callback))
+
+        async with app:
+            await app.update_queue.put(edited_update(1))
+            await app.update_queue.put(edited_update(2))
+            await app.start()
+            await asyncio.wait_for(app.update_queue.join(), timeout=5)
+            await app.stop()
+
+        # The first update is shed since the second one is waiting. The second update is shed as
+        # the first one is still in progress when it's taken from the queue.
+        assert sorted(degraded) == [1, 2]
+        assert processed == []
+        assert policy.degraded_updates == 2
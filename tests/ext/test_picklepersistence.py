@@ -625,6 +625,28 @@ class TestPicklePersistence:
         assert pickle_persistence.conversations["name1"] == {(123, 123): 5}
         assert await pickle_persistence.get_conversations("name1") == {(123, 123): 5}
 
+    @pytest.mark.parametrize("single_file", [False, True])
+    async def test_update_conversations(
+        self, pickle_persistence, good_pickle_files, monkeypatch, single_file
+    ):
+        pickle_persistence.single_file = single_file
+        dumped = []
+        monkeypatch.setattr(PicklePersistence, "_dump_file", lambda *args: dumped.append(args))
+        monkeypatch.setattr(
+            PicklePersistence, "_dump_singlefile", lambda *args: dumped.append(args)
+        )
+
+        conversation1 = await pickle_persistence.get_conversations("name1")
+        changes = {(1, 1): 1, (2, 2): 2, (123, 123): None}
+        await pickle_persistence.update_conversations("name1", changes)
+        assert await pickle_persistence.get_conversations("name1") == {**conversation1, **changes}
+        # The file is written once for all changes
+        assert len(dumped) == 1
+
+        # Nothing is written if nothing changed
+        await pickle_persistence.update_conversations("name1", changes)
+        assert len(dumped) == 1
+
     async def test_updating_single_file(self, pickle_persistence, good_pickle_files):
         pickle_persistence.single_file = True
 
@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+
+import pytest
+
+from telegram import CallbackQuery, Chat, Message, MessageReactionCountUpdated, Update, User
+from telegram.ext import ApplicationBuilder, PriorityUpdateProcessor, TypeHandler
+from tests.auxil.slots import mro_slots
+
+USER = User(1, "user", False)
+CHAT = Chat(1, Chat.PRIVATE)
+
+
+def callback_query_update(update_id):
+    return Update(update_id, callback_query=CallbackQuery(str(update_id), USER, "instance"))
+
+
+def message_update(update_id):
+    return Update(update_id, message=Message(update_id, None, CHAT, text="text"))
+
+
+def reaction_update(update_id):
+    return Update(update_id, message_reaction_count=MessageReactionCountUpdated(CHAT, 1, None, []))
+
+
+class TestPriorityUpdateProcessor:
+    def test_slot_behaviour(self):
+        inst = PriorityUpdateProcessor(1)
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_init(self):
+        processor = PriorityUpdateProcessor(3)
+        assert processor.max_concurrent_updates == 3
+        assert processor.weights == (4, 2, 1)
+        assert processor.waiting_updates == (0, 0, 0)
+        # Updates have to be dispatched concurrently to be reordered
+        assert PriorityUpdateProcessor(1).concurrent_dispatch
+
+        with pytest.raises(ValueError, match="must be a positive integer"):
+            PriorityUpdateProcessor(0)
+        with pytest.raises(ValueError, match="non-empty sequence"):
+            PriorityUpdateProcessor(1, weights=())
+        with pytest.raises(ValueError, match="non-empty sequence"):
+            PriorityUpdateProcessor(1, weights=(1, 0))
+        with pytest.raises(ValueError, match="defined by `weights`"):
+            PriorityUpdateProcessor(1, weights=(1,))
+        # No error if a classifier is passed
+        PriorityUpdateProcessor(1, weights=(1,), classifier=lambda _: 0)
+
+    def test_get_lane(self):
+        processor = PriorityUpdateProcessor(1)
+        assert processor.get_lane(callback_query_update(1)) == 0
+        assert processor.get_lane(message_update(1)) == 1
+        assert processor.get_lane(reaction_update(1)) == 2
+        assert processor.get_lane(object()) == 2
+
+        processor = PriorityUpdateProcessor(1, weights=(2, 1), lanes={"message": 0})
+        assert processor.get_lane(message_update(1)) == 0
+        assert processor.get_lane(callback_query_update(1)) == 1
+
+    def test_get_lane_classifier(self):
+        processor = PriorityUpdateProcessor(1, weights=(1, 1), classifier=lambda u: u)
+        assert processor.get_lane(0) == 0
+        assert processor.get_lane(1) == 1
+        # Out of range values are clamped
+        assert processor.get_lane(-5) == 0
+        assert processor.get_lane(5) == 1
+
+    async def _run(self, processor, updates):
+        order = []
+        event = asyncio.Event()
+
+        async def blocker():
+            await event.wait()
+
+        async def callback(update):
+            order.append(update)
+
+        # Occupy all slots, such that all other updates have to wait in the lanes
+        blockers = [
+            asyncio.create_task(processor.process_update(object(), blocker()))
+            for _ in range(processor.max_concurrent_updates)
+        ]
+        await asyncio.sleep(0.01)
+        tasks = [
+            asyncio.create_task(processor.process_update(update, callback(update)))
+            for update in updates
+        ]
+        await asyncio.sleep(0.01)
+        event.set()
+        await asyncio.gather(*blockers, *tasks)
+        assert processor.current_concurrent_updates == 0
+        assert processor.waiting_updates == tuple(0 for _ in processor.weights)
+        return order
+
+    async def test_priority(self):
+        processor = PriorityUpdateProcessor(1)
+        reactions = [reaction_update(i) for i in range(3)]
+        queries = [callback_query_update(i) for i in range(3, 5)]
+        messages = [message_update(i) for i in range(5, 7)]
+
+        order = await self._run(processor, reactions + messages + queries)
+        assert order == queries + messages + reactions
+
+    async def test_weights(self):
+        processor = PriorityUpdateProcessor(1, weights=(3, 1), classifier=lambda u: u[0])
+        updates = [(0, i) for i in range(6)] + [(1, i) for i in range(3)]
+
+        order = await self._run(processor, updates)
+        # The low-priority lane gets one update per round of four updates
+        assert order == [
+            (0, 0),
+            (0, 1),
+            (0, 2),
+            (1, 0),
+            (0, 3),
+            (0, 4),
+            (0, 5),
+            (1, 1),
+            (1, 2),
+        ]
+
+    async def test_waiting_updates(self):
+        processor = PriorityUpdateProcessor(1)
+        event = asyncio.Event()
+
+        async def blocker():
+            await event.wait()
+
+        tasks = [
+            asyncio.create_task(processor.process_update(update, blocker()))
+            for update in (object(), callback_query_update(1), object(), object())
+        ]
+        await asyncio.sleep(0.01)
+        assert processor.current_concurrent_updates == 1
+        assert processor.waiting_updates == (1, 0, 2)
+        event.set()
+        await asyncio.gather(*tasks)
+        assert processor.waiting_updates == (0, 0, 0)
+
+    async def test_cancel_waiting_update(self):
+        processor = PriorityUpdateProcessor(1)
+        event = asyncio.Event()
+        test_flag = False
+
+        async def blocker():
+            await event.wait()
+
+        async def callback():
+            nonlocal test_flag
+            test_flag = True
+
+        first = asyncio.create_task(processor.process_update(object(), blocker()))
+        await asyncio.sleep(0.01)
+        coroutine = blocker()
+        second = asyncio.create_task(processor.process_update(object(), coroutine))
+        third = asyncio.create_task(processor.process_update(object(), callback()))
+        await asyncio.sleep(0.01)
+        second.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        coroutine.close()
+
+        event.set()
+        await asyncio.gather(first, third)
+        assert test_flag
+        assert processor.current_concurrent_updates == 0
+
+        # The fast path is used again once nobody waits
+        await processor.process_update(object(), callback())
+        assert processor.current_concurrent_updates == 0
+
+    async def test_application_reorders_with_single_slot(self, one_time_bot):
+        processor = PriorityUpdateProcessor(1)
+        app = ApplicationBuilder().bot(one_time_bot).concurrent_updates(processor).build()
+        order = []
+        event = asyncio.Event()
+
+        async def callback(update, _):
+            if update == "blocker":
+                await event.wait()
+            else:
+                order.append(update)
+
+        app.add_handler(TypeHandler(object, callback))
+        reaction, query = reaction_update(1), callback_query_update(2)
+        async with app:
+            await app.start()
+            await app.update_queue.put("blocker")
+            await asyncio.sleep(0.05)
+            await app.update_queue.put(reaction)
+            await app.update_queue.put(query)
+            await asyncio.sleep(0.05)
+            event.set()
+            await asyncio.sleep(0.05)
+            await app.stop()
+
+        assert order == [query, reaction]
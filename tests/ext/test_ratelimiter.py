@@ -34,9 +34,10 @@ import pytest
 from telegram import BotCommand, Chat, Message, User
 from telegram.constants import ParseMode
 from telegram.error import RetryAfter
-from telegram.ext import AIORateLimiter, BaseRateLimiter, Defaults, ExtBot
+from telegram.ext import AIORateLimiter, BaseRateLimiter, Defaults, ExtBot, RateLimiterStatistics
 from telegram.request import BaseRequest, RequestData
 from tests.auxil.envvars import GITHUB_ACTIONS, TEST_WITH_OPT_DEPS
+from tests.auxil.slots import mro_slots
 
 
 @pytest.mark.skipif(
@@ -138,6 +139,100 @@ class TestBaseRateLimiter:
             else:
                 assert value == self.request_received[3][1][key]
 
+    def test_statistics_default(self):
+        class TestRateLimiter(BaseRateLimiter):
+            async def initialize(self) -> None:
+                pass
+
+            async def shutdown(self) -> None:
+                pass
+
+            async def process_request(self, *args, **kwargs):
+                pass
+
+        assert TestRateLimiter().statistics is None
+
+
+class TestRateLimiterStatistics:
+    def test_slot_behaviour(self):
+        inst = RateLimiterStatistics()
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    @pytest.mark.parametrize("max_samples", [0, -1])
+    def test_invalid_max_samples(self, max_samples):
+        with pytest.raises(ValueError, match="positive integer"):
+            RateLimiterStatistics(max_samples=max_samples)
+
+    async def test_initial_values(self):
+        statistics = RateLimiterStatistics()
+        assert statistics.received_requests == 0
+        assert statistics.started_requests == 0
+        assert statistics.completed_requests == 0
+        assert statistics.pending_requests == 0
+        assert statistics.queue_depths == {}
+        assert statistics.retry_after_count == 0
+        assert statistics.retry_count == 0
+        assert statistics.mean_wait_time == 0
+        assert statistics.max_wait_time == 0
+        assert statistics.wait_times == ()
+        assert statistics.throughput == 0
+        assert statistics.wait_time_percentile(50) == 0
+
+    async def test_request_lifecycle(self):
+        statistics = RateLimiterStatistics()
+        received_group = statistics.request_received(-1)
+        received_private = statistics.request_received()
+        statistics.request_received(-1)
+        assert statistics.received_requests == 3
+        assert statistics.pending_requests == 3
+        assert statistics.queue_depths == {-1: 2, None: 1}
+
+        with pytest.raises(TypeError):
+            statistics.queue_depths[-1] = 0
+
+        await asyncio.sleep(0.05)
+        statistics.request_started(received_group, -1)
+        statistics.request_started(received_private)
+        assert statistics.started_requests == 2
+        assert statistics.queue_depths == {-1: 1}
+        assert statistics.max_wait_time >= 0.05
+        assert len(statistics.wait_times) == 2
+
+        statistics.retry_after_received()
+        statistics.request_retried()
+        statistics.request_finished(True, -1)
+        statistics.request_finished(True)
+        # A request that was never sent, e.g. because of cancellation
+        statistics.request_finished(False, -1)
+        assert statistics.completed_requests == 2
+        assert statistics.pending_requests == 0
+        assert statistics.queue_depths == {}
+        assert statistics.retry_after_count == 1
+        assert statistics.retry_count == 1
+        assert statistics.throughput == pytest.approx(2 / 0.05, rel=0.5)
+
+    async def test_max_samples(self):
+        statistics = RateLimiterStatistics(max_samples=2)
+        for _ in range(3):
+            statistics.request_started(statistics.request_received())
+        assert len(statistics.wait_times) == 2
+        assert statistics.started_requests == 3
+
+    async def test_wait_time_percentile(self):
+        statistics = RateLimiterStatistics()
+        statistics._wait_times.extend([4.0, 1.0, 3.0, 2.0])
+        assert statistics.wait_time_percentile(0) == 1.0
+        assert statistics.wait_time_percentile(50) == 2.0
+        assert statistics.wait_time_percentile(75) == 3.0
+        assert statistics.wait_time_percentile(100) == 4.0
+
+    @pytest.mark.parametrize("percentile", [-1, 100.1])
+    def test_wait_time_percentile_invalid(self, percentile):
+        with pytest.raises(ValueError, match="between 0 and 100"):
+            RateLimiterStatistics().wait_time_percentile(percentile)
+
 
 @pytest.mark.skipif(
     not TEST_WITH_OPT_DEPS, reason="Only relevant if the optional dependency is installed"
@@ -249,6 +344,46 @@ class TestAIORateLimiter:
         await asyncio.sleep(1.1)
         assert isinstance(task_2.exception(), RetryAfter)
 
+    async def test_statistics(self, bot):
+        rate_limiter = AIORateLimiter(max_retries=2, overall_max_rate=0, group_max_rate=0)
+        assert isinstance(rate_limiter.statistics, RateLimiterStatistics)
+        assert rate_limiter.statistics is rate_limiter.statistics
+
+        bot = ExtBot(
+            token=bot.token,
+            request=self.CountRequest(retry_after=1),
+            rate_limiter=rate_limiter,
+        )
+        with pytest.raises(RetryAfter):
+            await bot.get_me()
+
+        statistics = rate_limiter.statistics
+        assert statistics.received_requests == 1
+        assert statistics.started_requests == 1
+        assert statistics.completed_requests == 1
+        assert statistics.pending_requests == 0
+        assert statistics.retry_after_count == 3
+        assert statistics.retry_count == 2
+
+    async def test_statistics_queue_depths(self, bot):
+        rate_limiter = AIORateLimiter(group_max_rate=1, group_time_period=1 / 2)
+        rl_bot = ExtBot(
+            token=bot.token, request=self.CountRequest(retry_after=None), rate_limiter=rate_limiter
+        )
+        async with rl_bot:
+            tasks = [
+                asyncio.create_task(rl_bot.send_message(chat_id=-1, text="test")) for _ in range(3)
+            ]
+            await asyncio.sleep(0.1)
+            assert rate_limiter.statistics.queue_depths == {-1: 2}
+
+            await asyncio.gather(*tasks)
+            statistics = rate_limiter.statistics
+            assert statistics.queue_depths == {}
+            # 3 x send_message + get_me from `async with rl_bot`
+            assert statistics.completed_requests == 4
+            assert statistics.max_wait_time == pytest.approx(1, abs=0.2)
+
     @pytest.mark.parametrize("group_id", [-1, "-1", "@username"])
     @pytest.mark.parametrize("chat_id", [1, "1"])
     async def test_basic_rate_limiting(self, bot, group_id, chat_id):
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import time
+
+import pytest
+
+from telegram.ext import AIORateLimiter, BaseRateLimiter, RateLimiterSimulator
+from tests.auxil.envvars import TEST_WITH_OPT_DEPS
+from tests.auxil.slots import mro_slots
+
+
+class PassThroughRateLimiter(BaseRateLimiter):
+    """Doesn't limit anything and hence runs into the flood limits of the simulated API"""
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    async def process_request(self, callback, args, kwargs, endpoint, data, rate_limit_args):
+        return await callback(*args, **kwargs)
+
+
+class SleepingRateLimiter(PassThroughRateLimiter):
+    async def process_request(self, callback, args, kwargs, endpoint, data, rate_limit_args):
+        await asyncio.sleep(rate_limit_args)
+        return await callback(*args, **kwargs)
+
+
+class TestRateLimiterSimulator:
+    def test_slot_behaviour(self):
+        inst = RateLimiterSimulator(PassThroughRateLimiter)
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_negative_request_duration(self):
+        with pytest.raises(ValueError, match="must not be negative"):
+            RateLimiterSimulator(PassThroughRateLimiter, request_duration=-1)
+
+    def test_virtual_clock(self):
+        simulator = RateLimiterSimulator(SleepingRateLimiter, request_duration=1)
+        start = time.perf_counter()
+        statistics = simulator.run(
+            [(3600, {"chat_id": 1}), (0, {"chat_id": 2})], rate_limit_args=60
+        )
+        # More than an hour of simulated time must not take any real time
+        assert time.perf_counter() - start < 1
+
+        assert statistics.received_requests == 2
+        assert statistics.completed_requests == 2
+        assert statistics.wait_times == pytest.approx((60, 60))
+        assert statistics.max_wait_time == pytest.approx(60)
+        # 2 requests from t=0 to t=3600 + 60 + 1
+        assert statistics.throughput == pytest.approx(2 / 3661)
+
+    def test_empty_run(self):
+        statistics = RateLimiterSimulator(PassThroughRateLimiter).run([])
+        assert statistics.received_requests == 0
+        assert statistics.throughput == 0
+
+    @pytest.mark.parametrize(
+        ("chat_id", "retry_afters"),
+        [(-1, 2), ("-1", 2), ("@channel", 2), (1, 0), (None, 0)],
+        ids=["group", "group-str", "channel", "private", "no chat_id"],
+    )
+    def test_group_flood_limit(self, chat_id, retry_afters):
+        simulator = RateLimiterSimulator(PassThroughRateLimiter, api_group_max_rate=3)
+        data = {} if chat_id is None else {"chat_id": chat_id}
+        statistics = simulator.run([(0, data)] * 5)
+        assert statistics.received_requests == 5
+        assert statistics.completed_requests == 5
+        assert statistics.retry_after_count == retry_afters
+        assert statistics.retry_count == 0
+        assert statistics.pending_requests == 0
+
+    def test_overall_flood_limit(self):
+        simulator = RateLimiterSimulator(
+            PassThroughRateLimiter, api_overall_max_rate=10, api_overall_time_period=1
+        )
+        statistics = simulator.run([(0, {"chat_id": i}) for i in range(15)])
+        assert statistics.retry_after_count == 5
+
+    def test_paid_broadcast_flood_limit(self):
+        simulator = RateLimiterSimulator(PassThroughRateLimiter, api_overall_max_rate=1)
+        statistics = simulator.run(
+            [(0, {"chat_id": i, "allow_paid_broadcast": True}) for i in range(100)]
+        )
+        assert statistics.retry_after_count == 0
+
+    def test_run_in_running_loop(self):
+        async def run():
+            RateLimiterSimulator(PassThroughRateLimiter).run([(0, {})])
+
+        with pytest.raises(RuntimeError, match="event loop is running"):
+            asyncio.run(run())
+
+    @pytest.mark.skipif(
+        not TEST_WITH_OPT_DEPS, reason="Only relevant if the optional dependency is installed"
+    )
+    def test_aioratelimiter(self):
+        def run_simulation():
+            simulator = RateLimiterSimulator(lambda: AIORateLimiter(max_retries=3))
+            traffic = [(i / 10, {"chat_id": -1}) for i in range(40)] + [
+                (i / 20, {"chat_id": i}) for i in range(200)
+            ]
+            return simulator.run(traffic)
+
+        statistics = run_simulation()
+        assert statistics.received_requests == 240
+        assert statistics.completed_requests == 240
+        assert statistics.pending_requests == 0
+        # 40 group messages can't be sent within 4 seconds with 20 messages per minute
+        assert statistics.max_wait_time > 30
+        assert statistics.wait_time_percentile(50) < 1
+
+        # The simulation is deterministic
+        other = run_simulation()
+        assert other.wait_times == statistics.wait_times
+        assert other.throughput == statistics.throughput
+
+    @pytest.mark.skipif(
+        not TEST_WITH_OPT_DEPS, reason="Only relevant if the optional dependency is installed"
+    )
+    def test_aioratelimiter_no_retry_after(self):
+        simulator = RateLimiterSimulator(AIORateLimiter)
+        statistics = simulator.run([(i / 20, {"chat_id": i}) for i in range(200)])
+        assert statistics.retry_after_count == 0
+        assert statistics.max_wait_time == 0
+
+    @pytest.mark.skipif(
+        not TEST_WITH_OPT_DEPS, reason="Only relevant if the optional dependency is installed"
+    )
+    def test_aioratelimiter_retries(self):
+        simulator = RateLimiterSimulator(
+            lambda: AIORateLimiter(max_retries=3, group_max_rate=100), api_group_max_rate=20
+        )
+        statistics = simulator.run([(0, {"chat_id": -1})] * 25)
+        assert statistics.completed_requests == 25
+        assert statistics.retry_after_count > 0
+        assert statistics.retry_count > 0
@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import os
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+
+from telegram import CallbackQuery, Update, User
+from telegram.ext import ApplicationBuilder, MessageHandler, ShardedApplication, Updater, filters
+from tests.auxil.build_messages import make_message_update
+from tests.auxil.ci_bots import BOT_INFO_PROVIDER
+from tests.auxil.pytest_classes import make_bot
+from tests.auxil.slots import mro_slots
+
+OUTPUT_ENV_VAR = "PTB_TEST_SHARDED_APPLICATION_OUTPUT"
+
+
+async def record(update, _):
+    text = update.effective_message.text
+    output = Path(os.environ[OUTPUT_ENV_VAR])
+    if text == "crash" and not output.with_suffix(".crashed").exists():
+        output.with_suffix(".crashed").touch()
+        os._exit(1)
+    if text == "hang" and not output.with_suffix(".hung").exists():
+        output.with_suffix(".hung").touch()
+        # Blocks the event loop, such that no heartbeats are sent anymore
+        time.sleep(60)  # noqa: ASYNC251
+    with output.open("a") as file:
+        file.write(f"{os.getpid()} {update.effective_chat.id} {update.update_id}\n")
+
+
+def build_application():
+    # Runs in the worker processes
+    application = (
+        ApplicationBuilder()
+        .bot(make_bot(BOT_INFO_PROVIDER.get_info(), offline=True))
+        .updater(None)
+        .build()
+    )
+    application.add_handler(MessageHandler(filters.TEXT, record))
+    return application
+
+
+def make_update(update_id, chat_id, text="text"):
+    update = make_message_update(text)
+    update.message._unfreeze()
+    update.message.chat._unfreeze()
+    update.message.chat.id = chat_id
+    update._unfreeze()
+    update.update_id = update_id
+    return update
+
+
+def read_output(path):
+    results = defaultdict(list)
+    if path.exists():
+        for line in path.read_text().splitlines():
+            pid, chat_id, update_id = map(int, line.split())
+            results[chat_id].append((pid, update_id))
+    return results
+
+
+@pytest.fixture
+def output(tmp_path, monkeypatch):
+    path = tmp_path / "output.txt"
+    monkeypatch.setenv(OUTPUT_ENV_VAR, str(path))
+    return path
+
+
+@pytest.fixture
+def updater(bot_info):
+    return Updater(bot=make_bot(bot_info, offline=True), update_queue=asyncio.Queue())
+
+
+class TestShardedApplication:
+    def test_slot_behaviour(self, updater):
+        inst = ShardedApplication(build_application, updater, 2)
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_init(self, updater):
+        sharded = ShardedApplication(build_application, updater, 3)
+        assert sharded.updater is updater
+        assert sharded.workers == 3
+        assert sharded.worker_pids == (None, None, None)
+        assert sharded.worker_restarts == (0, 0, 0)
+        assert not sharded.running
+        assert repr(sharded) == "ShardedApplication[workers=3]"
+
+        with pytest.raises(ValueError, match="must be a positive integer"):
+            ShardedApplication(build_application, updater, 0)
+
+    def test_get_shard(self, updater):
+        sharded = ShardedApplication(build_application, updater, 4)
+        shards = {sharded.get_shard(make_update(i, chat_id=i % 10)) for i in range(100)}
+        assert shards == {0, 1, 2, 3}
+        for chat_id in range(10):
+            assert len({sharded.get_shard(make_update(i, chat_id)) for i in range(10)}) == 1
+
+        # Falls back to the user
+        user = User(1, "user", False)
+        query_update = Update(1, callback_query=CallbackQuery("1", user, "chat_instance"))
+        assert len({sharded.get_shard(query_update) for _ in range(10)}) == 1
+
+        # Round-robin if there is no key
+        assert [sharded.get_shard(object()) for _ in range(8)] == [0, 1, 2, 3, 0, 1, 2, 3]
+
+    def test_get_shard_custom_key(self, updater):
+        sharded = ShardedApplication(build_application, updater, 4, key=lambda u: u % 2 or None)
+        assert sharded.get_shard(1) == sharded.get_shard(3)
+        assert [sharded.get_shard(2) for _ in range(4)] == [0, 1, 2, 3]
+
+    async def test_lifecycle_errors(self, updater):
+        sharded = ShardedApplication(build_application, updater, 1)
+        with pytest.raises(RuntimeError, match="not initialized"):
+            await sharded.start()
+        with pytest.raises(RuntimeError, match="not running"):
+            await sharded.stop()
+
+    async def test_distribute_updates(self, updater, output):
+        sharded = ShardedApplication(build_application, updater, 2, heartbeat_interval=0.1)
+        updates = [make_update(i, chat_id=i % 6) for i in range(30)]
+        async with sharded:
+            await sharded.start()
+            assert sharded.running
+            with pytest.raises(RuntimeError, match="already running"):
+                await sharded.start()
+            pids = sharded.worker_pids
+            assert all(pid is not None and pid != os.getpid() for pid in pids)
+
+            for update in updates:
+                await updater.update_queue.put(update)
+            # Stopping processes all pending updates
+            await sharded.stop(timeout=30)
+            assert not sharded.running
+            assert sharded.worker_pids == (None, None)
+
+        results = read_output(output)
+        assert sorted(results) == list(range(6))
+        for chat_id, processed in results.items():
+            # All updates of a chat are processed by the same worker in the original order
+            assert {pid for pid, _ in processed} == {pids[sharded.get_shard(updates[chat_id])]}
+            assert [update_id for _, update_id in processed] == list(range(chat_id, 30, 6))
+        assert {pid for processed in results.values() for pid, _ in processed} == set(pids)
+
+    @pytest.mark.parametrize("failure", ["crash", "hang"])
+    async def test_restart_worker(self, updater, output, failure):
+        sharded = ShardedApplication(
+            build_application, updater, 1, heartbeat_interval=0.1, heartbeat_timeout=3
+        )
+        async with sharded:
+            await sharded.start()
+            (pid,) = sharded.worker_pids
+            await updater.update_queue.put(make_update(1, chat_id=1))
+            await updater.update_queue.put(make_update(2, chat_id=1, text=failure))
+            await updater.update_queue.put(make_update(3, chat_id=1))
+
+            for _ in range(200):
+                await asyncio.sleep(0.1)
+                if sharded.worker_restarts == (1,):
+                    break
+            assert sharded.worker_restarts == (1,)
+            assert sharded.worker_pids != (pid,)
+
+            await updater.update_queue.put(make_update(4, chat_id=1))
+            await sharded.stop(timeout=30)
+
+        processed = [update_id for _, update_id in read_output(output)[1]]
+        # Updates that were not confirmed by the failed worker are delivered again, such that
+        # some updates may be processed twice. The order is preserved nonetheless.
+        assert set(processed) >= {1, 3, 4}
+        assert processed == sorted(processed)
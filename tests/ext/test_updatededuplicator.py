@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2025
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import random
+
+import pytest
+
+from telegram.ext import UpdateDeduplicator
+from tests.auxil.slots import mro_slots
+
+
+class TestUpdateDeduplicator:
+    def test_slot_behaviour(self):
+        inst = UpdateDeduplicator()
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_init(self):
+        deduplicator = UpdateDeduplicator()
+        assert deduplicator.window_size == 4096
+        assert deduplicator.highest_update_id is None
+        assert deduplicator.duplicates == 0
+        assert deduplicator.unique_updates == 0
+        assert repr(deduplicator) == "UpdateDeduplicator[window_size=4096, duplicates=0]"
+
+        with pytest.raises(ValueError, match="must be a positive integer"):
+            UpdateDeduplicator(window_size=0)
+
+    def test_record(self):
+        deduplicator = UpdateDeduplicator(window_size=8)
+        assert deduplicator.record(10)
+        assert not deduplicator.record(10)
+        assert deduplicator.record(12)
+        # Out of order ids within the window
+        assert deduplicator.record(11)
+        assert deduplicator.record(5)
+        assert not deduplicator.record(11)
+        assert not deduplicator.record(5)
+        assert deduplicator.highest_update_id == 12
+        assert deduplicator.unique_updates == 4
+        assert deduplicator.duplicates == 3
+
+        deduplicator.reset()
+        assert deduplicator.highest_update_id is None
+        assert deduplicator.unique_updates == 0
+        assert deduplicator.duplicates == 0
+        assert deduplicator.record(10)
+
+    def test_window_moves(self):
+        deduplicator = UpdateDeduplicator(window_size=8)
+        for update_id in range(20):
+            assert deduplicator.record(update_id)
+        # The last 8 ids are still tracked
+        for update_id in range(12, 20):
+            assert not deduplicator.record(update_id)
+        # Jumping ahead by more than the window size forgets all ids
+        assert deduplicator.record(100)
+        assert deduplicator.record(95)
+        assert not deduplicator.record(95)
+
+    def test_ids_below_window_dont_rewind(self):
+        deduplicator = UpdateDeduplicator(window_size=8)
+        for update_id in range(995, 1001):
+            assert deduplicator.record(update_id)
+        # A stale id can't be checked. It's passed through, but the window is kept.
+        assert deduplicator.record(10)
+        assert deduplicator.record(10)
+        assert deduplicator.highest_update_id == 1000
+        assert deduplicator.unique_updates == 8
+        for update_id in range(995, 1001):
+            assert not deduplicator.record(update_id)
+        assert deduplicator.record(1001)
+
+    def test_reset_after_restart(self):
+        # Telegram may restart the update ids at a random lower value
+        deduplicator = UpdateDeduplicator(window_size=8)
+        assert deduplicator.record(1000)
+        deduplicator.reset()
+        assert deduplicator.record(10)
+        assert deduplicator.highest_update_id == 10
+        assert not deduplicator.record(10)
+
+    def test_matches_set_semantics(self):
+        window_size = 64
+        deduplicator = UpdateDeduplicator(window_size=window_size)
+        seen = set()
+        rng = random.Random(1234)
+        update_id = 0
+        for _ in range(2000):
+            update_id += rng.randint(0, 3)
+            candidate = update_id - rng.randint(0, window_size - 1)
+            highest = max(seen) if seen else None
+            if highest is not None and highest - candidate >= window_size:
+                continue
+            assert deduplicator.record(candidate) is (candidate not in seen)
+            seen.add(candidate)
@@ -29,7 +29,13 @@ import pytest
 from telegram import Bot, InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram._utils.defaultvalue import DEFAULT_NONE
 from telegram.error import InvalidToken, RetryAfter, TelegramError, TimedOut
-from telegram.ext import ExtBot, InvalidCallbackData, Updater
+from telegram.ext import (
+    BoundedUpdateQueue,
+    ExtBot,
+    InvalidCallbackData,
+    UpdateDeduplicator,
+    Updater,
+)
 from tests.auxil.build_messages import make_message, make_message_update
 from tests.auxil.envvars import TEST_WITH_OPT_DEPS
 from tests.auxil.files import TEST_DATA_PATH, data_file
@@ -428,6 +434,7 @@ class TestUpdater:
             "pool_timeout": DEFAULT_NONE,
             "allowed_updates": None,
             "api_kwargs": None,
+            "limit": None,
         }
 
         async def get_updates(*args, **kwargs):
@@ -472,6 +479,7 @@ class TestUpdater:
                 "pool_timeout": 46,
                 "allowed_updates": ["message"],
                 "api_kwargs": None,
+                "limit": None,
             }
 
             await update_queue.put(Update(update_id=2))
@@ -487,6 +495,41 @@ class TestUpdater:
             on_stop_flag = True
             await updater.stop()
 
+    async def test_polling_bounded_update_queue(self, updater, monkeypatch):
+        updater.update_queue = BoundedUpdateQueue(high_watermark=4, low_watermark=1)
+        limits = []
+        update_id = 0
+
+        async def get_updates(*args, limit=None, **kwargs):
+            nonlocal update_id
+            await asyncio.sleep(0)
+            if limit is None:
+                # This is the call that marks the updates as read on shutdown
+                return []
+            limits.append(limit)
+            updates = [Update(update_id + i) for i in range(min(limit, 3))]
+            update_id += len(updates)
+            return updates
+
+        monkeypatch.setattr(updater.bot, "get_updates", get_updates)
+
+        async with updater:
+            await updater.start_polling()
+            await asyncio.sleep(0.05)
+            # The first call fetches 3 updates, the second one only the remaining single one.
+            # After that, the queue is overloaded and no further updates are fetched.
+            assert limits == [4, 1]
+            assert updater.update_queue.overloaded
+            assert updater.update_queue.qsize() == 4
+
+            for _ in range(3):
+                updater.update_queue.get_nowait()
+                updater.update_queue.task_done()
+            await asyncio.sleep(0.05)
+            # Polling resumes once the low watermark is reached
+            assert limits[:3] == [4, 1, 3]
+            await updater.stop()
+
     @pytest.mark.parametrize("exception_class", [InvalidToken, TelegramError])
     @pytest.mark.parametrize("retries", [3, 0])
     async def test_start_polling_bootstrap_retries(
@@ -1119,6 +1162,63 @@ class TestUpdater:
 
             await updater.stop()
 
+    async def test_webhook_bounded_update_queue(self, updater):
+        updater.update_queue = BoundedUpdateQueue(high_watermark=1, low_watermark=0)
+        ip = "127.0.0.1"
+        port = randrange(1024, 49152)  # Select random port
+
+        async with updater:
+            await updater.start_webhook(ip_address=ip, port=port, url_path="TOKEN")
+
+            update = make_message_update("Webhook")
+            response = await send_webhook_message(ip, port, update.to_json(), "TOKEN")
+            assert response.status_code == HTTPStatus.OK
+            assert updater.update_queue.overloaded
+
+            # Telegram will retry to deliver the update later
+            response = await send_webhook_message(ip, port, update.to_json(), "TOKEN")
+            assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+            assert response.text == self.response_text.format(
+                "Too many pending updates", HTTPStatus.SERVICE_UNAVAILABLE
+            )
+            assert updater.update_queue.qsize() == 1
+
+            updater.update_queue.get_nowait()
+            updater.update_queue.task_done()
+            response = await send_webhook_message(ip, port, update.to_json(), "TOKEN")
+            assert response.status_code == HTTPStatus.OK
+            assert updater.update_queue.qsize() == 1
+
+            await updater.stop()
+
+    async def test_webhook_update_deduplicator(self, updater):
+        deduplicator = UpdateDeduplicator()
+        ip = "127.0.0.1"
+        port = randrange(1024, 49152)  # Select random port
+
+        async with updater:
+            await updater.start_webhook(
+                ip_address=ip, port=port, url_path="TOKEN", update_deduplicator=deduplicator
+            )
+
+            update = make_message_update("Webhook")
+            other_update = make_message_update("Webhook")
+            other_update._unfreeze()
+            other_update.update_id = update.update_id + 1
+            for _ in range(2):
+                for upd in (update, other_update):
+                    response = await send_webhook_message(ip, port, upd.to_json(), "TOKEN")
+                    # Telegram must not deliver the duplicates again
+                    assert response.status_code == HTTPStatus.OK
+
+            assert updater.update_queue.qsize() == 2
+            assert updater.update_queue.get_nowait().update_id == update.update_id
+            assert updater.update_queue.get_nowait().update_id == other_update.update_id
+            assert deduplicator.duplicates == 2
+            assert deduplicator.unique_updates == 2
+
+            await updater.stop()
+
     async def test_webhook_update_de_json_fails(self, monkeypatch, updater, caplog):
         def de_json_fails(*args, **kwargs):
             raise TypeError("Invalid input")
@@ -19,7 +19,8 @@
 
 import contextlib
 import datetime as dtm
-from copy import copy
+import pickle
+from copy import copy, deepcopy
 
 import pytest
 
@@ -718,6 +719,62 @@ class TestMessageWithoutRequest(MessageTestBase):
         assert message.parse_entities(MessageEntity.URL) == {entity: "http://google.com"}
         assert message.parse_entities() == {entity: "http://google.com", entity_2: "h"}
 
+    def test_utf_16_text_not_pickled(self):
+        entity = MessageEntity(type=MessageEntity.BOLD, offset=3, length=4)
+        message = Message(
+            1,
+            from_user=self.from_user,
+            date=self.date,
+            chat=self.chat,
+            text="😎 bold",
+            entities=[entity],
+        )
+        assert message.text_html == "😎 <b>bold</b>"
+        assert isinstance(message._utf_16_text, tuple)
+
+        # The pickle doesn't contain the cache, i.e. it looks like a pickle created before the
+        # cache was introduced
+        data = pickle.dumps(message)
+        assert b"_utf_16" not in data
+        unpickled = pickle.loads(data)
+        assert not hasattr(unpickled, "_utf_16_text")
+        assert unpickled.text_html == "😎 <b>bold</b>"
+        assert unpickled.parse_caption_entities() == {}
+
+        copied = deepcopy(message)
+        assert not hasattr(copied, "_utf_16_text")
+        assert copied.parse_entities() == {entity: "bold"}
+
+    def test_utf_16_text_cached(self):
+        entity = MessageEntity(type=MessageEntity.BOLD, offset=3, length=4)
+        message = Message(
+            1,
+            from_user=self.from_user,
+            date=self.date,
+            chat=self.chat,
+            text="😎 bold",
+            entities=[entity],
+            caption="😎 caption",
+        )
+        assert message.parse_entities() == {entity: "bold"}
+        utf_16_text = message._utf_16_text[1]
+        assert utf_16_text == "😎 bold".encode("utf-16-le")
+
+        # The encoding is reused by all methods that extract entities
+        assert message.parse_entity(entity) == "bold"
+        assert message.text_html == "😎 <b>bold</b>"
+        assert message.compute_quote_position_and_entities("bold") == (
+            3,
+            (MessageEntity(MessageEntity.BOLD, 0, 4),),
+        )
+        assert message._utf_16_text[1] is utf_16_text
+        assert message._utf_16_caption is DEFAULT_NONE
+
+        # The cache is invalidated if the text is replaced
+        with message._unfrozen():
+            message.text = "😎 text"
+        assert message.parse_entity(entity) == "text"
+
     async def test_parse_caption_entities(self):
         text = (
             b"\\U0001f469\\u200d\\U0001f469\\u200d\\U0001f467"
@@ -965,6 +1022,105 @@ class TestMessageWithoutRequest(MessageTestBase):
         )
         assert expected == message[type_]
 
+    def test_text_html_enclosing_entity_listed_last(self):
+        message = Message(
+            1,
+            from_user=self.from_user,
+            date=self.date,
+            chat=self.chat,
+            text="bold italic",
+            entities=[
+                MessageEntity(MessageEntity.BOLD, 0, 4),
+                MessageEntity(MessageEntity.ITALIC, 0, 11),
+            ],
+        )
+        assert message.text_html == "<i><b>bold</b> italic</i>"
+        assert message.text_markdown_v2 == "_*bold* italic_"
+
+    @pytest.mark.parametrize(
+        ("text", "entities", "html", "markdown_v2"),
+        [
+            # Identical offsets: the longer entity encloses the shorter one, regardless of order
+            (
+                "bold italic",
+                [
+                    MessageEntity(MessageEntity.ITALIC, 0, 11),
+                    MessageEntity(MessageEntity.BOLD, 0, 4),
+                ],
+                "<i><b>bold</b> italic</i>",
+                "_*bold* italic_",
+            ),
+            (
+                "code bold",
+                [MessageEntity(MessageEntity.CODE, 0, 4), MessageEntity(MessageEntity.BOLD, 0, 9)],
+                "<b><code>code</code> bold</b>",
+                "*`code` bold*",
+            ),
+            # Identical spans: the entity listed first encloses the others
+            (
+                "bold",
+                [
+                    MessageEntity(MessageEntity.BOLD, 0, 4),
+                    MessageEntity(MessageEntity.ITALIC, 0, 4),
+                ],
+                "<b><i>bold</i></b>",
+                "*_bold_*",
+            ),
+            (
+                "bold",
+                [
+                    MessageEntity(MessageEntity.ITALIC, 0, 4),
+                    MessageEntity(MessageEntity.BOLD, 0, 4),
+                ],
+                "<i><b>bold</b></i>",
+                "_*bold*_",
+            ),
+            (
+                "bold text",
+                [
+                    MessageEntity(MessageEntity.UNDERLINE, 0, 4),
+                    MessageEntity(MessageEntity.BOLD, 0, 4),
+                    MessageEntity(MessageEntity.ITALIC, 0, 4),
+                ],
+                "<u><b><i>bold</i></b></u> text",
+                "__*_bold_*__ text",
+            ),
+        ],
+    )
+    def test_text_html_same_offset(self, text, entities, html, markdown_v2):
+        message = Message(
+            1,
+            from_user=self.from_user,
+            date=self.date,
+            chat=self.chat,
+            text=text,
+            entities=entities,
+        )
+        assert message.text_html == html
+        assert message.text_markdown_v2 == markdown_v2
+
+    def test_text_html_many_entities(self):
+        # Each chunk is a bold word with a nested italic word, followed by a plain word
+        chunk = "<😎 bold italic> & "
+        count = 250
+        entities = []
+        for i in range(count):
+            offset = i * 19
+            entities.append(MessageEntity(MessageEntity.BOLD, offset, 15))
+            entities.append(MessageEntity(MessageEntity.ITALIC, offset + 9, 6))
+        message = Message(
+            1,
+            from_user=self.from_user,
+            date=self.date,
+            chat=self.chat,
+            text=chunk * count,
+            entities=entities,
+        )
+
+        assert message.text_html == "<b>&lt;😎 bold <i>italic</i></b>&gt; &amp; " * count
+        assert message.text_html_urled == message.text_html
+        assert message.text_markdown_v2 == r"*<😎 bold _italic_*\> & " * count
+
     def test_caption_html_simple(self):
         test_html_string = (
             "<u>Test</u> for &lt;<b>bold</b>, <i>ita_lic</i>, "
@@ -468,6 +468,22 @@ class TestPollWithoutRequest(PollTestBase):
                 allows_multiple_answers=False,
             ).parse_explanation_entities()
 
+    def test_parse_entities_utf_16_text_cached(self, poll):
+        entity = MessageEntity(MessageEntity.ITALIC, 5, 8)
+        poll.question_entities = [entity]
+        poll.explanation_entities = [entity]
+
+        assert poll.parse_question_entities() == {entity: "Question"}
+        utf_16_question = poll._utf_16_question[1]
+        assert poll.parse_question_entity(entity) == "Question"
+        assert poll._utf_16_question[1] is utf_16_question
+
+        poll.parse_explanation_entities()
+        utf_16_explanation = poll._utf_16_explanation[1]
+        assert utf_16_explanation == poll.explanation.encode("utf-16-le")
+        poll.parse_explanation_entity(entity)
+        assert poll._utf_16_explanation[1] is utf_16_explanation
+
     def test_parse_question_entity(self, poll):
         entity = MessageEntity(MessageEntity.ITALIC, 5, 8)
         poll.question_entities = [entity]